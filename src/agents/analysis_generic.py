@@ -48,10 +48,10 @@ def analyze_market_generic(state: TradingState, strategy_name: str,
         
         # Calculate technical indicators for both timeframes
         print(f"   Analyzing {tf_higher} (trend)...")
-        indicators_higher = calculate_all_indicators(candles_higher)
+        indicators_higher = calculate_all_indicators(candles_higher, symbol=market_data['symbol'], interval=tf_higher)
         
         print(f"   Analyzing {tf_lower} (entry)...")
-        indicators_lower = calculate_all_indicators(candles_lower)
+        indicators_lower = calculate_all_indicators(candles_lower, symbol=market_data['symbol'], interval=tf_lower)
         
         # Combine indicators
         indicators = {
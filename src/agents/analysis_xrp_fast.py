@@ -48,10 +48,12 @@ def analyze_market_xrp_fast(state: TradingState, strategy_name: str,
         
         # Calculate technical indicators with EMA 7/25
         print(f"   Analyzing {tf_higher} (trend) with EMA 7/25...")
-        indicators_higher = calculate_all_indicators_custom(candles_higher, ema_periods=[7, 25])
+        indicators_higher = calculate_all_indicators_custom(candles_higher, ema_periods=[7, 25],
+                                                            symbol=market_data['symbol'], interval=tf_higher)
         
         print(f"   Analyzing {tf_lower} (entry) with EMA 7/25...")
-        indicators_lower = calculate_all_indicators_custom(candles_lower, ema_periods=[7, 25])
+        indicators_lower = calculate_all_indicators_custom(candles_lower, ema_periods=[7, 25],
+                                                           symbol=market_data['symbol'], interval=tf_lower)
         
         # Combine indicators
         indicators = {
@@ -4,12 +4,101 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models.state import TradingState
-from utils.binance_client import BinanceClient
+from utils.binance_client import get_binance_client
+from utils.async_binance_client import get_async_market_data_client
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 import config
 
 
+def get_market_data_key(strategy) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Get the market data bundle key for a strategy
+    
+    Strategies with the same symbol and the same set of timeframes
+    (e.g. sol + sol_fast on SOLUSDT 1h/15m) share one bundle.
+    
+    Args:
+        strategy: StrategyConfig instance
+        
+    Returns:
+        Tuple (symbol, sorted timeframes)
+    """
+    timeframes = tuple(sorted({strategy.timeframe_higher, strategy.timeframe_lower}))
+    return (strategy.symbol, timeframes)
+
+
+def plan_market_data(strategies: List) -> Dict[Tuple[str, Tuple[str, ...]], List[str]]:
+    """
+    Group strategies by (symbol, timeframe set)
+    
+    Args:
+        strategies: List of StrategyConfig instances
+        
+    Returns:
+        Dictionary bundle key -> list of strategy names using that bundle
+    """
+    plan = {}
+    for strategy in strategies:
+        plan.setdefault(get_market_data_key(strategy), []).append(strategy.name)
+    return plan
+
+
+def collect_market_data_bundles(strategies: List) -> Dict[Tuple[str, Tuple[str, ...]], Optional[Dict]]:
+    """
+    Fetch every unique market data bundle exactly once per cycle
+    
+    Bundles are fetched in parallel (one thread per unique bundle). A bundle
+    that fails to download is stored as None - strategies using it fall back
+    to their own fetch in collect_market_data_generic.
+    
+    Args:
+        strategies: List of StrategyConfig instances scheduled for this cycle
+        
+    Returns:
+        Dictionary bundle key -> market data (same shape as get_multi_timeframe_data)
+    """
+    plan = plan_market_data(strategies)
+    
+    if not plan:
+        return {}
+    
+    print(f"📦 Market data plan: {len(plan)} unique bundle(s) for {len(strategies)} strateg{'y' if len(strategies) == 1 else 'ies'}")
+    for (symbol, timeframes), names in plan.items():
+        print(f"   {symbol} {'/'.join(timeframes)} → {', '.join(names)}")
+    
+    def _fetch(key):
+        symbol, timeframes = key
+        if config.BINANCE_ASYNC_MARKET_DATA:
+            # Price, funding, orderbook and klines fetched concurrently (~1 round trip)
+            client = get_async_market_data_client()
+        else:
+            client = get_binance_client(
+                api_key=config.BINANCE_API_KEY,
+                api_secret=config.BINANCE_API_SECRET
+            )
+        return client.get_multi_timeframe_data(
+            symbol=symbol,
+            timeframes=list(timeframes),
+            limit=config.CANDLES_LIMIT
+        )
+    
+    bundles = {}
+    with ThreadPoolExecutor(max_workers=len(plan)) as executor:
+        futures = {key: executor.submit(_fetch, key) for key in plan}
+        for key, future in futures.items():
+            try:
+                bundles[key] = future.result()
+            except Exception as e:
+                print(f"❌ Error fetching market data bundle {key[0]} {'/'.join(key[1])}: {e}")
+                bundles[key] = None
+    
+    return bundles
+
+
 def collect_market_data_generic(state: TradingState, strategy_name: str, 
-                                tf_higher: str, tf_lower: str) -> TradingState:
+                                tf_higher: str, tf_lower: str,
+                                market_data: Optional[Dict] = None) -> TradingState:
     """
     Generic market data collector for any timeframe pair
     
@@ -18,6 +107,8 @@ def collect_market_data_generic(state: TradingState, strategy_name: str,
         strategy_name: Name of strategy (for state key)
         tf_higher: Higher timeframe (e.g., '1h', '15m')
         tf_lower: Lower timeframe (e.g., '15m', '5m')
+        market_data: Optional pre-fetched bundle from collect_market_data_bundles
+                     (shared with other strategies on the same symbol/timeframes)
         
     Returns:
         Updated state with market data at state[f'market_data_{strategy_name}']
@@ -28,18 +119,24 @@ def collect_market_data_generic(state: TradingState, strategy_name: str,
     print(f"   Timeframes: {tf_higher} (trend), {tf_lower} (entry)")
     
     try:
-        # Initialize Binance client
-        client = BinanceClient(
-            api_key=config.BINANCE_API_KEY,
-            api_secret=config.BINANCE_API_SECRET
-        )
-        
-        # Fetch multi-timeframe market data
-        market_data = client.get_multi_timeframe_data(
-            symbol=state['symbol'],
-            timeframes=[tf_higher, tf_lower],
-            limit=config.CANDLES_LIMIT
-        )
+        if market_data is not None:
+            # Shared bundle - shallow copy so per-strategy keys don't leak between strategies
+            # (DataFrames are shared read-only)
+            market_data = dict(market_data)
+            print(f"   Using shared market data bundle (fetched once per cycle)")
+        else:
+            # Initialize Binance client
+            client = get_binance_client(
+                api_key=config.BINANCE_API_KEY,
+                api_secret=config.BINANCE_API_SECRET
+            )
+            
+            # Fetch multi-timeframe market data
+            market_data = client.get_multi_timeframe_data(
+                symbol=state['symbol'],
+                timeframes=[tf_higher, tf_lower],
+                limit=config.CANDLES_LIMIT
+            )
         
         print(f"✅ [{strategy_name.upper()}] Market data collected:")
         print(f"   Current price: ${market_data['current_price']}")
@@ -5,6 +5,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models.state import TradingState
 from openai import OpenAI
+from utils.tracing import span
 from utils.indicators import calculate_stop_take_profit
 import config
 import json
@@ -140,15 +141,16 @@ Respond ONLY with JSON:
         
         # Call DeepSeek AI
         print("   Calling DeepSeek API...")
-        response = client.chat.completions.create(
-            model="deepseek-chat",
-            messages=[
-                {"role": "system", "content": "You are an expert cryptocurrency trader. Analyze data and make independent trading decisions. Always respond with valid JSON only."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=500
-        )
+        with span('llm', model="deepseek-chat"):
+            response = client.chat.completions.create(
+                model="deepseek-chat",
+                messages=[
+                    {"role": "system", "content": "You are an expert cryptocurrency trader. Analyze data and make independent trading decisions. Always respond with valid JSON only."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.7,
+                max_tokens=500
+            )
         
         # Parse response
         response_text = response.choices[0].message.content.strip()
@@ -0,0 +1,109 @@
+"""
+Streaming Exit Engine - event-driven SL/TP detection for paper trades.
+
+Consumes a price tick stream (Binance websocket or a recorded tape replay)
+and closes paper trades as soon as a tick crosses their stop loss or take
+profit, instead of waiting for the next 60-second monitoring poll. Wicks
+between polls are no longer missed.
+
+The triggering tick (price, exchange event time, stream type) is stored with
+the closed trade.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, Optional
+from utils.trigger_index import TriggerIndex
+
+logger = logging.getLogger(__name__)
+
+
+class ExitEngine:
+    """
+    Closes paper trades on the first price tick that hits SL/TP
+
+    Args:
+        trigger_index: Index of open trade SL/TP levels (kept in sync by the DB listeners)
+        close_trade: Callable(trade_id, exit_price, exit_reason, exit_tick) -> closed info or None
+        logger_instance: Optional logger
+    """
+
+    def __init__(self, trigger_index: TriggerIndex,
+                 close_trade: Callable[[str, float, str, Dict], Optional[Dict]],
+                 logger_instance=None):
+        self.trigger_index = trigger_index
+        self.close_trade = close_trade
+        self.logger = logger_instance if logger_instance else logger
+        self.source = None
+
+        self._closing = set()
+        self._closing_lock = threading.Lock()
+
+        self.ticks_processed = 0
+        self.trades_closed = 0
+        self.last_tick = None
+        self.close_latency_ms_total = 0.0
+        self.close_latency_ms_max = 0.0
+
+    def start(self, source):
+        """Start consuming ticks from a price stream (BinancePriceStream / ReplayPriceStream)"""
+        self.source = source
+        source.start(self.on_tick)
+        self.logger.info(f"⚡ [EXIT ENGINE] Started ({source.__class__.__name__}, {len(self.trigger_index)} open trade(s) indexed)")
+
+    def stop(self):
+        """Stop price stream"""
+        if self.source:
+            self.source.stop()
+            self.source = None
+            self.logger.info("⚡ [EXIT ENGINE] Stopped")
+
+    def on_tick(self, tick: Dict):
+        """
+        Handle one price tick
+
+        Args:
+            tick: {'symbol', 'price', 'event_time' (ms), 'source'}
+        """
+        received = time.time()
+        self.ticks_processed += 1
+        self.last_tick = tick
+
+        for trade, exit_reason, exit_price in self.trigger_index.check(tick['symbol'], tick['price']):
+            trade_id = trade['trade_id']
+
+            # Same trade can be hit by the next tick before the close is committed
+            with self._closing_lock:
+                if trade_id in self._closing:
+                    continue
+                self._closing.add(trade_id)
+
+            try:
+                closed_info = self.close_trade(trade_id, exit_price, exit_reason, tick)
+                if closed_info:
+                    latency_ms = (time.time() - received) * 1000
+                    self.trades_closed += 1
+                    self.close_latency_ms_total += latency_ms
+                    self.close_latency_ms_max = max(self.close_latency_ms_max, latency_ms)
+                    self.logger.info(
+                        f"⚡ [EXIT ENGINE] {trade_id} {exit_reason} on {tick['source']} tick "
+                        f"${tick['price']} - closed in {latency_ms:.1f}ms"
+                    )
+            except Exception as e:
+                self.logger.error(f"⚡ [EXIT ENGINE] Error closing {trade_id}: {e}")
+            finally:
+                with self._closing_lock:
+                    self._closing.discard(trade_id)
+
+    def get_stats(self) -> Dict:
+        """Get exit engine statistics"""
+        return {
+            'running': self.source is not None,
+            'ticks_processed': self.ticks_processed,
+            'trades_closed': self.trades_closed,
+            'open_trades_indexed': len(self.trigger_index),
+            'avg_close_latency_ms': self.close_latency_ms_total / self.trades_closed if self.trades_closed else 0.0,
+            'max_close_latency_ms': self.close_latency_ms_max,
+            'last_tick': self.last_tick
+        }
@@ -6,6 +6,44 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from models.state import TradingState
 import yfinance as yf
 import pandas as pd
+from datetime import datetime
+from typing import Optional, Tuple
+from utils.source_cache import get_source_cache, ixic_ttl
+
+# Data older than this is treated as stale (market closed)
+IXIC_FRESH_MINUTES = 120
+
+
+def ixic_freshness(latest_time: datetime, now: Optional[datetime] = None) -> Tuple[bool, int]:
+    """
+    Freshness of the newest IXIC candle
+    
+    Args:
+        latest_time: Newest candle time (naive, as stored in 'latest_time')
+        now: Current time (default: now)
+        
+    Returns:
+        (is_fresh, data_age_minutes)
+    """
+    data_age = ((now or datetime.now()) - latest_time).total_seconds() / 60
+    return data_age < IXIC_FRESH_MINUTES, int(data_age)
+
+
+def with_current_age(ixic_data: Optional[dict], now: Optional[datetime] = None) -> Optional[dict]:
+    """
+    Cached IXIC summary with fresh / data_age_minutes as of now (not as of the fetch)
+    
+    Args:
+        ixic_data: Summary from fetch_ixic_data (possibly cached for hours)
+        now: Current time (default: now)
+        
+    Returns:
+        Copy with recomputed freshness (None passes through)
+    """
+    if not ixic_data or not ixic_data.get('latest_time'):
+        return ixic_data
+    is_fresh, data_age = ixic_freshness(datetime.fromisoformat(ixic_data['latest_time']), now)
+    return {**ixic_data, 'fresh': is_fresh, 'data_age_minutes': data_age}
 
 
 def collect_ixic_data(state: TradingState) -> TradingState:
@@ -20,81 +58,85 @@ def collect_ixic_data(state: TradingState) -> TradingState:
     """
     print(f"\n📈 Collecting IXIC (Nasdaq) data...")
     
-    try:
-        # Get IXIC data (Nasdaq Composite)
-        ticker = yf.Ticker("^IXIC")
-        
-        # Get 15m data (last 5 days worth)
-        ixic_data = ticker.history(period="5d", interval="15m")
-        
-        if ixic_data.empty:
-            print("⚠️  No IXIC data available")
-            return {"ixic_data": None}
-        
-        # Calculate basic indicators on IXIC
-        current_price = ixic_data['Close'].iloc[-1]
-        
-        # Simple trend
-        sma_20 = ixic_data['Close'].rolling(20).mean().iloc[-1]
-        sma_50 = ixic_data['Close'].rolling(50).mean().iloc[-1] if len(ixic_data) >= 50 else sma_20
-        
-        if current_price > sma_20 > sma_50:
-            ixic_trend = "bullish"
-        elif current_price < sma_20 < sma_50:
-            ixic_trend = "bearish"
-        else:
-            ixic_trend = "neutral"
-        
-        # Recent change (last hour = 4 candles)
-        if len(ixic_data) >= 4:
-            price_1h_ago = ixic_data['Close'].iloc[-4]
-            change_1h = ((current_price - price_1h_ago) / price_1h_ago) * 100
-        else:
-            change_1h = 0
-        
-        # Recent change (last 4h = 16 candles)
-        if len(ixic_data) >= 16:
-            price_4h_ago = ixic_data['Close'].iloc[-16]
-            change_4h = ((current_price - price_4h_ago) / price_4h_ago) * 100
-        else:
-            change_4h = 0
-        
-        # Check data freshness
-        from datetime import datetime, timedelta
-        latest_time = ixic_data.index[-1].to_pydatetime().replace(tzinfo=None)
-        now = datetime.now()
-        data_age = (now - latest_time).total_seconds() / 60  # minutes
-        
-        # Consider fresh if < 2 hours old
-        is_fresh = data_age < 120
-        
-        ixic_analysis = {
-            "current_price": round(current_price, 2),
-            "trend": ixic_trend,
-            "change_1h": round(change_1h, 2),
-            "change_4h": round(change_4h, 2),
-            "sma_20": round(sma_20, 2),
-            "sma_50": round(sma_50, 2) if len(ixic_data) >= 50 else None,
-            "candles_available": len(ixic_data),
-            "fresh": is_fresh,
-            "data_age_minutes": int(data_age),
-            "latest_time": latest_time.isoformat()
-        }
-        
-        if is_fresh:
-            print(f"✅ IXIC data collected (FRESH - {int(data_age)}min old):")
-            print(f"   Price: {current_price:.2f}")
-            print(f"   Trend: {ixic_trend}")
-            print(f"   1h change: {change_1h:+.2f}%")
-            print(f"   4h change: {change_4h:+.2f}%")
-        else:
-            print(f"⚠️  IXIC data STALE ({int(data_age/60)}h old - market closed)")
-            print(f"   Last price: {current_price:.2f} from {latest_time.strftime('%Y-%m-%d %H:%M')}")
-            print(f"   Using with caution or skipping in analysis")
-        
-        return {"ixic_data": ixic_analysis}
-        
-    except Exception as e:
-        print(f"❌ Error collecting IXIC data: {e}")
-        return {"ixic_data": None}
+    # Refreshed every IXIC_CACHE_TTL while NASDAQ is open, held until the next session while closed
+    ixic_data = get_source_cache().get('ixic', fetch_ixic_data, ixic_ttl)
+    if ixic_data and ixic_data.get('stale'):
+        print(f"♻️  Using cached IXIC data ({ixic_data['stale_age_seconds']}s old, refreshing)")
+    # The summary can be hours old (held while NASDAQ is closed) - age it to this cycle
+    return {"ixic_data": with_current_age(ixic_data)}
+
 
+def fetch_ixic_data() -> dict:
+    """
+    Fetch ^IXIC 15m history from Yahoo Finance and summarize it
+    
+    Returns:
+        IXIC analysis dict (None if Yahoo returned no data)
+    """
+    # Get IXIC data (Nasdaq Composite)
+    ticker = yf.Ticker("^IXIC")
+    
+    # Get 15m data (last 5 days worth)
+    ixic_data = ticker.history(period="5d", interval="15m")
+    
+    if ixic_data.empty:
+        print("⚠️  No IXIC data available")
+        return None
+    
+    # Calculate basic indicators on IXIC
+    current_price = ixic_data['Close'].iloc[-1]
+    
+    # Simple trend
+    sma_20 = ixic_data['Close'].rolling(20).mean().iloc[-1]
+    sma_50 = ixic_data['Close'].rolling(50).mean().iloc[-1] if len(ixic_data) >= 50 else sma_20
+    
+    if current_price > sma_20 > sma_50:
+        ixic_trend = "bullish"
+    elif current_price < sma_20 < sma_50:
+        ixic_trend = "bearish"
+    else:
+        ixic_trend = "neutral"
+    
+    # Recent change (last hour = 4 candles)
+    if len(ixic_data) >= 4:
+        price_1h_ago = ixic_data['Close'].iloc[-4]
+        change_1h = ((current_price - price_1h_ago) / price_1h_ago) * 100
+    else:
+        change_1h = 0
+    
+    # Recent change (last 4h = 16 candles)
+    if len(ixic_data) >= 16:
+        price_4h_ago = ixic_data['Close'].iloc[-16]
+        change_4h = ((current_price - price_4h_ago) / price_4h_ago) * 100
+    else:
+        change_4h = 0
+    
+    # Check data freshness (recomputed on every read - see with_current_age)
+    latest_time = ixic_data.index[-1].to_pydatetime().replace(tzinfo=None)
+    is_fresh, data_age = ixic_freshness(latest_time)
+    
+    ixic_analysis = {
+        "current_price": round(current_price, 2),
+        "trend": ixic_trend,
+        "change_1h": round(change_1h, 2),
+        "change_4h": round(change_4h, 2),
+        "sma_20": round(sma_20, 2),
+        "sma_50": round(sma_50, 2) if len(ixic_data) >= 50 else None,
+        "candles_available": len(ixic_data),
+        "fresh": is_fresh,
+        "data_age_minutes": data_age,
+        "latest_time": latest_time.isoformat()
+    }
+    
+    if is_fresh:
+        print(f"✅ IXIC data collected (FRESH - {data_age}min old):")
+        print(f"   Price: {current_price:.2f}")
+        print(f"   Trend: {ixic_trend}")
+        print(f"   1h change: {change_1h:+.2f}%")
+        print(f"   4h change: {change_4h:+.2f}%")
+    else:
+        print(f"⚠️  IXIC data STALE ({data_age // 60}h old - market closed)")
+        print(f"   Last price: {current_price:.2f} from {latest_time.strftime('%Y-%m-%d %H:%M')}")
+        print(f"   Using with caution or skipping in analysis")
+    
+    return ixic_analysis
@@ -5,7 +5,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models.state import TradingState
 from utils.database import TradingDatabase
-from utils.binance_client import BinanceClient
+from utils.binance_client import get_binance_client, get_order_placement_guard
+from utils.order_latency import OrderLatencyTimer, STAGES
 from datetime import datetime, timezone, timedelta
 import config
 import json
@@ -38,7 +39,8 @@ def execute_live_trade(state: TradingState, strategy_configs: dict) -> TradingSt
     
     try:
         # Initialize Binance client
-        client = BinanceClient()
+        client = get_binance_client()
+        placement_guard = get_order_placement_guard()
         
         if not client.has_credentials:
             logger.info("🔴 ❌ Binance API credentials not configured!")
@@ -91,6 +93,7 @@ def execute_live_trade(state: TradingState, strategy_configs: dict) -> TradingSt
         # Execute trade for each strategy with live_trading=True
         for strategy_name, recommendation, strategy_config in recommendations:
             logger.info(f"\n🔴 [{strategy_name.upper()}] Processing LIVE recommendation...")
+            latency = OrderLatencyTimer(state.get('cycle_timing'), state.get(f'timing_{strategy_name}'))
             action = recommendation['action']
             confidence = recommendation.get('confidence', 'unknown')
             symbol = recommendation.get('symbol', strategy_config.symbol)
@@ -439,95 +442,131 @@ def execute_live_trade(state: TradingState, strategy_configs: dict) -> TradingSt
                 # Calculate fees (Binance Futures taker fee)
                 fee_rate = config.TRADING_FEE_RATE
                 
-                # Execute ONE market order
-                order = client.client.futures_create_order(
-                    symbol=symbol,
-                    side=side,
-                    type='MARKET',
-                    quantity=total_quantity
-                )
-                
-                logger.info(f"   ✅ Market order placed: {order['orderId']} ({total_quantity} {symbol})")
-                
-                # FIX #2: Place STOP LOSS and TAKE PROFIT orders on Binance
-                # Strategy: 2 TP levels + 2 SL levels for scale-out
-                try:
-                    sl_side = 'SELL' if action == 'LONG' else 'BUY'
-                    
-                    # Calculate quantities: split position into two parts
-                    # Use floor division to ensure we don't exceed total quantity
-                    half_quantity = round(total_quantity / 2, quantity_precision) if quantity_precision else total_quantity / 2
-                    remaining_quantity = total_quantity - half_quantity  # Ensure exact match
-                    
-                    logger.info(f"   📊 Position split: total={total_quantity}, first={half_quantity}, second={remaining_quantity}")
-                    
-                    # Get price precision for the symbol
-                    price_precision = 2  # default
-                    for filter in symbol_info['filters']:
-                        if filter['filterType'] == 'PRICE_FILTER':
-                            tick_size = float(filter['tickSize'])
-                            price_precision = get_quantity_precision(tick_size)
-                            break
-                    
-                    # Stop Loss 1: Původní SL pro 50% pozice (quick exit on original SL)
-                    sl1_rounded = round(sl1, price_precision)
-                    sl1_order = client.client.futures_create_order(
-                        symbol=symbol,
-                        side=sl_side,
-                        type='STOP',
-                        stopPrice=sl1_rounded,
-                        price=sl1_rounded,
-                        quantity=half_quantity,
-                        reduceOnly=True,
-                        timeInForce='GTC'
-                    )
-                    logger.info(f"   ✅ Stop Loss 1: {sl1_order['orderId']} @ ${sl1:.6f} (qty: {half_quantity})")
-                    
-                    # Stop Loss 2: Tighter SL pro ZBYLOU půlku (50% těsnější, breakeven style)
-                    sl2_rounded = round(sl2, price_precision)
-                    sl2_order = client.client.futures_create_order(
+                # Entry + SL/TP under the symbol's placement lock - monitoring never
+                # cancels from a snapshot that caught this half way
+                with placement_guard.placing(symbol):
+                    # Execute ONE market order
+                    latency.mark('entry_sent')
+                    order = client.client.futures_create_order(
                         symbol=symbol,
-                        side=sl_side,
-                        type='STOP',
-                        stopPrice=sl2_rounded,
-                        price=sl2_rounded,
-                        quantity=remaining_quantity,
-                        reduceOnly=True,
-                        timeInForce='GTC'
+                        side=side,
+                        type='MARKET',
+                        quantity=total_quantity
                     )
-                    logger.info(f"   ✅ Stop Loss 2: {sl2_order['orderId']} @ ${sl2:.6f} (qty: {remaining_quantity}, tighter)")
+                    latency.mark('entry_acked')
+                    protective_orders = 0
                     
-                    # Take Profit 1: 50% pozice @ 50% TP
-                    tp1_rounded = round(tp1, price_precision)
-                    tp1_order = client.client.futures_create_order(
-                        symbol=symbol,
-                        side=sl_side,
-                        type='TAKE_PROFIT',
-                        stopPrice=tp1_rounded,
-                        price=tp1_rounded,
-                        quantity=half_quantity,
-                        reduceOnly=True,
-                        timeInForce='GTC'
-                    )
-                    logger.info(f"   ✅ Take Profit 1: {tp1_order['orderId']} @ ${tp1:.6f} (qty: {half_quantity})")
-                    
-                    # Take Profit 2: ZBYLÁ půlka @ 100% TP
-                    tp2_rounded = round(tp2, price_precision)
-                    tp2_order = client.client.futures_create_order(
-                        symbol=symbol,
-                        side=sl_side,
-                        type='TAKE_PROFIT',
-                        stopPrice=tp2_rounded,
-                        price=tp2_rounded,
-                        quantity=remaining_quantity,
-                        reduceOnly=True,
-                        timeInForce='GTC'
-                    )
-                    logger.info(f"   ✅ Take Profit 2: {tp2_order['orderId']} @ ${tp2:.6f} (qty: {remaining_quantity})")
+                    logger.info(f"   ✅ Market order placed: {order['orderId']} ({total_quantity} {symbol})")
                     
+                    # FIX #2: Place STOP LOSS and TAKE PROFIT orders on Binance
+                    # Strategy: 2 TP levels + 2 SL levels for scale-out
+                    try:
+                        sl_side = 'SELL' if action == 'LONG' else 'BUY'
+                        
+                        # Calculate quantities: split position into two parts
+                        # Use floor division to ensure we don't exceed total quantity
+                        half_quantity = round(total_quantity / 2, quantity_precision) if quantity_precision else total_quantity / 2
+                        remaining_quantity = total_quantity - half_quantity  # Ensure exact match
+                        
+                        logger.info(f"   📊 Position split: total={total_quantity}, first={half_quantity}, second={remaining_quantity}")
+                        
+                        # Get price precision for the symbol
+                        price_precision = 2  # default
+                        for filter in symbol_info['filters']:
+                            if filter['filterType'] == 'PRICE_FILTER':
+                                tick_size = float(filter['tickSize'])
+                                price_precision = get_quantity_precision(tick_size)
+                                break
+                        
+                        # Stop Loss 1: Původní SL pro 50% pozice (quick exit on original SL)
+                        sl1_rounded = round(sl1, price_precision)
+                        sl1_order = client.client.futures_create_order(
+                            symbol=symbol,
+                            side=sl_side,
+                            type='STOP',
+                            stopPrice=sl1_rounded,
+                            price=sl1_rounded,
+                            quantity=half_quantity,
+                            reduceOnly=True,
+                            timeInForce='GTC'
+                        )
+                        protective_orders += 1
+                        latency.mark('protective_acked')
+                        logger.info(f"   ✅ Stop Loss 1: {sl1_order['orderId']} @ ${sl1:.6f} (qty: {half_quantity})")
+                        
+                        # Stop Loss 2: Tighter SL pro ZBYLOU půlku (50% těsnější, breakeven style)
+                        sl2_rounded = round(sl2, price_precision)
+                        sl2_order = client.client.futures_create_order(
+                            symbol=symbol,
+                            side=sl_side,
+                            type='STOP',
+                            stopPrice=sl2_rounded,
+                            price=sl2_rounded,
+                            quantity=remaining_quantity,
+                            reduceOnly=True,
+                            timeInForce='GTC'
+                        )
+                        protective_orders += 1
+                        latency.mark('protective_acked')
+                        logger.info(f"   ✅ Stop Loss 2: {sl2_order['orderId']} @ ${sl2:.6f} (qty: {remaining_quantity}, tighter)")
+                        
+                        # Take Profit 1: 50% pozice @ 50% TP
+                        tp1_rounded = round(tp1, price_precision)
+                        tp1_order = client.client.futures_create_order(
+                            symbol=symbol,
+                            side=sl_side,
+                            type='TAKE_PROFIT',
+                            stopPrice=tp1_rounded,
+                            price=tp1_rounded,
+                            quantity=half_quantity,
+                            reduceOnly=True,
+                            timeInForce='GTC'
+                        )
+                        protective_orders += 1
+                        latency.mark('protective_acked')
+                        logger.info(f"   ✅ Take Profit 1: {tp1_order['orderId']} @ ${tp1:.6f} (qty: {half_quantity})")
+                        
+                        # Take Profit 2: ZBYLÁ půlka @ 100% TP
+                        tp2_rounded = round(tp2, price_precision)
+                        tp2_order = client.client.futures_create_order(
+                            symbol=symbol,
+                            side=sl_side,
+                            type='TAKE_PROFIT',
+                            stopPrice=tp2_rounded,
+                            price=tp2_rounded,
+                            quantity=remaining_quantity,
+                            reduceOnly=True,
+                            timeInForce='GTC'
+                        )
+                        protective_orders += 1
+                        latency.mark('protective_acked')
+                        logger.info(f"   ✅ Take Profit 2: {tp2_order['orderId']} @ ${tp2:.6f} (qty: {remaining_quantity})")
+                        
+                    except Exception as e:
+                        logger.info(f"   ⚠️  Warning: Failed to place SL/TP orders: {str(e)}")
+                        # Continue anyway - trade is open on Binance
+                
+                # Candle close -> last SL/TP ack (entry ack if protection failed)
+                latency_record = latency.record(
+                    strategy_name, symbol, config.ORDER_LATENCY_SLO_MS,
+                    order_id=order['orderId'], protective_orders=protective_orders
+                )
+                try:
+                    db.log_order_latency(latency_record)
                 except Exception as e:
-                    logger.info(f"   ⚠️  Warning: Failed to place SL/TP orders: {str(e)}")
-                    # Continue anyway - trade is open on Binance
+                    logger.info(f"   ⚠️  Failed to store order latency: {str(e)}")
+                breakdown = ', '.join(
+                    f"{stage[:-3]} {latency_record[stage]:.0f}" for stage in STAGES
+                )
+                logger.info(
+                    f"   ⏱️  Candle close -> orders acked: {latency_record['total_latency_ms'] / 1000:.2f}s "
+                    f"(entry {latency_record['entry_latency_ms'] / 1000:.2f}s) | {breakdown} ms"
+                )
+                if latency_record['slo_breached']:
+                    logger.warning(
+                        f"   🐢 [{strategy_name.upper()}] Order latency SLO breached: "
+                        f"{latency_record['total_latency_ms'] / 1000:.2f}s > {config.ORDER_LATENCY_SLO_MS / 1000:.0f}s"
+                    )
                 
                 # NOTE: Live trades are NOT stored in DB trades table
                 # Binance is the single source of truth for live positions
@@ -561,7 +600,9 @@ def execute_live_trade(state: TradingState, strategy_configs: dict) -> TradingSt
                     'tp1': tp1,
                     'tp2': tp2,
                     'sl1': sl1,
-                    'sl2': sl2
+                    'sl2': sl2,
+                    'latency_ms': latency_record['total_latency_ms'],
+                    'slo_breached': latency_record['slo_breached']
                 })
                 
             except Exception as e:
@@ -6,6 +6,9 @@ This agent runs every minute (independently of trading cycles) to:
 - Cancel orphaned orders to prevent unexpected executions
 - Log monitoring activities
 
+MonitoringService runs the agent on its own long-lived thread and timer queue
+so the trading scheduler never waits on monitoring requests.
+
 Author: DeepTrader
 """
 
@@ -16,9 +19,15 @@ if __name__ == "__main__":
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import logging
+import threading
+import time
 from typing import List, Dict, Optional
 from datetime import datetime
-from utils.binance_client import BinanceClient
+from utils.binance_client import get_binance_client, get_order_placement_guard, request_priority, RequestPriority
+from utils.scheduler import CandleCloseScheduler, ServerClock, Fire
+from utils.account_snapshot import AccountSnapshot
+from utils.trigger_index import TriggerIndex
+from agents.exit_engine import ExitEngine
 import config
 
 logger = logging.getLogger(__name__)
@@ -38,13 +47,54 @@ class MonitoringAgent:
             logger_instance: Optional logger instance to use (defaults to module logger)
             db_instance: Optional database instance for paper trades monitoring
         """
-        self.client = BinanceClient()
+        self.client = get_binance_client()
         self.db = db_instance
         self.last_run = None
         self.run_count = 0
         self.orphaned_orders_cancelled = 0
         self.paper_trades_closed = 0
         self.logger = logger_instance if logger_instance else logger
+        
+        # Open paper trade SL/TP levels, kept in sync by DB trade listeners
+        self.trigger_index = TriggerIndex()
+        if self.db:
+            self.db.add_trade_listener(self.trigger_index)
+        
+        # Optional tick-driven exits (see start_price_stream)
+        self.exit_engine = None
+    
+    def start_price_stream(self, source=None, symbols: Optional[List[str]] = None):
+        """
+        Close paper trades on price ticks instead of waiting for the next pass
+        
+        Args:
+            source: Price stream (default: BinancePriceStream from config)
+            symbols: Symbols to subscribe (default: symbols of active strategies)
+        """
+        if not self.db:
+            self.logger.warning("⚡ [EXIT ENGINE] No database instance - price stream not started")
+            return
+        
+        if source is None:
+            from utils.price_stream import BinancePriceStream
+            if symbols is None:
+                from strategy_config import get_active_strategies
+                symbols = [s.symbol for s in get_active_strategies()]
+            source = BinancePriceStream(
+                symbols,
+                stream=config.PRICE_STREAM_TYPE,
+                record_path=config.PRICE_STREAM_RECORD_PATH
+            )
+        
+        token = self.trigger_index.sync_token()
+        self.trigger_index.sync(self.db.get_open_trades(), token)
+        self.exit_engine = ExitEngine(self.trigger_index, self.close_paper_trade, self.logger)
+        self.exit_engine.start(source)
+    
+    def stop_price_stream(self):
+        """Stop tick-driven exits"""
+        if self.exit_engine:
+            self.exit_engine.stop()
     
     def run(self) -> Dict:
         """
@@ -64,24 +114,72 @@ class MonitoringAgent:
             'tasks': {}
         }
         
-        # Task 1: Check and cancel orphaned orders (BINANCE)
-        orphaned_result = self.check_and_cancel_orphaned_orders()
-        results['tasks']['orphaned_orders'] = orphaned_result
-        
-        # Task 2: Check and fix SL/TP order amounts (BINANCE)
-        amount_result = self.check_and_fix_order_amounts()
-        results['tasks']['order_amounts'] = amount_result
-        
-        # Task 3: Check and close paper trades (DB)
-        if self.db:
-            paper_result = self.check_and_close_paper_trades()
-            results['tasks']['paper_trades'] = paper_result
+        # Monitoring requests queue ahead of analysis/dashboard when weight budget is tight
+        with request_priority(RequestPriority.MONITORING):
+            # One account snapshot shared by the Binance tasks (2 signed requests, consistent view)
+            try:
+                snapshot = AccountSnapshot.fetch(self.client)
+                results['account'] = snapshot.get_summary()
+                self.logger.info(
+                    f"🔍 [MONITORING] Account snapshot: {len(snapshot.positions)} positions, "
+                    f"{len(snapshot.all_orders)} open orders"
+                )
+            except Exception as e:
+                self.logger.error(f"🔍 [MONITORING] ❌ Error fetching account snapshot: {e}")
+                snapshot = None
+                snapshot_error = {'status': 'error', 'error': str(e)}
+            
+            if snapshot:
+                # Task 1: Check and cancel orphaned orders (BINANCE)
+                orphaned_result = self.check_and_cancel_orphaned_orders(snapshot)
+                results['tasks']['orphaned_orders'] = orphaned_result
+                
+                # Task 2: Check and fix SL/TP order amounts (BINANCE)
+                amount_result = self.check_and_fix_order_amounts(snapshot)
+                results['tasks']['order_amounts'] = amount_result
+            else:
+                results['tasks']['orphaned_orders'] = snapshot_error
+                results['tasks']['order_amounts'] = snapshot_error
+            
+            # Task 3: Check and close paper trades (DB)
+            if self.db:
+                paper_result = self.check_and_close_paper_trades()
+                results['tasks']['paper_trades'] = paper_result
         
         self.logger.info(f"🔍 [MONITORING] Cycle #{self.run_count} complete")
         
         return results
     
-    def check_and_cancel_orphaned_orders(self) -> Dict:
+    def _cancel_orders(self, snapshot: AccountSnapshot, symbol: str, orders: List[Dict]) -> Optional[List]:
+        """
+        Batch-cancel orders of one symbol and drop them from the snapshot
+        
+        Only the orders seen in the snapshot are cancelled (by ID) - cancel-all
+        could also hit SL/TP placed for a trade opened after the snapshot.
+        Symbols whose live order placement ran (or is running) since the
+        snapshot are skipped - the snapshot may show a half-placed SL/TP set.
+        
+        Returns:
+            Cancelled order IDs, or None if the symbol was skipped
+        """
+        if not orders:
+            return []
+        with get_order_placement_guard().unchanged_since(symbol, snapshot.placement_versions) as unchanged:
+            if not unchanged:
+                self.logger.info(f"🔍 [MONITORING] ⏭️  {symbol}: live order placement in flight - not cancelling this pass")
+                return None
+            try:
+                result = self.client.cancel_orders(symbol, [order['order_id'] for order in orders])
+            except Exception as e:
+                self.logger.error(f"🔍 [MONITORING] ❌ Error cancelling {len(orders)} orders for {symbol}: {e}")
+                return []
+        
+        for order_id, error in result['failed'].items():
+            self.logger.error(f"🔍 [MONITORING] ❌ Error cancelling order {order_id} for {symbol}: {error}")
+        snapshot.discard_orders(symbol, result['cancelled'])
+        return result['cancelled']
+    
+    def check_and_cancel_orphaned_orders(self, snapshot: AccountSnapshot) -> Dict:
         """
         Check for orphaned orders (orders without corresponding open positions).
         Cancel any orphaned orders found.
@@ -90,14 +188,16 @@ class MonitoringAgent:
         - It's a TP or SL order
         - There's no open position for the same symbol
         
+        Args:
+            snapshot: Account snapshot of this monitoring cycle
+        
         Returns:
             Dict with task results
         """
         try:
             self.logger.info("🔍 [MONITORING] Checking for orphaned orders...")
             
-            # Get all open orders
-            open_orders = self.client.get_open_orders()
+            open_orders = snapshot.all_orders
             
             if not open_orders:
                 self.logger.info("🔍 [MONITORING] ✅ No open orders found")
@@ -110,11 +210,9 @@ class MonitoringAgent:
             
             self.logger.info(f"🔍 [MONITORING] Found {len(open_orders)} open orders")
             
-            # Get all open positions
-            open_positions = self.client.get_open_positions()
-            position_symbols = {pos['symbol'] for pos in open_positions}
+            position_symbols = set(snapshot.position_symbols)
             
-            self.logger.info(f"🔍 [MONITORING] Found {len(open_positions)} open positions: {sorted(position_symbols)}")
+            self.logger.info(f"🔍 [MONITORING] Found {len(position_symbols)} open positions: {sorted(position_symbols)}")
             
             # Find orphaned orders (orders without corresponding positions)
             orphaned_orders = []
@@ -132,21 +230,18 @@ class MonitoringAgent:
             if orphaned_orders:
                 self.logger.info(f"🔍 [MONITORING] ❌ Found {len(orphaned_orders)} orphaned orders, cancelling...")
                 
+                # One batch request per symbol (up to 10 orders each)
+                by_symbol = {}
                 for order in orphaned_orders:
-                    try:
-                        symbol = order['symbol']
-                        order_id = order['order_id']
-                        order_type = order.get('type', '')
-                        
-                        # Cancel the order
-                        self.client.cancel_order(symbol, order_id)
-                        cancelled_count += 1
-                        self.orphaned_orders_cancelled += 1
-                        
-                        self.logger.info(f"🔍 [MONITORING] ✅ Cancelled orphaned order: {symbol} - {order_type} (ID: {order_id})")
-                        
-                    except Exception as e:
-                        self.logger.error(f"🔍 [MONITORING] ❌ Error cancelling order {order_id} for {symbol}: {e}")
+                    by_symbol.setdefault(order['symbol'], []).append(order)
+                
+                for symbol, symbol_orders in by_symbol.items():
+                    cancelled_ids = set(self._cancel_orders(snapshot, symbol, symbol_orders) or [])
+                    cancelled_count += len(cancelled_ids)
+                    self.orphaned_orders_cancelled += len(cancelled_ids)
+                    for order in symbol_orders:
+                        if order['order_id'] in cancelled_ids:
+                            self.logger.info(f"🔍 [MONITORING] ✅ Cancelled orphaned order: {symbol} - {order.get('type', '')} (ID: {order['order_id']})")
             else:
                 self.logger.info("🔍 [MONITORING] ✅ No orphaned orders found")
             
@@ -176,7 +271,7 @@ class MonitoringAgent:
                 'error': str(e)
             }
     
-    def check_and_fix_order_amounts(self) -> Dict:
+    def check_and_fix_order_amounts(self, snapshot: AccountSnapshot) -> Dict:
         """
         Check that SL/TP order amounts match open position size.
         
@@ -185,14 +280,16 @@ class MonitoringAgent:
         - Total TP amount should equal position size
         - Remove excess orders if amounts don't match
         
+        Args:
+            snapshot: Account snapshot of this monitoring cycle
+        
         Returns:
             Dict with task results
         """
         try:
             self.logger.info("🔍 [MONITORING] Checking order amounts vs positions...")
             
-            # Get all open positions
-            open_positions = self.client.get_open_positions()
+            open_positions = snapshot.positions
             
             if not open_positions:
                 self.logger.info("🔍 [MONITORING] ✅ No open positions to check")
@@ -203,9 +300,6 @@ class MonitoringAgent:
                     'orders_cancelled': 0
                 }
             
-            # Get all open orders
-            open_orders = self.client.get_open_orders()
-            
             issues_found = 0
             orders_cancelled = 0
             results_by_symbol = {}
@@ -213,14 +307,20 @@ class MonitoringAgent:
             for position in open_positions:
                 symbol = position['symbol']
                 position_amt = abs(float(position['position_amt']))
+                position_side = position.get('position_side', 'BOTH')
+                # Hedge-mode legs are checked separately against their own orders
+                label = symbol if position_side == 'BOTH' else f"{symbol} {position_side}"
                 
                 if position_amt == 0:
                     continue
                 
-                self.logger.info(f"🔍 [MONITORING] Checking {symbol}: Position size = {position_amt}")
+                self.logger.info(f"🔍 [MONITORING] Checking {label}: Position size = {position_amt}")
                 
-                # Get orders for this symbol
-                symbol_orders = [o for o in open_orders if o['symbol'] == symbol]
+                # Get orders for this position (same leg in hedge mode)
+                symbol_orders = [
+                    o for o in snapshot.orders(symbol)
+                    if o.get('position_side', 'BOTH') == position_side
+                ]
                 
                 # Separate SL and TP orders
                 sl_orders = [o for o in symbol_orders if o.get('type') in ['STOP', 'STOP_MARKET', 'STOP_LOSS', 'STOP_LOSS_MARKET']]
@@ -253,22 +353,25 @@ class MonitoringAgent:
                 if sl_mismatch or tp_mismatch:
                     if sl_mismatch:
                         issue = f"SL amount ({sl_total:.2f}) != position ({position_amt:.2f})"
-                        self.logger.info(f"🔍 [MONITORING] ⚠️  {symbol}: {issue}")
+                        self.logger.info(f"🔍 [MONITORING] ⚠️  {label}: {issue}")
                         symbol_result['issues'].append(issue)
                         issues_found += 1
                     
                     if tp_mismatch:
                         issue = f"TP amount ({tp_total:.2f}) != position ({position_amt:.2f})"
-                        self.logger.info(f"🔍 [MONITORING] ⚠️  {symbol}: {issue}")
+                        self.logger.info(f"🔍 [MONITORING] ⚠️  {label}: {issue}")
                         symbol_result['issues'].append(issue)
                         issues_found += 1
                     
                     # Cancel ALL SL/TP orders (something is wrong with order setup)
-                    self.logger.info(f"🔍 [MONITORING] ❌ Cancelling ALL {len(sl_orders)} SL + {len(tp_orders)} TP orders for {symbol}")
+                    self.logger.info(f"🔍 [MONITORING] ❌ Cancelling ALL {len(sl_orders)} SL + {len(tp_orders)} TP orders for {label}")
                     
+                    cancelled = self._cancel_orders(snapshot, symbol, sl_orders + tp_orders)
+                    if cancelled is None:
+                        symbol_result['skipped'] = 'live order placement in flight'
+                    cancelled_ids = set(cancelled or [])
                     for order in sl_orders + tp_orders:
-                        try:
-                            self.client.cancel_order(symbol, order['order_id'])
+                        if order['order_id'] in cancelled_ids:
                             orders_cancelled += 1
                             symbol_result['cancelled_orders'].append({
                                 'order_id': order['order_id'],
@@ -276,13 +379,11 @@ class MonitoringAgent:
                                 'qty': order.get('quantity')
                             })
                             self.logger.info(f"🔍 [MONITORING] ✅ Cancelled {order.get('type')} order {order['order_id']}")
-                        except Exception as e:
-                            self.logger.error(f"🔍 [MONITORING] ❌ Error cancelling order {order['order_id']}: {e}")
                 
                 if not symbol_result['issues']:
-                    self.logger.info(f"🔍 [MONITORING] ✅ {symbol}: Order amounts OK")
+                    self.logger.info(f"🔍 [MONITORING] ✅ {label}: Order amounts OK")
                 
-                results_by_symbol[symbol] = symbol_result
+                results_by_symbol[label] = symbol_result
             
             if issues_found == 0:
                 self.logger.info("🔍 [MONITORING] ✅ All order amounts match positions")
@@ -320,7 +421,11 @@ class MonitoringAgent:
             }
         
         try:
+            # Reconcile with DB once per pass (trades opened/closed by other processes);
+            # the token keeps trades opened/closed by listeners during the read
+            token = self.trigger_index.sync_token()
             open_trades = self.db.get_open_trades()
+            self.trigger_index.sync(open_trades, token)
             
             if not open_trades:
                 return {
@@ -330,93 +435,30 @@ class MonitoringAgent:
                 }
             
             self.logger.debug(f"🔍 [MONITORING] Checking {len(open_trades)} paper trade(s)")
-            trades_checked = 0
+            trades_checked = len(open_trades)
             trades_closed = 0
             closed_trades_info = []
             
-            for trade in open_trades:
+            # One all-symbols ticker request per pass - cost doesn't grow with open trades
+            prices = self.client.get_all_prices()
+            
+            # Only triggered trades are returned (O(log n + k) per symbol)
+            triggered = []
+            for symbol in self.trigger_index.symbols():
+                current_price = prices.get(symbol)
+                if current_price is None:
+                    self.logger.warning(f"🔍 [MONITORING] No price for {symbol} in snapshot - skipping")
+                    continue
+                triggered.extend(self.trigger_index.check(symbol, current_price))
+            
+            for trade, exit_reason, exit_price in triggered:
                 try:
-                    symbol = trade['symbol']
-                    current_price = self.client.get_current_price(symbol)
-                    
-                    action = trade['action']
-                    stop_loss = trade['stop_loss']
-                    take_profit = trade['take_profit']
-                    
-                    should_close = False
-                    exit_price = None
-                    exit_reason = None
-                    
-                    if action == 'LONG':
-                        if current_price <= stop_loss:
-                            should_close = True
-                            exit_price = stop_loss
-                            exit_reason = 'SL_HIT'
-                        elif current_price >= take_profit:
-                            should_close = True
-                            exit_price = take_profit
-                            exit_reason = 'TP_HIT'
-                    
-                    else:  # SHORT
-                        if current_price >= stop_loss:
-                            should_close = True
-                            exit_price = stop_loss
-                            exit_reason = 'SL_HIT'
-                        elif current_price <= take_profit:
-                            should_close = True
-                            exit_price = take_profit
-                            exit_reason = 'TP_HIT'
-                    
-                    if should_close:
-                        self.db.close_trade(trade['trade_id'], exit_price, exit_reason)
-                        
-                        # Get updated trade from DB with correct P&L (including fees)
-                        import sqlite3
-                        conn = sqlite3.connect(self.db.db_path)
-                        conn.row_factory = sqlite3.Row
-                        cursor = conn.cursor()
-                        cursor.execute('SELECT * FROM trades WHERE trade_id = ?', (trade['trade_id'],))
-                        closed_trade = dict(cursor.fetchone())
-                        conn.close()
-                        
-                        # Use P&L from database (already includes fees deduction)
-                        pnl = closed_trade['pnl']
-                        pnl_pct = closed_trade['pnl_percentage']
-                        total_fees = closed_trade['total_fees']
-                        
-                        # Log trade closure
-                        pnl_sign = '+' if pnl >= 0 else ''
-                        self.logger.info("="*70)
-                        self.logger.info(f"📝 PAPER TRADE CLOSED: {trade['trade_id']}")
-                        self.logger.info(f"  Strategy: {trade['strategy']}")
-                        self.logger.info(f"  Action: {action} @ ${trade['entry_price']}")
-                        self.logger.info(f"  Exit: ${exit_price} ({exit_reason})")
-                        self.logger.info(f"  Fees: ${total_fees:.4f} (entry + exit)")
-                        self.logger.info(f"  P&L: {pnl_sign}${pnl:.2f} ({pnl_sign}{pnl_pct:.2f}%) [after fees]")
-                        
-                        # Show updated stats
-                        stats = self.db.get_trade_stats(symbol)
-                        if stats['closed_trades'] > 0:
-                            self.logger.info(f"  Updated stats: Win rate {stats['win_rate']:.1f}%, Total P&L ${stats['total_pnl']:.2f}")
-                        
-                        self.logger.info("="*70)
-                        
-                        self.paper_trades_closed += 1
+                    closed_info = self.close_paper_trade(trade['trade_id'], exit_price, exit_reason)
+                    if closed_info:
                         trades_closed += 1
-                        
-                        closed_trades_info.append({
-                            'trade_id': trade['trade_id'],
-                            'symbol': symbol,
-                            'strategy': trade['strategy'],
-                            'action': action,
-                            'exit_reason': exit_reason,
-                            'pnl': pnl
-                        })
-                    
-                    trades_checked += 1
-                    
+                        closed_trades_info.append(closed_info)
                 except Exception as e:
-                    self.logger.error(f"🔍 [MONITORING] Error checking trade {trade.get('trade_id', 'unknown')}: {e}")
+                    self.logger.error(f"🔍 [MONITORING] Error closing trade {trade.get('trade_id', 'unknown')}: {e}")
             
             if trades_closed > 0:
                 self.logger.info(f"🔍 [MONITORING] Paper trades: {trades_checked} checked, {trades_closed} closed")
@@ -437,6 +479,68 @@ class MonitoringAgent:
                 'error': str(e)
             }
     
+    def close_paper_trade(self, trade_id: str, exit_price: float, exit_reason: str,
+                          exit_tick: Optional[Dict] = None) -> Optional[Dict]:
+        """
+        Close a triggered paper trade and log the result
+        
+        Args:
+            trade_id: Trade identifier
+            exit_price: SL/TP level that was hit
+            exit_reason: SL_HIT or TP_HIT
+            exit_tick: Price tick that triggered the exit (streaming exits only)
+            
+        Returns:
+            Closed trade info, or None if the trade was already closed elsewhere
+        """
+        if not self.db.close_trade(trade_id, exit_price, exit_reason, exit_tick=exit_tick):
+            self.trigger_index.remove_trade(trade_id)
+            return None
+        
+        # Get updated trade from DB with correct P&L (including fees)
+        import sqlite3
+        conn = sqlite3.connect(self.db.db_path)
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        cursor.execute('SELECT * FROM trades WHERE trade_id = ?', (trade_id,))
+        closed_trade = dict(cursor.fetchone())
+        conn.close()
+        
+        # Use P&L from database (already includes fees deduction)
+        pnl = closed_trade['pnl']
+        pnl_pct = closed_trade['pnl_percentage']
+        total_fees = closed_trade['total_fees']
+        symbol = closed_trade['symbol']
+        action = closed_trade['action']
+        
+        # Log trade closure
+        pnl_sign = '+' if pnl >= 0 else ''
+        self.logger.info("="*70)
+        self.logger.info(f"📝 PAPER TRADE CLOSED: {trade_id}")
+        self.logger.info(f"  Strategy: {closed_trade['strategy']}")
+        self.logger.info(f"  Action: {action} @ ${closed_trade['entry_price']}")
+        self.logger.info(f"  Exit: ${exit_price} ({exit_reason})")
+        self.logger.info(f"  Fees: ${total_fees:.4f} (entry + exit)")
+        self.logger.info(f"  P&L: {pnl_sign}${pnl:.2f} ({pnl_sign}{pnl_pct:.2f}%) [after fees]")
+        
+        # Show updated stats
+        stats = self.db.get_trade_stats(symbol)
+        if stats['closed_trades'] > 0:
+            self.logger.info(f"  Updated stats: Win rate {stats['win_rate']:.1f}%, Total P&L ${stats['total_pnl']:.2f}")
+        
+        self.logger.info("="*70)
+        
+        self.paper_trades_closed += 1
+        
+        return {
+            'trade_id': trade_id,
+            'symbol': symbol,
+            'strategy': closed_trade['strategy'],
+            'action': action,
+            'exit_reason': exit_reason,
+            'pnl': pnl
+        }
+    
     def get_stats(self) -> Dict:
         """
         Get monitoring agent statistics.
@@ -448,8 +552,126 @@ class MonitoringAgent:
             'total_runs': self.run_count,
             'last_run': self.last_run.isoformat() if self.last_run else None,
             'total_orphaned_orders_cancelled': self.orphaned_orders_cancelled,
-            'total_paper_trades_closed': self.paper_trades_closed
+            'total_paper_trades_closed': self.paper_trades_closed,
+            'exit_engine': self.exit_engine.get_stats() if self.exit_engine else None
+        }
+
+
+class MonitoringService:
+    """
+    Long-lived monitoring worker with its own timer queue
+    
+    The agent runs on one persistent daemon thread, so the bot's candle-close
+    scheduler never waits on monitoring's Binance round trips. Runs cannot
+    overlap (single worker); ticks that pass while a slow run is still going
+    are coalesced into one run right after it and counted as skipped.
+    """
+    
+    def __init__(self, agent: MonitoringAgent, interval: float = 60.0,
+                 clock: Optional[ServerClock] = None, logger_instance=None):
+        """
+        Args:
+            agent: Monitoring agent to run
+            interval: Seconds between runs (fixed rate)
+            clock: Clock for the timer queue (default: local clock)
+            logger_instance: Optional logger instance (defaults to the agent's)
+        """
+        self.agent = agent
+        self.interval = interval
+        self.logger = logger_instance or agent.logger
+        self.scheduler = CandleCloseScheduler(clock=clock)
+        self._thread = None
+        self._lock = threading.Lock()
+        self._running_since = None
+        self._stats = {
+            'runs': 0, 'failures': 0, 'consecutive_failures': 0, 'skipped': 0, 'overruns': 0,
+            'last_ms': None, 'total_ms': 0.0, 'max_ms': 0.0,
+            'last_success': None, 'last_error': None
         }
+    
+    def start(self, run_now: bool = True):
+        """
+        Start the worker thread (returns immediately)
+        
+        Args:
+            run_now: First run right away instead of after one interval
+        """
+        if self._thread and self._thread.is_alive():
+            return
+        self.scheduler.add_periodic_job('monitoring', self.interval, self._run_once, run_now=run_now)
+        self._thread = threading.Thread(target=self.scheduler.run, name='monitoring-service', daemon=True)
+        self._thread.start()
+        self.logger.info(f"🔍 [MONITORING] Service started (every {self.interval:g}s)")
+    
+    def stop(self, timeout: float = 10.0):
+        """Stop scheduling runs and wait up to `timeout` seconds for a run in progress"""
+        self.scheduler.stop()
+        if self._thread:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                self.logger.warning(f"🔍 [MONITORING] Run still in progress after {timeout:g}s - not waiting")
+    
+    def _run_once(self, fire: Fire):
+        """Scheduler callback on the worker thread"""
+        with self._lock:
+            self._running_since = time.time()
+            self._stats['skipped'] += fire.missed
+        if fire.missed:
+            self.logger.warning(f"🔍 [MONITORING] Previous run overran - {fire.missed} tick(s) coalesced")
+        
+        started = time.perf_counter()
+        error = None
+        try:
+            self.agent.run()
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            self.logger.error(f"Error in monitoring agent: {e}", exc_info=True)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        
+        with self._lock:
+            stats = self._stats
+            stats['runs'] += 1
+            stats['last_ms'] = elapsed_ms
+            stats['total_ms'] += elapsed_ms
+            stats['max_ms'] = max(stats['max_ms'], elapsed_ms)
+            if error:
+                stats['failures'] += 1
+                stats['consecutive_failures'] += 1
+                stats['last_error'] = error
+            else:
+                stats['consecutive_failures'] = 0
+                stats['last_success'] = datetime.now().isoformat()
+            if elapsed_ms > self.interval * 1000:
+                stats['overruns'] += 1
+            self._running_since = None
+    
+    def next_run_ms(self) -> Optional[float]:
+        """Next scheduled run (ms, service clock)"""
+        return self.scheduler.next_fire_ms('monitoring')
+    
+    def get_stats(self) -> Dict:
+        """
+        Service health counters
+        
+        Returns:
+            Dict with runs, failures, skipped ticks, overruns, durations,
+            current run age and an overall 'healthy' flag
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            running_since = self._running_since
+        alive = bool(self._thread and self._thread.is_alive())
+        running_for = time.time() - running_since if running_since is not None else None
+        stats['avg_ms'] = stats.pop('total_ms') / stats['runs'] if stats['runs'] else 0.0
+        stats['alive'] = alive
+        stats['running_for_seconds'] = running_for
+        # Unhealthy: thread gone, failing repeatedly or stuck in one run
+        stats['healthy'] = (
+            alive
+            and stats['consecutive_failures'] < 3
+            and (running_for is None or running_for < self.interval * 5)
+        )
+        return stats
 
 
 def run_monitoring_cycle() -> Dict:
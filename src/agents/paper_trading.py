@@ -394,6 +394,10 @@ def execute_paper_trade(state: TradingState) -> TradingState:
             conn.commit()
             conn.close()
             
+            # Manual insert bypasses create_trade - keep SL/TP trigger index in sync
+            for tid, tdata in [(trade_id_1, data_1), (trade_id_2, data_2)]:
+                db.notify_trade_opened({**tdata, 'trade_id': tid})
+            
             # LOG SUCCESSFUL EXECUTION
             log_data['executed'] = True
             log_data['execution_reason'] = f"Executed 2 partial trades: {trade_id_1[:30]}, {trade_id_2[:30]}"
@@ -0,0 +1,161 @@
+"""Shared Data Collector - news, BTC and IXIC fetched concurrently under one cycle deadline"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Tuple
+
+from models.state import TradingState
+from agents.news_collector import collect_stock_news
+from agents.btc_collector import collect_btc_data
+from agents.ixic_collector import collect_ixic_data
+from utils.source_cache import mark_stale
+import config
+
+
+class SharedDataCollector:
+    """
+    Runs the shared collectors in parallel and waits at most `deadline` seconds
+
+    Each source is a collector returning {state_key: value}. A source that
+    misses the deadline (or fails) is replaced by its last good value, marked
+    stale with its age; it keeps running in the background and its result
+    becomes the last good value for the next cycle. A source still running from
+    an earlier cycle is not started again, so a hung request (yfinance has no
+    timeout) never piles up threads.
+    """
+
+    def __init__(self, sources: List[Tuple[str, str, Callable]], deadline: float = 5.0,
+                 clock: Callable[[], float] = time.time):
+        """
+        Args:
+            sources: (name, state_key, collector) tuples
+            deadline: Seconds the whole collection may take per cycle
+            clock: Time source in seconds (ages of last good values)
+        """
+        self.sources = sources
+        self.deadline = deadline
+        self.clock = clock
+        self._executor = ThreadPoolExecutor(max_workers=len(sources), thread_name_prefix='shared-data')
+        self._lock = threading.Lock()
+        self._running = {}  # name -> Future still in flight
+        self._last_good = {}  # name -> (value, completed_at)
+        self._stats = {
+            name: {'runs': 0, 'timeouts': 0, 'errors': 0, 'stale_served': 0,
+                   'last_ms': None, 'total_ms': 0.0, 'max_ms': 0.0}
+            for name, _, _ in sources
+        }
+
+    def _run_source(self, name: str, key: str, collector: Callable, state: Dict):
+        """Run one collector and record its latency / last good value"""
+        started = time.perf_counter()
+        try:
+            value = collector(state).get(key)
+        except Exception as e:
+            print(f"❌ [SHARED DATA] {name} failed: {e}")
+            value = None
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        with self._lock:
+            stats = self._stats[name]
+            stats['runs'] += 1
+            stats['last_ms'] = elapsed_ms
+            stats['total_ms'] += elapsed_ms
+            stats['max_ms'] = max(stats['max_ms'], elapsed_ms)
+            if value is None:
+                stats['errors'] += 1
+            else:
+                self._last_good[name] = (value, self.clock())
+            self._running.pop(name, None)
+        return value
+
+    def _stale_value(self, name: str) -> Optional[Dict]:
+        """Last good value marked stale with its age (None if there never was one)"""
+        last = self._last_good.get(name)
+        if last is None:
+            return None
+        value, completed_at = last
+        self._stats[name]['stale_served'] += 1
+        return mark_stale(value, self.clock() - completed_at)
+
+    def collect(self, state: TradingState) -> Dict:
+        """
+        Collect all shared sources for one cycle
+
+        Args:
+            state: Current trading state (collectors get a snapshot)
+
+        Returns:
+            Partial state {state_key: value} for every source
+        """
+        snapshot = dict(state)
+        futures = {}
+        with self._lock:
+            for name, key, collector in self.sources:
+                future = self._running.get(name)
+                if future is None:
+                    future = self._executor.submit(self._run_source, name, key, collector, snapshot)
+                    self._running[name] = future
+                futures[name] = future
+
+        wait(futures.values(), timeout=self.deadline)
+
+        result = {}
+        with self._lock:
+            for name, key, _ in self.sources:
+                future = futures[name]
+                value = future.result() if future.done() else None
+                if not future.done():
+                    self._stats[name]['timeouts'] += 1
+                    print(f"⏱️  [SHARED DATA] {name} missed the {self.deadline:g}s deadline")
+                if value is None:
+                    value = self._stale_value(name)
+                    if value is not None:
+                        print(f"⚠️  [SHARED DATA] {name}: using last good value ({value['stale_age_seconds']}s old)")
+                result[key] = value
+        return result
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """
+        Per-source latency and fallback counters
+
+        Returns:
+            {name: {'runs', 'timeouts', 'errors', 'stale_served', 'last_ms', 'avg_ms', 'max_ms'}}
+        """
+        with self._lock:
+            return {
+                name: {
+                    'runs': stats['runs'],
+                    'timeouts': stats['timeouts'],
+                    'errors': stats['errors'],
+                    'stale_served': stats['stale_served'],
+                    'last_ms': stats['last_ms'],
+                    'avg_ms': stats['total_ms'] / stats['runs'] if stats['runs'] else 0.0,
+                    'max_ms': stats['max_ms']
+                }
+                for name, stats in self._stats.items()
+            }
+
+    def shutdown(self):
+        """Stop accepting work (running collectors are not waited for)"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_shared_data_collector = None
+_shared_data_collector_lock = threading.Lock()
+
+
+def get_shared_data_collector() -> SharedDataCollector:
+    """Get process-wide shared data collector (news, BTC, IXIC)"""
+    global _shared_data_collector
+    with _shared_data_collector_lock:
+        if _shared_data_collector is None:
+            _shared_data_collector = SharedDataCollector([
+                ('news', 'news_data', collect_stock_news),
+                ('btc', 'btc_data', collect_btc_data),
+                ('ixic', 'ixic_data', collect_ixic_data),
+            ], deadline=config.SHARED_DATA_DEADLINE)
+        return _shared_data_collector
@@ -18,15 +18,44 @@ SYMBOL = os.getenv("SYMBOL", "SOLUSDT")
 TIMEFRAME_HIGHER = os.getenv("TIMEFRAME_HIGHER", "1h")  # Trend timeframe
 TIMEFRAME_LOWER = os.getenv("TIMEFRAME_LOWER", "15m")   # Entry timeframe
 CANDLES_LIMIT = int(os.getenv("CANDLES_LIMIT", "100"))
+CANDLE_STORE_ENABLED = os.getenv("CANDLE_STORE_ENABLED", "true").lower() == "true"  # Local kline history in data/candles.db
+CANDLE_WINDOW_CAPACITY = int(os.getenv("CANDLE_WINDOW_CAPACITY", "1000"))  # In-memory candles per series (ring buffer, 0 = off)
+CANDLE_AGGREGATION_ENABLED = os.getenv("CANDLE_AGGREGATION_ENABLED", "true").lower() == "true"  # Build higher timeframes locally
+CANDLE_BASE_INTERVAL = os.getenv("CANDLE_BASE_INTERVAL", "auto")  # Aggregation base (auto = smallest configured timeframe)
+ORDERBOOK_DEPTH = int(os.getenv("ORDERBOOK_DEPTH", "100"))  # Orderbook levels per side (5-1000, 500+ costs more weight)
+ORDERBOOK_STREAM_ENABLED = os.getenv("ORDERBOOK_STREAM_ENABLED", "false").lower() == "true"  # Local books from diff-depth stream
+ORDERBOOK_STREAM_SPEED = os.getenv("ORDERBOOK_STREAM_SPEED", "100ms")  # Diff-depth update speed (100ms, 250ms, 500ms)
+ORDERBOOK_STREAM_RECORD_PATH = os.getenv("ORDERBOOK_STREAM_RECORD_PATH")  # Optional JSONL tape of raw depth messages
+ORDERBOOK_MAX_AGE = float(os.getenv("ORDERBOOK_MAX_AGE", "3.0"))  # Seconds since the last depth event before REST is used instead
 
 # Binance API Configuration (optional for public data)
 BINANCE_API_KEY = os.getenv("BINANCE_API_KEY")
 BINANCE_API_SECRET = os.getenv("BINANCE_API_SECRET")
 BINANCE_DEMO = os.getenv("BINANCE_DEMO", "false").lower() == "true"  # Use testnet if true
+BINANCE_HTTP_POOL_SIZE = int(os.getenv("BINANCE_HTTP_POOL_SIZE", "32"))  # Keep-alive connections per shared client
+BINANCE_ASYNC_MARKET_DATA = os.getenv("BINANCE_ASYNC_MARKET_DATA", "true").lower() == "true"  # Concurrent price/funding/orderbook/klines fetch
+BINANCE_RATE_LIMIT_ENABLED = os.getenv("BINANCE_RATE_LIMIT_ENABLED", "true").lower() == "true"  # Shared request-weight governor
+BINANCE_WEIGHT_LIMIT = int(os.getenv("BINANCE_WEIGHT_LIMIT", "2400"))  # Futures IP request weight per minute
 
 # Bot Configuration
 BOT_ANALYSIS_INTERVAL = int(os.getenv("BOT_ANALYSIS_INTERVAL", "900"))  # 15 min
 BOT_MONITOR_INTERVAL = int(os.getenv("BOT_MONITOR_INTERVAL", "60"))     # 1 min
+SCHEDULER_SETTLE_DELAY = float(os.getenv("SCHEDULER_SETTLE_DELAY", "1.0"))  # Seconds after candle close before a cycle starts
+NEWS_CACHE_TTL = int(os.getenv("NEWS_CACHE_TTL", "900"))  # Seconds cached news stays fresh
+BTC_CACHE_TTL = int(os.getenv("BTC_CACHE_TTL", "60"))  # Seconds cached BTC summary stays fresh (refetched inline once expired)
+IXIC_CACHE_TTL = int(os.getenv("IXIC_CACHE_TTL", "300"))  # Seconds cached IXIC stays fresh while NASDAQ is open
+SOURCE_BREAKER_FAILURES = int(os.getenv("SOURCE_BREAKER_FAILURES", "3"))  # Consecutive failures before a source is paused
+SOURCE_BREAKER_COOLDOWN = int(os.getenv("SOURCE_BREAKER_COOLDOWN", "300"))  # Seconds a failing source is not called
+SHARED_DATA_DEADLINE = float(os.getenv("SHARED_DATA_DEADLINE", "5.0"))  # Seconds news/BTC/IXIC may take per cycle
+CLOCK_SYNC_INTERVAL = int(os.getenv("CLOCK_SYNC_INTERVAL", "3600"))  # Re-measure server time offset every N seconds
+MONITORING_INTERVAL = float(os.getenv("MONITORING_INTERVAL", "60"))  # Seconds between monitoring service runs (own thread)
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "true").lower() == "true"  # Per-stage latency spans and histograms
+TRACE_FILE = os.getenv("TRACE_FILE") or None  # Append every span as JSON lines (unset = off)
+METRICS_EXPORT_PATH = os.getenv("METRICS_EXPORT_PATH") or None  # Prometheus snapshot served at /metrics (default data/metrics.prom)
+ORDER_LATENCY_SLO_MS = float(os.getenv("ORDER_LATENCY_SLO_MS", "30000"))  # Candle close -> last SL/TP ack budget for live orders
+PRICE_STREAM_ENABLED = os.getenv("PRICE_STREAM_ENABLED", "false").lower() == "true"  # Close paper trades on websocket ticks
+PRICE_STREAM_TYPE = os.getenv("PRICE_STREAM_TYPE", "markPrice")  # markPrice (1s) or aggTrade
+PRICE_STREAM_RECORD_PATH = os.getenv("PRICE_STREAM_RECORD_PATH")  # Optional JSONL tape of raw stream messages
 
 # Trading Fees (Binance Futures)
 # Maker: 0.02% (0.0002), Taker: 0.05% (0.0005)
@@ -1,5 +1,7 @@
 """State definition for dynamic multi-strategy trading system"""
-from typing import TypedDict, Optional, Dict, Any
+from collections import ChainMap
+from types import MappingProxyType
+from typing import TypedDict, Optional, Dict, Any, Mapping
 
 
 class TradingState(TypedDict, total=False):
@@ -10,6 +12,7 @@ class TradingState(TypedDict, total=False):
     - market_data_{strategy_name}: Market data for each strategy
     - analysis_{strategy_name}: Analysis results for each strategy
     - recommendation_{strategy_name}: Recommendations for each strategy
+    - timing_{strategy_name}: Stage marks of each strategy (server clock, ms)
     
     Example dynamic keys:
     - market_data_sol, analysis_sol, recommendation_sol
@@ -32,6 +35,43 @@ class TradingState(TypedDict, total=False):
     # Trade execution results
     trade_execution: Optional[Dict]
     
+    # Candle close / clock offset / shared stage marks of the cycle (order latency)
+    cycle_timing: Optional[Dict]
+    
     # NOTE: Strategy-specific fields are added dynamically:
-    # market_data_{strategy}, analysis_{strategy}, recommendation_{strategy}
+    # market_data_{strategy}, analysis_{strategy}, recommendation_{strategy}, timing_{strategy}
+
+
+def freeze_state(state: Dict) -> Mapping:
+    """
+    Read-only snapshot of the shared cycle state (news, BTC, IXIC, ...)
+    
+    Taken once per cycle and passed to every strategy thread by reference -
+    no per-strategy copy. Only the top level is frozen; nested values are
+    shared too and must be treated as read-only.
+    
+    Args:
+        state: Shared state collected for this cycle
+        
+    Returns:
+        MappingProxyType over a shallow copy of state
+    """
+    return MappingProxyType(dict(state))
+
 
+def strategy_state(shared: Mapping, **fields) -> ChainMap:
+    """
+    Per-strategy state layered over the shared snapshot
+    
+    Reads fall through to the shared snapshot; every write (market_data_*,
+    analysis_*, recommendation_*, symbol) lands in the strategy's own small
+    namespace, available as .maps[0].
+    
+    Args:
+        shared: Frozen shared snapshot (freeze_state)
+        **fields: Initial strategy-specific fields (e.g. symbol)
+        
+    Returns:
+        ChainMap(namespace, shared)
+    """
+    return ChainMap(dict(fields), shared)
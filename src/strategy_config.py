@@ -194,6 +194,14 @@ def get_all_intervals():
     return sorted(intervals)
 
 
+def get_all_timeframes():
+    """Get list of all candle timeframes used by active strategies"""
+    timeframes = set()
+    for s in get_active_strategies():
+        timeframes.update([s.timeframe_higher, s.timeframe_lower])
+    return sorted(timeframes)
+
+
 def get_min_interval():
     """Get shortest interval (for main bot loop)"""
     intervals = get_all_intervals()
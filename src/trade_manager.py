@@ -5,7 +5,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from utils.database import TradingDatabase
-from utils.binance_client import BinanceClient
+from utils.binance_client import get_binance_client
 from datetime import datetime
 from openai import OpenAI
 import config
@@ -187,7 +187,7 @@ def audit_trades(db: TradingDatabase, symbol: str = None, limit: int = 10):
     
     print(f"Auditing last {len(trades)} closed trades...\n")
     
-    client = BinanceClient()
+    client = get_binance_client()
     audit_results = []
     
     for trade in trades:
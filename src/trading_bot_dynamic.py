@@ -4,24 +4,35 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from models.state import TradingState
-from agents.data_collector_generic import collect_market_data_generic
+from models.state import TradingState, freeze_state, strategy_state
+from agents.data_collector_generic import collect_market_data_generic, collect_market_data_bundles, get_market_data_key
 from agents.decision_generic import make_decision_generic
-from agents.news_collector import collect_stock_news
-from agents.btc_collector import collect_btc_data
-from agents.ixic_collector import collect_ixic_data
+from agents.btc_collector import BTC_TIMEFRAMES
+from agents.shared_data import get_shared_data_collector
 from agents.paper_trading import execute_paper_trade
 from agents.live_trading import execute_live_trade
-from agents.monitoring import MonitoringAgent
+from agents.monitoring import MonitoringAgent, MonitoringService
 from utils.database import TradingDatabase
-from utils.binance_client import BinanceClient
-from strategy_config import get_active_strategies, get_all_intervals, get_min_interval, get_strategies_by_interval
+from utils.binance_client import (
+    get_binance_client, get_client_registry_stats, get_rate_limit_governor,
+    request_priority, RequestPriority
+)
+from utils.indicators import get_feature_cache
+from utils.order_book import start_order_book_manager, stop_order_book_manager, get_order_book_manager
+from utils.candle_aggregator import resolve_base_interval, set_base_interval
+from utils.candle_store import get_candle_store
+from utils.scheduler import CandleCloseScheduler, Fire, get_server_clock
+from utils.source_cache import get_source_cache
+from utils.tracing import span, get_tracer, default_metrics_path
+from strategy_config import (
+    get_active_strategies, get_all_intervals, get_all_timeframes, get_min_interval, get_strategies_by_interval
+)
 import config
 from datetime import datetime, timedelta
 import time
+import contextvars
 import signal
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from copy import deepcopy
 import json
 import logging
 from logging.handlers import RotatingFileHandler
@@ -34,7 +45,7 @@ class DynamicTradingBot:
         """Initialize dynamic trading bot"""
         self.running = True
         self.db = TradingDatabase()
-        self.binance_client = BinanceClient()
+        self.binance_client = get_binance_client()
         
         # Load active strategies from config
         self.strategies = get_active_strategies()
@@ -43,18 +54,48 @@ class DynamicTradingBot:
         
         # Track last run time for each interval
         self.last_run_time = {interval: 0 for interval in self.all_intervals}
-        self.last_run_minute = {interval: -1 for interval in self.all_intervals}  # Track UTC minute
-        self.last_monitoring_agent_time = 0  # Track monitoring agent runs (every 60s)
+        
+        # Timer queue: strategy intervals fire at candle close (Binance server time)
+        self.scheduler = CandleCloseScheduler(
+            get_server_clock(self.binance_client.get_server_time),
+            settle_delay=config.SCHEDULER_SETTLE_DELAY
+        )
         
         # Setup logging first
         self.setup_logging()
         
+        # One base candle series per symbol - higher timeframes are aggregated locally
+        if config.CANDLE_AGGREGATION_ENABLED:
+            base_interval = resolve_base_interval(get_all_timeframes() + BTC_TIMEFRAMES, config.CANDLE_BASE_INTERVAL)
+            set_base_interval(base_interval)
+            self.logger.info(f"Candle aggregation: higher timeframes built from {base_interval} candles")
+        
         # Monitoring agent (runs independently every minute) - pass bot's logger and DB
         self.monitoring_agent = MonitoringAgent(
             logger_instance=self.logger,
             db_instance=self.db
         )
-        self.monitoring_agent_interval = 60  # Run every 60 seconds
+        self.monitoring_agent_interval = config.MONITORING_INTERVAL
+        # Own worker thread and timer queue - the candle-close scheduler never waits on it
+        self.monitoring_service = MonitoringService(
+            self.monitoring_agent,
+            interval=self.monitoring_agent_interval,
+            logger_instance=self.logger
+        )
+        
+        # Tick-driven paper trade exits (monitoring pass stays as a fallback)
+        if config.PRICE_STREAM_ENABLED:
+            try:
+                self.monitoring_agent.start_price_stream()
+            except Exception as e:
+                self.logger.error(f"Failed to start price stream: {e}")
+        
+        # Local order books from the diff-depth stream (get_orderbook reads them)
+        if config.ORDERBOOK_STREAM_ENABLED:
+            try:
+                start_order_book_manager([s.symbol for s in self.strategies], max_levels=1000)
+            except Exception as e:
+                self.logger.error(f"Failed to start order book stream: {e}")
         
         # Counters
         self.analysis_counts = {s.name: 0 for s in self.strategies}
@@ -147,6 +188,96 @@ class DynamicTradingBot:
         self.logger.warning("Shutdown signal received. Stopping bot gracefully...")
         print(f"\n\n⏹️  Shutdown signal received. Stopping bot gracefully...")
         self.running = False
+        self.scheduler.stop()
+    
+    def sync_server_clock(self):
+        """Re-measure the local clock offset from Binance server time (scheduler marks use it)"""
+        clock = self.scheduler.clock
+        try:
+            offset_ms = clock.sync()
+            self.logger.info(f"Server clock offset: {offset_ms:+.0f} ms (round trip {clock.round_trip_ms:.0f} ms)")
+        except Exception as e:
+            self.logger.warning(f"Server time sync failed, keeping offset {clock.offset_ms:+.0f} ms: {e}")
+    
+    def on_candle_close(self, interval_minutes: int, fire: Fire):
+        """
+        Scheduler callback - run the strategies of one interval after its candle closed
+        
+        Args:
+            interval_minutes: Strategy interval
+            fire: Scheduled mark and how late the run started
+        """
+        close_time = datetime.utcfromtimestamp(fire.mark_ms / 1000)
+        self.logger.info(
+            f"{interval_minutes}min candle closed at {close_time.strftime('%H:%M:%S')} UTC | "
+            f"cycle started {fire.lateness_ms / 1000 + config.SCHEDULER_SETTLE_DELAY:.2f}s after close "
+            f"({fire.lateness_ms:+.0f} ms vs schedule)"
+        )
+        if fire.missed:
+            self.logger.warning(
+                f"{interval_minutes}min: previous run overran {fire.missed} candle close(s) - "
+                f"running once for the latest"
+            )
+        with span('cycle', interval=f"{interval_minutes}m"):
+            self.run_analysis_interval(interval_minutes, candle_close_ms=fire.mark_ms)
+        self.export_metrics()
+    
+    def export_metrics(self):
+        """Write the stage latency summaries for the web API /metrics endpoint"""
+        tracer = get_tracer()
+        if not tracer.enabled:
+            return
+        try:
+            path = default_metrics_path()
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tracer.export_prometheus(path)
+        except OSError as e:
+            self.logger.warning(f"Metrics export failed: {e}")
+    
+    def print_status(self, fire: Fire):
+        """Scheduler callback - one-line status with the next deadlines and fire lateness"""
+        stats = self.scheduler.get_stats()
+        now_ms = self.scheduler.clock.now_ms()
+        next_runs = []
+        for interval_minutes in self.all_intervals:
+            job = stats[f"{interval_minutes}min"]
+            next_fire = datetime.utcfromtimestamp(job['next_fire_ms'] / 1000)
+            strat_names = ', '.join(s.name for s in get_strategies_by_interval(interval_minutes))
+            lateness = f", last {job['last_lateness_ms']:+.0f} ms" if job['last_lateness_ms'] is not None else ""
+            next_runs.append(
+                f"{strat_names} at {next_fire.strftime('%H:%M:%S')} UTC "
+                f"({(job['next_fire_ms'] - now_ms) / 1000:.0f}s{lateness})"
+            )
+        monitoring = self.monitoring_service.get_stats()
+        next_monitoring_ms = self.monitoring_service.next_run_ms()
+        if monitoring['running_for_seconds'] is not None:
+            monitoring_status = f"running {monitoring['running_for_seconds']:.0f}s"
+        elif next_monitoring_ms is not None:
+            monitoring_status = f"{(next_monitoring_ms - time.time() * 1000) / 1000:.0f}s"
+        else:
+            monitoring_status = "stopped"
+        if not monitoring['healthy']:
+            monitoring_status += " ⚠️ UNHEALTHY"
+        
+        status_msg = f"Next: {' | '.join(next_runs)} | Monitoring: {monitoring_status}"
+        print(f"⏰ [{datetime.now().strftime('%H:%M:%S')} local / {datetime.utcnow().strftime('%H:%M:%S')} UTC] {status_msg}")
+        
+        # Log every hour
+        if stats['status']['fires'] % 60 == 0:
+            total_analyses = sum(self.analysis_counts.values())
+            self.logger.info(f"Heartbeat: Total analyses: {total_analyses}, "
+                           f"Trades created: {self.trades_created}, Trades closed: {self.trades_closed}")
+            self.logger.info(
+                f"Monitoring service: {monitoring['runs']} runs ({monitoring['failures']} failed, "
+                f"{monitoring['skipped']} ticks skipped, {monitoring['overruns']} overruns) | "
+                f"avg {monitoring['avg_ms']:.0f} ms, max {monitoring['max_ms']:.0f} ms"
+            )
+        if not monitoring['healthy']:
+            self.logger.warning(
+                f"Monitoring service unhealthy: alive={monitoring['alive']}, "
+                f"{monitoring['consecutive_failures']} consecutive failures, "
+                f"last error: {monitoring['last_error']}"
+            )
     
     def collect_shared_data(self, state: TradingState) -> TradingState:
         """Collect shared data (news, BTC, IXIC) - run once per cycle"""
@@ -154,15 +285,31 @@ class DynamicTradingBot:
             # Ensure symbol is preserved
             symbol = state.get('symbol', config.SYMBOL)
             
-            # Merge shared data into state (collectors return partial dicts)
-            state.update(collect_stock_news(state))
-            state.update(collect_btc_data(state))
-            state.update(collect_ixic_data(state))
+            # Collectors run concurrently under one deadline; late sources fall back
+            # to their last good value (marked stale) instead of delaying the cycle
+            collector = get_shared_data_collector()
+            with span('shared_data'):
+                shared = collector.collect(state)
+            state.update(shared)
+            
+            stats = collector.get_stats()
+            latencies = []
+            for name, key, _ in collector.sources:
+                value = shared.get(key)
+                if isinstance(value, dict) and value.get('stale'):
+                    latencies.append(f"{name} stale ({value['stale_age_seconds']}s old)")
+                elif stats[name]['last_ms'] is not None:
+                    latencies.append(f"{name} {stats[name]['last_ms']:.0f}ms")
+                else:
+                    latencies.append(f"{name} pending")
+            self.logger.info(f"Shared data: {' | '.join(latencies)}")
             
-            # DEBUG: Check if btc_data is in state
-            print(f"   [DEBUG] After shared data collection:")
-            print(f"   - btc_data in state: {'btc_data' in state}")
-            print(f"   - btc_data value: {state.get('btc_data', 'MISSING')}")
+            for name, source_stats in get_source_cache().get_stats().items():
+                if source_stats['circuit'] != 'closed':
+                    self.logger.warning(
+                        f"Source {name}: circuit {source_stats['circuit']} after "
+                        f"{source_stats['failures']} failures - serving cached data"
+                    )
             
             # Restore symbol if it was lost
             if 'symbol' not in state:
@@ -171,10 +318,21 @@ class DynamicTradingBot:
             self.logger.error(f"Error collecting shared data: {e}")
         return state
     
-    def run_strategy(self, strategy, state: TradingState) -> TradingState:
-        """Run a single strategy: data -> analysis -> decision"""
+    def run_strategy(self, strategy, state: TradingState, market_data=None) -> TradingState:
+        """
+        Run a single strategy: data -> analysis -> decision
+        
+        Args:
+            strategy: StrategyConfig to run
+            state: Trading state for this strategy
+            market_data: Optional shared market data bundle (fetched once per cycle)
+        """
         try:
             self.analysis_counts[strategy.name] += 1
+            # Stage marks on the server clock (live orders measure candle-close-to-order latency)
+            now_ms = self.scheduler.clock.now_ms
+            timing = {'started_ms': now_ms()}
+            state[f"timing_{strategy.name}"] = timing
             
             print(f"\n📊 Running {strategy.name.upper()} strategy ({strategy.timeframe_higher}/{strategy.timeframe_lower})...")
             self.logger.info(f"Running {strategy.name} strategy (TF: {strategy.timeframe_higher}/{strategy.timeframe_lower})")
@@ -185,27 +343,34 @@ class DynamicTradingBot:
                 self.logger.warning(f"Symbol was missing in state for {strategy.name}, added {config.SYMBOL}")
             
             # 1. Collect market data for this strategy's timeframes
-            state = collect_market_data_generic(
-                state, 
-                strategy.name,
-                strategy.timeframe_higher,
-                strategy.timeframe_lower
-            )
+            with span('market_data'):
+                state = collect_market_data_generic(
+                    state, 
+                    strategy.name,
+                    strategy.timeframe_higher,
+                    strategy.timeframe_lower,
+                    market_data=market_data
+                )
+            timing['market_data_done_ms'] = now_ms()
             
             # 2. Analyze market data (using strategy-specific analysis function)
-            state = strategy.analysis_func(
-                state,
-                strategy.name,
-                strategy.timeframe_higher,
-                strategy.timeframe_lower
-            )
+            with span('analysis'):
+                state = strategy.analysis_func(
+                    state,
+                    strategy.name,
+                    strategy.timeframe_higher,
+                    strategy.timeframe_lower
+                )
+            timing['analysis_done_ms'] = now_ms()
             
-            # 3. Make trading decision
-            state = make_decision_generic(
-                state,
-                strategy.name,
-                strategy.decision_func
-            )
+            # 3. Make trading decision (the LLM call inside is its own 'llm' span)
+            with span('decision'):
+                state = make_decision_generic(
+                    state,
+                    strategy.name,
+                    strategy.decision_func
+                )
+            timing['decided_ms'] = now_ms()
             
             # Log result
             rec_key = f"recommendation_{strategy.name}"
@@ -232,31 +397,32 @@ class DynamicTradingBot:
         
         return state
     
-    def run_strategy_wrapper(self, strategy, base_state):
+    def run_strategy_wrapper(self, strategy, base_state, market_data=None):
         """
         Wrapper for run_strategy that returns strategy-specific data only
         Used for parallel execution with ThreadPoolExecutor
         """
-        # Each thread gets its own copy of base state
-        thread_state = deepcopy(base_state)
+        # Strategy writes land in its own namespace over the frozen shared snapshot
+        # (no copy of base state per thread). Strategy-specific symbol: Fáze 2 multi-symbol support
+        thread_state = strategy_state(base_state, symbol=strategy.symbol)
         
-        # Set strategy-specific symbol (Fáze 2: multi-symbol support)
-        thread_state['symbol'] = strategy.symbol
-        
-        # Run strategy (modifies thread_state)
-        result_state = self.run_strategy(strategy, thread_state)
+        # Run strategy (writes into thread_state.maps[0]); child spans carry the strategy label
+        with span('strategy', strategy=strategy.name):
+            self.run_strategy(strategy, thread_state, market_data=market_data)
+        namespace = thread_state.maps[0]
         
         # Return only strategy-specific keys (not shared data like news, btc)
         strategy_keys = [
             f'market_data_{strategy.name}',
             f'analysis_{strategy.name}',
-            f'recommendation_{strategy.name}'
+            f'recommendation_{strategy.name}',
+            f'timing_{strategy.name}'
         ]
         
         strategy_result = {
             'strategy_name': strategy.name,
             'symbol': strategy.symbol,  # Include symbol for multi-symbol support
-            'data': {key: result_state.get(key) for key in strategy_keys if key in result_state}
+            'data': {key: namespace[key] for key in strategy_keys if key in namespace}
         }
         
         # IMPORTANT: Add symbol to recommendation so paper_trading knows which symbol to trade
@@ -266,8 +432,15 @@ class DynamicTradingBot:
         
         return strategy_result
     
-    def run_analysis_interval(self, interval_minutes: int):
-        """Run all strategies scheduled for this interval (PARALLEL execution)"""
+    def run_analysis_interval(self, interval_minutes: int, candle_close_ms: float = None):
+        """
+        Run all strategies scheduled for this interval (PARALLEL execution)
+        
+        Args:
+            interval_minutes: Strategy interval
+            candle_close_ms: Server time of the candle close that triggered the cycle
+                             (start of the candle-close-to-order latency)
+        """
         strategies = get_strategies_by_interval(interval_minutes)
         
         if not strategies:
@@ -275,6 +448,13 @@ class DynamicTradingBot:
         
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         start_time = time.time()
+        clock = self.scheduler.clock
+        cycle_timing = {
+            'interval_minutes': interval_minutes,
+            'candle_close_ms': candle_close_ms,
+            'clock_offset_ms': clock.offset_ms,
+            'cycle_start_ms': clock.now_ms()
+        }
         
         self.logger.info("="*70)
         self.logger.info(f"ANALYSIS CYCLE - {interval_minutes} min interval - {timestamp}")
@@ -295,7 +475,17 @@ class DynamicTradingBot:
             
             # Collect shared data once (news, BTC, IXIC)
             print(f"\n📰 Collecting shared data (news, BTC, IXIC)...")
-            base_state = self.collect_shared_data(initial_state)
+            # Frozen once per cycle - strategy threads share it by reference
+            base_state = freeze_state(self.collect_shared_data(initial_state))
+            cycle_timing['shared_data_done_ms'] = clock.now_ms()
+            
+            # Fetch market data once per unique (symbol, timeframes) bundle
+            # e.g. sol + sol_fast share one SOLUSDT 1h/15m download
+            print(f"\n📦 Collecting market data bundles...")
+            with span('market_data_bundles'):
+                market_bundles = collect_market_data_bundles(strategies)
+            cycle_timing['market_bundles_done_ms'] = clock.now_ms()
+            self.logger.info(f"Market data: {len(market_bundles)} unique bundle(s) for {len(strategies)} strategies")
             
             # Run strategies in PARALLEL using ThreadPoolExecutor
             print(f"\n⚡ Running strategies in parallel threads...")
@@ -303,8 +493,15 @@ class DynamicTradingBot:
             
             with ThreadPoolExecutor(max_workers=len(strategies)) as executor:
                 # Submit all strategy runs to thread pool
+                # Each thread runs in a copy of this context so its spans nest under the cycle
                 future_to_strategy = {
-                    executor.submit(self.run_strategy_wrapper, strategy, base_state): strategy 
+                    executor.submit(
+                        contextvars.copy_context().run,
+                        self.run_strategy_wrapper,
+                        strategy,
+                        base_state,
+                        market_bundles.get(get_market_data_key(strategy))
+                    ): strategy
                     for strategy in strategies
                 }
                 
@@ -319,10 +516,11 @@ class DynamicTradingBot:
                         self.logger.error(f"Strategy {strategy.name} generated exception: {exc}", exc_info=True)
                         print(f"   ✗ {strategy.name.upper()} failed: {exc}")
             
-            # Merge all strategy results into final state
-            state = deepcopy(base_state)
+            # Merge: shared snapshot | each strategy's namespace
+            state = dict(base_state)
             for result in strategy_results:
-                state.update(result['data'])
+                state |= result['data']
+            state['cycle_timing'] = cycle_timing
             
             elapsed = time.time() - start_time
             print(f"\n⚡ All strategies completed in {elapsed:.2f}s (parallel execution)")
@@ -356,13 +554,16 @@ class DynamicTradingBot:
             
             # PAPER TRADING - Always runs for ALL strategies (for comparison)
             self.logger.info(f"\n📝 Executing Paper Trading for ALL {len(strategies)} strategies: {', '.join(s.name for s in strategies)}")
-            state = execute_paper_trade(state)
+            with span('paper_trade'):
+                state = execute_paper_trade(state)
             
             # LIVE TRADING - Only for strategies with live_trading=True
             if live_strategies:
                 demo_str = "DEMO/TESTNET" if config.BINANCE_DEMO else "REAL ACCOUNT"
                 self.logger.info(f"\n🔴 Executing Live Trading for {len(live_strategies)} strategies ({demo_str}): {', '.join(s.name for s in live_strategies)}")
-                state = execute_live_trade(state, strategy_configs)
+                # Account checks + order placement go ahead of all queued requests
+                with request_priority(RequestPriority.ORDER), span('live_trade'):
+                    state = execute_live_trade(state, strategy_configs)
             else:
                 self.logger.info(f"\n🔴 No Live Trading strategies enabled")
             
@@ -385,11 +586,59 @@ class DynamicTradingBot:
                     
                     self.logger.info(f"   [{trade_info['strategy'].upper()}] {trade_id} - {trade_info.get('action', 'N/A')}{binance_info}")
                 self.trades_created += len(trades)
+                
+                # Candle-close-to-order SLO (live orders only)
+                breached = [t for t in trades if t.get('slo_breached')]
+                if breached:
+                    self.logger.warning(
+                        f"⏱️  Cycle breached the {config.ORDER_LATENCY_SLO_MS / 1000:.0f}s order latency SLO: "
+                        + ', '.join(f"{t['strategy']} {t['latency_ms'] / 1000:.2f}s" for t in breached)
+                    )
             else:
                 self.logger.info("\nℹ️  No trades executed (all NEUTRAL)")
             
             self.logger.info(f"\n{'='*70}\n")
             
+            # Shared client / keep-alive pool usage
+            pool_stats = get_client_registry_stats()
+            self.logger.info(
+                f"Binance clients: {pool_stats['clients']} shared ({pool_stats['clients_reused']} reuses) | "
+                f"HTTP connections: {pool_stats['connections_opened']} opened, "
+                f"{pool_stats['connections_reused']} reused"
+            )
+            if config.BINANCE_RATE_LIMIT_ENABLED:
+                weight_stats = get_rate_limit_governor().get_stats()
+                self.logger.info(
+                    f"Binance weight: {weight_stats['used_weight']}/{weight_stats['weight_limit']} used this minute | "
+                    f"{weight_stats['queued']} queued ({weight_stats['wait_seconds']:.1f}s waited) | "
+                    f"429: {weight_stats['rate_limited']}, 418: {weight_stats['banned']}"
+                )
+            
+            # Indicator features shared between strategies on the same candles
+            feature_stats = get_feature_cache().take_cycle_stats()
+            self.logger.info(
+                f"Feature cache: {feature_stats['hits']} hits / {feature_stats['misses']} misses "
+                f"({feature_stats['hit_rate']:.0f}% reused)"
+            )
+            
+            if config.CANDLE_STORE_ENABLED:
+                window_stats = get_candle_store().get_window_stats()
+                if window_stats:
+                    self.logger.info(
+                        f"Candle windows: {window_stats['series']} series / {window_stats['symbols']} symbols | "
+                        f"{window_stats['bytes'] / 1024:.0f} KB ({window_stats['bytes_per_symbol'] / 1024:.0f} KB per symbol) | "
+                        f"{window_stats['hits']} hits / {window_stats['misses']} SQLite loads"
+                    )
+            
+            book_manager = get_order_book_manager()
+            if book_manager:
+                book_stats = book_manager.get_stats()
+                synced = [symbol for symbol, stats in book_stats.items() if stats['synced']]
+                self.logger.info(
+                    f"Local order books: {len(synced)}/{len(book_stats)} synced | "
+                    f"{sum(stats['resyncs'] for stats in book_stats.values())} resyncs"
+                )
+            
             self.last_run_time[interval_minutes] = time.time()
             self.logger.info(f"Analysis cycle complete for {interval_minutes}min interval")
             
@@ -399,23 +648,6 @@ class DynamicTradingBot:
             import traceback
             traceback.print_exc()
     
-    def run_monitoring_agent_async(self):
-        """
-        Run monitoring agent in a separate thread (non-blocking).
-        This allows the agent to run every minute without blocking the main trading cycle.
-        """
-        def _run_agent():
-            try:
-                self.monitoring_agent.run()
-            except Exception as e:
-                self.logger.error(f"Error in monitoring agent: {e}")
-                import traceback
-                traceback.print_exc()
-        
-        # Submit to thread pool for async execution
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(_run_agent)
-    
     def run(self):
         """Main bot loop with dynamic strategy scheduling"""
         self.logger.info("="*70)
@@ -435,7 +667,7 @@ class DynamicTradingBot:
         print(f"\n📋 Active Strategies ({len(self.strategies)}):")
         for s in self.strategies:
             print(f"  • {s.name.upper()}: {s.timeframe_higher}/{s.timeframe_lower} → Every {s.interval_minutes} min")
-        print(f"\n⏱️  Scheduling (CRON-style - UTC time, synced with Binance candles):")
+        print(f"\n⏱️  Scheduling (candle close + {config.SCHEDULER_SETTLE_DELAY:.1f}s, Binance server time):")
         for interval in self.all_intervals:
             strats = get_strategies_by_interval(interval)
             if interval == 5:
@@ -471,6 +703,9 @@ class DynamicTradingBot:
         print(f"📁 Logs: logs/trading_bot.log")
         print(f"{'='*70}\n")
         
+        # Monitoring runs on its own thread from the start (first pass right away)
+        self.monitoring_service.start(run_now=True)
+        
         # Run initial analysis for all strategies (good for testing)
         print(f"🚀 Running initial analysis for all strategies...\n")
         self.logger.info("Running initial analysis for all strategies...")
@@ -480,101 +715,36 @@ class DynamicTradingBot:
         print(f"\n✅ Initial analysis complete!")
         print(f"📊 Now waiting for CRON schedule...\n")
         
+        # Candle-close jobs: each interval fires at UTC close + settle delay (exchange clock)
+        self.sync_server_clock()
+        for interval in self.all_intervals:
+            self.scheduler.add_candle_job(
+                f"{interval}min", interval, lambda fire, interval=interval: self.on_candle_close(interval, fire)
+            )
+        self.scheduler.add_periodic_job('clock_sync', config.CLOCK_SYNC_INTERVAL, lambda fire: self.sync_server_clock())
+        self.scheduler.add_periodic_job('status', 60, self.print_status)
+        
         # Show when next runs will happen
-        now_utc = datetime.utcnow()
         for interval in self.all_intervals:
-            current_minute_utc = now_utc.minute
-            minutes_to_next = interval - (current_minute_utc % interval)
-            if minutes_to_next == 0:
-                minutes_to_next = interval
-            next_minute = (current_minute_utc + minutes_to_next) % 60
-            next_hour = now_utc.hour if (current_minute_utc + minutes_to_next) < 60 else (now_utc.hour + 1) % 24
+            next_fire = datetime.utcfromtimestamp(self.scheduler.next_fire_ms(f"{interval}min") / 1000)
             strats = get_strategies_by_interval(interval)
-            print(f"  • {', '.join(s.name for s in strats)}: Next CRON run at {next_hour:02d}:{next_minute:02d} UTC")
+            print(f"  • {', '.join(s.name for s in strats)}: Next CRON run at {next_fire.strftime('%H:%M:%S')} UTC")
         print()
         
-        # Main loop
-        cycle = 0
-        while self.running:
-            try:
-                cycle += 1
-                current_time = time.time()
-                now = datetime.now()
-                
-                # Check each interval to see if it's time to run (CRON-STYLE with UTC)
-                for interval_minutes in self.all_intervals:
-                    # Use UTC time (Binance candles are in UTC)
-                    now_utc = datetime.utcnow()
-                    current_minute_utc = now_utc.minute
-                    
-                    # CRON-STYLE: Check if we're at the right UTC time mark
-                    # For 5min: run at XX:00, XX:05, XX:10, XX:15, XX:20, XX:25, etc.
-                    # For 15min: run at XX:00, XX:15, XX:30, XX:45
-                    is_time_mark = (current_minute_utc % interval_minutes == 0)
-                    
-                    # Check if we haven't already run this UTC minute
-                    is_new_minute = (current_minute_utc != self.last_run_minute[interval_minutes])
-                    
-                    # Run if we're at time mark AND it's a new minute (haven't run yet)
-                    should_run = is_time_mark and is_new_minute
-                    
-                    if should_run:
-                        self.run_analysis_interval(interval_minutes)
-                        self.last_run_minute[interval_minutes] = current_minute_utc
-                
-                # Check if time to run monitoring agent (every 60 seconds, async)
-                # MonitoringAgent handles: orphaned orders, order amounts, AND paper trades
-                time_since_monitoring_agent = current_time - self.last_monitoring_agent_time
-                if time_since_monitoring_agent >= self.monitoring_agent_interval:
-                    self.run_monitoring_agent_async()
-                    self.last_monitoring_agent_time = current_time
-                
-                # Status update every 10 cycles
-                if cycle % 10 == 0:
-                    now_utc = datetime.utcnow()
-                    next_runs = []
-                    for interval_minutes in self.all_intervals:
-                        current_minute_utc = now_utc.minute
-                        current_second_utc = now_utc.second
-                        
-                        # Calculate next UTC cron time
-                        minutes_to_next = interval_minutes - (current_minute_utc % interval_minutes)
-                        if minutes_to_next == 0 and current_second_utc > 0:
-                            minutes_to_next = interval_minutes
-                        seconds_to_next = (minutes_to_next * 60) - current_second_utc
-                        
-                        next_minute = (current_minute_utc + minutes_to_next) % 60
-                        
-                        strats = get_strategies_by_interval(interval_minutes)
-                        strat_names = ', '.join(s.name for s in strats)
-                        next_runs.append(f"{strat_names} at {now_utc.hour:02d}:{next_minute:02d} UTC ({seconds_to_next}s)")
-                    
-                    time_since_monitoring_agent = current_time - self.last_monitoring_agent_time
-                    next_monitoring = int(self.monitoring_agent_interval - time_since_monitoring_agent)
-                    
-                    status_msg = f"Bot cycle {cycle} | Next: {' | '.join(next_runs)} | Monitoring: {next_monitoring}s"
-                    print(f"⏰ [{datetime.now().strftime('%H:%M:%S')} local / {datetime.utcnow().strftime('%H:%M:%S')} UTC] {status_msg}")
-                    
-                    # Log every hour
-                    if cycle % 720 == 0:  # Every hour (720 * 5s = 3600s)
-                        total_analyses = sum(self.analysis_counts.values())
-                        self.logger.info(f"Heartbeat: Cycle {cycle}, Total analyses: {total_analyses}, "
-                                       f"Trades created: {self.trades_created}, Trades closed: {self.trades_closed}")
-                
-                # Sleep short interval
-                time.sleep(5)
-                
-            except KeyboardInterrupt:
-                break
-            except Exception as e:
-                self.logger.error(f"Error in bot loop: {e}", exc_info=True)
-                print(f"⚠️  Error in bot loop: {e}")
-                time.sleep(10)  # Wait before retry
+        # Main loop - sleeps until the next deadline in the timer queue
+        try:
+            self.scheduler.run()
+        except KeyboardInterrupt:
+            pass
         
         # Shutdown
+        self.monitoring_service.stop()
+        self.monitoring_agent.stop_price_stream()
+        stop_order_book_manager()
         self.logger.info("="*70)
         self.logger.info("BOT SHUTDOWN INITIATED")
-        self.logger.info(f"Total runtime cycles: {cycle}")
+        self.logger.info(f"Scheduler fires: { {name: stats['fires'] for name, stats in self.scheduler.get_stats().items()} }")
+        self.logger.info(f"Monitoring runs: {self.monitoring_service.get_stats()['runs']}")
         self.logger.info(f"Strategy analysis counts: {self.analysis_counts}")
         self.logger.info(f"Total trades created: {self.trades_created}")
         self.logger.info(f"Total trades closed: {self.trades_closed}")
@@ -0,0 +1,168 @@
+"""
+Account snapshot - one consistent view of positions, open orders and balances per monitoring cycle
+
+    snapshot = AccountSnapshot.fetch(client)
+    snapshot.position('SOLUSDT')  # None if flat
+    snapshot.orders('SOLUSDT')
+
+In hedge mode a symbol can hold a LONG and a SHORT leg at once; each leg is
+kept as its own position ('position_side' LONG/SHORT, BOTH in one-way mode).
+
+Two signed requests build it: open orders (all symbols) first, then the
+account (balances + positions). The order matters - protective orders are
+placed after their entry fills, so every order in the snapshot belongs to a
+position that already existed when positions were read. Reading positions
+first could miss a position opened in between and make its fresh SL/TP look
+orphaned.
+
+Live order placement for a symbol may still be running while the snapshot is
+taken; placement_versions (taken before the reads) lets the cancel tasks skip
+such symbols (see OrderPlacementGuard).
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from utils.binance_client import get_order_placement_guard
+
+
+def _position_from_account(pos: Dict) -> Dict:
+    """Account position entry in the get_open_positions() format"""
+    position_amt = float(pos['positionAmt'])
+    position_side = pos.get('positionSide', 'BOTH')
+    return {
+        'symbol': pos['symbol'],
+        'position_amt': position_amt,
+        'entry_price': float(pos.get('entryPrice', 0)),
+        'unrealized_pnl': float(pos.get('unrealizedProfit', pos.get('unRealizedProfit', 0))),
+        'leverage': int(pos.get('leverage', 1)),
+        'side': position_side if position_side != 'BOTH' else ('LONG' if position_amt > 0 else 'SHORT'),
+        'position_side': position_side
+    }
+
+
+class AccountSnapshot:
+    """Positions, open orders and balances taken once, indexed by symbol"""
+
+    __slots__ = ('taken_at', 'balances', 'assets', 'placement_versions', '_positions', '_orders')
+
+    def __init__(self, positions: List[Dict], orders: List[Dict], balances: Optional[Dict] = None,
+                 assets: Optional[Dict] = None, taken_at: Optional[datetime] = None):
+        """
+        Args:
+            positions: Open positions (get_open_positions() format)
+            orders: Open orders (get_open_orders() format)
+            balances: Account totals (total/available balance, unrealized P&L)
+            assets: Per-asset balances {asset: {'wallet_balance', 'available_balance'}}
+            taken_at: Snapshot time
+        """
+        self.taken_at = taken_at or datetime.now()
+        self.placement_versions = {}
+        self.balances = balances or {}
+        self.assets = assets or {}
+        self._positions: Dict[str, List[Dict]] = {}
+        for pos in positions:
+            if pos['position_amt'] != 0:
+                self._positions.setdefault(pos['symbol'], []).append(pos)
+        self._orders: Dict[str, List[Dict]] = {}
+        for order in orders:
+            self._orders.setdefault(order['symbol'], []).append(order)
+
+    @classmethod
+    def from_responses(cls, open_orders: List[Dict], account: Dict) -> 'AccountSnapshot':
+        """
+        Build from get_open_orders() and a raw futures_account() response
+
+        Args:
+            open_orders: Open orders (get_open_orders() format)
+            account: futures_account() response (balances + positions)
+        """
+        positions = [
+            _position_from_account(pos) for pos in account.get('positions', [])
+            if float(pos['positionAmt']) != 0
+        ]
+        balances = {
+            'total_balance': float(account.get('totalWalletBalance', 0)),
+            'available_balance': float(account.get('availableBalance', 0)),
+            'unrealized_pnl': float(account.get('totalUnrealizedProfit', 0))
+        }
+        assets = {
+            asset['asset']: {
+                'wallet_balance': float(asset['walletBalance']),
+                'available_balance': float(asset.get('availableBalance', 0))
+            }
+            for asset in account.get('assets', [])
+            if float(asset.get('walletBalance', 0)) != 0
+        }
+        return cls(positions, open_orders, balances, assets)
+
+    @classmethod
+    def fetch(cls, client) -> 'AccountSnapshot':
+        """
+        Take a snapshot (open orders first, then account - see module docstring)
+
+        Args:
+            client: BinanceClient
+        """
+        client.check_credentials()
+        placement_versions = get_order_placement_guard().versions()
+        open_orders = client.get_open_orders()
+        account = client.client.futures_account()
+        snapshot = cls.from_responses(open_orders, account)
+        snapshot.placement_versions = placement_versions
+        return snapshot
+
+    @property
+    def positions(self) -> List[Dict]:
+        """Open positions (both legs of a hedge-mode symbol)"""
+        return [pos for legs in self._positions.values() for pos in legs]
+
+    @property
+    def position_symbols(self) -> List[str]:
+        return sorted(self._positions)
+
+    @property
+    def order_symbols(self) -> List[str]:
+        return sorted(self._orders)
+
+    @property
+    def all_orders(self) -> List[Dict]:
+        return [order for orders in self._orders.values() for order in orders]
+
+    def position(self, symbol: str, position_side: Optional[str] = None) -> Optional[Dict]:
+        """
+        Open position of a symbol (None if flat)
+
+        Args:
+            symbol: Trading pair
+            position_side: LONG/SHORT leg in hedge mode (None = first open leg)
+        """
+        for pos in self._positions.get(symbol, []):
+            if position_side is None or pos.get('position_side', 'BOTH') == position_side:
+                return pos
+        return None
+
+    def symbol_positions(self, symbol: str) -> List[Dict]:
+        """Open positions of a symbol (two legs in hedge mode)"""
+        return self._positions.get(symbol, [])
+
+    def orders(self, symbol: str) -> List[Dict]:
+        """Open orders of a symbol"""
+        return self._orders.get(symbol, [])
+
+    def discard_orders(self, symbol: str, order_ids: Iterable):
+        """Drop cancelled orders so later tasks in the cycle see the current book"""
+        order_ids = set(order_ids)
+        remaining = [order for order in self.orders(symbol) if order['order_id'] not in order_ids]
+        if remaining:
+            self._orders[symbol] = remaining
+        else:
+            self._orders.pop(symbol, None)
+
+    def get_summary(self) -> Dict:
+        return {
+            'taken_at': self.taken_at.isoformat(),
+            'positions': sum(len(legs) for legs in self._positions.values()),
+            'open_orders': sum(len(orders) for orders in self._orders.values()),
+            'available_balance': self.balances.get('available_balance')
+        }
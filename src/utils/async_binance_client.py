@@ -0,0 +1,346 @@
+"""Async Binance Futures market data client - concurrent fan-out over one pooled HTTP session"""
+import asyncio
+import concurrent.futures
+import contextvars
+import threading
+import aiohttp
+from binance.async_client import AsyncClient
+from binance.exceptions import BinanceAPIException
+import pandas as pd
+from datetime import datetime
+from typing import Dict, Optional, List
+from utils.binance_client import (
+    klines_to_dataframe, parse_funding_rate, parse_orderbook,
+    get_rate_limit_governor, get_endpoint_weight, resolve_request_priority
+)
+from utils.candle_store import get_candle_store, INTERVAL_MS, MAX_KLINES_PER_REQUEST
+from utils.order_book import get_local_orderbook
+from utils.kline_parser import kline_arrays_from_dataframe
+from utils.candle_aggregator import get_aggregation_base, aggregate_klines, base_candles_needed
+from utils.tracing import span
+import config
+
+
+class AsyncBinanceClient:
+    """
+    asyncio version of BinanceClient market data methods
+
+    Same public methods and return shapes as BinanceClient, but coroutines.
+    get_market_data / get_multi_timeframe_data issue price, funding rate,
+    orderbook and klines requests concurrently, so fetch latency is close to
+    one round trip instead of the sum of 4-5.
+    """
+
+    def __init__(self, api_key: Optional[str] = None, api_secret: Optional[str] = None,
+                 demo: Optional[bool] = None, pool_size: int = 20):
+        """
+        Initialize async client (call connect() inside the event loop before use)
+
+        Args:
+            api_key: Optional API key (not required for public data)
+            api_secret: Optional API secret (not required for public data)
+            demo: Optional demo mode flag (uses testnet if True)
+            pool_size: Max pooled keep-alive connections
+        """
+        self.api_key = api_key if api_key else config.BINANCE_API_KEY
+        self.api_secret = api_secret if api_secret else config.BINANCE_API_SECRET
+        self.demo = demo if demo is not None else config.BINANCE_DEMO
+        self.pool_size = pool_size
+        self.client = None
+        # Per-series locks for coroutines on this loop (the store's threading
+        # locks are never held across an await - see _get_klines_from_store)
+        self._series_locks = {}
+
+        # Local candle history (shared with the sync BinanceClient)
+        self.candle_store = get_candle_store() if config.CANDLE_STORE_ENABLED else None
+
+    async def connect(self):
+        """Create AsyncClient with a pooled aiohttp session"""
+        if self.client is None:
+            session_params = {'connector': aiohttp.TCPConnector(limit=self.pool_size)}
+            if config.BINANCE_RATE_LIMIT_ENABLED:
+                session_params['trace_configs'] = [self._governor_trace_config()]
+            self.client = await AsyncClient.create(
+                self.api_key,
+                self.api_secret,
+                testnet=self.demo,
+                session_params=session_params
+            )
+            if self.demo:
+                print("🧪 Using Binance Futures TESTNET (Demo Mode) - async client")
+            # Tracing first, so spans time the request and not the budget wait
+            if config.TRACING_ENABLED:
+                self._install_request_tracing()
+            if config.BINANCE_RATE_LIMIT_ENABLED:
+                self._install_rate_limiter()
+        return self
+
+    def _install_request_tracing(self):
+        """Record every futures REST call as a 'binance_rest' span labelled by endpoint"""
+        request_futures_api = self.client._request_futures_api
+
+        async def traced_request(method, path, signed=False, version=1, **kwargs):
+            with span('binance_rest', endpoint=path):
+                return await request_futures_api(method, path, signed, version, **kwargs)
+
+        self.client._request_futures_api = traced_request
+
+    def _install_rate_limiter(self):
+        """Route futures requests through the shared governor (same budget as sync clients)"""
+        governor = get_rate_limit_governor()
+        request_futures_api = self.client._request_futures_api
+
+        async def governed_request(method, path, signed=False, version=1, **kwargs):
+            weight = get_endpoint_weight(path, kwargs.get('data') or kwargs.get('params'))
+            # Waiting for budget blocks, so do it off the event loop
+            await asyncio.to_thread(governor.acquire, weight, resolve_request_priority(method, path))
+            return await request_futures_api(method, path, signed, version, **kwargs)
+
+        self.client._request_futures_api = governed_request
+
+    @staticmethod
+    def _governor_trace_config() -> aiohttp.TraceConfig:
+        """
+        Sync the governor from each response's own headers
+
+        AsyncClient.response is shared by all concurrent requests, so it is
+        read from the aiohttp request trace instead.
+        """
+        governor = get_rate_limit_governor()
+
+        async def on_request_end(session, trace_config_ctx, params):
+            # Spot endpoints (ping) have their own weight budget
+            if '/fapi/' in str(params.url):
+                governor.update_from_headers(params.response.status, params.response.headers)
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_end.append(on_request_end)
+        return trace_config
+
+    async def close(self):
+        """Close pooled HTTP session"""
+        if self.client is not None:
+            await self.client.close_connection()
+            self.client = None
+
+    async def get_current_price(self, symbol: str) -> float:
+        """Get current price for a symbol"""
+        try:
+            ticker = await self.client.futures_symbol_ticker(symbol=symbol)
+            return float(ticker['price'])
+        except BinanceAPIException as e:
+            raise Exception(f"Error fetching current price: {e}")
+
+    async def get_klines(self, symbol: str, interval: str, limit: int = 100) -> pd.DataFrame:
+        """Get historical klines (CLOSED candles only, same DataFrame as BinanceClient.get_klines)"""
+        base_interval = get_aggregation_base(interval)
+        if base_interval:
+            count = max(limit - 1, 1)
+            needed = base_candles_needed(interval, base_interval, count)
+            if self.candle_store or needed < MAX_KLINES_PER_REQUEST:
+                base = kline_arrays_from_dataframe(await self.get_klines(symbol, base_interval, needed + 1))
+                return aggregate_klines(base, base_interval, interval).tail(count).to_dataframe()
+
+        if self.candle_store and self.candle_store.supports(interval):
+            return await self._get_klines_from_store(symbol, interval, limit)
+
+        try:
+            klines = await self.client.futures_klines(symbol=symbol, interval=interval, limit=limit)
+            return klines_to_dataframe(klines)
+        except BinanceAPIException as e:
+            raise Exception(f"Error fetching klines: {e}")
+
+    async def _get_klines_from_store(self, symbol: str, interval: str, limit: int) -> pd.DataFrame:
+        """get_klines backed by the local candle store (see BinanceClient._get_klines_from_store)"""
+        store = self.candle_store
+        count = max(limit - 1, 1)
+
+        # Coroutines asking for the same series wait for one download. The store's
+        # series lock (shared with sync clients in other threads) is taken only around
+        # each store call, in a worker thread - holding it across an await could starve
+        # the default executor the other coroutines' requests need and deadlock the loop
+        series_lock = self._series_locks.setdefault((symbol, interval), asyncio.Lock())
+        async with series_lock:
+            try:
+                params = await self._store_call(symbol, interval, store.plan_tail_fetch, symbol, interval, count)
+                if params is not None:
+                    klines = await self.client.futures_klines(symbol=symbol, interval=interval, **params)
+                    await self._store_call(symbol, interval, store.save_klines, symbol, interval, klines[:-1])
+
+                interval_ms = INTERVAL_MS[interval]
+                gaps = await self._store_call(symbol, interval, store.find_gaps, symbol, interval, count)
+                for gap_start, gap_end in gaps:
+                    while gap_start <= gap_end:
+                        backfill = await self.client.futures_klines(
+                            symbol=symbol,
+                            interval=interval,
+                            startTime=gap_start,
+                            endTime=gap_end,
+                            limit=MAX_KLINES_PER_REQUEST
+                        )
+                        if not backfill:
+                            break
+                        await self._store_call(symbol, interval, store.save_klines, symbol, interval, backfill)
+                        gap_start = int(backfill[-1][0]) + interval_ms
+
+                arrays = await self._store_call(symbol, interval, store.load_arrays, symbol, interval, count)
+                return arrays.to_dataframe()
+            except BinanceAPIException as e:
+                raise Exception(f"Error fetching klines: {e}")
+
+    async def _store_call(self, symbol: str, interval: str, func, *args):
+        """Run one candle store call in a worker thread under the store's series lock"""
+        lock = self.candle_store.lock_for(symbol, interval)
+
+        def locked_call():
+            with lock:
+                return func(*args)
+
+        return await asyncio.to_thread(locked_call)
+
+    async def get_funding_rate(self, symbol: str) -> float:
+        """Get current funding rate"""
+        try:
+            funding_rate = await self.client.futures_funding_rate(symbol=symbol, limit=1)
+            return parse_funding_rate(funding_rate)
+        except BinanceAPIException as e:
+            raise Exception(f"Error fetching funding rate: {e}")
+
+    async def get_orderbook(self, symbol: str, limit: int = 100) -> Dict:
+        """Get orderbook (depth) data - local diff-depth book when synced"""
+        local_book = get_local_orderbook(symbol, limit)
+        if local_book is not None:
+            return local_book
+        try:
+            depth = await self.client.futures_order_book(symbol=symbol, limit=limit)
+            return parse_orderbook(depth)
+        except BinanceAPIException as e:
+            raise Exception(f"Error fetching orderbook: {e}")
+
+    async def get_market_data(self, symbol: str, interval: str, limit: int = 100) -> Dict:
+        """Get complete market data package for single timeframe (requests run concurrently)"""
+        current_price, candles, funding_rate, orderbook = await asyncio.gather(
+            self.get_current_price(symbol),
+            self.get_klines(symbol, interval, limit),
+            self.get_funding_rate(symbol),
+            self.get_orderbook(symbol, limit=config.ORDERBOOK_DEPTH)
+        )
+
+        return {
+            "symbol": symbol,
+            "current_price": current_price,
+            "timestamp": datetime.now().isoformat(),
+            "candles": candles,
+            "funding_rate": funding_rate,
+            "orderbook": orderbook
+        }
+
+    async def get_multi_timeframe_data(self, symbol: str, timeframes: List[str], limit: int = 100) -> Dict:
+        """Get market data for multiple timeframes (all requests run concurrently)"""
+        results = await asyncio.gather(
+            self.get_current_price(symbol),
+            self.get_funding_rate(symbol),
+            self.get_orderbook(symbol, limit=config.ORDERBOOK_DEPTH),
+            *[self.get_klines(symbol, tf, limit) for tf in timeframes]
+        )
+        current_price, funding_rate, orderbook = results[:3]
+        timeframe_data = dict(zip(timeframes, results[3:]))
+
+        return {
+            "symbol": symbol,
+            "current_price": current_price,
+            "timestamp": datetime.now().isoformat(),
+            "timeframes": timeframe_data,
+            "funding_rate": funding_rate,
+            "orderbook": orderbook
+        }
+
+
+class AsyncBinanceClientFacade:
+    """
+    Blocking facade over AsyncBinanceClient for the existing (sync) agents
+
+    Runs one event loop in a daemon thread; every method submits the coroutine
+    to that loop and waits for the result. Safe to call from many threads at
+    once - all calls share the loop's pooled HTTP session.
+    """
+
+    def __init__(self, api_key: Optional[str] = None, api_secret: Optional[str] = None,
+                 demo: Optional[bool] = None, pool_size: int = 20):
+        self.async_client = AsyncBinanceClient(api_key, api_secret, demo, pool_size)
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name='binance-async-loop', daemon=True)
+        self._thread.start()
+        self._connected = False
+        self._connect_lock = threading.Lock()
+
+    def _submit(self, coro) -> concurrent.futures.Future:
+        """
+        Schedule a coroutine on the facade loop in the caller's context
+
+        The task runs with a copy of the calling thread's contextvars, so
+        context set by the caller carries over to the loop.
+        """
+        context = contextvars.copy_context()
+        future = concurrent.futures.Future()
+
+        def on_done(task: asyncio.Task):
+            if task.cancelled():
+                future.cancel()
+            elif task.exception() is not None:
+                future.set_exception(task.exception())
+            else:
+                future.set_result(task.result())
+
+        def start():
+            # Tasks copy the context current at creation - here, the caller's
+            self.loop.create_task(coro).add_done_callback(on_done)
+
+        self.loop.call_soon_threadsafe(start, context=context)
+        return future
+
+    def _run(self, coro_func, *args, **kwargs):
+        """Run coroutine on the facade loop and wait for result"""
+        with self._connect_lock:
+            if not self._connected:
+                self._submit(self.async_client.connect()).result()
+                self._connected = True
+        return self._submit(coro_func(*args, **kwargs)).result()
+
+    def get_current_price(self, symbol: str) -> float:
+        return self._run(self.async_client.get_current_price, symbol)
+
+    def get_klines(self, symbol: str, interval: str, limit: int = 100) -> pd.DataFrame:
+        return self._run(self.async_client.get_klines, symbol, interval, limit)
+
+    def get_funding_rate(self, symbol: str) -> float:
+        return self._run(self.async_client.get_funding_rate, symbol)
+
+    def get_orderbook(self, symbol: str, limit: int = 100) -> Dict:
+        return self._run(self.async_client.get_orderbook, symbol, limit)
+
+    def get_market_data(self, symbol: str, interval: str, limit: int = 100) -> Dict:
+        return self._run(self.async_client.get_market_data, symbol, interval, limit)
+
+    def get_multi_timeframe_data(self, symbol: str, timeframes: List[str], limit: int = 100) -> Dict:
+        return self._run(self.async_client.get_multi_timeframe_data, symbol, timeframes, limit)
+
+    def close(self):
+        """Close HTTP session and stop the loop thread"""
+        if self._connected:
+            self._submit(self.async_client.close()).result()
+            self._connected = False
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+
+_async_facade = None
+_async_facade_lock = threading.Lock()
+
+
+def get_async_market_data_client() -> AsyncBinanceClientFacade:
+    """Get process-wide async market data facade"""
+    global _async_facade
+    with _async_facade_lock:
+        if _async_facade is None:
+            _async_facade = AsyncBinanceClientFacade(pool_size=config.BINANCE_HTTP_POOL_SIZE)
+        return _async_facade
@@ -1,12 +1,403 @@
 """Binance Futures API client for market data and live trading"""
 from binance.client import Client
 from binance.exceptions import BinanceAPIException
+from requests.adapters import HTTPAdapter
+import numpy as np
 import pandas as pd
+import threading
+import time
+import heapq
+import itertools
+import contextvars
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, Optional, List
+from typing import Callable, Dict, Optional, List
+from utils.candle_store import get_candle_store, INTERVAL_MS, MAX_KLINES_PER_REQUEST
+from utils.order_book import get_local_orderbook
+from utils.kline_parser import KlineArrays, parse_klines
+from utils.candle_aggregator import get_aggregation_base, aggregate_klines, base_candles_needed
+from utils.tracing import span
 import config
 
 
+def klines_to_dataframe(klines: List) -> pd.DataFrame:
+    """
+    Convert raw futures_klines payload to OHLCV DataFrame
+    
+    The last candle (incomplete/currently forming) is removed.
+    
+    Args:
+        klines: Raw kline rows from Binance
+        
+    Returns:
+        DataFrame with timestamp, open, high, low, close, volume
+    """
+    # Decoded straight into typed arrays - only CLOSED candles are kept
+    return parse_klines(klines).to_dataframe()
+
+
+def parse_funding_rate(funding_rate: List) -> float:
+    """Extract latest funding rate from futures_funding_rate payload"""
+    if funding_rate:
+        return float(funding_rate[0]['fundingRate'])
+    return 0.0
+
+
+def parse_orderbook(depth: Dict) -> Dict:
+    """
+    Convert futures_order_book payload to bids/asks float64 arrays
+    
+    Each side is a contiguous (levels, 2) array of [price, quantity] rows,
+    best price first - indexing (bids[0][0]) and len() work as with lists.
+    """
+    bids = np.array(depth['bids'], dtype=np.float64).reshape(-1, 2)
+    asks = np.array(depth['asks'], dtype=np.float64).reshape(-1, 2)
+    
+    return {
+        "bids": bids,  # Buy orders [[price, quantity], ...]
+        "asks": asks,  # Sell orders [[price, quantity], ...]
+        "last_update_id": depth['lastUpdateId']
+    }
+
+
+# =============================================================================
+# RATE LIMIT GOVERNOR
+# =============================================================================
+
+class RequestPriority:
+    """Request priorities for the rate limit governor (lower value = served first)"""
+    ORDER = 0        # Live order placement / cancellation
+    MONITORING = 1   # MonitoringAgent
+    ANALYSIS = 2     # Strategy market data
+    DASHBOARD = 3    # Web API
+
+    NAMES = {0: 'order', 1: 'monitoring', 2: 'analysis', 3: 'dashboard'}
+
+
+# Share of the weight budget each priority may use - the rest is kept free for
+# higher priorities, so dashboard traffic can never starve order placement
+PRIORITY_BUDGET_SHARE = {
+    RequestPriority.ORDER: 1.0,
+    RequestPriority.MONITORING: 0.9,
+    RequestPriority.ANALYSIS: 0.8,
+    RequestPriority.DASHBOARD: 0.6,
+}
+
+# Max orders per DELETE batchOrders request
+BATCH_CANCEL_LIMIT = 10
+
+# Futures endpoints that place/cancel orders always run with ORDER priority
+ORDER_ENDPOINTS = {'order', 'batchOrders', 'allOpenOrders', 'leverage', 'marginType'}
+
+_request_priority = contextvars.ContextVar('binance_request_priority', default=RequestPriority.ANALYSIS)
+
+
+@contextmanager
+def request_priority(priority: int):
+    """
+    Run Binance requests made inside the block with given priority
+    
+    Example:
+        with request_priority(RequestPriority.MONITORING):
+            client.get_open_positions()
+    """
+    token = set_request_priority(priority)
+    try:
+        yield
+    finally:
+        reset_request_priority(token)
+
+
+def set_request_priority(priority: int) -> contextvars.Token:
+    """Set priority for the current context (for hooks that can't use a with-block)"""
+    return _request_priority.set(priority)
+
+
+def reset_request_priority(token: contextvars.Token):
+    """Restore priority saved by set_request_priority"""
+    _request_priority.reset(token)
+
+
+def get_request_priority() -> int:
+    """Get priority of the current thread / task"""
+    return _request_priority.get()
+
+
+def get_endpoint_weight(path: str, params: Optional[Dict] = None) -> int:
+    """
+    Get Binance USD-M futures request weight for an endpoint
+    
+    Args:
+        path: Futures API path without version prefix (e.g. 'klines', 'depth')
+        params: Request parameters
+        
+    Returns:
+        IP request weight
+    """
+    params = params or {}
+    has_symbol = bool(params.get('symbol'))
+    
+    if path == 'klines':
+        limit = int(params.get('limit', 500))
+        if limit < 100:
+            return 1
+        if limit < 500:
+            return 2
+        if limit <= 1000:
+            return 5
+        return 10
+    
+    if path == 'depth':
+        limit = int(params.get('limit', 500))
+        if limit <= 50:
+            return 2
+        if limit <= 100:
+            return 5
+        if limit <= 500:
+            return 10
+        return 20
+    
+    if path in ('ticker/price', 'ticker/bookTicker'):
+        return 1 if has_symbol else 2
+    if path == 'ticker/24hr':
+        return 1 if has_symbol else 40
+    if path == 'openOrders':
+        return 1 if has_symbol else 40
+    if path in ('account', 'positionRisk', 'balance', 'userTrades', 'allOrders'):
+        return 5
+    if path == 'income':
+        return 30
+    
+    return 1
+
+
+class RateLimitGovernor:
+    """
+    Process-wide Binance request weight governor
+    
+    Binance counts IP request weight in one-minute windows. The governor keeps
+    that budget locally: every request reserves its endpoint weight before it is
+    sent, and the X-MBX-USED-WEIGHT-1M header of every response re-syncs the
+    counter with the exchange (it also covers requests from other processes on
+    the same IP). When the budget is used up, requests queue by priority until
+    the next window instead of failing. 429/418 responses pause all traffic for
+    the Retry-After period.
+    """
+    
+    WINDOW_SECONDS = 60
+    
+    def __init__(self, weight_limit: int = 2400, clock: Callable[[], float] = time.time):
+        """
+        Initialize governor
+        
+        Args:
+            weight_limit: Request weight allowed per minute
+            clock: Wall clock in seconds (minute windows follow the exchange's)
+        """
+        self.weight_limit = weight_limit
+        self.clock = clock
+        self._cond = threading.Condition()
+        self._window = self._current_window()
+        self._used = 0
+        self._blocked_until = 0.0
+        self._waiters = []  # heap of (priority, seq)
+        self._seq = itertools.count()
+        
+        self.stats = {
+            'requests': 0,
+            'weight_reserved': 0,
+            'queued': 0,
+            'wait_seconds': 0.0,
+            'rate_limited': 0,
+            'banned': 0,
+            'by_priority': {name: 0 for name in RequestPriority.NAMES.values()}
+        }
+    
+    def _current_window(self) -> int:
+        return int(self.clock() // self.WINDOW_SECONDS)
+    
+    def _roll_window(self):
+        """Reset used weight when a new minute window starts (caller holds lock)"""
+        window = self._current_window()
+        if window != self._window:
+            self._window = window
+            self._used = 0
+    
+    def _budget_for(self, priority: int) -> int:
+        share = PRIORITY_BUDGET_SHARE.get(priority, PRIORITY_BUDGET_SHARE[RequestPriority.DASHBOARD])
+        return int(self.weight_limit * share)
+    
+    def acquire(self, weight: int, priority: Optional[int] = None):
+        """
+        Reserve request weight, waiting (in priority order) until budget is available
+        
+        Args:
+            weight: Endpoint weight
+            priority: RequestPriority value (default: current context priority)
+        """
+        priority = get_request_priority() if priority is None else priority
+        entry = (priority, next(self._seq))
+        started = self.clock()
+        waited = False
+        
+        with self._cond:
+            heapq.heappush(self._waiters, entry)
+            try:
+                while True:
+                    self._roll_window()
+                    now = self.clock()
+                    
+                    if now < self._blocked_until:
+                        timeout = self._blocked_until - now
+                    elif self._waiters[0] != entry:
+                        # Higher priority (or older) request is queued first
+                        timeout = None
+                    elif self._used + weight <= self._budget_for(priority) or self._used == 0:
+                        break
+                    else:
+                        timeout = (self._window + 1) * self.WINDOW_SECONDS - now
+                    
+                    waited = True
+                    self._cond.wait(timeout=timeout)
+            finally:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                self._cond.notify_all()
+            
+            self._used += weight
+            self.stats['requests'] += 1
+            self.stats['weight_reserved'] += weight
+            self.stats['by_priority'][RequestPriority.NAMES.get(priority, 'dashboard')] += 1
+            if waited:
+                self.stats['queued'] += 1
+                self.stats['wait_seconds'] += self.clock() - started
+    
+    def update_from_headers(self, status_code: int, headers):
+        """
+        Sync budget from a Binance response
+        
+        Args:
+            status_code: HTTP status
+            headers: Response headers (case-insensitive mapping)
+        """
+        used_weight = headers.get('X-MBX-USED-WEIGHT-1M') if headers is not None else None
+        
+        with self._cond:
+            self._roll_window()
+            
+            if used_weight is not None:
+                # Local counter also includes requests still in flight - keep the larger
+                self._used = max(self._used, int(used_weight))
+            
+            if status_code in (418, 429):
+                retry_after = headers.get('Retry-After') if headers is not None else None
+                pause = float(retry_after) if retry_after else self.WINDOW_SECONDS
+                self._blocked_until = max(self._blocked_until, self.clock() + pause)
+                self.stats['banned' if status_code == 418 else 'rate_limited'] += 1
+                print(f"⚠️  Binance rate limit hit (HTTP {status_code}) - pausing requests for {pause:.0f}s")
+            
+            self._cond.notify_all()
+    
+    def get_stats(self) -> Dict:
+        """Get governor statistics (used weight in current window, queueing, bans)"""
+        with self._cond:
+            self._roll_window()
+            stats = dict(self.stats)
+            stats['by_priority'] = dict(self.stats['by_priority'])
+            stats['used_weight'] = self._used
+            stats['weight_limit'] = self.weight_limit
+            stats['queue_length'] = len(self._waiters)
+            stats['blocked_for'] = max(self._blocked_until - self.clock(), 0.0)
+        return stats
+
+
+_governor = None
+_governor_lock = threading.Lock()
+
+
+def get_rate_limit_governor() -> RateLimitGovernor:
+    """Get process-wide rate limit governor (all clients share one IP budget)"""
+    global _governor
+    with _governor_lock:
+        if _governor is None:
+            _governor = RateLimitGovernor(weight_limit=config.BINANCE_WEIGHT_LIMIT)
+        return _governor
+
+
+def resolve_request_priority(method: str, path: str) -> int:
+    """Order placement/cancellation always goes first, everything else uses context priority"""
+    if path in ORDER_ENDPOINTS and method.lower() in ('post', 'delete'):
+        return RequestPriority.ORDER
+    return get_request_priority()
+
+
+class OrderPlacementGuard:
+    """
+    Per-symbol lock around multi-request order placement (entry + SL/TP)
+    
+    Live trading holds a symbol's lock from the entry order until its last
+    protective order is acknowledged. Every release bumps the symbol's version,
+    so monitoring can tell whether an account snapshot may have caught a
+    placement half way (lock held, or version changed since the snapshot) and
+    must leave that symbol's orders alone.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._locks: Dict[str, threading.Lock] = {}
+        self._versions: Dict[str, int] = {}
+    
+    def _symbol_lock(self, symbol: str) -> threading.Lock:
+        with self._lock:
+            lock = self._locks.get(symbol)
+            if lock is None:
+                lock = self._locks[symbol] = threading.Lock()
+            return lock
+    
+    @contextmanager
+    def placing(self, symbol: str):
+        """Hold the symbol while placing its entry and protective orders"""
+        lock = self._symbol_lock(symbol)
+        with lock:
+            try:
+                yield
+            finally:
+                with self._lock:
+                    self._versions[symbol] = self._versions.get(symbol, 0) + 1
+    
+    def versions(self) -> Dict[str, int]:
+        """Placement versions of all symbols (take before reading the account)"""
+        with self._lock:
+            return dict(self._versions)
+    
+    @contextmanager
+    def unchanged_since(self, symbol: str, versions: Dict[str, int]):
+        """
+        Hold the symbol if no placement ran or is running since `versions`
+        
+        Yields:
+            True if held (safe to cancel from the snapshot), False otherwise
+        """
+        lock = self._symbol_lock(symbol)
+        if not lock.acquire(blocking=False):
+            yield False
+            return
+        try:
+            with self._lock:
+                unchanged = self._versions.get(symbol, 0) == versions.get(symbol, 0)
+            yield unchanged
+        finally:
+            lock.release()
+
+
+_placement_guard = OrderPlacementGuard()
+
+
+def get_order_placement_guard() -> OrderPlacementGuard:
+    """Get process-wide order placement guard"""
+    return _placement_guard
+
+
 class BinanceClient:
     """Client for fetching Binance Futures market data and executing trades"""
     
@@ -24,19 +415,121 @@ class BinanceClient:
         self.api_secret = api_secret if api_secret else config.BINANCE_API_SECRET
         self.demo = demo if demo is not None else config.BINANCE_DEMO
         
-        # Initialize client with testnet URL if demo mode
         if self.demo:
-            self.client = Client(
-                self.api_key, 
-                self.api_secret,
-                testnet=True
-            )
             print("🧪 Using Binance Futures TESTNET (Demo Mode)")
-        else:
-            self.client = Client(self.api_key, self.api_secret)
+        
+        # Keep-alive connection pool sized for bot threads + Flask workers,
+        # shared by the per-thread python-binance clients
+        self.http_adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=config.BINANCE_HTTP_POOL_SIZE
+        )
+        
+        # All futures requests go through the shared request-weight governor
+        self.governor = get_rate_limit_governor() if config.BINANCE_RATE_LIMIT_ENABLED else None
+        
+        # python-binance Client keeps the last response on the instance (Client.response),
+        # so each thread gets its own Client (see client property)
+        self._local = threading.local()
+        
+        self.client.ping()
         
         self.has_credentials = bool(self.api_key and self.api_secret)
         
+        # Local candle history (only new candles are downloaded)
+        self.candle_store = get_candle_store() if config.CANDLE_STORE_ENABLED else None
+        
+    @property
+    def client(self) -> Client:
+        """python-binance Client of the calling thread (created on first use)"""
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            client = self._local.client = self._create_client()
+        return client
+    
+    def _create_client(self) -> Client:
+        """
+        Create a python-binance Client on the shared connection pool
+        
+        Returns:
+            Client with tracing and rate limiting installed
+        """
+        # (ping is done once by __init__, after the pooled adapter is mounted)
+        client = Client(self.api_key, self.api_secret, testnet=self.demo, ping=False)
+        client.session.mount('https://', self.http_adapter)
+        
+        # Per-endpoint latency spans (installed first so they time the request, not the budget wait)
+        if config.TRACING_ENABLED:
+            self._install_request_tracing(client)
+        
+        if self.governor:
+            self._install_rate_limiter(client)
+        
+        return client
+    
+    def _install_request_tracing(self, client: Client):
+        """Record every futures REST call as a 'binance_rest' span labelled by endpoint"""
+        request_futures_api = client._request_futures_api
+        
+        def traced_request(method, path, signed=False, version=1, **kwargs):
+            with span('binance_rest', endpoint=path):
+                return request_futures_api(method, path, signed, version, **kwargs)
+        
+        client._request_futures_api = traced_request
+    
+    def _install_rate_limiter(self, client: Client):
+        """Route futures requests through the governor and sync it from response headers"""
+        governor = self.governor
+        request_futures_api = client._request_futures_api
+        
+        def governed_request(method, path, signed=False, version=1, **kwargs):
+            weight = get_endpoint_weight(path, kwargs.get('data') or kwargs.get('params'))
+            governor.acquire(weight, resolve_request_priority(method, path))
+            return request_futures_api(method, path, signed, version, **kwargs)
+        
+        def sync_governor(response, *args, **kwargs):
+            # Spot endpoints (ping) have their own weight budget
+            if '/fapi/' in response.url:
+                governor.update_from_headers(response.status_code, response.headers)
+        
+        client._request_futures_api = governed_request
+        client.session.hooks['response'].append(sync_governor)
+    
+    def get_connection_stats(self) -> Dict:
+        """
+        Get keep-alive connection pool counters
+        
+        Returns:
+            Dictionary with connections opened, requests sent and reused connections
+        """
+        opened = 0
+        requests_sent = 0
+        pools = self.http_adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            opened += pool.num_connections
+            requests_sent += pool.num_requests
+        
+        return {
+            'connections_opened': opened,
+            'requests': requests_sent,
+            'connections_reused': max(requests_sent - opened, 0)
+        }
+    
+    def get_server_time(self) -> int:
+        """
+        Get Binance Futures server time
+        
+        Returns:
+            Server time in ms
+        """
+        try:
+            return int(self.client.futures_time()['serverTime'])
+        except BinanceAPIException as e:
+            raise Exception(f"Error fetching server time: {e}")
+    
     def get_current_price(self, symbol: str) -> float:
         """
         Get current price for a symbol
@@ -53,6 +546,26 @@ class BinanceClient:
         except BinanceAPIException as e:
             raise Exception(f"Error fetching current price: {e}")
     
+    def get_all_prices(self, mark_price: bool = False) -> Dict[str, float]:
+        """
+        Get price snapshot for ALL futures symbols in one request
+        
+        Args:
+            mark_price: Use mark prices (premiumIndex) instead of last trade prices
+            
+        Returns:
+            Dictionary symbol -> price
+        """
+        try:
+            if mark_price:
+                tickers = self.client.futures_mark_price()
+                return {t['symbol']: float(t['markPrice']) for t in tickers}
+            
+            tickers = self.client.futures_symbol_ticker()
+            return {t['symbol']: float(t['price']) for t in tickers}
+        except BinanceAPIException as e:
+            raise Exception(f"Error fetching price snapshot: {e}")
+    
     def get_klines(self, symbol: str, interval: str, limit: int = 100) -> pd.DataFrame:
         """
         Get historical klines (candlestick data)
@@ -65,6 +578,35 @@ class BinanceClient:
         Returns:
             DataFrame with OHLCV data
         """
+        return self.get_kline_arrays(symbol, interval, limit).to_dataframe()
+    
+    def get_kline_arrays(self, symbol: str, interval: str, limit: int = 100) -> KlineArrays:
+        """
+        Get historical klines as typed arrays (int64 open time, float64 OHLCV)
+        
+        Same candles as get_klines without building a DataFrame unless
+        to_dataframe() is called.
+        
+        Args:
+            symbol: Trading pair (e.g., 'SOLUSDT')
+            interval: Timeframe (e.g., '1h', '4h')
+            limit: Number of candles to fetch
+            
+        Returns:
+            KlineArrays of closed candles
+        """
+        # Higher timeframes are aggregated from the base interval series
+        base_interval = get_aggregation_base(interval)
+        if base_interval:
+            count = max(limit - 1, 1)
+            needed = base_candles_needed(interval, base_interval, count)
+            if self.candle_store or needed < MAX_KLINES_PER_REQUEST:
+                base = self.get_kline_arrays(symbol, base_interval, needed + 1)
+                return aggregate_klines(base, base_interval, interval).tail(count)
+        
+        if self.candle_store and self.candle_store.supports(interval):
+            return self._get_klines_from_store(symbol, interval, limit)
+        
         try:
             klines = self.client.futures_klines(
                 symbol=symbol,
@@ -72,27 +614,46 @@ class BinanceClient:
                 limit=limit
             )
             
-            # Convert to DataFrame
-            df = pd.DataFrame(klines, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_volume', 'trades', 'taker_buy_base',
-                'taker_buy_quote', 'ignore'
-            ])
-            
-            # Convert types
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            for col in ['open', 'high', 'low', 'close', 'volume']:
-                df[col] = df[col].astype(float)
-            
-            # Keep only relevant columns
-            df = df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
-            
-            # Remove last candle (incomplete/currently forming) for data integrity
-            # This ensures we only use CLOSED candles for analysis
-            if len(df) > 1:
-                df = df.iloc[:-1].reset_index(drop=True)
-            
-            return df
+            return parse_klines(klines)
+        except BinanceAPIException as e:
+            raise Exception(f"Error fetching klines: {e}")
+    
+    def _get_klines_from_store(self, symbol: str, interval: str, limit: int) -> KlineArrays:
+        """
+        get_kline_arrays backed by the local candle store
+        
+        Downloads only candles newer than the last stored close, backfills gaps
+        inside the requested window and returns the same candles as get_klines
+        (limit - 1 CLOSED candles - the forming candle is never stored).
+        """
+        store = self.candle_store
+        count = max(limit - 1, 1)
+        
+        try:
+            with store.lock_for(symbol, interval):
+                # 1. Bring the series up to date (last row = forming candle, dropped)
+                params = store.plan_tail_fetch(symbol, interval, count)
+                if params is not None:
+                    klines = self.client.futures_klines(symbol=symbol, interval=interval, **params)
+                    store.save_klines(symbol, interval, klines[:-1])
+                
+                # 2. Backfill holes inside the window (bot downtime, first run with smaller limit)
+                interval_ms = INTERVAL_MS[interval]
+                for gap_start, gap_end in store.find_gaps(symbol, interval, count):
+                    while gap_start <= gap_end:
+                        backfill = self.client.futures_klines(
+                            symbol=symbol,
+                            interval=interval,
+                            startTime=gap_start,
+                            endTime=gap_end,
+                            limit=MAX_KLINES_PER_REQUEST
+                        )
+                        if not backfill:
+                            break
+                        store.save_klines(symbol, interval, backfill)
+                        gap_start = int(backfill[-1][0]) + interval_ms
+                
+                return store.load_arrays(symbol, interval, count)
         except BinanceAPIException as e:
             raise Exception(f"Error fetching klines: {e}")
     
@@ -108,9 +669,7 @@ class BinanceClient:
         """
         try:
             funding_rate = self.client.futures_funding_rate(symbol=symbol, limit=1)
-            if funding_rate:
-                return float(funding_rate[0]['fundingRate'])
-            return 0.0
+            return parse_funding_rate(funding_rate)
         except BinanceAPIException as e:
             raise Exception(f"Error fetching funding rate: {e}")
     
@@ -125,18 +684,14 @@ class BinanceClient:
         Returns:
             Dictionary with bids and asks
         """
+        # Local book kept in sync by the diff-depth stream - no request weight
+        local_book = get_local_orderbook(symbol, limit)
+        if local_book is not None:
+            return local_book
+        
         try:
             depth = self.client.futures_order_book(symbol=symbol, limit=limit)
-            
-            # Convert to lists of [price, quantity]
-            bids = [[float(price), float(qty)] for price, qty in depth['bids']]
-            asks = [[float(price), float(qty)] for price, qty in depth['asks']]
-            
-            return {
-                "bids": bids,  # Buy orders [[price, quantity], ...]
-                "asks": asks,  # Sell orders [[price, quantity], ...]
-                "last_update_id": depth['lastUpdateId']
-            }
+            return parse_orderbook(depth)
         except BinanceAPIException as e:
             raise Exception(f"Error fetching orderbook: {e}")
     
@@ -155,7 +710,7 @@ class BinanceClient:
         current_price = self.get_current_price(symbol)
         candles = self.get_klines(symbol, interval, limit)
         funding_rate = self.get_funding_rate(symbol)
-        orderbook = self.get_orderbook(symbol, limit=100)
+        orderbook = self.get_orderbook(symbol, limit=config.ORDERBOOK_DEPTH)
         
         return {
             "symbol": symbol,
@@ -180,7 +735,7 @@ class BinanceClient:
         """
         current_price = self.get_current_price(symbol)
         funding_rate = self.get_funding_rate(symbol)
-        orderbook = self.get_orderbook(symbol, limit=100)
+        orderbook = self.get_orderbook(symbol, limit=config.ORDERBOOK_DEPTH)
         
         # Get candles for each timeframe
         timeframe_data = {}
@@ -445,6 +1000,36 @@ class BinanceClient:
         except BinanceAPIException as e:
             raise Exception(f"Error canceling order: {e}")
     
+    def cancel_orders(self, symbol: str, order_ids: List[int]) -> Dict:
+        """
+        Cancel several open orders of one symbol via the batch endpoint
+        (up to 10 orders per request instead of one request per order)
+        
+        Args:
+            symbol: Trading pair
+            order_ids: Order IDs to cancel
+            
+        Returns:
+            Dict with 'cancelled' order IDs and 'failed' {order_id: error}
+        """
+        self.check_credentials()
+        cancelled = []
+        failed = {}
+        for start in range(0, len(order_ids), BATCH_CANCEL_LIMIT):
+            batch = list(order_ids[start:start + BATCH_CANCEL_LIMIT])
+            try:
+                results = self.client.futures_cancel_orders(symbol=symbol, orderidlist=batch)
+            except BinanceAPIException as e:
+                failed.update({order_id: str(e) for order_id in batch})
+                continue
+            # One entry per requested order, in request order: the order or {'code', 'msg'}
+            for order_id, result in zip(batch, results):
+                if 'orderId' in result:
+                    cancelled.append(result['orderId'])
+                else:
+                    failed[order_id] = result.get('msg', str(result))
+        return {'symbol': symbol, 'cancelled': cancelled, 'failed': failed}
+    
     def cancel_all_orders(self, symbol: str) -> Dict:
         """
         Cancel all open orders for a symbol
@@ -524,6 +1109,7 @@ class BinanceClient:
                 'quantity': float(order['origQty']),
                 'price': float(order.get('price', 0)),
                 'stop_price': float(order.get('stopPrice', 0)),
+                'position_side': order.get('positionSide', 'BOTH'),
                 'timestamp': order['time']
             } for order in orders]
         except BinanceAPIException as e:
@@ -631,3 +1217,77 @@ class BinanceClient:
         except BinanceAPIException as e:
             raise Exception(f"Error fetching live trading stats: {e}")
 
+
+
+# =============================================================================
+# SHARED CLIENT REGISTRY
+# =============================================================================
+
+_client_registry = {}
+_client_registry_lock = threading.Lock()
+_client_registry_counters = {'clients_created': 0, 'clients_reused': 0}
+
+
+def get_binance_client(api_key: Optional[str] = None, api_secret: Optional[str] = None,
+                       demo: Optional[bool] = None) -> BinanceClient:
+    """
+    Get shared BinanceClient for (credentials, demo)
+    
+    Clients are created once per process and reused by all agents, threads
+    and web API requests, so TLS handshakes and the construction ping are paid
+    only once. Each thread talks through its own python-binance Client, all on
+    one keep-alive connection pool. Use this instead of BinanceClient().
+    
+    Args:
+        api_key: Optional API key (defaults to config)
+        api_secret: Optional API secret (defaults to config)
+        demo: Optional demo mode flag (defaults to config)
+        
+    Returns:
+        Shared BinanceClient instance
+    """
+    api_key = api_key if api_key else config.BINANCE_API_KEY
+    api_secret = api_secret if api_secret else config.BINANCE_API_SECRET
+    demo = demo if demo is not None else config.BINANCE_DEMO
+    key = (api_key, api_secret, demo)
+    
+    with _client_registry_lock:
+        client = _client_registry.get(key)
+        if client is not None:
+            _client_registry_counters['clients_reused'] += 1
+            return client
+    
+    # Construct and ping outside the lock - a slow ping must not block callers of other clients.
+    # If two threads race here, the first registered client wins and the other is dropped.
+    client = BinanceClient(api_key=api_key, api_secret=api_secret, demo=demo)
+    with _client_registry_lock:
+        registered = _client_registry.setdefault(key, client)
+        if registered is client:
+            _client_registry_counters['clients_created'] += 1
+        else:
+            _client_registry_counters['clients_reused'] += 1
+        return registered
+
+
+def get_client_registry_stats() -> Dict:
+    """
+    Get shared client registry statistics
+    
+    Returns:
+        Dictionary with client and connection reuse counters
+    """
+    with _client_registry_lock:
+        clients = list(_client_registry.values())
+        stats = dict(_client_registry_counters)
+    
+    stats['clients'] = len(clients)
+    stats['connections_opened'] = 0
+    stats['connections_reused'] = 0
+    stats['requests'] = 0
+    for client in clients:
+        conn_stats = client.get_connection_stats()
+        stats['connections_opened'] += conn_stats['connections_opened']
+        stats['connections_reused'] += conn_stats['connections_reused']
+        stats['requests'] += conn_stats['requests']
+    
+    return stats
@@ -0,0 +1,131 @@
+"""
+Local timeframe aggregation - higher timeframes built from one base interval.
+
+One base series per symbol (the smallest configured interval) is downloaded
+through the candle store; every higher timeframe is aggregated from it with
+Binance's UTC candle boundaries, so a new timeframe combination costs no
+extra REST calls. Only complete buckets are returned - a higher-timeframe
+candle appears once all of its base candles have closed, exactly when
+Binance closes it.
+"""
+
+import numpy as np
+from typing import Iterable, Optional
+from utils.candle_store import INTERVAL_MS
+from utils.kline_parser import KlineArrays
+
+# Weekly candles open Monday 00:00 UTC (the epoch was a Thursday)
+_BUCKET_OFFSET_MS = {'1w': 4 * 24 * 60 * 60_000}
+
+# Intervals whose boundaries we can reproduce ('3d' / '1M' are not epoch aligned)
+AGGREGATABLE_INTERVALS = [interval for interval in INTERVAL_MS if interval != '3d']
+
+_base_interval = None
+
+
+def bucket_start(open_time: np.ndarray, interval: str) -> np.ndarray:
+    """
+    Open time of the `interval` candle containing each open time (UTC aligned)
+
+    Args:
+        open_time: int64 open times in ms
+        interval: Target interval
+
+    Returns:
+        int64 array of bucket open times
+    """
+    size = INTERVAL_MS[interval]
+    offset = _BUCKET_OFFSET_MS.get(interval, 0)
+    return (open_time - offset) // size * size + offset
+
+
+def aggregate_klines(base: KlineArrays, base_interval: str, interval: str) -> KlineArrays:
+    """
+    Aggregate base candles into complete `interval` candles
+
+    Args:
+        base: Closed base candles (sorted, unique open times)
+        base_interval: Interval of base (e.g. '15m')
+        interval: Target interval (e.g. '1h') - multiple of base_interval
+
+    Returns:
+        KlineArrays of complete target candles (open = first open, high = max,
+        low = min, close = last close, volume = sum)
+    """
+    ratio = INTERVAL_MS[interval] // INTERVAL_MS[base_interval]
+    if len(base) == 0:
+        return KlineArrays(np.empty(0, dtype=np.int64), np.empty((0, 5)))
+
+    buckets = bucket_start(base.open_time, interval)
+    starts = np.flatnonzero(np.concatenate(([True], buckets[1:] != buckets[:-1])))
+    counts = np.diff(np.append(starts, len(buckets)))
+    ends = starts + counts - 1
+
+    # Partial buckets (window edges, missing base candles) are dropped
+    complete = counts == ratio
+    starts, ends = starts[complete], ends[complete]
+    if len(starts) == 0:
+        return KlineArrays(np.empty(0, dtype=np.int64), np.empty((0, 5)))
+
+    # reduceat over contiguous segments [start, next start) - only complete
+    # buckets are kept, so each segment is reduced on its own rows
+    segment_bounds = np.ravel(np.column_stack((starts, ends + 1)))
+    if segment_bounds[-1] == len(buckets):
+        segment_bounds = segment_bounds[:-1]
+
+    ohlcv = np.empty((len(starts), 5))
+    ohlcv[:, 0] = base.open[starts]
+    ohlcv[:, 1] = np.maximum.reduceat(base.high, segment_bounds)[::2]
+    ohlcv[:, 2] = np.minimum.reduceat(base.low, segment_bounds)[::2]
+    ohlcv[:, 3] = base.close[ends]
+    ohlcv[:, 4] = np.add.reduceat(base.volume, segment_bounds)[::2]
+
+    return KlineArrays(buckets[starts], ohlcv)
+
+
+def base_candles_needed(interval: str, base_interval: str, count: int) -> int:
+    """Base candles that always contain `count` complete target candles"""
+    ratio = INTERVAL_MS[interval] // INTERVAL_MS[base_interval]
+    # The newest (ratio - 1) base candles can belong to the still forming target candle
+    return count * ratio + ratio - 1
+
+
+def resolve_base_interval(intervals: Iterable[str], override: Optional[str] = None) -> Optional[str]:
+    """
+    Pick the base interval for a set of configured timeframes
+
+    Args:
+        intervals: Timeframes used by strategies / collectors
+        override: Forced base interval ('auto' or None = smallest configured)
+
+    Returns:
+        Base interval or None if no configured timeframe can be aggregated
+    """
+    if override and override != 'auto':
+        return override
+    candidates = [i for i in set(intervals) if i in AGGREGATABLE_INTERVALS]
+    return min(candidates, key=INTERVAL_MS.get) if candidates else None
+
+
+def set_base_interval(interval: Optional[str]):
+    """Enable local aggregation from `interval` (None disables)"""
+    global _base_interval
+    _base_interval = interval
+
+
+def get_aggregation_base(interval: str) -> Optional[str]:
+    """
+    Base interval to aggregate `interval` from, or None to fetch it directly
+
+    Args:
+        interval: Requested timeframe
+
+    Returns:
+        Configured base interval if interval is a larger, aligned multiple of it
+    """
+    base = _base_interval
+    if base is None or interval == base or interval not in AGGREGATABLE_INTERVALS:
+        return None
+    if INTERVAL_MS[interval] % INTERVAL_MS[base] != 0:
+        return None
+    return base
@@ -0,0 +1,335 @@
+"""Local OHLCV candle store - incremental kline history for BinanceClient.get_klines"""
+import sqlite3
+import threading
+import os
+import sys
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path for config import
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import config
+from utils.kline_parser import KlineArrays, parse_klines
+from utils.candle_window import CandleWindows
+from utils.scheduler import get_server_clock
+
+
+# Fixed-length Binance intervals in milliseconds ('1M' has variable length - not stored)
+INTERVAL_MS = {
+    '1m': 60_000,
+    '3m': 3 * 60_000,
+    '5m': 5 * 60_000,
+    '15m': 15 * 60_000,
+    '30m': 30 * 60_000,
+    '1h': 60 * 60_000,
+    '2h': 2 * 60 * 60_000,
+    '4h': 4 * 60 * 60_000,
+    '6h': 6 * 60 * 60_000,
+    '8h': 8 * 60 * 60_000,
+    '12h': 12 * 60 * 60_000,
+    '1d': 24 * 60 * 60_000,
+    '3d': 3 * 24 * 60 * 60_000,
+    '1w': 7 * 24 * 60 * 60_000,
+}
+
+# Binance futures klines endpoint returns at most 1500 candles per request
+MAX_KLINES_PER_REQUEST = 1500
+
+
+class CandleStore:
+    """
+    SQLite store of CLOSED candles keyed by (symbol, interval, open_time)
+
+    Only candles newer than the last stored one are downloaded, gaps inside the
+    requested window are backfilled, and reads return the same DataFrame shape
+    as BinanceClient.get_klines. The newest candles of each series are also
+    held in an in-memory ring buffer, so an up-to-date series is served
+    without touching SQLite.
+    """
+
+    def __init__(self, db_path: str = None, window_capacity: Optional[int] = None):
+        """
+        Initialize candle store
+
+        Args:
+            db_path: Path to SQLite database file (default: data/candles.db)
+            window_capacity: Candles kept in memory per series
+                             (default: config.CANDLE_WINDOW_CAPACITY, 0 = off)
+        """
+        if db_path is None:
+            project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+            data_dir = os.path.join(project_root, 'data')
+            os.makedirs(data_dir, exist_ok=True)
+            # Testnet candles differ from mainnet - never mix them
+            db_name = 'candles_testnet.db' if config.BINANCE_DEMO else 'candles.db'
+            db_path = os.path.join(data_dir, db_name)
+
+        self.db_path = db_path
+        if window_capacity is None:
+            window_capacity = config.CANDLE_WINDOW_CAPACITY
+        self.windows = CandleWindows(window_capacity) if window_capacity > 0 else None
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+        self.init_database()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def init_database(self):
+        """Create candles table if it doesn't exist"""
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS candles (
+                symbol TEXT NOT NULL,
+                interval TEXT NOT NULL,
+                open_time INTEGER NOT NULL,
+                open REAL NOT NULL,
+                high REAL NOT NULL,
+                low REAL NOT NULL,
+                close REAL NOT NULL,
+                volume REAL NOT NULL,
+                close_time INTEGER NOT NULL,
+                PRIMARY KEY (symbol, interval, open_time)
+            ) WITHOUT ROWID
+        ''')
+
+        conn.commit()
+        conn.close()
+
+    @staticmethod
+    def supports(interval: str) -> bool:
+        """Check if interval has a fixed length (can be stored incrementally)"""
+        return interval in INTERVAL_MS
+
+    def lock_for(self, symbol: str, interval: str) -> threading.Lock:
+        """
+        Get lock for a (symbol, interval) series
+
+        Parallel strategy threads asking for the same series wait for one
+        download instead of fetching the same candles twice.
+        """
+        key = (symbol, interval)
+        with self._locks_guard:
+            if key not in self._locks:
+                self._locks[key] = threading.Lock()
+            return self._locks[key]
+
+    def _window(self, symbol: str, interval: str):
+        """Loaded in-memory window of a series (None if empty / disabled)"""
+        if self.windows is None:
+            return None
+        window = self.windows.peek(symbol, interval)
+        return window if window is not None and len(window) else None
+
+    def get_last_open_time(self, symbol: str, interval: str) -> Optional[int]:
+        """Get open time (ms) of the newest stored candle"""
+        window = self._window(symbol, interval)
+        if window is not None:
+            return window.last_open_time
+
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute(
+            'SELECT MAX(open_time) FROM candles WHERE symbol = ? AND interval = ?',
+            (symbol, interval)
+        )
+        result = cursor.fetchone()[0]
+        conn.close()
+        return result
+
+    def save_klines(self, symbol: str, interval: str, klines: List) -> int:
+        """
+        Store closed candles (raw Binance kline rows)
+
+        Args:
+            symbol: Trading pair
+            interval: Timeframe
+            klines: Raw rows [open_time, open, high, low, close, volume, close_time, ...]
+                    Caller is responsible for stripping the forming candle.
+
+        Returns:
+            Number of rows written
+        """
+        if not klines:
+            return 0
+
+        rows = [
+            (symbol, interval, int(k[0]), float(k[1]), float(k[2]), float(k[3]),
+             float(k[4]), float(k[5]), int(k[6]))
+            for k in klines
+        ]
+
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.executemany('''
+            INSERT OR REPLACE INTO candles (
+                symbol, interval, open_time, open, high, low, close, volume, close_time
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', rows)
+        conn.commit()
+        conn.close()
+
+        # Keep the in-memory window in step (O(1) per new candle)
+        window = self._window(symbol, interval)
+        if window is not None:
+            window.extend(parse_klines(klines, drop_last=False))
+
+        return len(rows)
+
+    def plan_tail_fetch(self, symbol: str, interval: str, count: int,
+                        now_ms: Optional[int] = None) -> Dict:
+        """
+        Plan the request that brings the series up to date
+
+        Args:
+            symbol: Trading pair
+            interval: Timeframe
+            count: Number of closed candles the caller needs
+            now_ms: Current time in ms (default: server-corrected clock - a local
+                    clock running behind would see the just-closed candle as
+                    still forming and skip the fetch)
+
+        Returns:
+            futures_klines params ({'limit': n} or {'startTime': t, 'limit': n}),
+            or None if the newest closed candle is already stored.
+            The last candle of the response is the forming one.
+        """
+        interval_ms = INTERVAL_MS[interval]
+        now_ms = now_ms if now_ms is not None else int(get_server_clock().now_ms())
+        last_open_time = self.get_last_open_time(symbol, interval)
+
+        # +1 for the forming candle that gets dropped
+        full_fetch = {'limit': min(count + 1, MAX_KLINES_PER_REQUEST)}
+
+        if last_open_time is None:
+            return full_fetch
+
+        # Candles after the last stored one, including the forming candle
+        missing = (now_ms - last_open_time) // interval_ms
+        if missing <= 1:
+            # Only the forming candle is newer - nothing to download
+            return None
+        if missing + 1 > MAX_KLINES_PER_REQUEST or missing >= count:
+            # Store is too far behind - window is refetched in one go
+            return full_fetch
+
+        return {
+            'startTime': last_open_time + interval_ms,
+            'limit': max(int(missing) + 1, 2)
+        }
+
+    def find_gaps(self, symbol: str, interval: str, count: int) -> List[Tuple[int, int]]:
+        """
+        Find missing candles inside the window of the last `count` stored candles
+
+        Args:
+            symbol: Trading pair
+            interval: Timeframe
+            count: Window size (in candles) ending at the newest stored candle
+
+        Returns:
+            List of (start_open_time, end_open_time) ranges to backfill
+        """
+        # The in-memory window is contiguous by construction
+        window = self._window(symbol, interval)
+        if window is not None and len(window) >= count:
+            return []
+
+        interval_ms = INTERVAL_MS[interval]
+        last_open_time = self.get_last_open_time(symbol, interval)
+        if last_open_time is None:
+            return []
+
+        window_start = last_open_time - (count - 1) * interval_ms
+
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT open_time FROM candles
+            WHERE symbol = ? AND interval = ? AND open_time >= ?
+        ''', (symbol, interval, window_start))
+        present = {row[0] for row in cursor.fetchall()}
+        conn.close()
+
+        gaps = []
+        gap_start = None
+        for open_time in range(window_start, last_open_time + interval_ms, interval_ms):
+            if open_time not in present:
+                if gap_start is None:
+                    gap_start = open_time
+            elif gap_start is not None:
+                gaps.append((gap_start, open_time - interval_ms))
+                gap_start = None
+        if gap_start is not None:
+            gaps.append((gap_start, last_open_time))
+
+        return gaps
+
+    def load(self, symbol: str, interval: str, count: int) -> pd.DataFrame:
+        """
+        Load the newest `count` closed candles
+
+        Returns:
+            DataFrame with timestamp, open, high, low, close, volume
+            (same shape as BinanceClient.get_klines)
+        """
+        return self.load_arrays(symbol, interval, count).to_dataframe()
+
+    def load_arrays(self, symbol: str, interval: str, count: int) -> KlineArrays:
+        """
+        Load the newest `count` closed candles as typed arrays
+
+        Served from the in-memory window when it holds `count` candles,
+        otherwise read from SQLite and the window is refilled.
+
+        Returns:
+            KlineArrays (owned by the caller - never overwritten by later reads)
+        """
+        if self.windows is not None:
+            window = self.windows.get(symbol, interval, INTERVAL_MS[interval], count)
+            if len(window) >= count:
+                self.windows.record(hit=True)
+                return window.latest(count)
+            self.windows.record(hit=False)
+
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT open_time, open, high, low, close, volume FROM candles
+            WHERE symbol = ? AND interval = ?
+            ORDER BY open_time DESC
+            LIMIT ?
+        ''', (symbol, interval, count))
+        rows = cursor.fetchall()
+        conn.close()
+
+        rows.reverse()
+        open_time = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+        ohlcv = np.array([row[1:] for row in rows], dtype=np.float64).reshape(-1, 5)
+        candles = KlineArrays(open_time, ohlcv)
+
+        if self.windows is not None:
+            window.clear()
+            if window.extend(candles):
+                return window.latest(count)
+        return candles
+
+    def get_window_stats(self) -> Dict:
+        """In-memory window footprint (see CandleWindows.get_stats), {} if disabled"""
+        return self.windows.get_stats() if self.windows is not None else {}
+
+_candle_store = None
+_candle_store_lock = threading.Lock()
+
+
+def get_candle_store() -> CandleStore:
+    """Get process-wide candle store instance"""
+    global _candle_store
+    with _candle_store_lock:
+        if _candle_store is None:
+            _candle_store = CandleStore()
+        return _candle_store
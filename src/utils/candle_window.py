@@ -0,0 +1,178 @@
+"""
+In-memory candle windows - fixed-size NumPy ring buffers per (symbol, interval)
+
+The candle store keeps one window per series in front of SQLite: newly closed
+candles are appended in O(1) (no reload of the whole history every cycle) and
+reads copy the newest candles out in one block.
+
+Each buffer is mirrored - every row is written twice, at slot i and slot
+i + size - so the newest N rows are always one contiguous slice, never a
+wrapped pair of slices that would need concatenating.
+
+Reads are copies, not views: the ring is rewritten in place (appends, resets
+after a gap, refills with a longer window) while DataFrames built from earlier
+reads are still in use by strategies.
+"""
+
+import threading
+import numpy as np
+from typing import Dict, Optional
+from utils.kline_parser import KlineArrays
+
+
+class CandleRingBuffer:
+    """
+    Fixed-capacity window of the newest closed candles of one series
+
+    Rows are kept contiguous in open time: an append that would leave a hole
+    (or rewrite older candles) resets the window, and the caller reloads it
+    from the store.
+    """
+
+    __slots__ = ('interval_ms', 'capacity', '_size', '_open_time', '_ohlcv', '_head', '_length')
+
+    def __init__(self, interval_ms: int, capacity: int):
+        """
+        Preallocate the buffer
+
+        Args:
+            interval_ms: Candle interval in ms (used to check continuity)
+            capacity: Max candles kept
+        """
+        self.interval_ms = interval_ms
+        self.capacity = capacity
+        self._size = capacity
+        self._open_time = np.zeros(2 * self._size, dtype=np.int64)
+        self._ohlcv = np.zeros((2 * self._size, 5), dtype=np.float64)
+        self._head = 0
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def nbytes(self) -> int:
+        """Preallocated memory in bytes"""
+        return self._open_time.nbytes + self._ohlcv.nbytes
+
+    @property
+    def last_open_time(self) -> Optional[int]:
+        """Open time (ms) of the newest candle, None if empty"""
+        if self._length == 0:
+            return None
+        return int(self._open_time[self._head + self._size - 1])
+
+    def clear(self):
+        self._head = 0
+        self._length = 0
+
+    def extend(self, candles: KlineArrays) -> bool:
+        """
+        Append closed candles newer than the newest one in the window
+
+        Args:
+            candles: Closed candles sorted by open time
+
+        Returns:
+            False if they don't continue the window (window is cleared)
+        """
+        last = self.last_open_time
+        open_time = candles.open_time
+        if last is not None:
+            # Closed candles never change - rows we already hold (or older
+            # backfill outside the window) are skipped
+            first_new = int(np.searchsorted(open_time, last, side='right'))
+            if first_new:
+                candles = KlineArrays(open_time[first_new:], candles.ohlcv[first_new:])
+                open_time = candles.open_time
+            if len(open_time) and open_time[0] != last + self.interval_ms:
+                self.clear()
+                return False
+
+        if len(open_time) == 0:
+            return True
+        if len(open_time) > 1 and not (np.diff(open_time) == self.interval_ms).all():
+            self.clear()
+            return False
+
+        if len(open_time) > self.capacity:
+            candles = candles.tail(self.capacity)
+            open_time = candles.open_time
+
+        count = len(open_time)
+        slots = (self._head + np.arange(count)) % self._size
+        for offset in (0, self._size):
+            self._open_time[slots + offset] = open_time
+            self._ohlcv[slots + offset] = candles.ohlcv
+        self._head = (self._head + count) % self._size
+        self._length = min(self._length + count, self.capacity)
+        return True
+
+    def latest(self, count: int) -> KlineArrays:
+        """Newest `count` candles, copied out of the ring (one contiguous slice each)"""
+        count = min(count, self._length)
+        end = self._head + self._size
+        return KlineArrays(self._open_time[end - count:end].copy(), self._ohlcv[end - count:end].copy())
+
+
+class CandleWindows:
+    """
+    Registry of ring buffers keyed by (symbol, interval)
+
+    Buffers are preallocated at `capacity` candles; a series whose callers need
+    a longer window (e.g. an aggregation base feeding 4h from 15m) is
+    reallocated once at that size, so memory is set by the configured
+    timeframes and stays flat afterwards.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        self.capacity = capacity
+        self._buffers: Dict[tuple, CandleRingBuffer] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, symbol: str, interval: str, interval_ms: int, count: int = 0) -> CandleRingBuffer:
+        """
+        Buffer for a series, created (or grown to hold `count` candles) on demand
+
+        Returns:
+            CandleRingBuffer (callers hold the candle store series lock)
+        """
+        key = (symbol, interval)
+        with self._lock:
+            buffer = self._buffers.get(key)
+            if buffer is None or buffer.capacity < count:
+                buffer = CandleRingBuffer(interval_ms, max(self.capacity, count))
+                self._buffers[key] = buffer
+            return buffer
+
+    def peek(self, symbol: str, interval: str) -> Optional[CandleRingBuffer]:
+        """Existing buffer for a series (None if never loaded)"""
+        return self._buffers.get((symbol, interval))
+
+    def record(self, hit: bool):
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def get_stats(self) -> Dict:
+        """
+        Memory footprint and hit counters
+
+        Returns:
+            {'series', 'symbols', 'bytes', 'bytes_per_symbol', 'hits', 'misses'}
+        """
+        with self._lock:
+            buffers = dict(self._buffers)
+        symbols = {symbol for symbol, _ in buffers}
+        total = sum(buffer.nbytes for buffer in buffers.values())
+        return {
+            'series': len(buffers),
+            'symbols': len(symbols),
+            'bytes': total,
+            'bytes_per_symbol': total // len(symbols) if symbols else 0,
+            'hits': self.hits,
+            'misses': self.misses
+        }
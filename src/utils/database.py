@@ -5,12 +5,18 @@ from datetime import datetime
 from typing import Dict, List, Optional
 import os
 import sys
+import threading
 
 # Add parent directory to path for config import
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import config
 
 
+# Listeners notified when paper trades open/close in this process: (db_path, listener)
+_trade_listeners = []
+_trade_listeners_lock = threading.Lock()
+
+
 class TradingDatabase:
     """SQLite database for paper trading records"""
     
@@ -78,6 +84,14 @@ class TradingDatabase:
                 cursor.execute("ALTER TABLE trades ADD COLUMN size REAL DEFAULT 0")
                 conn.commit()
                 print("✅ Database migration complete (size column added)")
+            
+            if 'exit_tick_price' not in columns:
+                print("🔧 Migrating database: Adding exit tick columns...")
+                cursor.execute("ALTER TABLE trades ADD COLUMN exit_tick_price REAL")
+                cursor.execute("ALTER TABLE trades ADD COLUMN exit_tick_time TEXT")
+                cursor.execute("ALTER TABLE trades ADD COLUMN exit_tick_source TEXT")
+                conn.commit()
+                print("✅ Database migration complete (exit tick columns added)")
         
         # Trades table
         cursor.execute('''
@@ -114,6 +128,9 @@ class TradingDatabase:
                 reasoning TEXT,
                 valid INTEGER DEFAULT 1,
                 audit_notes TEXT,
+                exit_tick_price REAL,
+                exit_tick_time TEXT,
+                exit_tick_source TEXT,
                 created_at TEXT DEFAULT CURRENT_TIMESTAMP,
                 live_trade INTEGER DEFAULT 0
             )
@@ -151,9 +168,77 @@ class TradingDatabase:
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_runs_strategy ON strategy_runs(strategy)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_runs_timestamp ON strategy_runs(timestamp)')
         
+        # Candle-close-to-order latency of live orders (one row per entry order)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS order_latency (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                cycle_id TEXT NOT NULL,
+                strategy TEXT NOT NULL,
+                symbol TEXT NOT NULL,
+                interval_minutes INTEGER,
+                candle_close_ms INTEGER NOT NULL,
+                order_id TEXT,
+                schedule_ms REAL,
+                shared_data_ms REAL,
+                market_data_ms REAL,
+                analysis_ms REAL,
+                decision_ms REAL,
+                queue_ms REAL,
+                order_prep_ms REAL,
+                entry_order_ms REAL,
+                protective_orders_ms REAL,
+                entry_latency_ms REAL NOT NULL,
+                total_latency_ms REAL NOT NULL,
+                protective_orders INTEGER DEFAULT 0,
+                slo_ms REAL NOT NULL,
+                slo_breached INTEGER DEFAULT 0,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_latency_strategy ON order_latency(strategy)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_latency_close ON order_latency(candle_close_ms)')
+        
         conn.commit()
         conn.close()
     
+    def add_trade_listener(self, listener):
+        """
+        Register listener for trades opened/closed in this database
+        
+        Args:
+            listener: Object with on_trade_opened(trade: Dict) and on_trade_closed(trade_id: str)
+        """
+        with _trade_listeners_lock:
+            _trade_listeners.append((self.db_path, listener))
+    
+    def remove_trade_listener(self, listener):
+        """Unregister listener added by add_trade_listener"""
+        with _trade_listeners_lock:
+            _trade_listeners[:] = [(path, l) for path, l in _trade_listeners if l is not listener]
+    
+    def _listeners(self) -> List:
+        with _trade_listeners_lock:
+            return [l for path, l in _trade_listeners if path == self.db_path]
+    
+    def notify_trade_opened(self, trade: Dict):
+        """
+        Notify listeners about a new OPEN trade
+        
+        Called by create_trade; code inserting trades manually must call it too.
+        """
+        for listener in self._listeners():
+            try:
+                listener.on_trade_opened(trade)
+            except Exception as e:
+                print(f"⚠️  Trade listener error (opened {trade.get('trade_id')}): {e}")
+    
+    def _notify_trade_closed(self, trade_id: str):
+        for listener in self._listeners():
+            try:
+                listener.on_trade_closed(trade_id)
+            except Exception as e:
+                print(f"⚠️  Trade listener error (closed {trade_id}): {e}")
+    
     def create_trade(self, trade_data: Dict) -> str:
         """
         Create a new paper trade
@@ -211,6 +296,14 @@ class TradingDatabase:
         conn.commit()
         conn.close()
         
+        self.notify_trade_opened({
+            'trade_id': trade_id,
+            'symbol': trade_data['symbol'],
+            'action': trade_data['action'],
+            'stop_loss': trade_data['stop_loss'],
+            'take_profit': trade_data['take_profit']
+        })
+        
         return trade_id
     
     def mark_trade_invalid(self, trade_id: str, reason: str):
@@ -255,7 +348,8 @@ class TradingDatabase:
         
         return trades
     
-    def close_trade(self, trade_id: str, exit_price: float, exit_reason: str, fee_rate: float = None):
+    def close_trade(self, trade_id: str, exit_price: float, exit_reason: str, fee_rate: float = None,
+                    exit_tick: Optional[Dict] = None) -> bool:
         """
         Close a trade and calculate P&L (with fees deducted)
         
@@ -264,6 +358,10 @@ class TradingDatabase:
             exit_price: Exit price
             exit_reason: Reason for exit (TP_HIT, SL_HIT, MANUAL)
             fee_rate: Trading fee rate (default from config.TRADING_FEE_RATE)
+            exit_tick: Optional price tick that triggered the exit (price, event_time ms, source)
+            
+        Returns:
+            True if the trade was closed, False if it was already closed
         """
         if fee_rate is None:
             fee_rate = config.TRADING_FEE_RATE
@@ -314,8 +412,11 @@ class TradingDatabase:
                 exit_fee = ?,
                 total_fees = ?,
                 pnl = ?,
-                pnl_percentage = ?
-            WHERE trade_id = ?
+                pnl_percentage = ?,
+                exit_tick_price = ?,
+                exit_tick_time = ?,
+                exit_tick_source = ?
+            WHERE trade_id = ? AND status = 'OPEN'
         ''', (
             datetime.utcnow().isoformat() + 'Z',
             exit_price,
@@ -324,11 +425,20 @@ class TradingDatabase:
             total_fees,
             pnl,
             pnl_percentage,
+            exit_tick['price'] if exit_tick else None,
+            datetime.utcfromtimestamp(exit_tick['event_time'] / 1000).isoformat() + 'Z' if exit_tick else None,
+            exit_tick.get('source') if exit_tick else None,
             trade_id
         ))
+        # Guard against double close (e.g. monitoring and dashboard at the same time)
+        closed = cursor.rowcount > 0
         
         conn.commit()
         conn.close()
+        
+        self._notify_trade_closed(trade_id)
+        
+        return closed
     
     def get_trade_stats(self, symbol: Optional[str] = None, strategy: Optional[str] = None) -> Dict:
         """Get trading statistics"""
@@ -502,4 +612,64 @@ class TradingDatabase:
         conn.close()
         
         return runs
-
+    
+    def log_order_latency(self, record: Dict) -> int:
+        """
+        Store the candle-close-to-order latency of one live order
+        
+        Args:
+            record: Row from OrderLatencyTimer.record()
+            
+        Returns:
+            Row id
+        """
+        columns = [
+            'cycle_id', 'strategy', 'symbol', 'interval_minutes', 'candle_close_ms', 'order_id',
+            'schedule_ms', 'shared_data_ms', 'market_data_ms', 'analysis_ms', 'decision_ms',
+            'queue_ms', 'order_prep_ms', 'entry_order_ms', 'protective_orders_ms',
+            'entry_latency_ms', 'total_latency_ms', 'protective_orders', 'slo_ms', 'slo_breached'
+        ]
+        values = [record.get(column) for column in columns]
+        values[columns.index('order_id')] = str(record['order_id']) if record.get('order_id') is not None else None
+        values[columns.index('slo_breached')] = int(bool(record.get('slo_breached')))
+        
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute(
+            f"INSERT INTO order_latency ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+            values
+        )
+        row_id = cursor.lastrowid
+        conn.commit()
+        conn.close()
+        
+        return row_id
+    
+    def get_order_latency(self, strategy: Optional[str] = None, since_ms: Optional[int] = None,
+                          limit: int = 1000) -> List[Dict]:
+        """Get live order latency rows (newest first) with optional filtering"""
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        
+        query = 'SELECT * FROM order_latency WHERE 1=1'
+        params = []
+        
+        if strategy:
+            query += ' AND strategy = ?'
+            params.append(strategy)
+        
+        if since_ms:
+            query += ' AND candle_close_ms >= ?'
+            params.append(since_ms)
+        
+        query += ' ORDER BY candle_close_ms DESC, id DESC LIMIT ?'
+        params.append(limit)
+        
+        cursor.execute(query, params)
+        rows = [dict(row) for row in cursor.fetchall()]
+        conn.close()
+        
+        for row in rows:
+            row['slo_breached'] = bool(row['slo_breached'])
+        return rows
@@ -0,0 +1,192 @@
+"""Vectorized NumPy indicator kernel - raw values for calculate_all_indicators in a few array passes"""
+import numpy as np
+from typing import Dict, List, Sequence, Tuple
+
+
+# Max growth of the in-block weights in ewm() - bounds cancellation error to ~1e-12
+_EWM_MAX_GAIN = 1e4
+
+
+def ewm(x: np.ndarray, alphas: Sequence[float]) -> np.ndarray:
+    """
+    Exponentially weighted mean (pandas ewm(adjust=False)) of several series at once
+
+    Uses the closed form y[t0+j] = b^j * (y[t0] + a * sum_i b^-i * x[t0+i]) evaluated
+    with cumsum in blocks short enough that b^-i stays bounded, so the whole
+    recursion is a handful of array operations instead of a Python loop.
+
+    Args:
+        x: Array (k, n) - one row per series (or 1-D for a single series)
+        alphas: Smoothing factor of each row
+
+    Returns:
+        Array (k, n) of smoothed values (no min_periods masking)
+    """
+    x = np.atleast_2d(np.asarray(x, dtype=float))
+    k, n = x.shape
+    out = np.empty_like(x)
+    if n == 0:
+        return out
+
+    a = np.asarray(alphas, dtype=float).reshape(k, 1)
+    b = 1.0 - a
+    block = max(1, int(np.log(_EWM_MAX_GAIN) / -np.log(b.min()))) if b.min() > 0 else 1
+
+    steps = np.arange(1, block + 1)
+    decay = b ** steps          # b^1 .. b^block
+    gain = a / decay            # a * b^-i
+
+    # The recursion is linear - run it on deviations from the first value
+    # (smaller magnitudes, and flat series stay exactly flat)
+    base = x[:, :1]
+    dev = x - base
+
+    y = np.zeros(k)
+    out[:, 0] = 0.0
+    t = 1
+    while t < n:
+        m = min(block, n - t)
+        acc = np.cumsum(dev[:, t:t + m] * gain[:, :m], axis=1)
+        out[:, t:t + m] = decay[:, :m] * (y[:, None] + acc)
+        y = out[:, t + m - 1]
+        t += m
+
+    return out + base
+
+
+def _mask_warmup(series: np.ndarray, min_periods: int) -> np.ndarray:
+    """NaN for the first min_periods-1 values (same as ta / pandas min_periods)"""
+    series[:min(min_periods - 1, len(series))] = np.nan
+    return series
+
+
+def _rsi_from_ewm(emaup: np.ndarray, emadn: np.ndarray) -> np.ndarray:
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(emadn == 0, 100.0, 100.0 - 100.0 / (1.0 + emaup / emadn))
+
+
+def compute_ema_values(close: np.ndarray, periods: Sequence[int]) -> Dict[int, float]:
+    """
+    Last EMA value (ewm(span, adjust=False), NaN while warming up) for each period
+
+    Args:
+        close: 1-D close array (oldest first)
+        periods: EMA periods
+
+    Returns:
+        Dictionary {period: value}
+    """
+    close = np.asarray(close, dtype=float)
+    periods = list(periods)
+    if not periods:
+        return {}
+    smoothed = ewm(np.vstack([close] * len(periods)), [2.0 / (p + 1) for p in periods])
+    return {period: _mask_warmup(smoothed[i].copy(), period)[-1] for i, period in enumerate(periods)}
+
+
+def compute_indicator_values(close: np.ndarray, high: np.ndarray, low: np.ndarray, volume: np.ndarray,
+                             ema_periods: Sequence[int] = (20, 50),
+                             rsi_periods: Sequence[int] = (14, 7),
+                             macd_params: Tuple[int, int, int] = (12, 26, 9),
+                             bb_period: int = 20, bb_std: float = 2,
+                             atr_period: int = 14, volume_period: int = 20,
+                             rsi_tail: int = 3) -> Dict:
+    """
+    Compute raw indicator values from OHLCV arrays
+
+    Matches the ta library / pandas definitions used by utils.indicators:
+    EMA = ewm(span, adjust=False), RSI = Wilder ewm(alpha=1/period), MACD on
+    EMA(fast) - EMA(slow) with EMA(signal), Bollinger = rolling mean +/- std
+    (ddof=0), ATR = rolling mean of true range.
+
+    Args:
+        close, high, low, volume: 1-D float arrays (oldest first)
+        ema_periods: EMA periods
+        rsi_periods: RSI periods
+        macd_params: (fast, slow, signal)
+        bb_period: Bollinger window
+        bb_std: Bollinger std multiplier
+        atr_period: ATR window
+        volume_period: Volume average window
+        rsi_tail: Number of trailing RSI values to return
+
+    Returns:
+        Dictionary with raw numpy float values:
+            close, ema {period: value}, rsi {period: last rsi_tail values},
+            macd (macd, signal, histogram), bollinger (upper, middle, lower, avg_band_width),
+            atr, volume (current, average, last 5 volumes)
+    """
+    close = np.asarray(close, dtype=float)
+    high = np.asarray(high, dtype=float)
+    low = np.asarray(low, dtype=float)
+    volume = np.asarray(volume, dtype=float)
+    n = len(close)
+
+    fast, slow, sign = macd_params
+    ema_periods = list(ema_periods)
+    rsi_periods = list(rsi_periods)
+    span_periods = [fast, slow] + ema_periods
+
+    # Pass 1: every close EMA plus RSI up/down smoothing in one ewm() call
+    diff = np.diff(close, prepend=np.nan)
+    diff[0] = 0.0  # ta: diff.where(diff > 0, 0.0) turns the leading NaN into 0
+    up = np.where(diff > 0, diff, 0.0)
+    down = np.where(diff < 0, -diff, 0.0)
+
+    rows = [close] * len(span_periods)
+    alphas = [2.0 / (p + 1) for p in span_periods]
+    for period in rsi_periods:
+        rows += [up, down]
+        alphas += [1.0 / period, 1.0 / period]
+
+    smoothed = ewm(np.vstack(rows), alphas)
+
+    ema_series = {}
+    for i, period in enumerate(span_periods):
+        ema_series.setdefault(period, _mask_warmup(smoothed[i].copy(), period))
+
+    rsi = {}
+    offset = len(span_periods)
+    for j, period in enumerate(rsi_periods):
+        emaup = _mask_warmup(smoothed[offset + 2 * j].copy(), period)
+        emadn = _mask_warmup(smoothed[offset + 2 * j + 1].copy(), period)
+        rsi[period] = _rsi_from_ewm(emaup[-rsi_tail:], emadn[-rsi_tail:])
+
+    # Pass 2: MACD signal line (starts where the slow EMA becomes valid)
+    macd_line = ema_series[fast] - ema_series[slow]
+    if n >= slow:
+        signal_series = np.full(n, np.nan)
+        signal_series[slow - 1:] = _mask_warmup(ewm(macd_line[slow - 1:], [2.0 / (sign + 1)])[0], sign)
+        macd = (macd_line[-1], signal_series[-1], macd_line[-1] - signal_series[-1])
+    else:
+        macd = (np.nan, np.nan, np.nan)
+
+    # Rolling windows (Bollinger, squeeze average, ATR, volume)
+    if n >= bb_period:
+        last_window = close[-bb_period:]
+        middle = last_window.mean()
+        std = last_window.std()
+        upper = middle + bb_std * std
+        lower = middle - bb_std * std
+        # Squeeze reference: mean of 2 * 2 * rolling std (pandas default ddof=1)
+        windows = np.lib.stride_tricks.sliding_window_view(close, bb_period)
+        avg_band_width = (windows.std(axis=1, ddof=1) * 2 * 2).mean()
+    else:
+        upper = middle = lower = avg_band_width = np.nan
+
+    prev_close = np.concatenate(([np.nan], close[:-1]))
+    with np.errstate(invalid='ignore'):
+        true_range = np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+    atr = true_range[-atr_period:].mean() if n >= atr_period else np.nan
+
+    avg_volume = volume[-volume_period:].mean() if n >= volume_period else np.nan
+
+    return {
+        'close': close[-1],
+        'ema': {period: ema_series[period][-1] for period in ema_periods},
+        'rsi': rsi,
+        'macd': macd,
+        'bollinger': (upper, middle, lower, avg_band_width),
+        'atr': atr,
+        'volume': (volume[-1], avg_volume, volume[-5:])
+    }
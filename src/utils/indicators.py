@@ -1,10 +1,14 @@
 """Technical indicators calculation utilities"""
+import threading
 import pandas as pd
 import numpy as np
+from collections import OrderedDict
 from ta.momentum import RSIIndicator
 from ta.trend import MACD, EMAIndicator
 from ta.volatility import BollingerBands
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+from utils.indicator_kernel import compute_indicator_values, compute_ema_values
+from utils.swing_detector import detect_swings
 
 
 def calculate_rsi(df: pd.DataFrame, period: int = 14, return_series: bool = False) -> Dict:
@@ -20,7 +24,16 @@ def calculate_rsi(df: pd.DataFrame, period: int = 14, return_series: bool = Fals
     """
     rsi = RSIIndicator(close=df['close'], window=period)
     rsi_series = rsi.rsi()
-    rsi_value = rsi_series.iloc[-1]
+    
+    if return_series:
+        return rsi_series
+    
+    return _format_rsi(rsi_series.values[-3:])
+
+
+def _format_rsi(rsi_tail: np.ndarray) -> Dict:
+    """Build RSI result from the last (up to 3) RSI values"""
+    rsi_value = rsi_tail[-1]
     
     # Determine signal
     if rsi_value < 30:
@@ -32,10 +45,10 @@ def calculate_rsi(df: pd.DataFrame, period: int = 14, return_series: bool = Fals
     
     # Detect RSI turning (for reversal detection)
     turning = "none"
-    if len(rsi_series) >= 3:
-        rsi_3 = rsi_series.iloc[-3]
-        rsi_2 = rsi_series.iloc[-2]
-        rsi_1 = rsi_series.iloc[-1]
+    if len(rsi_tail) >= 3:
+        rsi_3 = rsi_tail[-3]
+        rsi_2 = rsi_tail[-2]
+        rsi_1 = rsi_tail[-1]
         
         # Turning up (bullish reversal)
         if rsi_3 > rsi_2 and rsi_1 > rsi_2 and rsi_1 > rsi_3:
@@ -44,9 +57,6 @@ def calculate_rsi(df: pd.DataFrame, period: int = 14, return_series: bool = Fals
         elif rsi_3 < rsi_2 and rsi_1 < rsi_2 and rsi_1 < rsi_3:
             turning = "turning_down"
     
-    if return_series:
-        return rsi_series
-    
     return {
         "value": round(rsi_value, 2),
         "signal": signal,
@@ -73,6 +83,11 @@ def calculate_macd(df: pd.DataFrame, fast: int = 12, slow: int = 26, signal: int
     signal_line = macd.macd_signal().iloc[-1]
     histogram = macd.macd_diff().iloc[-1]
     
+    return _format_macd(macd_line, signal_line, histogram)
+
+
+def _format_macd(macd_line: float, signal_line: float, histogram: float) -> Dict:
+    """Build MACD result from raw values"""
     # Determine signal based on histogram and crossover
     if histogram > 0:
         macd_signal = "bullish"
@@ -100,11 +115,20 @@ def calculate_ema(df: pd.DataFrame, periods: List[int] = [20, 50]) -> Dict:
     Returns:
         Dictionary with EMA values and trend
     """
+    values = {}
+    for period in periods:
+        ema = EMAIndicator(close=df['close'], window=period)
+        values[period] = ema.ema_indicator().iloc[-1]
+    
+    return _format_ema(values, periods)
+
+
+def _format_ema(values: Dict[int, float], periods: List[int]) -> Dict:
+    """Build EMA result from raw values {period: ema}"""
     result = {}
     
     for period in periods:
-        ema = EMAIndicator(close=df['close'], window=period)
-        result[f"ema_{period}"] = round(ema.ema_indicator().iloc[-1], 2)
+        result[f"ema_{period}"] = round(values[period], 2)
     
     # Determine trend
     if len(periods) >= 2:
@@ -140,6 +164,15 @@ def calculate_bollinger_bands(df: pd.DataFrame, period: int = 20, std_dev: int =
     lower = bb.bollinger_lband().iloc[-1]
     current_price = df['close'].iloc[-1]
     
+    # Squeeze reference: average band width over the whole window
+    avg_band_width = (df['close'].rolling(window=20).std() * 2 * 2).mean()
+    
+    return _format_bollinger_bands(upper, middle, lower, current_price, avg_band_width)
+
+
+def _format_bollinger_bands(upper: float, middle: float, lower: float,
+                            current_price: float, avg_band_width: float) -> Dict:
+    """Build Bollinger Bands result from raw values"""
     # Determine position
     band_width = upper - lower
     upper_threshold = middle + (band_width * 0.4)
@@ -157,7 +190,6 @@ def calculate_bollinger_bands(df: pd.DataFrame, period: int = 20, std_dev: int =
         position = "middle"
     
     # Check for squeeze (low volatility)
-    avg_band_width = (df['close'].rolling(window=20).std() * 2 * 2).mean()
     squeeze = band_width < avg_band_width * 0.5
     
     return {
@@ -169,41 +201,31 @@ def calculate_bollinger_bands(df: pd.DataFrame, period: int = 20, std_dev: int =
     }
 
 
-def find_support_resistance(df: pd.DataFrame, window: int = 10) -> Dict:
+def find_support_resistance(df: pd.DataFrame, window: int = 10, lookback: Optional[int] = None) -> Dict:
     """
     Find support and resistance levels using swing highs and lows
     
     Args:
         df: DataFrame with 'high' and 'low' columns
         window: Window for finding local extremes
+        lookback: Only search the last N candles (None = all)
         
     Returns:
         Dictionary with support/resistance levels
     """
-    # Find local maxima (resistance)
-    highs = df['high'].values
-    resistance_levels = []
-    
-    for i in range(window, len(highs) - window):
-        if highs[i] == max(highs[i-window:i+window+1]):
-            resistance_levels.append(highs[i])
-    
-    # Find local minima (support)
-    lows = df['low'].values
-    support_levels = []
-    
-    for i in range(window, len(lows) - window):
-        if lows[i] == min(lows[i-window:i+window+1]):
-            support_levels.append(lows[i])
+    # Local maxima (resistance) and minima (support)
+    swings = detect_swings(df['high'].values, df['low'].values, window=window, lookback=lookback)
+    resistance_levels = swings['swing_highs']
+    support_levels = swings['swing_lows']
     
     current_price = df['close'].iloc[-1]
     
     # Find nearest levels
-    resistance_above = [r for r in resistance_levels if r > current_price]
-    support_below = [s for s in support_levels if s < current_price]
+    resistance_above = resistance_levels[resistance_levels > current_price]
+    support_below = support_levels[support_levels < current_price]
     
-    nearest_resistance = min(resistance_above) if resistance_above else current_price * 1.05
-    nearest_support = max(support_below) if support_below else current_price * 0.95
+    nearest_resistance = resistance_above.min() if len(resistance_above) else current_price * 1.05
+    nearest_support = support_below.max() if len(support_below) else current_price * 0.95
     
     # Determine position
     resistance_distance = nearest_resistance - current_price
@@ -237,11 +259,16 @@ def calculate_volume_analysis(df: pd.DataFrame, period: int = 20) -> Dict:
     """
     current_volume = df['volume'].iloc[-1]
     avg_volume = df['volume'].rolling(window=period).mean().iloc[-1]
+    recent_volumes = df['volume'].tail(5).values
     
+    return _format_volume_analysis(current_volume, avg_volume, recent_volumes)
+
+
+def _format_volume_analysis(current_volume: float, avg_volume: float, recent_volumes: np.ndarray) -> Dict:
+    """Build volume analysis result from raw values"""
     current_vs_avg = current_volume / avg_volume if avg_volume > 0 else 1.0
     
     # Determine trend
-    recent_volumes = df['volume'].tail(5).values
     if len(recent_volumes) >= 3:
         if recent_volumes[-1] > recent_volumes[-2] > recent_volumes[-3]:
             trend = "increasing"
@@ -258,39 +285,58 @@ def calculate_volume_analysis(df: pd.DataFrame, period: int = 20) -> Dict:
     }
 
 
-def analyze_orderbook(orderbook: Dict, current_price: float) -> Dict:
+def _orderbook_side(orders) -> np.ndarray:
+    """Orderbook side as (levels, 2) float64 array of [price, qty] (lists are converted)"""
+    return np.asarray(orders, dtype=np.float64).reshape(-1, 2)
+
+
+def _depth_volumes(orders: np.ndarray, current_price: float, depth_levels: Tuple[float, ...]) -> Dict:
+    """
+    Volume within each percentage depth of current price
+    
+    Levels are sorted by distance once; every band is then a searchsorted
+    lookup into the cumulative quantity, so extra bands cost almost nothing.
+    """
+    distance_pct = np.abs((orders[:, 0] - current_price) / current_price * 100)
+    order = np.argsort(distance_pct, kind='stable')
+    cumulative = np.concatenate(([0.0], np.cumsum(orders[order, 1])))
+    counts = np.searchsorted(distance_pct[order], depth_levels, side='right')
+    return {f"{depth_pct}%": float(cumulative[count]) for depth_pct, count in zip(depth_levels, counts)}
+
+
+def _find_walls(orders: np.ndarray, avg_size: float) -> List[Dict]:
+    """Levels larger than 3x the average size (orders = top levels)"""
+    walls = orders[orders[:, 1] > avg_size * 3]
+    return [{"price": round(float(price), 2), "size": round(float(qty), 2)} for price, qty in walls[:3]]
+
+
+def analyze_orderbook(orderbook: Dict, current_price: float,
+                      depth_levels: Tuple[float, ...] = (0.5, 1.0, 2.0), top_levels: int = 20) -> Dict:
     """
     Analyze orderbook for buying/selling pressure
     
     Args:
-        orderbook: Dictionary with bids and asks [[price, qty], ...]
+        orderbook: Dictionary with bids and asks - (levels, 2) float64 arrays
+                   or [[price, qty], ...] lists
         current_price: Current market price
+        depth_levels: Depth bands in % from current price
+        top_levels: Levels per side used for imbalance and walls
         
     Returns:
         Dictionary with orderbook analysis
     """
-    bids = orderbook['bids']  # Buy orders
-    asks = orderbook['asks']  # Sell orders
+    bids = _orderbook_side(orderbook['bids'])  # Buy orders
+    asks = _orderbook_side(orderbook['asks'])  # Sell orders
     
     # Calculate total volume at different depths
-    def calculate_depth_volume(orders, depth_levels=[0.5, 1.0, 2.0]):
-        """Calculate volume within percentage depth"""
-        volumes = {}
-        for depth_pct in depth_levels:
-            volume = 0
-            for price, qty in orders:
-                price_diff_pct = abs((price - current_price) / current_price * 100)
-                if price_diff_pct <= depth_pct:
-                    volume += qty
-            volumes[f"{depth_pct}%"] = volume
-        return volumes
-    
-    bid_volumes = calculate_depth_volume(bids)
-    ask_volumes = calculate_depth_volume(asks)
+    bid_volumes = _depth_volumes(bids, current_price, depth_levels)
+    ask_volumes = _depth_volumes(asks, current_price, depth_levels)
     
     # Calculate bid/ask imbalance
-    total_bid_volume = sum(qty for _, qty in bids[:20])  # Top 20 levels
-    total_ask_volume = sum(qty for _, qty in asks[:20])
+    top_bids = bids[:top_levels]
+    top_asks = asks[:top_levels]
+    total_bid_volume = float(top_bids[:, 1].sum())
+    total_ask_volume = float(top_asks[:, 1].sum())
     
     total_volume = total_bid_volume + total_ask_volume
     if total_volume > 0:
@@ -315,25 +361,14 @@ def analyze_orderbook(orderbook: Dict, current_price: float) -> Dict:
         pressure = "balanced"
     
     # Calculate spread
-    best_bid = bids[0][0] if bids else current_price
-    best_ask = asks[0][0] if asks else current_price
+    best_bid = float(bids[0, 0]) if len(bids) else current_price
+    best_ask = float(asks[0, 0]) if len(asks) else current_price
     spread = best_ask - best_bid
     spread_pct = (spread / current_price) * 100 if current_price > 0 else 0
     
-    # Find large orders (walls)
-    avg_bid_size = np.mean([qty for _, qty in bids[:20]]) if bids else 0
-    avg_ask_size = np.mean([qty for _, qty in asks[:20]]) if asks else 0
-    
-    bid_walls = []
-    ask_walls = []
-    
-    for price, qty in bids[:20]:
-        if qty > avg_bid_size * 3:  # 3x average = wall
-            bid_walls.append({"price": round(price, 2), "size": round(qty, 2)})
-    
-    for price, qty in asks[:20]:
-        if qty > avg_ask_size * 3:
-            ask_walls.append({"price": round(price, 2), "size": round(qty, 2)})
+    # Find large orders (walls) - 3x average of the top levels
+    bid_walls = _find_walls(top_bids, top_bids[:, 1].mean()) if len(top_bids) else []
+    ask_walls = _find_walls(top_asks, top_asks[:, 1].mean()) if len(top_asks) else []
     
     return {
         "imbalance": {
@@ -351,8 +386,8 @@ def analyze_orderbook(orderbook: Dict, current_price: float) -> Dict:
             "percentage": round(spread_pct, 4)
         },
         "walls": {
-            "bid_walls": bid_walls[:3],  # Top 3 walls
-            "ask_walls": ask_walls[:3],
+            "bid_walls": bid_walls,  # Top 3 walls
+            "ask_walls": ask_walls,
             "has_significant_walls": len(bid_walls) > 0 or len(ask_walls) > 0
         }
     }
@@ -384,6 +419,11 @@ def calculate_atr(df: pd.DataFrame, period: int = 14) -> Dict:
     current_atr = atr.iloc[-1]
     current_price = close.iloc[-1]
     
+    return _format_atr(current_atr, current_price)
+
+
+def _format_atr(current_atr: float, current_price: float) -> Dict:
+    """Build ATR result from raw values"""
     # ATR as percentage of price
     atr_percentage = (current_atr / current_price) * 100
     
@@ -482,35 +522,23 @@ def calculate_stop_take_profit(df: pd.DataFrame, direction: str,
     }
 
 
-def detect_trend_pattern(df: pd.DataFrame, lookback: int = 20) -> Dict:
+def detect_trend_pattern(df: pd.DataFrame, lookback: int = 20, window: int = 2) -> Dict:
     """
     Detect trend patterns (Higher Highs/Lows, Lower Highs/Lows)
     
     Args:
         df: DataFrame with OHLCV data
         lookback: Period for pattern detection
+        window: Candles on each side a swing point must strictly exceed
         
     Returns:
         Dictionary with trend pattern information
     """
-    # Get recent highs and lows
-    recent_data = df.tail(lookback)
-    
-    # Find swing points
-    highs = recent_data['high'].values
-    lows = recent_data['low'].values
-    
-    # Identify swing highs (local maxima)
-    swing_highs = []
-    for i in range(2, len(highs) - 2):
-        if highs[i] > highs[i-1] and highs[i] > highs[i-2] and highs[i] > highs[i+1] and highs[i] > highs[i+2]:
-            swing_highs.append(highs[i])
-    
-    # Identify swing lows (local minima)
-    swing_lows = []
-    for i in range(2, len(lows) - 2):
-        if lows[i] < lows[i-1] and lows[i] < lows[i-2] and lows[i] < lows[i+1] and lows[i] < lows[i+2]:
-            swing_lows.append(lows[i])
+    # Swing points of recent highs and lows
+    swings = detect_swings(df['high'].values, df['low'].values, window=window,
+                           lookback=lookback, strict=True)
+    swing_highs = swings['swing_highs']
+    swing_lows = swings['swing_lows']
     
     # Determine pattern
     pattern = "unclear"
@@ -546,8 +574,8 @@ def detect_trend_pattern(df: pd.DataFrame, lookback: int = 20) -> Dict:
         "trend_direction": trend_direction,
         "swing_highs_count": len(swing_highs),
         "swing_lows_count": len(swing_lows),
-        "last_swing_high": round(swing_highs[-1], 2) if swing_highs else None,
-        "last_swing_low": round(swing_lows[-1], 2) if swing_lows else None
+        "last_swing_high": round(swing_highs[-1], 2) if len(swing_highs) else None,
+        "last_swing_low": round(swing_lows[-1], 2) if len(swing_lows) else None
     }
 
 
@@ -716,60 +744,183 @@ def detect_choppy_market(indicators: Dict, current_price: float) -> Dict:
     }
 
 
-def calculate_all_indicators(df: pd.DataFrame) -> Dict:
+class FeatureCache:
+    """
+    Thread-safe LRU cache of indicator results
+    
+    Strategies on the same symbol (e.g. sol / sol_fast) analyze identical
+    closed candles; results are keyed by (symbol, interval, last candle time,
+    candle count, indicator name, parameters) so parallel strategy threads
+    compute each feature once. A key that is being computed by another thread
+    is waited for instead of computed twice.
+    
+    Cached values are shared between callers - treat them as read-only.
+    """
+    
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._cycle_hits = 0
+        self._cycle_misses = 0
+    
+    def get_or_compute(self, key: Hashable, compute: Callable):
+        """
+        Return cached value for key, computing (and storing) it on a miss
+        
+        Args:
+            key: Hashable cache key
+            compute: Zero-argument callable producing the value
+            
+        Returns:
+            Cached or freshly computed value
+        """
+        while True:
+            with self._lock:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    self._cycle_hits += 1
+                    return self._entries[key]
+                
+                pending = self._pending.get(key)
+                if pending is None:
+                    pending = self._pending[key] = threading.Event()
+                    self.misses += 1
+                    self._cycle_misses += 1
+                    break
+            
+            # Another thread is computing this key - wait, then re-check
+            # (if it failed, the loop computes the value here)
+            pending.wait()
+        
+        try:
+            value = compute()
+            with self._lock:
+                self._entries[key] = value
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+            return value
+        finally:
+            with self._lock:
+                del self._pending[key]
+            pending.set()
+    
+    def take_cycle_stats(self) -> Dict:
+        """Hits/misses since the previous call (per analysis cycle)"""
+        with self._lock:
+            hits, misses = self._cycle_hits, self._cycle_misses
+            self._cycle_hits = self._cycle_misses = 0
+        total = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / total * 100 if total else 0.0
+        }
+    
+    def get_stats(self) -> Dict:
+        """Cumulative cache statistics"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / total * 100 if total else 0.0
+            }
+    
+    def clear(self):
+        """Drop all cached results"""
+        with self._lock:
+            self._entries.clear()
+
+
+_feature_cache = FeatureCache()
+
+
+def get_feature_cache() -> FeatureCache:
+    """Process-wide indicator feature cache"""
+    return _feature_cache
+
+
+def calculate_all_indicators(df: pd.DataFrame, symbol: Optional[str] = None,
+                             interval: Optional[str] = None) -> Dict:
     """
     Calculate all technical indicators including RSI_7
     
     Args:
         df: DataFrame with OHLCV data
+        symbol: Trading pair - with interval enables the shared feature cache
+        interval: Candle interval (e.g., '15m')
         
     Returns:
         Dictionary with all indicators
     """
-    indicators = {
-        "rsi": calculate_rsi(df, period=14),
-        "rsi_7": calculate_rsi(df, period=7),  # Fast RSI for reversal detection
-        "macd": calculate_macd(df),
-        "ema": calculate_ema(df, [20, 50]),
-        "bollinger_bands": calculate_bollinger_bands(df),
-        "support_resistance": find_support_resistance(df),
-        "volume": calculate_volume_analysis(df),
-        "atr": calculate_atr(df),
-        "trend_pattern": detect_trend_pattern(df)
-    }
-    
-    # Detect choppy market
-    current_price = df['close'].iloc[-1]
-    indicators['market_condition'] = detect_choppy_market(indicators, current_price)
-    
-    return indicators
+    return calculate_all_indicators_custom(df, ema_periods=[20, 50], symbol=symbol, interval=interval)
 
 
-def calculate_all_indicators_custom(df: pd.DataFrame, ema_periods: List[int] = [20, 50]) -> Dict:
+def calculate_all_indicators_custom(df: pd.DataFrame, ema_periods: List[int] = [20, 50],
+                                    symbol: Optional[str] = None, interval: Optional[str] = None) -> Dict:
     """
     Calculate all technical indicators with custom EMA periods
     
+    RSI, MACD, EMA, Bollinger, ATR and volume come from the vectorized NumPy
+    kernel (utils.indicator_kernel) - same values as the per-indicator ta
+    functions above, without building a ta object per indicator.
+    
+    With symbol and interval given, the kernel values, EMAs, support/resistance
+    and trend pattern are memoized in the shared FeatureCache, so strategies
+    that differ only in EMA periods reuse everything else.
+    
     Args:
-        df: DataFrame with OHLCV data
+        df: DataFrame with OHLCV data (closed candles)
         ema_periods: Custom EMA periods (e.g., [7, 25])
+        symbol: Trading pair (optional, enables caching)
+        interval: Candle interval (optional, enables caching)
         
     Returns:
         Dictionary with all indicators
     """
+    if symbol and interval and 'timestamp' in df.columns and len(df):
+        cache = get_feature_cache()
+        series_key = (symbol, interval, df['timestamp'].iloc[-1], len(df))
+        cached = lambda name, params, compute: cache.get_or_compute(series_key + (name, params), compute)
+    else:
+        cached = lambda name, params, compute: compute()
+    
+    close = df['close'].values
+    values = cached('kernel', ((14, 7), (12, 26, 9), 20, 2, 14, 20), lambda: compute_indicator_values(
+        close,
+        df['high'].values,
+        df['low'].values,
+        df['volume'].values,
+        ema_periods=(),
+        rsi_periods=(14, 7)
+    ))
+    ema_values = cached('ema', tuple(ema_periods), lambda: compute_ema_values(close, ema_periods))
+    current_price = values['close']
+    
     indicators = {
-        "rsi": calculate_rsi(df, period=14),
-        "rsi_7": calculate_rsi(df, period=7),  # Fast RSI for reversal detection
-        "macd": calculate_macd(df),
-        "ema": calculate_ema(df, ema_periods),
-        "bollinger_bands": calculate_bollinger_bands(df),
-        "support_resistance": find_support_resistance(df),
-        "volume": calculate_volume_analysis(df),
-        "atr": calculate_atr(df),
-        "trend_pattern": detect_trend_pattern(df)
+        "rsi": _format_rsi(values['rsi'][14]),
+        "rsi_7": _format_rsi(values['rsi'][7]),  # Fast RSI for reversal detection
+        "macd": _format_macd(*values['macd']),
+        "ema": _format_ema(ema_values, ema_periods),
+        "bollinger_bands": _format_bollinger_bands(*values['bollinger'][:3], current_price, values['bollinger'][3]),
+        "support_resistance": cached('support_resistance', (10,), lambda: find_support_resistance(df)),
+        "volume": _format_volume_analysis(*values['volume']),
+        "atr": _format_atr(values['atr'], current_price),
+        "trend_pattern": cached('trend_pattern', (20, 2), lambda: detect_trend_pattern(df))
     }
     
     # Detect choppy market
-    current_price = df['close'].iloc[-1]
     indicators['market_condition'] = detect_choppy_market(indicators, current_price)
     
     return indicators
@@ -0,0 +1,102 @@
+"""Fast futures_klines decoding straight into typed NumPy arrays"""
+import itertools
+import operator
+import numpy as np
+import pandas as pd
+from typing import List
+
+OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+_ohlcv_fields = operator.itemgetter(1, 2, 3, 4, 5)
+
+
+class KlineArrays:
+    """
+    Closed candles as typed arrays
+
+    open_time is int64 (ms); OHLCV is one contiguous (n, 5) float64 block and
+    open/high/low/close/volume are column views into it. to_dataframe() wraps
+    the same memory in the usual get_klines DataFrame on first request.
+    """
+
+    __slots__ = ('open_time', 'ohlcv', '_df')
+
+    def __init__(self, open_time: np.ndarray, ohlcv: np.ndarray):
+        self.open_time = open_time
+        self.ohlcv = ohlcv
+        self._df = None
+
+    def __len__(self) -> int:
+        return len(self.open_time)
+
+    @property
+    def open(self) -> np.ndarray:
+        return self.ohlcv[:, 0]
+
+    @property
+    def high(self) -> np.ndarray:
+        return self.ohlcv[:, 1]
+
+    @property
+    def low(self) -> np.ndarray:
+        return self.ohlcv[:, 2]
+
+    @property
+    def close(self) -> np.ndarray:
+        return self.ohlcv[:, 3]
+
+    @property
+    def volume(self) -> np.ndarray:
+        return self.ohlcv[:, 4]
+
+    def tail(self, count: int) -> 'KlineArrays':
+        """Newest `count` candles (views, no copy)"""
+        start = max(len(self) - count, 0)
+        return KlineArrays(self.open_time[start:], self.ohlcv[start:])
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """DataFrame with timestamp, open, high, low, close, volume (built once, cached)"""
+        if self._df is None:
+            df = pd.DataFrame(self.ohlcv, columns=OHLCV_COLUMNS, copy=False)
+            df.insert(0, 'timestamp', pd.to_datetime(self.open_time, unit='ms'))
+            self._df = df
+        return self._df
+
+
+def parse_klines(klines: List, drop_last: bool = True) -> KlineArrays:
+    """
+    Decode raw futures_klines rows into KlineArrays
+
+    Only open time and OHLCV are read; the rows are streamed once into
+    preallocated arrays (no intermediate object DataFrame or casts).
+
+    Args:
+        klines: Raw kline rows from Binance ([open_time, "open", "high", ...])
+        drop_last: Skip the last (incomplete/currently forming) candle, as
+                   klines_to_dataframe does when there is more than one row
+
+    Returns:
+        KlineArrays
+    """
+    n = len(klines)
+    if drop_last and n > 1:
+        n -= 1
+    rows = itertools.islice(klines, n)
+
+    ohlcv = np.fromiter(
+        itertools.chain.from_iterable(map(_ohlcv_fields, rows)),
+        dtype=np.float64,
+        count=n * 5
+    ).reshape(n, 5)
+    open_time = np.fromiter((row[0] for row in itertools.islice(klines, n)), dtype=np.int64, count=n)
+
+    return KlineArrays(open_time, ohlcv)
+
+
+def kline_arrays_from_dataframe(df: pd.DataFrame) -> KlineArrays:
+    """KlineArrays view of an existing get_klines DataFrame (e.g. from the candle store)"""
+    open_time = df['timestamp'].values.astype('datetime64[ms]').astype(np.int64)
+    ohlcv = np.ascontiguousarray(df[OHLCV_COLUMNS].to_numpy(dtype=np.float64))
+    arrays = KlineArrays(open_time, ohlcv)
+    arrays._df = df
+    return arrays
@@ -0,0 +1,399 @@
+"""
+Local L2 order books maintained from the Binance futures diff-depth stream.
+
+Follows Binance's documented synchronization for USD-M futures:
+  1. Subscribe to <symbol>@depth@100ms and buffer events
+  2. Fetch a REST depth snapshot (lastUpdateId)
+  3. Drop buffered events with u < lastUpdateId
+  4. The first applied event must satisfy U <= lastUpdateId <= u
+     (or directly follow the snapshot: pu == lastUpdateId)
+  5. Every following event must have pu == previous event's u,
+     otherwise the book is discarded and re-synced from step 2
+
+Each side is a sorted (levels, 2) float64 array, best price first. Updates
+build new arrays (copy-on-write), so a view handed out by get_orderbook()
+never changes under the reader and needs no copy or lock.
+
+The REST snapshot (step 2) is fetched on its own thread; the stream thread
+keeps buffering events meanwhile and never waits on the request.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+import numpy as np
+import os
+import sys
+
+# Add parent directory to path for config import
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import config
+from utils.price_stream import BinancePriceStream, ReplayPriceStream
+from utils.scheduler import get_server_clock
+
+_EMPTY_SIDE = np.empty((0, 2))
+_EMPTY_SIDE.flags.writeable = False
+
+
+def _run_in_thread(job: Callable[[], None]):
+    """Default snapshot runner - one daemon thread per request"""
+    threading.Thread(target=job, name='orderbook-snapshot', daemon=True).start()
+
+
+def _levels(rows) -> np.ndarray:
+    """[[price, qty], ...] (strings or floats) -> (n, 2) float64 array"""
+    return np.array(rows, dtype=np.float64).reshape(-1, 2)
+
+
+def parse_depth_message(message: Dict) -> List[Dict]:
+    """
+    Convert a Binance futures diff-depth message to depth events
+
+    Accepts the raw event or the combined-stream wrapper ({"stream": ..., "data": ...}).
+
+    Returns:
+        List of events {'symbol', 'first_update_id' (U), 'final_update_id' (u),
+        'prev_final_update_id' (pu), 'event_time' (ms), 'bids', 'asks'}
+    """
+    data = message.get('data', message) if isinstance(message, dict) else message
+    if not isinstance(data, dict) or data.get('e') != 'depthUpdate':
+        return []
+
+    return [{
+        'symbol': data['s'],
+        'first_update_id': int(data['U']),
+        'final_update_id': int(data['u']),
+        'prev_final_update_id': int(data['pu']),
+        'event_time': int(data['E']),
+        'bids': _levels(data['b']),
+        'asks': _levels(data['a'])
+    }]
+
+
+def apply_levels(side: np.ndarray, updates: np.ndarray, descending: bool,
+                 max_levels: Optional[int] = None) -> np.ndarray:
+    """
+    Apply absolute level updates to a sorted book side (returns a NEW array)
+
+    Quantity 0 removes the level. The existing side is already sorted, so the
+    stable sort below is close to linear.
+
+    Args:
+        side: (n, 2) [price, qty] sorted best first
+        updates: (m, 2) [price, qty] level updates
+        descending: True for bids (highest price first)
+        max_levels: Keep only the best N levels
+
+    Returns:
+        Read-only (k, 2) array sorted best first
+    """
+    if len(updates) == 0:
+        return side
+
+    rows = np.concatenate((side, updates))
+    keys = -rows[:, 0] if descending else rows[:, 0]
+    order = np.argsort(keys, kind='stable')
+    rows = rows[order]
+    keys = keys[order]
+
+    # Same price twice: keep the later row (the update)
+    keep = np.append(keys[1:] != keys[:-1], True) & (rows[:, 1] > 0)
+    rows = rows[keep]
+    if max_levels is not None:
+        rows = rows[:max_levels]
+
+    rows.flags.writeable = False
+    return rows
+
+
+class LocalOrderBook:
+    """
+    One symbol's order book kept in sync with the diff-depth stream
+
+    Args:
+        symbol: Trading pair
+        fetch_snapshot: Callable(symbol, limit) -> raw futures_order_book payload
+        max_levels: Snapshot depth / max levels kept per side
+        min_snapshot_interval: Min seconds between snapshot requests while syncing
+        run_snapshot: Callable(job) running a snapshot request off the stream
+                      thread (default: a daemon thread)
+    """
+
+    def __init__(self, symbol: str, fetch_snapshot: Callable[[str, int], Dict],
+                 max_levels: int = 1000, min_snapshot_interval: float = 1.0,
+                 run_snapshot: Optional[Callable[[Callable[[], None]], None]] = None):
+        self.symbol = symbol
+        self.fetch_snapshot = fetch_snapshot
+        self.max_levels = max_levels
+        self.min_snapshot_interval = min_snapshot_interval
+        self.run_snapshot = run_snapshot or _run_in_thread
+
+        self.bids = _EMPTY_SIDE
+        self.asks = _EMPTY_SIDE
+        self.last_update_id = None
+        self.event_time = None
+        self.synced = False
+        self._published = None  # (bids, asks, last_update_id, event_time) of the synced book
+
+        self._buffer = []
+        self._snapshot = None
+        self._snapshot_in_flight = False
+        self._last_snapshot_request = 0.0
+        self._lock = threading.Lock()
+
+        self.events_applied = 0
+        self.snapshots = 0
+        self.resyncs = 0
+
+    def on_event(self, event: Dict):
+        """Handle one parsed depth event (stream thread)"""
+        request_snapshot = False
+        with self._lock:
+            if not self.synced:
+                self._buffer.append(event)
+                request_snapshot = self._try_sync()
+            elif event['final_update_id'] < self.last_update_id:
+                return  # Already covered
+            elif event['prev_final_update_id'] != self.last_update_id:
+                # Gap in the stream - discard the book and start over
+                print(f"⚠️  [ORDER BOOK] {self.symbol} update gap "
+                      f"(pu={event['prev_final_update_id']}, expected {self.last_update_id}) - resyncing")
+                self.resyncs += 1
+                self.synced = False
+                self._published = None
+                self._snapshot = None
+                self._buffer = [event]
+                request_snapshot = self._try_sync()
+            else:
+                self._apply(event)
+            self._publish()
+
+        # Outside the lock - an inline runner (tests) takes it again
+        if request_snapshot:
+            self.run_snapshot(self._load_snapshot)
+
+    def _publish(self):
+        # Single attribute swap - readers see one consistent update
+        if self.synced:
+            self._published = (self.bids, self.asks, self.last_update_id, self.event_time)
+
+    def _load_snapshot(self):
+        """Step 2 - fetch the REST snapshot (snapshot thread) and sync from the buffer"""
+        try:
+            depth = self.fetch_snapshot(self.symbol, self.max_levels)
+        except Exception as e:
+            print(f"⚠️  [ORDER BOOK] {self.symbol} snapshot failed: {e}")
+            depth = None
+
+        with self._lock:
+            self._snapshot_in_flight = False
+            if depth is None or self.synced:
+                return  # Next buffered event requests again
+            self.snapshots += 1
+            self._snapshot = depth
+            self._try_sync()
+            self._publish()
+
+    def _apply(self, event: Dict):
+        self.bids = apply_levels(self.bids, event['bids'], descending=True, max_levels=self.max_levels)
+        self.asks = apply_levels(self.asks, event['asks'], descending=False, max_levels=self.max_levels)
+        self.last_update_id = event['final_update_id']
+        self.event_time = event['event_time']
+        self.events_applied += 1
+
+    def _try_sync(self) -> bool:
+        """
+        Steps 3-4 of the Binance procedure - called (under the lock) with buffered events pending
+
+        Returns:
+            True if the caller must start a snapshot request (see _load_snapshot)
+        """
+        if self._snapshot is None:
+            if self._snapshot_in_flight or time.time() - self._last_snapshot_request < self.min_snapshot_interval:
+                return False
+            self._snapshot_in_flight = True
+            self._last_snapshot_request = time.time()
+            return True
+
+        snapshot_id = int(self._snapshot['lastUpdateId'])
+        self._buffer = [e for e in self._buffer if e['final_update_id'] >= snapshot_id]
+        if not self._buffer:
+            return False  # Snapshot is ahead of the stream - wait for the next event
+
+        first = self._buffer[0]
+        if first['first_update_id'] > snapshot_id and first['prev_final_update_id'] != snapshot_id:
+            # Events already moved past the snapshot - the next event requests a newer one
+            self._snapshot = None
+            return False
+
+        self.bids = apply_levels(_EMPTY_SIDE, _levels(self._snapshot['bids']), descending=True, max_levels=self.max_levels)
+        self.asks = apply_levels(_EMPTY_SIDE, _levels(self._snapshot['asks']), descending=False, max_levels=self.max_levels)
+        self.last_update_id = snapshot_id
+
+        buffered, self._buffer, self._snapshot = self._buffer, [], None
+        self._apply(buffered[0])
+        self.synced = True
+
+        for event in buffered[1:]:
+            if event['prev_final_update_id'] != self.last_update_id:
+                self.synced = False
+                self.resyncs += 1
+                self._buffer = [event]
+                return False
+            self._apply(event)
+        return False
+
+    def view(self, limit: Optional[int] = None) -> Optional[Dict]:
+        """
+        Current book without copying (same shape as BinanceClient.get_orderbook)
+
+        Args:
+            limit: Levels per side (None = all)
+
+        Returns:
+            {'bids', 'asks', 'last_update_id', 'event_time'} or None while not synced
+        """
+        published = self._published
+        if published is None:
+            return None
+
+        bids, asks, last_update_id, event_time = published
+        return {
+            "bids": bids[:limit],
+            "asks": asks[:limit],
+            "last_update_id": last_update_id,
+            "event_time": event_time
+        }
+
+
+class BinanceDepthStream(BinancePriceStream):
+    """Live Binance USD-M futures diff-depth stream (<symbol>@depth@100ms)"""
+
+    parse_message = staticmethod(parse_depth_message)
+
+    def _stream_names(self) -> List[str]:
+        return [f"{symbol.lower()}@depth@{self.stream}" for symbol in self.symbols]
+
+
+class ReplayDepthStream(ReplayPriceStream):
+    """Replays a recorded JSONL tape of raw diff-depth messages (offline testing)"""
+
+    parse_message = staticmethod(parse_depth_message)
+
+
+def _fetch_rest_snapshot(symbol: str, limit: int) -> Dict:
+    """Default snapshot source - REST depth through the shared client"""
+    from utils.binance_client import get_binance_client
+    return get_binance_client().client.futures_order_book(symbol=symbol, limit=limit)
+
+
+class OrderBookManager:
+    """
+    Local order books for a set of symbols fed by one depth stream
+
+    Args:
+        symbols: Symbols to maintain
+        fetch_snapshot: Callable(symbol, limit) -> raw depth snapshot (default: REST)
+        max_levels: Snapshot depth / max levels per side
+        run_snapshot: Callable(job) running snapshot requests (default: a daemon thread each)
+    """
+
+    def __init__(self, symbols: Iterable[str], fetch_snapshot: Optional[Callable[[str, int], Dict]] = None,
+                 max_levels: int = 1000, run_snapshot: Optional[Callable[[Callable[[], None]], None]] = None):
+        fetch_snapshot = fetch_snapshot or _fetch_rest_snapshot
+        self.books = {
+            symbol: LocalOrderBook(symbol, fetch_snapshot, max_levels, run_snapshot=run_snapshot)
+            for symbol in sorted(set(symbols))
+        }
+        self.source = None
+
+    def start(self, source=None):
+        """Start consuming depth events (default: BinanceDepthStream from config)"""
+        if source is None:
+            source = BinanceDepthStream(
+                self.books.keys(),
+                stream=config.ORDERBOOK_STREAM_SPEED,
+                record_path=config.ORDERBOOK_STREAM_RECORD_PATH
+            )
+        self.source = source
+        source.start(self.on_event)
+
+    def stop(self):
+        if self.source:
+            self.source.stop()
+            self.source = None
+
+    def on_event(self, event: Dict):
+        book = self.books.get(event['symbol'])
+        if book:
+            book.on_event(event)
+
+    def get_orderbook(self, symbol: str, limit: Optional[int] = None) -> Optional[Dict]:
+        """Zero-copy view of a synced book (None if symbol unknown or not synced)"""
+        book = self.books.get(symbol)
+        return book.view(limit) if book else None
+
+    def get_stats(self) -> Dict:
+        return {
+            symbol: {
+                'synced': book.synced,
+                'last_update_id': book.last_update_id,
+                'bid_levels': len(book.bids),
+                'ask_levels': len(book.asks),
+                'events_applied': book.events_applied,
+                'snapshots': book.snapshots,
+                'resyncs': book.resyncs
+            }
+            for symbol, book in self.books.items()
+        }
+
+
+_order_book_manager = None
+
+
+def start_order_book_manager(symbols: Iterable[str], source=None, **kwargs) -> OrderBookManager:
+    """Start the process-wide order book manager (get_orderbook reads from it)"""
+    global _order_book_manager
+    stop_order_book_manager()
+    manager = OrderBookManager(symbols, **kwargs)
+    manager.start(source)
+    _order_book_manager = manager
+    return manager
+
+
+def stop_order_book_manager():
+    global _order_book_manager
+    if _order_book_manager:
+        _order_book_manager.stop()
+        _order_book_manager = None
+
+
+def get_order_book_manager() -> Optional[OrderBookManager]:
+    """Running order book manager or None"""
+    return _order_book_manager
+
+
+def get_local_orderbook(symbol: str, limit: Optional[int] = None,
+                        max_age: Optional[float] = None) -> Optional[Dict]:
+    """
+    Synced local book view for symbol (None = caller falls back to REST)
+
+    Args:
+        symbol: Trading pair
+        limit: Levels per side (None = all)
+        max_age: Max seconds since the book's last depth event, on the
+                 exchange clock (default: config.ORDERBOOK_MAX_AGE)
+
+    Returns:
+        Book view, or None if no manager runs, the book isn't synced or the
+        stream went quiet (disconnect, stalled thread)
+    """
+    manager = _order_book_manager
+    view = manager.get_orderbook(symbol, limit) if manager else None
+    if view is None:
+        return None
+
+    max_age = config.ORDERBOOK_MAX_AGE if max_age is None else max_age
+    if get_server_clock().now_ms() - view['event_time'] > max_age * 1000:
+        return None
+    return view
@@ -0,0 +1,162 @@
+"""
+Candle-close-to-order latency - one production number per live order
+
+The clock starts when the candle closes on the exchange (scheduler mark) and
+stops when the last protective order (SL/TP) is acknowledged. Timestamps are
+taken on the server-corrected clock (local clock + offset measured by
+ServerClock), so the close mark and the acks are comparable. The breakdown
+stages add up to the total:
+
+    schedule        candle close -> cycle start (settle delay + scheduler lateness)
+    shared_data     news / BTC / IXIC collection
+    market_data     shared market bundles + the strategy's own data step
+    analysis        strategy analysis function
+    decision        decision step (LLM call)
+    queue           decision -> live execution picks the strategy up
+                    (other strategies, paper trading, earlier live orders)
+    order_prep      balance, exchange info, leverage
+    entry_order     market order request -> ack
+    protective      entry ack -> last SL/TP ack
+"""
+
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+STAGES = (
+    'schedule_ms', 'shared_data_ms', 'market_data_ms', 'analysis_ms', 'decision_ms',
+    'queue_ms', 'order_prep_ms', 'entry_order_ms', 'protective_orders_ms'
+)
+
+
+def server_now_ms(offset_ms: float = 0.0) -> float:
+    """Local clock corrected by the server time offset (ms)"""
+    return time.time() * 1000 + offset_ms
+
+
+class OrderLatencyTimer:
+    """Marks of one live order, turned into a latency record once the orders are acked"""
+
+    def __init__(self, cycle_timing: Optional[Dict], strategy_timing: Optional[Dict]):
+        """
+        Args:
+            cycle_timing: state['cycle_timing'] (candle close, clock offset, shared stage marks)
+            strategy_timing: state['timing_{strategy}'] (strategy stage marks)
+        """
+        self.cycle = cycle_timing or {}
+        self.strategy = strategy_timing or {}
+        self.offset_ms = self.cycle.get('clock_offset_ms', 0.0)
+        self.marks = {'picked_up': self.now_ms()}
+
+    def now_ms(self) -> float:
+        return server_now_ms(self.offset_ms)
+
+    def mark(self, name: str):
+        """Record a mark: 'entry_sent', 'entry_acked', 'protective_acked'"""
+        self.marks[name] = self.now_ms()
+
+    def record(self, strategy: str, symbol: str, slo_ms: float, order_id=None,
+               protective_orders: int = 0) -> Dict:
+        """
+        Build the order_latency row
+
+        Args:
+            strategy: Strategy name
+            symbol: Traded symbol
+            slo_ms: Candle-close-to-order SLO
+            order_id: Binance entry order id
+            protective_orders: SL/TP orders acknowledged
+
+        Returns:
+            Row dict (TradingDatabase.log_order_latency)
+        """
+        cycle = self.cycle
+        marks = self.marks
+        cycle_start = cycle.get('cycle_start_ms', marks['picked_up'])
+        candle_close = cycle.get('candle_close_ms') or cycle_start
+        shared_done = cycle.get('shared_data_done_ms', cycle_start)
+        bundles_done = cycle.get('market_bundles_done_ms', shared_done)
+
+        started = self.strategy.get('started_ms', bundles_done)
+        data_done = self.strategy.get('market_data_done_ms', started)
+        analysis_done = self.strategy.get('analysis_done_ms', data_done)
+        decided = self.strategy.get('decided_ms', analysis_done)
+
+        entry_sent = marks.get('entry_sent', marks['picked_up'])
+        entry_acked = marks.get('entry_acked', entry_sent)
+        finished = marks.get('protective_acked', entry_acked)
+
+        total_ms = finished - candle_close
+        return {
+            'cycle_id': f"{cycle.get('interval_minutes', 0)}m_{int(candle_close)}",
+            'strategy': strategy,
+            'symbol': symbol,
+            'interval_minutes': cycle.get('interval_minutes'),
+            'candle_close_ms': int(candle_close),
+            'order_id': order_id,
+            'schedule_ms': cycle_start - candle_close,
+            'shared_data_ms': shared_done - cycle_start,
+            'market_data_ms': (bundles_done - shared_done) + (data_done - started),
+            'analysis_ms': analysis_done - data_done,
+            'decision_ms': decided - analysis_done,
+            # Strategy threads start right after the bundles; time between is thread startup
+            'queue_ms': (started - bundles_done) + (marks['picked_up'] - decided),
+            'order_prep_ms': entry_sent - marks['picked_up'],
+            'entry_order_ms': entry_acked - entry_sent,
+            'protective_orders_ms': finished - entry_acked,
+            'entry_latency_ms': entry_acked - candle_close,
+            'total_latency_ms': total_ms,
+            'protective_orders': protective_orders,
+            'slo_ms': slo_ms,
+            'slo_breached': total_ms > slo_ms
+        }
+
+
+def summarize_latencies(records: List[Dict], slo_ms: float, bucket_ms: int = 1000) -> Dict:
+    """
+    Distribution of total candle-close-to-order latency
+
+    Args:
+        records: order_latency rows
+        slo_ms: SLO for the breach rate
+        bucket_ms: Histogram bucket width
+
+    Returns:
+        {'count', 'p50', 'p95', 'p99', 'max', 'breaches', 'breach_rate',
+         'cycles', 'cycles_breached', 'histogram': {'bucket_ms', 'edges', 'counts'},
+         'stages': {stage: mean ms}}
+    """
+    if not records:
+        return {'count': 0, 'breaches': 0, 'breach_rate': 0.0, 'cycles': 0, 'cycles_breached': 0,
+                'histogram': {'bucket_ms': bucket_ms, 'edges': [], 'counts': []}, 'stages': {}}
+
+    totals = np.array([r['total_latency_ms'] for r in records], dtype=np.float64)
+    p50, p95, p99 = np.percentile(totals, [50, 95, 99]).tolist()
+    breaches = int((totals > slo_ms).sum())
+
+    cycles = {}
+    for r in records:
+        cycles[r['cycle_id']] = cycles.get(r['cycle_id'], False) or r['total_latency_ms'] > slo_ms
+
+    # Buckets cover [0, max] and always include the SLO so the chart can mark it
+    top = max(totals.max(), slo_ms)
+    edges = np.arange(0, top // bucket_ms * bucket_ms + bucket_ms + 1, bucket_ms)
+    counts, _ = np.histogram(totals, bins=edges)
+
+    return {
+        'count': len(records),
+        'p50': p50,
+        'p95': p95,
+        'p99': p99,
+        'max': float(totals.max()),
+        'breaches': breaches,
+        'breach_rate': breaches / len(records) * 100,
+        'cycles': len(cycles),
+        'cycles_breached': sum(cycles.values()),
+        'histogram': {'bucket_ms': bucket_ms, 'edges': edges[:-1].tolist(), 'counts': counts.tolist()},
+        'stages': {
+            stage: float(np.mean([r[stage] or 0 for r in records]))
+            for stage in STAGES
+        }
+    }
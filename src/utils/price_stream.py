@@ -0,0 +1,174 @@
+"""Price tick streams - Binance futures websocket and recorded tape replay"""
+import json
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+import os
+import sys
+
+# Add parent directory to path for config import
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import config
+
+
+def parse_price_message(message: Dict) -> List[Dict]:
+    """
+    Convert a Binance futures stream message to price ticks
+
+    Supports markPriceUpdate and aggTrade events, single or array payloads
+    (!markPrice@arr), with or without the combined-stream wrapper
+    ({"stream": ..., "data": ...}).
+
+    Returns:
+        List of ticks {'symbol', 'price', 'event_time' (ms), 'source'}
+    """
+    data = message.get('data', message) if isinstance(message, dict) else message
+    events = data if isinstance(data, list) else [data]
+
+    ticks = []
+    for event in events:
+        if not isinstance(event, dict):
+            continue
+        event_type = event.get('e')
+        if event_type == 'markPriceUpdate':
+            ticks.append({
+                'symbol': event['s'],
+                'price': float(event['p']),
+                'event_time': int(event['E']),
+                'source': 'markPrice'
+            })
+        elif event_type == 'aggTrade':
+            ticks.append({
+                'symbol': event['s'],
+                'price': float(event['p']),
+                'event_time': int(event.get('T', event['E'])),
+                'source': 'aggTrade'
+            })
+    return ticks
+
+
+class BinancePriceStream:
+    """
+    Live Binance USD-M futures price stream (markPrice@1s or aggTrade)
+
+    Raw messages can be recorded to a JSONL tape and replayed later with
+    ReplayPriceStream.
+    """
+
+    # Message -> list of events (subclasses stream other event types)
+    parse_message = staticmethod(parse_price_message)
+
+    def __init__(self, symbols: Iterable[str], stream: str = 'markPrice',
+                 demo: Optional[bool] = None, record_path: Optional[str] = None):
+        """
+        Args:
+            symbols: Symbols to subscribe (e.g. ['SOLUSDT', 'ETHUSDT'])
+            stream: 'markPrice' (1s mark price) or 'aggTrade' (every trade)
+            demo: Use testnet streams (default: config.BINANCE_DEMO)
+            record_path: Optional JSONL file to append raw messages to
+        """
+        self.symbols = sorted(set(symbols))
+        self.stream = stream
+        self.demo = demo if demo is not None else config.BINANCE_DEMO
+        self.record_path = record_path
+        self._twm = None
+        self._record_file = None
+
+    def _stream_names(self) -> List[str]:
+        suffix = 'markPrice@1s' if self.stream == 'markPrice' else 'aggTrade'
+        return [f"{symbol.lower()}@{suffix}" for symbol in self.symbols]
+
+    def start(self, on_tick: Callable[[Dict], None]):
+        """Connect and call on_tick(tick) for every price update (websocket thread)"""
+        from binance import ThreadedWebsocketManager
+
+        if self.record_path:
+            self._record_file = open(self.record_path, 'a')
+
+        def handle_message(message):
+            if self._record_file:
+                self._record_file.write(json.dumps(message) + '\n')
+            if isinstance(message, dict) and message.get('e') == 'error':
+                print(f"⚠️  Price stream error: {message.get('m')}")
+                return
+            for tick in self.parse_message(message):
+                on_tick(tick)
+
+        self._twm = ThreadedWebsocketManager(testnet=self.demo)
+        self._twm.start()
+        self._twm.start_futures_multiplex_socket(callback=handle_message, streams=self._stream_names())
+        print(f"📡 {self.__class__.__name__} started: {', '.join(self._stream_names())}")
+
+    def stop(self):
+        """Close websocket and tape file"""
+        if self._twm:
+            self._twm.stop()
+            self._twm = None
+        if self._record_file:
+            self._record_file.close()
+            self._record_file = None
+
+
+class ReplayPriceStream:
+    """
+    Replays a recorded JSONL tape (raw Binance messages, one per line)
+
+    Stand-in for BinancePriceStream in tests and backtests - the exit engine
+    can't tell the difference.
+    """
+
+    parse_message = staticmethod(parse_price_message)
+
+    def __init__(self, path: Optional[str] = None, messages: Optional[List[Dict]] = None,
+                 speed: float = 0.0):
+        """
+        Args:
+            path: JSONL tape file
+            messages: In-memory messages (instead of path)
+            speed: 0 = as fast as possible, 1.0 = real time (by event_time), 10 = 10x
+        """
+        self.path = path
+        self.messages = messages
+        self.speed = speed
+        self._thread = None
+        self._stop = threading.Event()
+        self.ticks_replayed = 0
+
+    def _iter_messages(self):
+        if self.messages is not None:
+            yield from self.messages
+            return
+        with open(self.path) as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+    def replay(self, on_tick: Callable[[Dict], None]):
+        """Replay synchronously in the calling thread"""
+        last_event_time = None
+        for message in self._iter_messages():
+            for tick in self.parse_message(message):
+                if self._stop.is_set():
+                    return
+                if self.speed and last_event_time is not None:
+                    delay = (tick['event_time'] - last_event_time) / 1000 / self.speed
+                    if delay > 0:
+                        time.sleep(delay)
+                last_event_time = tick['event_time']
+                on_tick(tick)
+                self.ticks_replayed += 1
+
+    def start(self, on_tick: Callable[[Dict], None]):
+        """Replay in a background thread (same interface as BinancePriceStream)"""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.replay, args=(on_tick,), name='price-replay', daemon=True)
+        self._thread.start()
+
+    def join(self, timeout: Optional[float] = None):
+        if self._thread:
+            self._thread.join(timeout)
+
+    def stop(self):
+        self._stop.set()
+        self.join()
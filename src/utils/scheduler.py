@@ -0,0 +1,251 @@
+"""
+Timer-queue scheduler - strategy cycles fire at candle close, not on a polling tick
+
+Jobs sit in a heap ordered by their next deadline; the scheduler thread sleeps
+until the earliest one. Candle jobs are aligned to UTC interval boundaries
+(Binance candle closes) plus a settle delay, measured on the exchange's clock
+(local clock + offset from the server time endpoint). Every fire reports how
+late it started; marks that passed while a previous job was still running are
+coalesced into one late fire instead of being skipped.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, Dict, NamedTuple, Optional
+
+
+class Fire(NamedTuple):
+    """One job execution, passed to the job callback"""
+    job: str
+    mark_ms: int  # Scheduled mark in server time (candle close / period tick)
+    lateness_ms: float  # Start time minus (mark + settle delay)
+    missed: int  # Earlier marks coalesced into this fire (previous run overran)
+
+
+class ServerClock:
+    """Local wall clock corrected by its offset from exchange server time"""
+
+    def __init__(self, fetch_server_time: Optional[Callable[[], int]] = None,
+                 clock: Callable[[], float] = time.time):
+        """
+        Args:
+            fetch_server_time: Returns server time in ms (e.g. BinanceClient.get_server_time)
+            clock: Local clock in seconds
+        """
+        self.fetch_server_time = fetch_server_time
+        self.clock = clock
+        self.offset_ms = 0.0
+        self.round_trip_ms = None
+
+    def now_ms(self) -> float:
+        """Current server time estimate in ms"""
+        return self.clock() * 1000 + self.offset_ms
+
+    def sync(self, samples: int = 3) -> float:
+        """
+        Measure the server time offset (sample with the shortest round trip wins)
+
+        Returns:
+            Offset in ms (server - local)
+        """
+        best = None
+        for _ in range(samples):
+            sent = self.clock() * 1000
+            server_ms = self.fetch_server_time()
+            received = self.clock() * 1000
+            round_trip = received - sent
+            # Server stamped the response roughly halfway through the round trip
+            if best is None or round_trip < best[0]:
+                best = (round_trip, server_ms - (sent + received) / 2)
+        self.round_trip_ms, self.offset_ms = best
+        return self.offset_ms
+
+
+class _Job:
+    __slots__ = ('name', 'period_ms', 'settle_ms', 'callback', 'next_mark',
+                 'fires', 'missed', 'last_lateness_ms', 'total_lateness_ms', 'max_lateness_ms')
+
+    def __init__(self, name: str, period_ms: int, settle_ms: float, callback: Callable[[Fire], None],
+                 next_mark: int):
+        self.name = name
+        self.period_ms = period_ms
+        self.settle_ms = settle_ms
+        self.callback = callback
+        self.next_mark = next_mark
+        self.fires = 0
+        self.missed = 0
+        self.last_lateness_ms = None
+        self.total_lateness_ms = 0.0
+        self.max_lateness_ms = 0.0
+
+    @property
+    def deadline_ms(self) -> float:
+        return self.next_mark + self.settle_ms
+
+
+class CandleCloseScheduler:
+    """
+    Heap of next-fire deadlines, one entry per job
+
+    Jobs run on the thread that calls run(); a job that overruns delays the
+    others (their lateness shows it) but never makes them skip a mark.
+    """
+
+    def __init__(self, clock: Optional[ServerClock] = None, settle_delay: float = 1.0,
+                 max_sleep: float = 60.0):
+        """
+        Args:
+            clock: Server-corrected clock (default: local clock, no offset)
+            settle_delay: Seconds after candle close before candle jobs fire
+            max_sleep: Longest single sleep - deadlines are re-read after it,
+                       so a changed clock offset is picked up
+        """
+        self.clock = clock or ServerClock()
+        self.settle_ms = settle_delay * 1000
+        self.max_sleep = max_sleep
+        self._heap = []
+        self._jobs: Dict[str, _Job] = {}
+        self._seq = itertools.count()
+        self._stop = threading.Event()
+
+    def _push(self, job: _Job):
+        heapq.heappush(self._heap, (job.deadline_ms, next(self._seq), job))
+
+    def add_candle_job(self, name: str, interval_minutes: int, callback: Callable[[Fire], None],
+                       settle_delay: Optional[float] = None):
+        """
+        Fire `callback` at every close of an interval_minutes candle (UTC aligned)
+
+        Args:
+            name: Job name (stats key)
+            interval_minutes: Candle interval
+            callback: Called with a Fire
+            settle_delay: Override of the scheduler settle delay (seconds)
+        """
+        period_ms = interval_minutes * 60_000
+        now_ms = self.clock.now_ms()
+        settle_ms = self.settle_ms if settle_delay is None else settle_delay * 1000
+        # Next boundary whose deadline is still ahead
+        next_mark = int((now_ms - settle_ms) // period_ms + 1) * period_ms
+        job = _Job(name, period_ms, settle_ms, callback, next_mark)
+        self._jobs[name] = job
+        self._push(job)
+
+    def add_periodic_job(self, name: str, seconds: float, callback: Callable[[Fire], None],
+                         run_now: bool = False):
+        """
+        Fire `callback` every `seconds` (fixed rate, not aligned to candles)
+
+        Args:
+            name: Job name (stats key)
+            seconds: Period
+            callback: Called with a Fire
+            run_now: First fire immediately instead of after one period
+        """
+        period_ms = int(seconds * 1000)
+        now_ms = int(self.clock.now_ms())
+        job = _Job(name, period_ms, 0, callback, now_ms if run_now else now_ms + period_ms)
+        self._jobs[name] = job
+        self._push(job)
+
+    def next_fire_ms(self, name: str) -> Optional[float]:
+        """Next deadline of a job in server time (ms)"""
+        job = self._jobs.get(name)
+        return job.deadline_ms if job else None
+
+    def run_pending(self) -> int:
+        """
+        Fire every job whose deadline has passed
+
+        Returns:
+            Number of jobs fired
+        """
+        fired = 0
+        while self._heap and not self._stop.is_set():
+            deadline, _, job = self._heap[0]
+            now_ms = self.clock.now_ms()
+            if deadline > now_ms:
+                break
+            heapq.heappop(self._heap)
+
+            fire = Fire(job.name, job.next_mark, now_ms - deadline, 0)
+            self._fire(job, fire)
+            fired += 1
+
+            # Next mark after the run; marks that passed meanwhile collapse
+            # into the latest one, which fires right away (late, not skipped)
+            next_mark = job.next_mark + job.period_ms
+            overdue = int((self.clock.now_ms() - job.settle_ms - next_mark) // job.period_ms)
+            if overdue > 0:
+                next_mark += overdue * job.period_ms
+                job.missed += overdue
+            job.next_mark = next_mark
+            self._push(job)
+        return fired
+
+    def _fire(self, job: _Job, fire: Fire):
+        job.fires += 1
+        job.last_lateness_ms = fire.lateness_ms
+        job.total_lateness_ms += fire.lateness_ms
+        job.max_lateness_ms = max(job.max_lateness_ms, fire.lateness_ms)
+        try:
+            job.callback(fire._replace(missed=job.missed))
+        except Exception as e:
+            print(f"❌ [SCHEDULER] {job.name} failed: {e}")
+        job.missed = 0
+
+    def run(self):
+        """Sleep until the next deadline and fire due jobs until stop() is called"""
+        while not self._stop.is_set():
+            if self._heap:
+                wait = (self._heap[0][0] - self.clock.now_ms()) / 1000
+            else:
+                wait = self.max_sleep
+            if wait > 0:
+                self._stop.wait(min(wait, self.max_sleep))
+                continue
+            self.run_pending()
+
+    def stop(self):
+        """Wake the scheduler thread and make run() return"""
+        self._stop.set()
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """
+        Per-job fire statistics
+
+        Returns:
+            {name: {'fires', 'last_lateness_ms', 'avg_lateness_ms', 'max_lateness_ms', 'next_fire_ms'}}
+        """
+        return {
+            name: {
+                'fires': job.fires,
+                'last_lateness_ms': job.last_lateness_ms,
+                'avg_lateness_ms': job.total_lateness_ms / job.fires if job.fires else 0.0,
+                'max_lateness_ms': job.max_lateness_ms,
+                'next_fire_ms': job.deadline_ms
+            }
+            for name, job in self._jobs.items()
+        }
+
+
+_server_clock = None
+_server_clock_lock = threading.Lock()
+
+
+def get_server_clock(fetch_server_time: Optional[Callable[[], int]] = None) -> ServerClock:
+    """
+    Get process-wide exchange clock (synced by the bot; local clock until then)
+
+    Args:
+        fetch_server_time: Server time source to sync from (set once by the owner)
+    """
+    global _server_clock
+    with _server_clock_lock:
+        if _server_clock is None:
+            _server_clock = ServerClock()
+        if fetch_server_time is not None:
+            _server_clock.fetch_server_time = fetch_server_time
+        return _server_clock
@@ -0,0 +1,269 @@
+"""
+Stale-while-revalidate cache with a circuit breaker for external data sources
+
+Collectors (news, IXIC, BTC) fetch through get_source_cache().get():
+  - fresh value (younger than its TTL) -> returned, no network call
+  - expired value -> returned immediately (marked stale) while one background
+    refresh replaces it
+  - nothing cached -> fetched inline
+Sources whose value must be current when it is read (BTC at candle close)
+pass refresh_inline=True: an expired value is refetched inline and only
+served stale if that fetch fails or the circuit is open.
+A source that fails `failure_threshold` times in a row is not called again
+for `cooldown` seconds (circuit open); after the cooldown a single trial call
+decides whether it closes again.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Optional
+from zoneinfo import ZoneInfo
+
+import config
+
+_NEW_YORK = ZoneInfo('America/New_York')
+
+
+def mark_stale(value: Dict, age_seconds: float) -> Dict:
+    """
+    Copy of a cached value marked stale
+
+    A value that was already stale when it was cached (e.g. a collector served
+    from this cache, then held by SharedDataCollector) keeps its earlier age:
+    stale_age_seconds and data_age_minutes are added to, not replaced.
+
+    Args:
+        value: Cached value dict
+        age_seconds: Seconds since this layer stored it
+
+    Returns:
+        New dict with 'stale', 'stale_age_seconds' and, where present,
+        'fresh' / 'data_age_minutes' updated
+    """
+    stale = {**value, 'stale': True, 'stale_age_seconds': value.get('stale_age_seconds', 0) + int(age_seconds)}
+    if 'fresh' in stale:
+        stale['fresh'] = False
+    if 'data_age_minutes' in stale:
+        stale['data_age_minutes'] = stale['data_age_minutes'] + int(age_seconds / 60)
+    return stale
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker (closed -> open -> half-open)"""
+
+    def __init__(self, failure_threshold: int = 3, cooldown: float = 300.0,
+                 clock: Callable[[], float] = time.time):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.clock = clock
+        self.failures = 0
+        self.opened_at = None
+        self.trips = 0
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return 'closed'
+        if self.clock() - self.opened_at >= self.cooldown:
+            return 'half_open'
+        return 'open'
+
+    def allow(self) -> bool:
+        """Can the source be called now (closed, or cooldown over)?"""
+        return self.state != 'open'
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self):
+        self.failures += 1
+        # A failed half-open trial re-opens immediately
+        if self.failures >= self.failure_threshold or self.opened_at is not None:
+            if self.opened_at is None:
+                self.trips += 1
+            self.opened_at = self.clock()
+
+
+class _Entry:
+    __slots__ = ('value', 'fetched_at', 'expires_at', 'refreshing', 'breaker', 'hits', 'stale_hits', 'fetches')
+
+    def __init__(self, breaker: CircuitBreaker):
+        self.value = None
+        self.fetched_at = None
+        self.expires_at = 0.0
+        self.refreshing = False
+        self.breaker = breaker
+        self.hits = 0
+        self.stale_hits = 0
+        self.fetches = 0
+
+
+class SourceCache:
+    """Per-source cached values with TTLs, background refresh and circuit breakers"""
+
+    def __init__(self, failure_threshold: int = 3, cooldown: float = 300.0,
+                 clock: Callable[[], float] = time.time):
+        """
+        Args:
+            failure_threshold: Consecutive failures that open a source's circuit
+            cooldown: Seconds an open circuit blocks calls
+            clock: Time source in seconds
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.clock = clock
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='source-refresh')
+
+    def _entry(self, name: str) -> _Entry:
+        entry = self._entries.get(name)
+        if entry is None:
+            entry = _Entry(CircuitBreaker(self.failure_threshold, self.cooldown, self.clock))
+            self._entries[name] = entry
+        return entry
+
+    def _fetch(self, name: str, entry: _Entry, fetch: Callable[[], Dict], ttl):
+        """Call the source and store the result (runs inline or on the refresh pool)"""
+        try:
+            value = fetch()
+            if value is None:
+                raise ValueError("no data")
+        except Exception as e:
+            with self._lock:
+                entry.breaker.record_failure()
+                entry.refreshing = False
+                state = entry.breaker.state
+            print(f"❌ [SOURCE CACHE] {name} fetch failed ({state}): {e}")
+            return None
+
+        now = self.clock()
+        with self._lock:
+            entry.value = value
+            entry.fetched_at = now
+            entry.expires_at = now + (ttl() if callable(ttl) else ttl)
+            entry.fetches += 1
+            entry.refreshing = False
+            entry.breaker.record_success()
+        return value
+
+    def _stale(self, entry: _Entry) -> Dict:
+        entry.stale_hits += 1
+        return mark_stale(entry.value, self.clock() - entry.fetched_at)
+
+    def get(self, name: str, fetch: Callable[[], Dict], ttl, refresh_inline: bool = False) -> Optional[Dict]:
+        """
+        Get a source's value
+
+        Args:
+            name: Source name (cache / breaker key)
+            fetch: Zero-argument callable returning the value dict (raises on failure)
+            ttl: Seconds a value stays fresh, or a callable returning them
+                 (evaluated after each fetch, e.g. market-hours aware)
+            refresh_inline: Refetch an expired value before returning instead of
+                            serving it stale while it refreshes in the background
+
+        Returns:
+            Fresh value, stale value (with 'stale' and 'stale_age_seconds') or
+            None if the source never succeeded
+        """
+        with self._lock:
+            entry = self._entry(name)
+            if entry.value is not None and self.clock() < entry.expires_at:
+                entry.hits += 1
+                return entry.value
+
+            can_call = entry.breaker.allow() and not entry.refreshing
+            if entry.value is not None and not (refresh_inline and can_call):
+                # Serve what we have; refresh once in the background
+                if can_call:
+                    entry.refreshing = True
+                    self._executor.submit(self._fetch, name, entry, fetch, ttl)
+                return self._stale(entry)
+
+            if not can_call:
+                return None
+            entry.refreshing = True
+
+        value = self._fetch(name, entry, fetch, ttl)
+        if value is None and refresh_inline:
+            # Inline refresh failed - the last good value is better than nothing
+            with self._lock:
+                if entry.value is not None:
+                    return self._stale(entry)
+        return value
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """
+        Per-source cache and breaker counters
+
+        Returns:
+            {name: {'hits', 'stale_hits', 'fetches', 'circuit', 'failures', 'trips', 'age_seconds'}}
+        """
+        with self._lock:
+            now = self.clock()
+            return {
+                name: {
+                    'hits': entry.hits,
+                    'stale_hits': entry.stale_hits,
+                    'fetches': entry.fetches,
+                    'circuit': entry.breaker.state,
+                    'failures': entry.breaker.failures,
+                    'trips': entry.breaker.trips,
+                    'age_seconds': now - entry.fetched_at if entry.fetched_at is not None else None
+                }
+                for name, entry in self._entries.items()
+            }
+
+
+def nasdaq_is_open(now: Optional[datetime] = None) -> bool:
+    """Regular NASDAQ session (Mon-Fri 09:30-16:00 New York time, holidays not modelled)"""
+    local = (now or datetime.now(timezone.utc)).astimezone(_NEW_YORK)
+    if local.weekday() >= 5:
+        return False
+    minutes = local.hour * 60 + local.minute
+    return 9 * 60 + 30 <= minutes < 16 * 60
+
+
+def ixic_ttl(now: Optional[datetime] = None, open_ttl: Optional[float] = None) -> float:
+    """
+    Seconds the IXIC snapshot stays valid
+
+    While the market is open it refreshes every `open_ttl` seconds
+    (config.IXIC_CACHE_TTL); while it is closed the data is frozen, so it is
+    kept until the next session opens.
+    """
+    now = now or datetime.now(timezone.utc)
+    if open_ttl is None:
+        open_ttl = config.IXIC_CACHE_TTL
+    if nasdaq_is_open(now):
+        return open_ttl
+
+    local = now.astimezone(_NEW_YORK)
+    next_open = local.replace(hour=9, minute=30, second=0, microsecond=0)
+    if local >= next_open:
+        next_open += timedelta(days=1)
+    while next_open.weekday() >= 5:
+        next_open += timedelta(days=1)
+    # Compare in UTC - same-zone aware datetimes subtract as wall clock (wrong across DST)
+    until_open = next_open.astimezone(timezone.utc) - now.astimezone(timezone.utc)
+    return max(until_open.total_seconds(), open_ttl)
+
+
+_source_cache = None
+_source_cache_lock = threading.Lock()
+
+
+def get_source_cache() -> SourceCache:
+    """Get process-wide source cache"""
+    global _source_cache
+    with _source_cache_lock:
+        if _source_cache is None:
+            _source_cache = SourceCache(
+                failure_threshold=config.SOURCE_BREAKER_FAILURES,
+                cooldown=config.SOURCE_BREAKER_COOLDOWN
+            )
+        return _source_cache
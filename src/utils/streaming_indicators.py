@@ -0,0 +1,379 @@
+"""Incremental (O(1) per candle) indicator state - EMA, Wilder RSI, MACD, ATR, Bollinger Bands"""
+import json
+import math
+import os
+from collections import deque
+from typing import Dict, Iterable, List, Optional
+
+
+class EMAState:
+    """
+    Exponential moving average, same values as ta EMAIndicator / ewm(span, adjust=False)
+
+    The recursion starts at the first value; value is None until `period`
+    values were seen (ta min_periods).
+    """
+
+    def __init__(self, period: int):
+        self.period = period
+        self.alpha = 2.0 / (period + 1)
+        self.ema = None
+        self.count = 0
+
+    def update(self, x: float) -> Optional[float]:
+        if self.ema is None:
+            self.ema = float(x)
+        else:
+            self.ema = (1.0 - self.alpha) * self.ema + self.alpha * x
+        self.count += 1
+        return self.value
+
+    @property
+    def value(self) -> Optional[float]:
+        return self.ema if self.count >= self.period else None
+
+    def to_dict(self) -> Dict:
+        return {'period': self.period, 'ema': self.ema, 'count': self.count}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'EMAState':
+        state = cls(data['period'])
+        state.ema = data['ema']
+        state.count = data['count']
+        return state
+
+
+class RSIState:
+    """
+    RSI with Wilder smoothing (alpha = 1/period), same values as ta RSIIndicator
+
+    The first close has no change and counts as a zero up/down move, exactly
+    like ta does with the leading NaN of diff().
+    """
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.alpha = 1.0 / period
+        self.prev_close = None
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self.count = 0
+
+    def update(self, close: float) -> Optional[float]:
+        change = 0.0 if self.prev_close is None else close - self.prev_close
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+
+        if self.count == 0:
+            self.avg_gain = gain
+            self.avg_loss = loss
+        else:
+            self.avg_gain = (1.0 - self.alpha) * self.avg_gain + self.alpha * gain
+            self.avg_loss = (1.0 - self.alpha) * self.avg_loss + self.alpha * loss
+
+        self.prev_close = float(close)
+        self.count += 1
+        return self.value
+
+    @property
+    def value(self) -> Optional[float]:
+        if self.count < self.period:
+            return None
+        if self.avg_loss == 0:
+            return 100.0
+        return 100.0 - 100.0 / (1.0 + self.avg_gain / self.avg_loss)
+
+    def to_dict(self) -> Dict:
+        return {
+            'period': self.period,
+            'prev_close': self.prev_close,
+            'avg_gain': self.avg_gain,
+            'avg_loss': self.avg_loss,
+            'count': self.count
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'RSIState':
+        state = cls(data['period'])
+        state.prev_close = data['prev_close']
+        state.avg_gain = data['avg_gain']
+        state.avg_loss = data['avg_loss']
+        state.count = data['count']
+        return state
+
+
+class MACDState:
+    """MACD line, signal and histogram (ta MACD: signal EMA starts once the slow EMA is valid)"""
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.fast = EMAState(fast)
+        self.slow = EMAState(slow)
+        self.signal = EMAState(signal)
+
+    def update(self, close: float) -> Optional[Dict]:
+        self.fast.update(close)
+        self.slow.update(close)
+        if self.slow.value is not None:
+            self.signal.update(self.fast.ema - self.slow.ema)
+        return self.value
+
+    @property
+    def value(self) -> Optional[Dict]:
+        if self.slow.value is None:
+            return None
+        macd = self.fast.ema - self.slow.ema
+        signal = self.signal.value
+        return {
+            'macd': macd,
+            'signal_line': signal,
+            'histogram': macd - signal if signal is not None else None
+        }
+
+    def to_dict(self) -> Dict:
+        return {'fast': self.fast.to_dict(), 'slow': self.slow.to_dict(), 'signal': self.signal.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'MACDState':
+        state = cls(data['fast']['period'], data['slow']['period'], data['signal']['period'])
+        state.fast = EMAState.from_dict(data['fast'])
+        state.slow = EMAState.from_dict(data['slow'])
+        state.signal = EMAState.from_dict(data['signal'])
+        return state
+
+
+class _RollingWindow:
+    """
+    Fixed-size window with running sum / sum of squares
+
+    Sums are kept around a shift (the window mean at the last rebuild) so the
+    variance doesn't lose precision on high-priced symbols, and are rebuilt
+    from the window every `period` updates so add/subtract drift can't accumulate.
+    """
+
+    def __init__(self, period: int):
+        self.period = period
+        self.values = deque(maxlen=period)
+        self.shift = 0.0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self._since_rebuild = 0
+
+    def push(self, x: float):
+        x = float(x)
+        if not self.values:
+            self.shift = x
+        if len(self.values) == self.period:
+            old = self.values[0] - self.shift
+            self.total -= old
+            self.total_sq -= old * old
+        self.values.append(x)
+        d = x - self.shift
+        self.total += d
+        self.total_sq += d * d
+
+        self._since_rebuild += 1
+        if self._since_rebuild >= self.period:
+            self._rebuild()
+
+    def _rebuild(self):
+        if self.values:
+            self.shift = math.fsum(self.values) / len(self.values)
+        self.total = math.fsum(v - self.shift for v in self.values)
+        self.total_sq = math.fsum((v - self.shift) ** 2 for v in self.values)
+        self._since_rebuild = 0
+
+    @property
+    def full(self) -> bool:
+        return len(self.values) == self.period
+
+    def mean(self) -> float:
+        return self.shift + self.total / len(self.values)
+
+    def std(self) -> float:
+        """Population std (ddof=0, as ta BollingerBands)"""
+        n = len(self.values)
+        mean_d = self.total / n
+        return math.sqrt(max(self.total_sq / n - mean_d * mean_d, 0.0))
+
+    def to_dict(self) -> Dict:
+        return {'period': self.period, 'values': list(self.values)}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> '_RollingWindow':
+        window = cls(data['period'])
+        window.values.extend(data['values'])
+        window._rebuild()
+        return window
+
+
+class ATRState:
+    """ATR as simple rolling mean of true range (same as utils.indicators.calculate_atr)"""
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.prev_close = None
+        self.window = _RollingWindow(period)
+
+    def update(self, high: float, low: float, close: float) -> Optional[float]:
+        true_range = high - low
+        if self.prev_close is not None:
+            true_range = max(true_range, abs(high - self.prev_close), abs(low - self.prev_close))
+        self.window.push(true_range)
+        self.prev_close = float(close)
+        return self.value
+
+    @property
+    def value(self) -> Optional[float]:
+        return self.window.mean() if self.window.full else None
+
+    def to_dict(self) -> Dict:
+        return {'period': self.period, 'prev_close': self.prev_close, 'window': self.window.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ATRState':
+        state = cls(data['period'])
+        state.prev_close = data['prev_close']
+        state.window = _RollingWindow.from_dict(data['window'])
+        return state
+
+
+class BollingerState:
+    """Bollinger Bands from a running-sum window (same as ta BollingerBands)"""
+
+    def __init__(self, period: int = 20, std_dev: float = 2):
+        self.period = period
+        self.std_dev = std_dev
+        self.window = _RollingWindow(period)
+
+    def update(self, close: float) -> Optional[Dict]:
+        self.window.push(close)
+        return self.value
+
+    @property
+    def value(self) -> Optional[Dict]:
+        if not self.window.full:
+            return None
+        middle = self.window.mean()
+        std = self.window.std()
+        return {
+            'upper': middle + self.std_dev * std,
+            'middle': middle,
+            'lower': middle - self.std_dev * std
+        }
+
+    def to_dict(self) -> Dict:
+        return {'period': self.period, 'std_dev': self.std_dev, 'window': self.window.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'BollingerState':
+        state = cls(data['period'], data['std_dev'])
+        state.window = _RollingWindow.from_dict(data['window'])
+        return state
+
+
+class StreamingIndicators:
+    """
+    All streaming indicators of one (symbol, interval) series
+
+    Feed every CLOSED candle once with update(); candles at or before the last
+    applied open time are ignored, so replaying an overlapping window after a
+    restart is safe.
+    """
+
+    def __init__(self, ema_periods: Iterable[int] = (20, 50), rsi_periods: Iterable[int] = (14, 7),
+                 macd_params=(12, 26, 9), atr_period: int = 14, bb_period: int = 20, bb_std: float = 2):
+        self.ema = {period: EMAState(period) for period in ema_periods}
+        self.rsi = {period: RSIState(period) for period in rsi_periods}
+        self.macd = MACDState(*macd_params)
+        self.atr = ATRState(atr_period)
+        self.bollinger = BollingerState(bb_period, bb_std)
+        self.last_open_time = None
+        self.candles = 0
+
+    def update(self, open_time: int, high: float, low: float, close: float) -> bool:
+        """
+        Apply one closed candle
+
+        Args:
+            open_time: Candle open time (ms) - used to skip already applied candles
+            high, low, close: Candle prices
+
+        Returns:
+            False if the candle was already applied
+        """
+        if self.last_open_time is not None and open_time <= self.last_open_time:
+            return False
+
+        for state in self.ema.values():
+            state.update(close)
+        for state in self.rsi.values():
+            state.update(close)
+        self.macd.update(close)
+        self.atr.update(high, low, close)
+        self.bollinger.update(close)
+
+        self.last_open_time = int(open_time)
+        self.candles += 1
+        return True
+
+    def update_from_df(self, df) -> int:
+        """Apply all new candles from a get_klines DataFrame (returns number applied)"""
+        applied = 0
+        open_times = df['timestamp'].values.astype('datetime64[ms]').astype('int64')
+        for open_time, high, low, close in zip(open_times, df['high'].values, df['low'].values, df['close'].values):
+            if self.update(int(open_time), float(high), float(low), float(close)):
+                applied += 1
+        return applied
+
+    def values(self) -> Dict:
+        """Current raw indicator values (None while warming up)"""
+        return {
+            'ema': {period: state.value for period, state in self.ema.items()},
+            'rsi': {period: state.value for period, state in self.rsi.items()},
+            'macd': self.macd.value,
+            'atr': self.atr.value,
+            'bollinger': self.bollinger.value,
+            'last_open_time': self.last_open_time
+        }
+
+    def to_dict(self) -> Dict:
+        return {
+            'ema': [state.to_dict() for state in self.ema.values()],
+            'rsi': [state.to_dict() for state in self.rsi.values()],
+            'macd': self.macd.to_dict(),
+            'atr': self.atr.to_dict(),
+            'bollinger': self.bollinger.to_dict(),
+            'last_open_time': self.last_open_time,
+            'candles': self.candles
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'StreamingIndicators':
+        state = cls(ema_periods=(), rsi_periods=())
+        state.ema = {item['period']: EMAState.from_dict(item) for item in data['ema']}
+        state.rsi = {item['period']: RSIState.from_dict(item) for item in data['rsi']}
+        state.macd = MACDState.from_dict(data['macd'])
+        state.atr = ATRState.from_dict(data['atr'])
+        state.bollinger = BollingerState.from_dict(data['bollinger'])
+        state.last_open_time = data['last_open_time']
+        state.candles = data['candles']
+        return state
+
+
+def save_indicator_states(path: str, states: Dict[str, StreamingIndicators]):
+    """Persist states keyed by series name (e.g. 'SOLUSDT:15m') to a JSON file"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump({key: state.to_dict() for key, state in states.items()}, f)
+    # Atomic replace - a crash mid-write never leaves a truncated state file
+    os.replace(tmp_path, path)
+
+
+def load_indicator_states(path: str) -> Dict[str, StreamingIndicators]:
+    """Load states saved by save_indicator_states (empty dict if file missing)"""
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    return {key: StreamingIndicators.from_dict(item) for key, item in data.items()}
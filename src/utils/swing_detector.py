@@ -0,0 +1,146 @@
+"""Vectorized swing high/low (local extrema) detection and price level clustering"""
+import numpy as np
+from typing import Dict, List, Optional
+
+
+def sliding_max(x: np.ndarray, size: int) -> np.ndarray:
+    """
+    Max of every window x[j:j+size] (van Herk / Gil-Werman, O(n) for any window size)
+
+    The array is cut into blocks of `size`; a window always spans the suffix of
+    one block and the prefix of the next, so its max is max(suffix, prefix).
+
+    Args:
+        x: 1-D array
+        size: Window size
+
+    Returns:
+        Array of len(x) - size + 1 window maxima (empty if x is shorter than size)
+    """
+    x = np.asarray(x, dtype=float)
+    n = len(x)
+    if size <= 0 or n < size:
+        return np.empty(0)
+    if size == 1:
+        return x.copy()
+
+    blocks = -(-n // size)
+    padded = np.full(blocks * size, -np.inf)
+    padded[:n] = x
+    padded = padded.reshape(blocks, size)
+
+    prefix = np.maximum.accumulate(padded, axis=1).ravel()
+    suffix = np.maximum.accumulate(padded[:, ::-1], axis=1)[:, ::-1].ravel()
+
+    starts = np.arange(n - size + 1)
+    return np.maximum(suffix[starts], prefix[starts + size - 1])
+
+
+def sliding_min(x: np.ndarray, size: int) -> np.ndarray:
+    """Min of every window x[j:j+size] (see sliding_max)"""
+    return -sliding_max(-np.asarray(x, dtype=float), size)
+
+
+def find_swing_highs(values: np.ndarray, window: int, strict: bool = False) -> np.ndarray:
+    """
+    Indices of swing highs - points that are the max of +/- window neighbours
+
+    Args:
+        values: 1-D array (e.g. candle highs)
+        window: Number of candles on each side
+        strict: True - must be strictly above every neighbour,
+                False - must equal the max of the window (ties count)
+
+    Returns:
+        Sorted array of indices (only points with a full window on both sides)
+    """
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    if window <= 0 or n < 2 * window + 1:
+        return np.empty(0, dtype=int)
+
+    centers = values[window:n - window]
+    if strict:
+        # Max of the window on each side, excluding the center itself
+        side_max = sliding_max(values, window)
+        neighbours = np.maximum(side_max[:n - 2 * window], side_max[window + 1:])
+        is_swing = centers > neighbours
+    else:
+        is_swing = centers == sliding_max(values, 2 * window + 1)
+
+    return np.flatnonzero(is_swing) + window
+
+
+def find_swing_lows(values: np.ndarray, window: int, strict: bool = False) -> np.ndarray:
+    """Indices of swing lows - points that are the min of +/- window neighbours (see find_swing_highs)"""
+    return find_swing_highs(-np.asarray(values, dtype=float), window, strict)
+
+
+def cluster_levels(prices: np.ndarray, tolerance_pct: float = 0.5) -> List[Dict]:
+    """
+    Group nearby swing prices into levels
+
+    Prices are sorted and a new level starts wherever the gap to the previous
+    price exceeds tolerance_pct of that price.
+
+    Args:
+        prices: Swing prices
+        tolerance_pct: Max gap between neighbouring prices of one level (%)
+
+    Returns:
+        List of levels (lowest first): price (mean), low, high, touches
+    """
+    prices = np.sort(np.asarray(prices, dtype=float))
+    if len(prices) == 0:
+        return []
+
+    gaps = np.diff(prices) > prices[:-1] * tolerance_pct / 100
+    bounds = np.concatenate(([0], np.flatnonzero(gaps) + 1, [len(prices)]))
+
+    levels = []
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        group = prices[start:end]
+        levels.append({
+            "price": float(group.mean()),
+            "low": float(group[0]),
+            "high": float(group[-1]),
+            "touches": int(end - start)
+        })
+    return levels
+
+
+def detect_swings(highs: np.ndarray, lows: np.ndarray, window: int = 10,
+                  lookback: Optional[int] = None, strict: bool = False,
+                  cluster_pct: float = 0.5) -> Dict:
+    """
+    Swing highs/lows and clustered support/resistance levels in one pass
+
+    Args:
+        highs: Candle highs (oldest first)
+        lows: Candle lows (oldest first)
+        window: Candles on each side of a swing point
+        lookback: Only use the last N candles (None = all)
+        strict: Strict extrema (see find_swing_highs)
+        cluster_pct: Level clustering tolerance (%)
+
+    Returns:
+        Dictionary with swing_high_indices / swing_highs, swing_low_indices / swing_lows
+        (indices relative to the lookback slice), resistance_levels, support_levels
+    """
+    highs = np.asarray(highs, dtype=float)
+    lows = np.asarray(lows, dtype=float)
+    if lookback is not None:
+        highs = highs[-lookback:]
+        lows = lows[-lookback:]
+
+    high_idx = find_swing_highs(highs, window, strict)
+    low_idx = find_swing_lows(lows, window, strict)
+
+    return {
+        "swing_high_indices": high_idx,
+        "swing_highs": highs[high_idx],
+        "swing_low_indices": low_idx,
+        "swing_lows": lows[low_idx],
+        "resistance_levels": cluster_levels(highs[high_idx], cluster_pct),
+        "support_levels": cluster_levels(lows[low_idx], cluster_pct)
+    }
@@ -0,0 +1,241 @@
+"""
+Per-stage latency tracing - spans, in-process latency summaries and Prometheus export
+
+    with span('analysis', strategy='sol'):
+        ...
+
+Every finished span feeds a rolling latency summary keyed by (stage, labels)
+(p50/p95/p99 over the most recent samples, plus count and sum since start).
+Spans nest through contextvars, so a Binance request inside a strategy's
+analysis is recorded as its child and inherits the strategy label. When a
+trace file is configured every span is also appended to it as one JSON line
+(trace_id / span_id / parent_id, start, duration, labels, error).
+
+The bot writes render_prometheus() to METRICS_EXPORT_PATH; the web API serves
+that file at /metrics.
+"""
+
+import contextvars
+import json
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+import config
+
+# Labels children take over from the enclosing span
+_INHERITED_LABELS = ('strategy',)
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+_current_span = contextvars.ContextVar('current_span', default=None)
+
+
+class LatencySummary:
+    """Rolling latency samples of one (stage, labels) series"""
+
+    __slots__ = ('samples', 'count', 'total', 'errors')
+
+    def __init__(self, window: int):
+        self.samples = deque(maxlen=window)
+        self.count = 0
+        self.total = 0.0
+        self.errors = 0
+
+    def observe(self, seconds: float, error: bool = False):
+        self.samples.append(seconds)
+        self.count += 1
+        self.total += seconds
+        if error:
+            self.errors += 1
+
+    def quantiles(self) -> Dict[float, float]:
+        """p50/p95/p99 over the rolling window (empty dict if no samples)"""
+        if not self.samples:
+            return {}
+        values = np.quantile(np.fromiter(self.samples, dtype=np.float64), QUANTILES)
+        return dict(zip(QUANTILES, values.tolist()))
+
+
+class _Span:
+    __slots__ = ('trace_id', 'span_id', 'parent_id', 'name', 'labels')
+
+    def __init__(self, trace_id: str, span_id: str, parent_id: Optional[str], name: str, labels: Dict):
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.name = name
+        self.labels = labels
+
+
+class Tracer:
+    """Span recorder with per-stage latency summaries and an optional JSONL trace file"""
+
+    def __init__(self, trace_file: Optional[str] = None, window: int = 1024, enabled: bool = True):
+        """
+        Args:
+            trace_file: Append every finished span to this JSONL file (None = off)
+            window: Samples kept per series for quantiles
+            enabled: False turns span() into a no-op
+        """
+        self.trace_file = trace_file
+        self.window = window
+        self.enabled = enabled
+        self._series: Dict[Tuple[str, Tuple], LatencySummary] = {}
+        self._lock = threading.Lock()
+        self._file_lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, **labels):
+        """
+        Time a block as a span (child of the current span, if any)
+
+        Args:
+            name: Stage name (e.g. 'market_data', 'llm', 'binance_rest')
+            **labels: Series labels (e.g. strategy='sol', endpoint='klines')
+        """
+        if not self.enabled:
+            yield None
+            return
+
+        parent = _current_span.get()
+        if parent is not None:
+            for key in _INHERITED_LABELS:
+                if key in parent.labels and key not in labels:
+                    labels[key] = parent.labels[key]
+        labels = {key: str(value) for key, value in labels.items() if value is not None}
+        current = _Span(
+            parent.trace_id if parent else uuid.uuid4().hex[:16],
+            uuid.uuid4().hex[:16],
+            parent.span_id if parent else None,
+            name,
+            labels
+        )
+
+        token = _current_span.set(current)
+        started_at = time.time()
+        started = time.perf_counter()
+        error = None
+        try:
+            yield current
+        except BaseException as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            duration = time.perf_counter() - started
+            _current_span.reset(token)
+            self._record(current, started_at, duration, error)
+
+    def _record(self, current: _Span, started_at: float, duration: float, error: Optional[str]):
+        key = (current.name, tuple(sorted(current.labels.items())))
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = LatencySummary(self.window)
+            series.observe(duration, error is not None)
+
+        if self.trace_file:
+            line = json.dumps({
+                'trace_id': current.trace_id,
+                'span_id': current.span_id,
+                'parent_id': current.parent_id,
+                'name': current.name,
+                'labels': current.labels,
+                'start': round(started_at, 6),
+                'duration_ms': round(duration * 1000, 3),
+                'error': error
+            })
+            try:
+                with self._file_lock, open(self.trace_file, 'a') as f:
+                    f.write(line + '\n')
+            except OSError as e:
+                print(f"⚠️  [TRACING] Cannot write trace file: {e}")
+
+    def get_stats(self) -> Dict[Tuple[str, Tuple], Dict]:
+        """
+        Latency summary per series
+
+        Returns:
+            {(stage, labels): {'count', 'sum', 'errors', 'p50', 'p95', 'p99'}} (seconds)
+        """
+        with self._lock:
+            series = {key: (s.count, s.total, s.errors, s.quantiles()) for key, s in self._series.items()}
+        return {
+            key: {
+                'count': count,
+                'sum': total,
+                'errors': errors,
+                **{f"p{int(q * 100)}": value for q, value in quantiles.items()}
+            }
+            for key, (count, total, errors, quantiles) in series.items()
+        }
+
+    def render_prometheus(self) -> str:
+        """Latency summaries in Prometheus text exposition format"""
+        stats = self.get_stats()
+        lines = [
+            '# HELP llmtrader_stage_duration_seconds Analysis cycle stage latency (rolling quantiles)',
+            '# TYPE llmtrader_stage_duration_seconds summary'
+        ]
+        errors = [
+            '# HELP llmtrader_stage_errors_total Spans that ended with an exception',
+            '# TYPE llmtrader_stage_errors_total counter'
+        ]
+        for (name, labels), values in sorted(stats.items()):
+            base = _format_labels((('stage', name),) + labels)
+            for q in QUANTILES:
+                key = f"p{int(q * 100)}"
+                if key in values:
+                    quantile_labels = _format_labels((('stage', name),) + labels + (('quantile', str(q)),))
+                    lines.append(f"llmtrader_stage_duration_seconds{quantile_labels} {values[key]:.6f}")
+            lines.append(f"llmtrader_stage_duration_seconds_sum{base} {values['sum']:.6f}")
+            lines.append(f"llmtrader_stage_duration_seconds_count{base} {values['count']}")
+            errors.append(f"llmtrader_stage_errors_total{base} {values['errors']}")
+        return '\n'.join(lines + errors) + '\n'
+
+    def export_prometheus(self, path: str):
+        """Atomically write render_prometheus() to path (read by the web API)"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(self.render_prometheus())
+        os.replace(tmp_path, path)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels: Tuple) -> str:
+    return '{' + ','.join(f'{key}="{_escape_label(str(value))}"' for key, value in labels) + '}'
+
+
+def default_metrics_path() -> str:
+    """METRICS_EXPORT_PATH or data/metrics.prom in the project root"""
+    if config.METRICS_EXPORT_PATH:
+        return config.METRICS_EXPORT_PATH
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.join(project_root, 'data', 'metrics.prom')
+
+
+_tracer = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """Get process-wide tracer"""
+    global _tracer
+    with _tracer_lock:
+        if _tracer is None:
+            _tracer = Tracer(trace_file=config.TRACE_FILE, enabled=config.TRACING_ENABLED)
+        return _tracer
+
+
+def span(name: str, **labels):
+    """Shortcut for get_tracer().span(...)"""
+    return get_tracer().span(name, **labels)
@@ -0,0 +1,248 @@
+"""In-memory SL/TP trigger index for open paper trades"""
+import threading
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Tuple
+
+
+class _SortedLevels:
+    """Sorted price levels with trade ids (parallel lists, bisect lookups)"""
+
+    def __init__(self):
+        self.levels = []
+        self.trade_ids = []
+
+    def __len__(self):
+        return len(self.levels)
+
+    def add(self, level: float, trade_id: str):
+        pos = bisect_right(self.levels, level)
+        self.levels.insert(pos, level)
+        self.trade_ids.insert(pos, trade_id)
+
+    def remove(self, level: float, trade_id: str):
+        pos = bisect_left(self.levels, level)
+        while pos < len(self.levels) and self.levels[pos] == level:
+            if self.trade_ids[pos] == trade_id:
+                del self.levels[pos]
+                del self.trade_ids[pos]
+                return
+            pos += 1
+
+    def at_or_above(self, price: float) -> List[str]:
+        """Trade ids with level >= price"""
+        return self.trade_ids[bisect_left(self.levels, price):]
+
+    def at_or_below(self, price: float) -> List[str]:
+        """Trade ids with level <= price"""
+        return self.trade_ids[:bisect_right(self.levels, price)]
+
+
+class _SymbolIndex:
+    """Trigger levels of one symbol"""
+
+    def __init__(self):
+        self.long_sl = _SortedLevels()    # hit when price <= level
+        self.long_tp = _SortedLevels()    # hit when price >= level
+        self.short_sl = _SortedLevels()   # hit when price >= level
+        self.short_tp = _SortedLevels()   # hit when price <= level
+
+    def __len__(self):
+        return len(self.long_sl) + len(self.short_sl)
+
+
+def _trade_record(trade: Dict) -> Optional[Dict]:
+    """Indexed fields of a trade (None if it has no SL/TP levels)"""
+    if trade.get('stop_loss') is None or trade.get('take_profit') is None:
+        return None
+    return {
+        'trade_id': trade['trade_id'],
+        'symbol': trade['symbol'],
+        'action': trade['action'],
+        'stop_loss': float(trade['stop_loss']),
+        'take_profit': float(trade['take_profit'])
+    }
+
+
+class TriggerIndex:
+    """
+    Per-symbol index of open paper trade SL/TP levels
+
+    check(symbol, price) returns every trade whose stop loss or take profit is
+    hit at that price in O(log n + k) - suitable for checking on every price
+    tick instead of scanning all open trades. Kept in sync with TradingDatabase
+    through its trade listeners (create_trade / close_trade) and sync().
+
+    Every add/remove bumps the index version. sync() gets the version taken
+    before the open trades were read (sync_token()), so listener updates that
+    happened after the read are not undone by the older DB view.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._symbols: Dict[str, _SymbolIndex] = {}
+        self._trades: Dict[str, Dict] = {}
+        self._version = 0
+        self._indexed_at: Dict[str, int] = {}  # trade_id -> version when indexed
+        self._removed_at: Dict[str, int] = {}  # trade_id -> version when removed (pruned by sync)
+
+    def __len__(self):
+        return len(self._trades)
+
+    def __contains__(self, trade_id: str):
+        return trade_id in self._trades
+
+    def symbols(self) -> List[str]:
+        """Symbols with at least one indexed trade"""
+        with self._lock:
+            return [symbol for symbol, index in self._symbols.items() if len(index)]
+
+    def get_trade(self, trade_id: str) -> Optional[Dict]:
+        """Indexed trade record (trade_id, symbol, action, stop_loss, take_profit)"""
+        return self._trades.get(trade_id)
+
+    def add_trade(self, trade: Dict) -> bool:
+        """
+        Index an open trade
+
+        Args:
+            trade: Trade dict with trade_id, symbol, action, stop_loss, take_profit
+
+        Returns:
+            False if the trade has no SL/TP levels (not indexed)
+        """
+        record = _trade_record(trade)
+        if record is None:
+            return False
+
+        with self._lock:
+            self._add_locked(record)
+        return True
+
+    def _add_locked(self, record: Dict):
+        trade_id = record['trade_id']
+        if trade_id in self._trades:
+            self._remove_locked(trade_id)
+
+        index = self._symbols.setdefault(record['symbol'], _SymbolIndex())
+        if record['action'] == 'LONG':
+            index.long_sl.add(record['stop_loss'], trade_id)
+            index.long_tp.add(record['take_profit'], trade_id)
+        else:  # SHORT
+            index.short_sl.add(record['stop_loss'], trade_id)
+            index.short_tp.add(record['take_profit'], trade_id)
+
+        self._trades[trade_id] = record
+        self._version += 1
+        self._indexed_at[trade_id] = self._version
+        self._removed_at.pop(trade_id, None)
+
+    def remove_trade(self, trade_id: str) -> bool:
+        """Remove a trade from the index (returns False if it wasn't indexed)"""
+        with self._lock:
+            return self._remove_locked(trade_id)
+
+    def _remove_locked(self, trade_id: str) -> bool:
+        record = self._trades.pop(trade_id, None)
+        if record is None:
+            return False
+
+        index = self._symbols[record['symbol']]
+        if record['action'] == 'LONG':
+            index.long_sl.remove(record['stop_loss'], trade_id)
+            index.long_tp.remove(record['take_profit'], trade_id)
+        else:
+            index.short_sl.remove(record['stop_loss'], trade_id)
+            index.short_tp.remove(record['take_profit'], trade_id)
+        self._version += 1
+        del self._indexed_at[trade_id]
+        self._removed_at[trade_id] = self._version
+        return True
+
+    def sync_token(self) -> int:
+        """Current index version - take it BEFORE reading the open trades passed to sync()"""
+        with self._lock:
+            return self._version
+
+    def sync(self, open_trades: List[Dict], token: Optional[int] = None) -> Tuple[int, int]:
+        """
+        Reconcile index with the open trades in the database
+
+        Picks up trades opened/closed by other processes (e.g. web dashboard).
+        Trades indexed or removed after `token` (by the listeners, while
+        open_trades was being read) are left as they are.
+
+        Args:
+            open_trades: Open trades read from the database
+            token: sync_token() taken before the read (None = now)
+
+        Returns:
+            (added, removed)
+        """
+        open_ids = {trade['trade_id'] for trade in open_trades}
+        with self._lock:
+            if token is None:
+                token = self._version
+
+            removed = 0
+            for trade_id in list(self._trades.keys()):
+                if trade_id not in open_ids and self._indexed_at[trade_id] <= token:
+                    self._remove_locked(trade_id)
+                    removed += 1
+
+            # Removals the read already reflects are no longer needed
+            self._removed_at = {trade_id: version for trade_id, version in self._removed_at.items()
+                                if version > token}
+
+            added = 0
+            for trade in open_trades:
+                trade_id = trade['trade_id']
+                if trade_id in self._trades or trade_id in self._removed_at:
+                    continue  # indexed, or closed after the read
+                record = _trade_record(trade)
+                if record is not None:
+                    self._add_locked(record)
+                    added += 1
+
+        return added, removed
+
+    def check(self, symbol: str, price: float) -> List[Tuple[Dict, str, float]]:
+        """
+        Find trades triggered at price
+
+        Args:
+            symbol: Trading pair
+            price: Current price
+
+        Returns:
+            List of (trade, exit_reason, exit_price); SL wins if both levels are hit
+        """
+        with self._lock:
+            index = self._symbols.get(symbol)
+            if index is None:
+                return []
+
+            hits = {}
+            for trade_id in index.long_tp.at_or_below(price):
+                hits[trade_id] = 'TP_HIT'
+            for trade_id in index.short_tp.at_or_above(price):
+                hits[trade_id] = 'TP_HIT'
+            for trade_id in index.long_sl.at_or_above(price):
+                hits[trade_id] = 'SL_HIT'
+            for trade_id in index.short_sl.at_or_below(price):
+                hits[trade_id] = 'SL_HIT'
+
+            triggered = []
+            for trade_id, exit_reason in hits.items():
+                trade = self._trades[trade_id]
+                exit_price = trade['stop_loss'] if exit_reason == 'SL_HIT' else trade['take_profit']
+                triggered.append((trade, exit_reason, exit_price))
+
+        return triggered
+
+    # TradingDatabase trade listener interface
+
+    def on_trade_opened(self, trade: Dict):
+        self.add_trade(trade)
+
+    def on_trade_closed(self, trade_id: str):
+        self.remove_trade(trade_id)
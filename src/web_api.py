@@ -3,20 +3,36 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from flask import Flask, jsonify, request, send_from_directory
+from flask import Flask, Response, jsonify, request, send_from_directory, g
 from flask_cors import CORS
 from utils.database import TradingDatabase
 import sqlite3
 import json
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from collections import defaultdict
 import requests
 import config
 from strategy_config import STRATEGIES
+from utils.binance_client import set_request_priority, reset_request_priority, RequestPriority
+from utils.tracing import default_metrics_path
+from utils.order_latency import summarize_latencies
 
 app = Flask(__name__, static_folder='../web', static_url_path='')
 CORS(app)
 
+
+@app.before_request
+def dashboard_request_priority():
+    """Dashboard Binance calls have lowest priority (bot orders/monitoring go first)"""
+    g.binance_priority_token = set_request_priority(RequestPriority.DASHBOARD)
+
+
+@app.teardown_request
+def restore_request_priority(exc=None):
+    token = g.pop('binance_priority_token', None)
+    if token is not None:
+        reset_request_priority(token)
+
 db = TradingDatabase()
 
 
@@ -62,8 +78,8 @@ def get_stats():
     # Get live trading stats from Binance
     live_stats = None
     try:
-        from utils.binance_client import BinanceClient
-        client = BinanceClient()
+        from utils.binance_client import get_binance_client
+        client = get_binance_client()
         live_stats = client.get_live_trading_stats(symbol=symbol)
     except Exception as e:
         print(f"Error fetching live stats: {e}")
@@ -132,8 +148,8 @@ def get_trades():
         
         # Fetch current prices from Binance
         try:
-            from utils.binance_client import BinanceClient
-            client = BinanceClient()
+            from utils.binance_client import get_binance_client
+            client = get_binance_client()
             current_prices = {}
             
             for symbol in symbols:
@@ -174,14 +190,14 @@ def get_trades():
 @app.route('/api/chart-data')
 def get_chart_data():
     """Get price and portfolio data for chart (with optional strategy filter)"""
-    from utils.binance_client import BinanceClient
+    from utils.binance_client import get_binance_client
     from datetime import datetime, timedelta
     
     strategy = request.args.get('strategy')  # Optional filter by strategy
     
     try:
         # Get SOLUSDT price history (last 48 hours, 2h intervals for cleaner chart)
-        client = BinanceClient()
+        client = get_binance_client()
         klines = client.client.get_klines(
             symbol='SOLUSDT',
             interval='2h',
@@ -315,6 +331,17 @@ def get_bot_status():
         return jsonify({'running': False, 'pid': None})
 
 
+@app.route('/metrics')
+def get_metrics():
+    """Stage latency summaries (Prometheus text format) exported by the bot after each cycle"""
+    try:
+        with open(default_metrics_path()) as f:
+            body = f.read()
+    except FileNotFoundError:
+        body = ''  # Bot has not finished a cycle yet (or tracing is disabled)
+    return Response(body, content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
 @app.route('/api/strategy-runs')
 def get_strategy_runs():
     """Get strategy execution logs"""
@@ -336,7 +363,7 @@ def get_strategy_runs():
 def close_trade_api(trade_id):
     """Close an open trade at current market price"""
     try:
-        from utils.binance_client import BinanceClient
+        from utils.binance_client import get_binance_client
         import sqlite3
         
         # Check if trade exists and is open
@@ -355,7 +382,7 @@ def close_trade_api(trade_id):
             return jsonify({'error': 'Trade is already closed'}), 400
         
         # Get current market price
-        client = BinanceClient()
+        client = get_binance_client()
         current_price = client.get_current_price(symbol)
         
         # Close trade using database function (handles P&L calculation with fees and size)
@@ -779,9 +806,9 @@ def get_strategy_detail():
 def get_binance_account():
     """Get comprehensive Binance Futures account overview"""
     try:
-        from utils.binance_client import BinanceClient
+        from utils.binance_client import get_binance_client
         
-        client = BinanceClient()
+        client = get_binance_client()
         is_demo = client.demo
         
         # Get account balance
@@ -937,10 +964,10 @@ def get_binance_account():
 def binance_debug():
     """Debug endpoint to check Binance data"""
     try:
-        from utils.binance_client import BinanceClient
+        from utils.binance_client import get_binance_client
         from datetime import datetime, timedelta
         
-        client = BinanceClient()
+        client = get_binance_client()
         now = datetime.now()
         month_ago = int((now - timedelta(days=30)).timestamp() * 1000)
         
@@ -997,10 +1024,10 @@ def binance_debug():
 def get_binance_analytics():
     """Get comprehensive analytics for Binance account (ONLY Binance data, no local DB)"""
     try:
-        from utils.binance_client import BinanceClient
+        from utils.binance_client import get_binance_client
         from datetime import datetime, timedelta
         
-        client = BinanceClient()
+        client = get_binance_client()
         
         # Get account info
         account = client.client.futures_account()
@@ -1662,6 +1689,36 @@ Keep analysis concise but technical. Use plain language but don't shy away from
         })
 
 
+@app.route('/api/order-latency')
+def get_order_latency():
+    """Candle-close-to-order latency of live orders (distribution, SLO breaches, recent orders)"""
+    try:
+        strategy = request.args.get('strategy')
+        days = int(request.args.get('days', 30))
+        since_ms = int((datetime.now(timezone.utc) - timedelta(days=days)).timestamp() * 1000)
+        
+        rows = db.get_order_latency(strategy=strategy, since_ms=since_ms)
+        slo_ms = config.ORDER_LATENCY_SLO_MS
+        
+        by_strategy = defaultdict(list)
+        for row in rows:
+            by_strategy[row['strategy']].append(row)
+        
+        return jsonify({
+            'success': True,
+            'slo_ms': slo_ms,
+            'summary': summarize_latencies(rows, slo_ms),
+            'strategies': {
+                name: {key: value for key, value in summarize_latencies(strategy_rows, slo_ms).items()
+                       if key not in ('histogram', 'stages')}
+                for name, strategy_rows in by_strategy.items()
+            },
+            'recent': rows[:20]
+        })
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
 @app.route('/api/strategies')
 def get_strategies():
     """Get all strategies with their configuration"""
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""One account snapshot per monitoring cycle and batch order cancels"""
+import logging
+import os
+import sys
+import threading
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import agents.monitoring as monitoring
+from utils.account_snapshot import AccountSnapshot
+from utils.binance_client import BinanceClient, BATCH_CANCEL_LIMIT, get_order_placement_guard
+
+
+def order(order_id, symbol, order_type, quantity):
+    return {'order_id': order_id, 'symbol': symbol, 'side': 'SELL', 'type': order_type, 'status': 'NEW',
+            'quantity': quantity, 'price': 0.0, 'stop_price': 0.0, 'timestamp': 0}
+
+
+ACCOUNT = {
+    'totalWalletBalance': '1000', 'availableBalance': '800', 'totalUnrealizedProfit': '5',
+    'assets': [{'asset': 'USDT', 'walletBalance': '1000', 'availableBalance': '800'},
+               {'asset': 'BNB', 'walletBalance': '0', 'availableBalance': '0'}],
+    'positions': [
+        {'symbol': 'SOLUSDT', 'positionAmt': '2', 'entryPrice': '150', 'unrealizedProfit': '5', 'leverage': '5'},
+        {'symbol': 'ETHUSDT', 'positionAmt': '1', 'entryPrice': '3000', 'unrealizedProfit': '0', 'leverage': '5'},
+        {'symbol': 'XRPUSDT', 'positionAmt': '0', 'entryPrice': '0', 'unrealizedProfit': '0', 'leverage': '5'},
+    ]
+}
+
+OPEN_ORDERS = (
+    [order(100 + i, 'DOGEUSDT', 'STOP', 10) for i in range(12)]  # orphaned (no DOGE position)
+    + [order(200, 'SOLUSDT', 'STOP', 1), order(201, 'SOLUSDT', 'STOP', 1),
+       order(202, 'SOLUSDT', 'TAKE_PROFIT', 1), order(203, 'SOLUSDT', 'TAKE_PROFIT', 1)]  # matches position
+    + [order(300, 'ETHUSDT', 'STOP', 3), order(301, 'ETHUSDT', 'TAKE_PROFIT', 1),
+       order(302, 'ETHUSDT', 'LIMIT', 1)]  # SL too big -> SL/TP cancelled, LIMIT kept
+)
+
+
+class FakeFuturesApi:
+    def __init__(self, calls):
+        self.calls = calls
+
+    def futures_account(self):
+        self.calls.append(('futures_account',))
+        return ACCOUNT
+
+    def futures_cancel_orders(self, symbol, orderidlist):
+        self.calls.append(('futures_cancel_orders', symbol, list(orderidlist)))
+        # Binance answers per order; 111 is already gone
+        return [{'code': -2011, 'msg': 'Unknown order sent.'} if order_id == 111 else
+                {'orderId': order_id, 'symbol': symbol, 'status': 'CANCELED'} for order_id in orderidlist]
+
+
+class FakeClient:
+    def __init__(self):
+        self.calls = []
+        self.client = FakeFuturesApi(self.calls)
+        self.has_credentials = True
+
+    def check_credentials(self):
+        pass
+
+    def get_open_orders(self, symbol=None):
+        self.calls.append(('get_open_orders',))
+        return list(OPEN_ORDERS)
+
+    def get_open_positions(self, symbol=None):
+        raise AssertionError('positions must come from the snapshot')
+
+    def cancel_orders(self, symbol, order_ids):
+        return BinanceClient.cancel_orders(self, symbol, order_ids)
+
+    def cancel_order(self, symbol, order_id):
+        raise AssertionError('orders must be cancelled in batches')
+
+
+def test_snapshot_indexes_by_symbol():
+    snapshot = AccountSnapshot.from_responses(list(OPEN_ORDERS), ACCOUNT)
+    assert snapshot.position_symbols == ['ETHUSDT', 'SOLUSDT']  # flat XRP dropped
+    assert snapshot.position('SOLUSDT')['position_amt'] == 2.0 and snapshot.position('XRPUSDT') is None
+    assert [o['order_id'] for o in snapshot.orders('ETHUSDT')] == [300, 301, 302]
+    assert snapshot.orders('BTCUSDT') == []
+    assert snapshot.balances['available_balance'] == 800.0 and list(snapshot.assets) == ['USDT']
+
+    snapshot.discard_orders('ETHUSDT', [300, 301])
+    assert [o['order_id'] for o in snapshot.orders('ETHUSDT')] == [302]
+    snapshot.discard_orders('ETHUSDT', [302])
+    assert 'ETHUSDT' not in snapshot.order_symbols
+
+
+def test_batch_cancel_splits_and_reports_failures():
+    client = FakeClient()
+    result = BinanceClient.cancel_orders(client, 'DOGEUSDT', list(range(100, 125)))
+    batches = [call for call in client.calls if call[0] == 'futures_cancel_orders']
+    assert [len(call[2]) for call in batches] == [BATCH_CANCEL_LIMIT, BATCH_CANCEL_LIMIT, 5]
+    assert len(result['cancelled']) == 24 and list(result['failed']) == [111]
+
+
+def test_monitoring_cycle_uses_one_snapshot():
+    client = FakeClient()
+    original = monitoring.get_binance_client
+    monitoring.get_binance_client = lambda: client
+    try:
+        agent = monitoring.MonitoringAgent(logger_instance=logging.getLogger('test_account_snapshot'))
+        results = agent.run()
+    finally:
+        monitoring.get_binance_client = original
+
+    # Open orders first, then account - two signed reads for the whole cycle
+    reads = [call[0] for call in client.calls if call[0] != 'futures_cancel_orders']
+    assert reads == ['get_open_orders', 'futures_account']
+
+    cancels = [call[1:] for call in client.calls if call[0] == 'futures_cancel_orders']
+    assert cancels == [
+        ('DOGEUSDT', list(range(100, 110))),
+        ('DOGEUSDT', [110, 111]),
+        ('ETHUSDT', [300, 301]),
+    ]
+
+    orphaned = results['tasks']['orphaned_orders']
+    assert orphaned['orphaned_orders_found'] == 12 and orphaned['orphaned_orders_cancelled'] == 11
+    amounts = results['tasks']['order_amounts']
+    assert amounts['positions_checked'] == 2 and amounts['orders_cancelled'] == 2
+    assert not amounts['details']['SOLUSDT']['issues']
+    assert results['account']['positions'] == 2 and results['account']['open_orders'] == 19
+
+
+def test_monitoring_skips_symbol_with_live_placement_in_flight():
+    """Entry filled, only SL1 acked yet: monitoring must not cancel the half-placed set"""
+    half_placed = [order(400, 'SOLUSDT', 'STOP', 1)]  # position 2, SL 1, no TP yet
+    client = FakeClient()
+    client.get_open_orders = lambda symbol=None: list(half_placed)
+    original = monitoring.get_binance_client
+    monitoring.get_binance_client = lambda: client
+    try:
+        agent = monitoring.MonitoringAgent(logger_instance=logging.getLogger('test_account_snapshot'))
+    finally:
+        monitoring.get_binance_client = original
+    guard = get_order_placement_guard()
+
+    entry_placed = threading.Event()
+    snapshot_taken = threading.Event()
+
+    def execute_live_trade():
+        with guard.placing('SOLUSDT'):
+            entry_placed.set()
+            snapshot_taken.wait(5)  # monitoring snapshots while SL2/TP1/TP2 are still pending
+            half_placed.extend([order(401, 'SOLUSDT', 'STOP', 1), order(402, 'SOLUSDT', 'TAKE_PROFIT', 1),
+                                order(403, 'SOLUSDT', 'TAKE_PROFIT', 1)])
+
+    trader = threading.Thread(target=execute_live_trade)
+    trader.start()
+    assert entry_placed.wait(5)
+
+    # Pass 1: placement still running -> mismatch seen but nothing cancelled
+    snapshot = monitoring.AccountSnapshot.fetch(client)
+    during = agent.check_and_fix_order_amounts(snapshot)
+    assert during['issues_found'] >= 1 and during['orders_cancelled'] == 0
+    assert during['details']['SOLUSDT']['skipped']
+
+    # Pass 2: same stale snapshot after placement finished -> version changed, still skipped
+    snapshot_taken.set()
+    trader.join(5)
+    after = agent.check_and_fix_order_amounts(snapshot)
+    assert after['orders_cancelled'] == 0
+    assert not [call for call in client.calls if call[0] == 'futures_cancel_orders']
+
+    # Pass 3: fresh snapshot sees the complete SL/TP set
+    fresh = agent.check_and_fix_order_amounts(monitoring.AccountSnapshot.fetch(client))
+    assert fresh['details']['SOLUSDT']['issues'] == [] and fresh['orders_cancelled'] == 0
+
+
+def test_hedge_mode_keeps_both_legs():
+    def leg_order(order_id, order_type, quantity, position_side):
+        return dict(order(order_id, 'SOLUSDT', order_type, quantity), position_side=position_side)
+
+    account = {'positions': [
+        {'symbol': 'SOLUSDT', 'positionSide': 'LONG', 'positionAmt': '2', 'entryPrice': '150', 'leverage': '5'},
+        {'symbol': 'SOLUSDT', 'positionSide': 'SHORT', 'positionAmt': '-1', 'entryPrice': '160', 'leverage': '5'},
+    ]}
+    open_orders = [leg_order(500, 'STOP', 2, 'LONG'), leg_order(501, 'TAKE_PROFIT', 2, 'LONG'),
+                   leg_order(502, 'STOP', 3, 'SHORT'), leg_order(503, 'TAKE_PROFIT', 1, 'SHORT')]
+    snapshot = AccountSnapshot.from_responses(open_orders, account)
+    snapshot.placement_versions = get_order_placement_guard().versions()
+
+    assert snapshot.position_symbols == ['SOLUSDT'] and len(snapshot.positions) == 2
+    assert snapshot.position('SOLUSDT', 'LONG')['position_amt'] == 2.0
+    assert snapshot.position('SOLUSDT', 'SHORT')['side'] == 'SHORT'
+    assert snapshot.get_summary()['positions'] == 2
+
+    # Each leg is checked against its own orders: only the SHORT SL/TP are off
+    client = FakeClient()
+    original = monitoring.get_binance_client
+    monitoring.get_binance_client = lambda: client
+    try:
+        agent = monitoring.MonitoringAgent(logger_instance=logging.getLogger('test_account_snapshot'))
+    finally:
+        monitoring.get_binance_client = original
+    result = agent.check_and_fix_order_amounts(snapshot)
+    assert result['positions_checked'] == 2
+    assert not result['details']['SOLUSDT LONG']['issues']
+    assert result['details']['SOLUSDT SHORT']['issues']
+    cancels = [call[1:] for call in client.calls if call[0] == 'futures_cancel_orders']
+    assert cancels == [('SOLUSDT', [502, 503])]
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Async market data client: candle store locking and the blocking facade"""
+import asyncio
+import contextvars
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import config
+from utils.async_binance_client import AsyncBinanceClient, AsyncBinanceClientFacade
+from utils.binance_client import RequestPriority, get_request_priority, request_priority
+from utils.candle_store import CandleStore, INTERVAL_MS
+
+STEP = INTERVAL_MS['15m']
+
+caller_label = contextvars.ContextVar('caller_label', default=None)
+
+
+def without_default_store(factory):
+    """Build a client without opening data/candles.db"""
+    enabled = config.CANDLE_STORE_ENABLED
+    config.CANDLE_STORE_ENABLED = False
+    try:
+        return factory()
+    finally:
+        config.CANDLE_STORE_ENABLED = enabled
+
+
+class FakeAsyncFuturesApi:
+    """futures_klines that needs a default-executor thread per request"""
+
+    def __init__(self):
+        self.requests = 0
+
+    async def futures_klines(self, symbol, interval, limit=None, startTime=None, endTime=None):
+        self.requests += 1
+        await asyncio.to_thread(time.sleep, 0.01)
+        now = int(time.time() * 1000) // STEP * STEP
+        return [[t, "1", "2", "0.5", "1.5", "10", t + STEP - 1, "0", 0, "0", "0", "0"]
+                for t in range(now - (limit - 1) * STEP, now + 1, STEP)]
+
+
+def test_same_series_coroutines_do_not_starve_the_executor():
+    client = without_default_store(lambda: AsyncBinanceClient(api_key='', api_secret='', demo=False))
+    client.client = FakeAsyncFuturesApi()
+    client.candle_store = CandleStore(os.path.join(tempfile.mkdtemp(), 'candles.db'))
+
+    async def fetch_all():
+        # Fewer executor threads than waiting coroutines: blocking lock.acquire() in
+        # the executor would leave none for the request holding the lock
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=2))
+        return await asyncio.gather(*[client._get_klines_from_store('SOLUSDT', '15m', 50) for _ in range(6)])
+
+    frames = asyncio.run(asyncio.wait_for(fetch_all(), timeout=10))
+    assert all(len(frame) == 49 for frame in frames)
+    assert client.client.requests == 1  # one download, the rest are served from the store
+
+
+class ContextProbe:
+    """Stands in for AsyncBinanceClient - reports the context the coroutine runs in"""
+
+    async def probe(self):
+        return caller_label.get()
+
+    async def priority(self):
+        return get_request_priority()
+
+
+def test_facade_runs_coroutines_in_callers_context():
+    facade = without_default_store(AsyncBinanceClientFacade)
+    facade.async_client = ContextProbe()
+    facade._connected = True
+    try:
+        token = caller_label.set('monitoring')
+        try:
+            assert facade._run(facade.async_client.probe) == 'monitoring'
+        finally:
+            caller_label.reset(token)
+
+        # Nothing leaks into later calls from other contexts
+        assert facade._run(facade.async_client.probe) is None
+    finally:
+        facade.loop.call_soon_threadsafe(facade.loop.stop)
+
+
+def test_facade_requests_keep_callers_priority():
+    facade = without_default_store(AsyncBinanceClientFacade)
+    facade.async_client = ContextProbe()
+    facade._connected = True
+    try:
+        with request_priority(RequestPriority.MONITORING):
+            assert facade._run(facade.async_client.priority) == RequestPriority.MONITORING
+        assert facade._run(facade.async_client.priority) == RequestPriority.ANALYSIS
+    finally:
+        facade.loop.call_soon_threadsafe(facade.loop.stop)
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Local timeframe aggregation vs pandas resampling and Binance UTC boundaries"""
+import os
+import sys
+import tempfile
+import threading
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import numpy as np
+import pandas as pd
+from utils.binance_client import BinanceClient
+from utils.candle_store import CandleStore, INTERVAL_MS
+from utils.candle_aggregator import (
+    aggregate_klines, bucket_start, base_candles_needed, resolve_base_interval, set_base_interval
+)
+from utils.kline_parser import parse_klines
+
+
+def make_klines(start_ms: int, n: int, interval: str, seed: int = 0) -> list:
+    """Raw kline rows for n consecutive candles"""
+    rng = np.random.default_rng(seed)
+    step = INTERVAL_MS[interval]
+    close = 150 * np.exp(np.cumsum(rng.normal(0, 0.002, n)))
+    rows = []
+    for i in range(n):
+        open_ = close[i - 1] if i else 150.0
+        rows.append([
+            start_ms + i * step, f"{open_:.4f}", f"{max(open_, close[i]) * 1.001:.4f}",
+            f"{min(open_, close[i]) * 0.999:.4f}", f"{close[i]:.4f}", f"{rng.uniform(1, 100):.3f}",
+            start_ms + (i + 1) * step - 1, "0", 0, "0", "0", "0"
+        ])
+    return rows
+
+
+def pandas_resample(df: pd.DataFrame, interval: str) -> pd.DataFrame:
+    """Reference: pandas resample on UTC boundaries, complete buckets only"""
+    rule = {'15m': '15min', '1h': '1h', '4h': '4h', '1d': '1D', '1w': 'W-MON'}[interval]
+    kwargs = {'label': 'left', 'closed': 'left'} if interval == '1w' else {'origin': 'epoch'}
+    grouped = df.set_index('timestamp').resample(rule, **kwargs)
+    out = grouped.agg({'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'})
+    counts = grouped['close'].count()
+    ratio = INTERVAL_MS[interval] * 10**6 // (df['timestamp'].iloc[1] - df['timestamp'].iloc[0]).value
+    return out[counts == ratio].reset_index()
+
+
+def test_matches_pandas_resample():
+    # 1m base starting mid-bucket on a Wednesday, covering more than two weeks
+    start = int(pd.Timestamp('2024-03-06 05:37', tz='UTC').value // 10**6)
+    base = parse_klines(make_klines(start, 22000, '1m'), drop_last=False)
+    df = base.to_dataframe()
+
+    for interval in ['15m', '1h', '4h', '1d', '1w']:
+        expected = pandas_resample(df, interval)
+        actual = aggregate_klines(base, '1m', interval).to_dataframe()
+        assert len(actual) == len(expected) > 0, interval
+        assert np.array_equal(actual['timestamp'].values, expected['timestamp'].values.astype('datetime64[ms]'))
+        for col in ['open', 'high', 'low', 'close']:
+            assert np.array_equal(actual[col].values, expected[col].values), (interval, col)
+        assert np.allclose(actual['volume'].values, expected['volume'].values, rtol=1e-12)
+
+
+def test_utc_boundaries():
+    monday = int(pd.Timestamp('2024-03-11 00:00', tz='UTC').value // 10**6)
+    times = np.array([monday, monday + 3 * 86400000 + 5, monday - 1], dtype=np.int64)
+    assert bucket_start(times, '1w').tolist() == [monday, monday, monday - 7 * 86400000]
+    assert bucket_start(times, '4h').tolist() == [monday, monday + 3 * 86400000, monday - 4 * 3600000]
+
+
+def test_missing_base_candle_drops_bucket():
+    start = int(pd.Timestamp('2024-03-06 00:00', tz='UTC').value // 10**6)
+    klines = make_klines(start, 60, '15m')
+    del klines[5]  # hole in the second hour
+    candles = aggregate_klines(parse_klines(klines, drop_last=False), '15m', '1h')
+    hours = ((candles.open_time - start) // INTERVAL_MS['1h']).tolist()
+    assert 1 not in hours and hours == [0] + list(range(2, 15))
+
+
+def test_base_interval_selection():
+    assert resolve_base_interval(['1h', '15m', '4h']) == '15m'
+    assert resolve_base_interval(['1h', '15m'], override='1m') == '1m'
+    assert base_candles_needed('1h', '15m', 99) == 99 * 4 + 3
+
+
+class FakeFuturesApi:
+    """futures_klines served from a synthetic 15m history ending with the forming candle"""
+
+    def __init__(self, now_ms: int):
+        self.step = INTERVAL_MS['15m']
+        forming = now_ms // self.step * self.step
+        self.start = forming - 3000 * self.step
+        self.klines = make_klines(self.start, 3001, '15m', seed=7)
+        self.requests = []
+
+    def futures_klines(self, symbol, interval, limit=500, startTime=None, endTime=None):
+        self.requests.append((interval, limit, startTime))
+        assert interval == '15m', f"unexpected {interval} request"
+        rows = self.klines
+        if startTime is not None:
+            rows = [k for k in rows if k[0] >= startTime]
+            if endTime is not None:
+                rows = [k for k in rows if k[0] <= endTime]
+            return rows[:limit]
+        return rows[-limit:]
+
+
+def test_client_reads_higher_timeframes_from_base_series():
+    api = FakeFuturesApi(int(time.time() * 1000))
+    client = BinanceClient.__new__(BinanceClient)
+    client._local = threading.local()
+    client._local.client = api
+    client.candle_store = CandleStore(os.path.join(tempfile.mkdtemp(), 'candles.db'))
+
+    set_base_interval('15m')
+    try:
+        m15 = client.get_klines('BTCUSDT', '15m', 100)
+        h1 = client.get_klines('BTCUSDT', '1h', 100)
+        h4 = client.get_klines('BTCUSDT', '4h', 100)
+    finally:
+        set_base_interval(None)
+
+    # Base series is downloaded once; higher timeframes add no 15m requests
+    # beyond the deeper history they need on the first call
+    assert all(interval == '15m' for interval, _, _ in api.requests)
+    assert len(m15) == 99 and len(h1) == 99 and len(h4) == 99
+
+    reference = parse_klines(api.klines).to_dataframe()  # closed candles only
+    expected_h1 = pandas_resample(reference, '1h').tail(99).reset_index(drop=True)
+    pd.testing.assert_frame_equal(h1[['timestamp', 'open', 'high', 'low', 'close']],
+                                  expected_h1[['timestamp', 'open', 'high', 'low', 'close']].astype({'timestamp': 'datetime64[ms]'}))
+
+    # Everything is in the store now - a new timeframe costs no request at all
+    requests = len(api.requests)
+    set_base_interval('15m')
+    try:
+        client.get_klines('BTCUSDT', '30m', 100)
+        client.get_klines('BTCUSDT', '1h', 100)
+    finally:
+        set_base_interval(None)
+    assert len(api.requests) == requests
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Incremental candle store: tail fetch planning, gap backfill, forming candle never stored"""
+import os
+import sys
+import tempfile
+import threading
+from contextlib import contextmanager
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from utils.binance_client import BinanceClient
+from utils.candle_store import CandleStore, INTERVAL_MS
+from utils.scheduler import get_server_clock
+
+STEP = INTERVAL_MS['15m']
+START = 1700000100000 // STEP * STEP
+
+
+def make_klines(start_index: int, n: int) -> list:
+    """Raw kline rows; prices encode the candle index"""
+    rows = []
+    for i in range(start_index, start_index + n):
+        open_time = START + i * STEP
+        rows.append([open_time, f"{i}", f"{i + 0.5}", f"{i - 0.5}", f"{i + 0.25}", f"{i * 2}",
+                     open_time + STEP - 1, "0", 0, "0", "0", "0"])
+    return rows
+
+
+def make_store() -> CandleStore:
+    return CandleStore(os.path.join(tempfile.mkdtemp(), 'candles.db'))
+
+
+@contextmanager
+def server_time(state: dict):
+    """Pin the process-wide server clock to state['now_ms']"""
+    clock = get_server_clock()
+    original = (clock.clock, clock.offset_ms)
+    clock.clock = lambda: state['now_ms'] / 1000
+    clock.offset_ms = 0.0
+    try:
+        yield
+    finally:
+        clock.clock, clock.offset_ms = original
+
+
+class FakeFuturesApi:
+    """futures_klines over an endless 15m history; the newest row is the forming candle"""
+
+    def __init__(self, state: dict):
+        self.state = state
+        self.requests = []
+
+    def futures_klines(self, symbol, interval, limit=500, startTime=None, endTime=None):
+        self.requests.append({'limit': limit, 'startTime': startTime, 'endTime': endTime})
+        forming = (self.state['now_ms'] - START) // STEP
+        first = (startTime - START) // STEP if startTime is not None else forming - limit + 1
+        last = min(forming, (endTime - START) // STEP if endTime is not None else forming, first + limit - 1)
+        return make_klines(first, last - first + 1)
+
+
+def make_client(store: CandleStore, api: FakeFuturesApi) -> BinanceClient:
+    client = BinanceClient.__new__(BinanceClient)
+    client._local = threading.local()
+    client._local.client = api
+    client.candle_store = store
+    return client
+
+
+def stored_indexes(store: CandleStore) -> list:
+    conn = store._connect()
+    rows = conn.execute('SELECT open_time FROM candles ORDER BY open_time').fetchall()
+    conn.close()
+    return [(open_time - START) // STEP for open_time, in rows]
+
+
+def opens(client: BinanceClient) -> list:
+    return client.get_klines('SOLUSDT', '15m', 100)['open'].tolist()
+
+
+def test_tail_fetch_plans():
+    store = make_store()
+    now_ms = START + 500 * STEP + 1000  # candle 500 is forming
+    assert store.plan_tail_fetch('SOLUSDT', '15m', 99, now_ms=now_ms) == {'limit': 100}
+
+    store.save_klines('SOLUSDT', '15m', make_klines(400, 100))  # up to candle 499
+    assert store.plan_tail_fetch('SOLUSDT', '15m', 99, now_ms=now_ms) is None
+
+    # Three candles closed since: fetch from the first of them (plus the forming one)
+    params = store.plan_tail_fetch('SOLUSDT', '15m', 99, now_ms=now_ms + 3 * STEP)
+    assert params['startTime'] == START + 500 * STEP and params['limit'] >= 4
+    # Further behind than the window - refetch the window in one request
+    assert store.plan_tail_fetch('SOLUSDT', '15m', 99, now_ms=now_ms + 120 * STEP) == {'limit': 100}
+
+
+def test_tail_fetch_uses_server_clock():
+    store = make_store()
+    store.save_klines('SOLUSDT', '15m', make_klines(0, 299))
+
+    # Candle 299 closed 1.5 s ago on the exchange; the local clock runs 5 s behind
+    server_ms = START + 300 * STEP + 1500
+    clock = get_server_clock()
+    original = (clock.clock, clock.offset_ms)
+    clock.clock = lambda: (server_ms - 5000) / 1000
+    try:
+        clock.offset_ms = 0.0  # unsynced: the closed candle still looks like it is forming
+        assert store.plan_tail_fetch('SOLUSDT', '15m', 99) is None
+
+        clock.offset_ms = 5000.0
+        params = store.plan_tail_fetch('SOLUSDT', '15m', 99)
+    finally:
+        clock.clock, clock.offset_ms = original
+
+    assert params == {'startTime': START + 299 * STEP, 'limit': 3}  # 299 + forming 300
+
+
+def test_client_downloads_only_new_candles_and_drops_forming():
+    state = {'now_ms': START + 500 * STEP + 1000}
+    store = make_store()
+    api = FakeFuturesApi(state)
+    client = make_client(store, api)
+
+    with server_time(state):
+        # 99 closed candles; the forming candle 500 is neither returned nor stored
+        assert opens(client) == list(range(401, 500))
+        assert api.requests == [{'limit': 100, 'startTime': None, 'endTime': None}]
+        assert stored_indexes(store)[-1] == 499
+
+        # Same candle still forming: served from the store without a request
+        state['now_ms'] += STEP // 2
+        assert opens(client) == list(range(401, 500))
+        assert len(api.requests) == 1
+
+        # Two more candles closed: one tail request from the first missing candle
+        state['now_ms'] += 2 * STEP
+        assert opens(client) == list(range(403, 502))
+        assert len(api.requests) == 2 and api.requests[1]['startTime'] == START + 500 * STEP
+        assert stored_indexes(store) == list(range(401, 502))  # candle 502 (forming) dropped
+
+
+def test_gaps_inside_the_window_are_backfilled():
+    state = {'now_ms': START + 500 * STEP + 1000}
+    store = make_store()
+    # Bot was down for candles 450-459, and 480 is missing too
+    store.save_klines('SOLUSDT', '15m', make_klines(380, 70) + make_klines(460, 20) + make_klines(481, 19))
+    assert store.find_gaps('SOLUSDT', '15m', 99) == [
+        (START + 450 * STEP, START + 459 * STEP), (START + 480 * STEP, START + 480 * STEP)
+    ]
+    assert store.find_gaps('SOLUSDT', '15m', 19) == []  # holes outside a short window don't matter
+
+    api = FakeFuturesApi(state)
+    with server_time(state):
+        candles = opens(make_client(store, api))
+
+    # Store is up to date - only the two holes are requested
+    assert [(r['startTime'], r['endTime']) for r in api.requests] == [
+        (START + 450 * STEP, START + 459 * STEP), (START + 480 * STEP, START + 480 * STEP)
+    ]
+    assert candles == list(range(401, 500))
+    assert store.find_gaps('SOLUSDT', '15m', 99) == []
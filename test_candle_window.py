@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""Mirrored ring-buffer candle windows in front of the candle store"""
+import os
+import sys
+import tempfile
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import numpy as np
+from utils.candle_store import CandleStore, INTERVAL_MS
+from utils.candle_window import CandleRingBuffer, CandleWindows
+from utils.kline_parser import KlineArrays
+
+STEP = INTERVAL_MS['15m']
+START = 1700000100000 // STEP * STEP
+
+
+def make_klines(start_index: int, n: int) -> list:
+    """Raw closed kline rows; prices encode the candle index"""
+    rows = []
+    for i in range(start_index, start_index + n):
+        open_time = START + i * STEP
+        rows.append([open_time, f"{i}", f"{i + 0.5}", f"{i - 0.5}", f"{i + 0.25}", f"{i * 2}",
+                     open_time + STEP - 1, "0", 0, "0", "0", "0"])
+    return rows
+
+
+def make_arrays(start_index: int, n: int) -> KlineArrays:
+    index = np.arange(start_index, start_index + n, dtype=np.float64)
+    ohlcv = np.column_stack((index, index + 0.5, index - 0.5, index + 0.25, index * 2))
+    return KlineArrays(START + np.arange(start_index, start_index + n, dtype=np.int64) * STEP, ohlcv)
+
+
+def test_ring_buffer_wraps_contiguously():
+    buffer = CandleRingBuffer(STEP, capacity=10)
+    assert buffer.extend(make_arrays(0, 7))
+    for i in range(7, 33):  # one candle per cycle, wrapping several times
+        assert buffer.extend(make_arrays(i, 1))
+        view = buffer.latest(10)
+        assert view.open.tolist() == list(range(max(i - 9, 0), i + 1))
+        assert view.ohlcv.flags.c_contiguous and view.ohlcv.base is None  # owned copy
+    assert len(buffer) == 10 and buffer.last_open_time == START + 32 * STEP
+    assert buffer.latest(3).close.tolist() == [30.25, 31.25, 32.25]
+
+
+def test_reads_survive_later_writes():
+    buffer = CandleRingBuffer(STEP, capacity=5)
+    buffer.extend(make_arrays(0, 5))
+    full = buffer.latest(5)  # count == capacity
+    buffer.extend(make_arrays(5, 3))  # several candles in one append
+    assert full.open.tolist() == [0, 1, 2, 3, 4]
+    buffer.extend(make_arrays(20, 2))  # gap -> reset, ring rewritten from slot 0
+    buffer.extend(make_arrays(30, 5))
+    assert full.open.tolist() == [0, 1, 2, 3, 4]
+
+
+def test_longer_read_does_not_rewrite_earlier_dataframes():
+    """15m strategy reads 99 candles, then an aggregation base needs 399 of the same series"""
+    store = CandleStore(os.path.join(tempfile.mkdtemp(), 'candles.db'), window_capacity=200)
+    store.save_klines('SOLUSDT', '15m', make_klines(0, 600))
+    short_df = store.load_arrays('SOLUSDT', '15m', 99).to_dataframe()
+    before = short_df.copy()
+
+    long_df = store.load_arrays('SOLUSDT', '15m', 399).to_dataframe()  # window regrown and refilled
+    store.save_klines('SOLUSDT', '15m', make_klines(600, 1))
+    store.load_arrays('SOLUSDT', '15m', 399)
+
+    assert short_df.equals(before)
+    assert short_df['close'].iloc[-1] == 599.25 and long_df['open'].iloc[0] == 201
+
+
+def test_overlap_and_gaps():
+    buffer = CandleRingBuffer(STEP, capacity=20)
+    buffer.extend(make_arrays(0, 10))
+    assert buffer.extend(make_arrays(5, 8))  # refetch overlapping the window
+    assert buffer.latest(20).open.tolist() == list(range(13))
+    assert buffer.extend(make_arrays(0, 3)) and len(buffer) == 13  # older backfill is ignored
+    assert not buffer.extend(make_arrays(15, 2))  # hole -> reload from the store
+    assert len(buffer) == 0
+
+
+def test_store_serves_window_without_sqlite():
+    store = CandleStore(os.path.join(tempfile.mkdtemp(), 'candles.db'), window_capacity=200)
+    store.save_klines('SOLUSDT', '15m', make_klines(0, 300))
+    first = store.load_arrays('SOLUSDT', '15m', 99)  # miss: SQLite read fills the window
+    assert first.open.tolist() == list(range(201, 300))
+
+    connects = []
+    original_connect = store._connect
+    store._connect = lambda: connects.append(1) or original_connect()
+
+    # Up-to-date series: last open time, gaps and candles all come from memory
+    now_ms = START + 300 * STEP + 1000  # candle 300 is still forming
+    assert store.plan_tail_fetch('SOLUSDT', '15m', 99, now_ms=now_ms) is None
+    assert store.find_gaps('SOLUSDT', '15m', 99) == []
+    cached = store.load_arrays('SOLUSDT', '15m', 99)
+    assert not connects
+    assert np.array_equal(cached.ohlcv, first.ohlcv)
+
+    # A newly closed candle is written through and appended in place
+    store.save_klines('SOLUSDT', '15m', make_klines(300, 1))
+    latest = store.load_arrays('SOLUSDT', '15m', 99)
+    assert len(connects) == 1  # the INSERT only
+    assert latest.open.tolist() == list(range(202, 301))
+    pd_frame = store.load('SOLUSDT', '15m', 99)
+    assert pd_frame['open'].tolist() == latest.open.tolist()
+
+    stats = store.get_window_stats()
+    assert stats['series'] == 1 and stats['hits'] == 3 and stats['misses'] == 1
+    assert stats['bytes_per_symbol'] == 2 * 200 * (8 + 5 * 8)
+
+
+def test_memory_is_bounded():
+    windows = CandleWindows(capacity=500)
+    for s in range(300):
+        for interval in ['15m', '1h', '4h']:
+            buffer = windows.get(f'SYM{s}USDT', interval, INTERVAL_MS[interval])
+            buffer.extend(make_arrays(0, 2000))
+    stats = windows.get_stats()
+    assert stats['symbols'] == 300
+    assert stats['bytes_per_symbol'] == 3 * 2 * 500 * 48
+    assert windows.get('SYM0USDT', '15m', STEP, count=900).capacity == 900  # grows once, on demand
+    print(f"   {stats['symbols']} symbols x 3 timeframes x 500 candles: "
+          f"{stats['bytes'] / 2**20:.1f} MB ({stats['bytes_per_symbol'] / 1024:.0f} KB per symbol)")
+
+
+def benchmark_window_vs_sqlite():
+    """Timing comparison - run as a script, not part of the pytest suite"""
+    store = CandleStore(os.path.join(tempfile.mkdtemp(), 'candles.db'), window_capacity=1000)
+    store.save_klines('SOLUSDT', '15m', make_klines(0, 1000))
+    store.load_arrays('SOLUSDT', '15m', 999)
+    runs = 50
+
+    start = time.perf_counter()
+    for i in range(runs):
+        store.save_klines('SOLUSDT', '15m', make_klines(1000 + i, 1))
+        store.load_arrays('SOLUSDT', '15m', 999).to_dataframe()
+    window_ms = (time.perf_counter() - start) / runs * 1000
+
+    store.windows = None
+    start = time.perf_counter()
+    for i in range(runs):
+        store.save_klines('SOLUSDT', '15m', make_klines(1000 + runs + i, 1))
+        store.load_arrays('SOLUSDT', '15m', 999).to_dataframe()
+    sqlite_ms = (time.perf_counter() - start) / runs * 1000
+
+    print(f"   append + 999-candle read: window {window_ms:.2f} ms | SQLite reload {sqlite_ms:.2f} ms "
+          f"({sqlite_ms / window_ms:.1f}x)")
+    assert window_ms < sqlite_ms
+
+
+if __name__ == '__main__':
+    benchmark_window_vs_sqlite()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Shared BinanceClient: one python-binance Client per thread, registry built outside its lock"""
+import os
+import sys
+import threading
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from binance.client import Client
+import config
+import utils.binance_client as binance_client
+from utils.binance_client import BinanceClient, get_binance_client, get_client_registry_stats
+
+
+class _NoPing:
+    """Replace Client.ping (network) for the duration of a test"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+
+    def __enter__(self):
+        self.original = Client.ping
+        self.store_enabled = config.CANDLE_STORE_ENABLED
+        config.CANDLE_STORE_ENABLED = False  # no data/candles.db from tests
+        delay = self.delay
+        Client.ping = lambda client: time.sleep(delay) or {}
+        return self
+
+    def __exit__(self, *exc):
+        Client.ping = self.original
+        config.CANDLE_STORE_ENABLED = self.store_enabled
+
+
+def test_threads_get_own_client_on_shared_pool():
+    with _NoPing():
+        client = BinanceClient(api_key='key', api_secret='secret', demo=False)
+
+    seen = {}
+
+    def grab(name):
+        seen[name] = (client.client, client.client)
+
+    threads = [threading.Thread(target=grab, args=(name,)) for name in ('strategy', 'monitoring', 'flask')]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    clients = [first for first, again in seen.values()]
+    assert all(first is again for first, again in seen.values())  # stable within a thread
+    assert len({id(c) for c in clients + [client.client]}) == 4  # one per thread
+    for c in clients:
+        assert c.session.get_adapter('https://fapi.binance.com') is client.http_adapter
+        if client.governor:
+            assert '_request_futures_api' in vars(c) and c.session.hooks['response']
+
+
+def test_registry_constructs_outside_lock():
+    binance_client._client_registry.clear()
+    result = {}
+
+    def slow_create():
+        result['client'] = get_binance_client('slow', 'secret', demo=False)
+
+    with _NoPing(delay=0.5):
+        creator = threading.Thread(target=slow_create)
+        creator.start()
+        time.sleep(0.1)
+
+        # Stats (web API) stay responsive while the slow client pings
+        started = time.perf_counter()
+        get_client_registry_stats()
+        assert time.perf_counter() - started < 0.2
+
+        # A racing caller for the same key ends up with the same registered client
+        racer = get_binance_client('slow', 'secret', demo=False)
+        creator.join()
+
+    assert racer is result['client']
+    assert get_binance_client('slow', 'secret', demo=False) is racer
+    binance_client._client_registry.clear()
+
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Streaming exit engine closing paper trades from a replayed price tape"""
+import logging
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import agents.monitoring as monitoring
+from agents.exit_engine import ExitEngine
+from utils.database import TradingDatabase
+from utils.price_stream import ReplayPriceStream
+from utils.trigger_index import TriggerIndex
+
+T0 = 1700000000000
+
+
+def mark_price(symbol, price, i):
+    return {'stream': f'{symbol.lower()}@markPrice@1s', 'data': {
+        'e': 'markPriceUpdate', 'E': T0 + i * 1000, 's': symbol, 'p': f'{price}'
+    }}
+
+
+def agg_trade(symbol, price, i):
+    return {'e': 'aggTrade', 'E': T0 + i * 1000 + 5, 'T': T0 + i * 1000, 's': symbol, 'p': f'{price}', 'q': '1'}
+
+
+# SOL long SL 95 / TP 110, ETH short SL 2100 / TP 1900
+TAPE = [
+    mark_price('SOLUSDT', 100.0, 0),
+    mark_price('ETHUSDT', 2000.0, 0),
+    mark_price('SOLUSDT', 96.0, 1),
+    agg_trade('SOLUSDT', 94.8, 2),      # wick through the SOL stop
+    mark_price('SOLUSDT', 94.5, 3),     # still below - must not close again
+    mark_price('ETHUSDT', 1950.0, 3),
+    mark_price('ETHUSDT', 1899.5, 4),   # ETH take profit
+    mark_price('ETHUSDT', 1890.0, 5),
+    mark_price('BTCUSDT', 30000.0, 5),  # no trades on this symbol
+]
+
+
+def open_trades(db):
+    sol = db.create_trade({'symbol': 'SOLUSDT', 'strategy': 'sol', 'action': 'LONG', 'entry_price': 100.0,
+                           'stop_loss': 95.0, 'take_profit': 110.0})
+    eth = db.create_trade({'symbol': 'ETHUSDT', 'strategy': 'eth', 'action': 'SHORT', 'entry_price': 2000.0,
+                           'stop_loss': 2100.0, 'take_profit': 1900.0})
+    return sol, eth
+
+
+def make_agent(db):
+    original = monitoring.get_binance_client
+    monitoring.get_binance_client = lambda: None
+    try:
+        return monitoring.MonitoringAgent(logger_instance=logging.getLogger('test_exit_engine'), db_instance=db)
+    finally:
+        monitoring.get_binance_client = original
+
+
+def read_trade(db, trade_id):
+    conn = sqlite3.connect(db.db_path)
+    conn.row_factory = sqlite3.Row
+    row = dict(conn.execute('SELECT * FROM trades WHERE trade_id = ?', (trade_id,)).fetchone())
+    conn.close()
+    return row
+
+
+def test_replayed_ticks_close_trades_once_with_exit_tick():
+    db = TradingDatabase(os.path.join(tempfile.mkdtemp(), 'paper_trades.db'))
+    agent = make_agent(db)
+    try:
+        sol, eth = open_trades(db)
+
+        stream = ReplayPriceStream(messages=TAPE)
+        agent.start_price_stream(source=stream)
+        stream.join(5)
+
+        stats = agent.exit_engine.get_stats()
+        assert stats['ticks_processed'] == len(TAPE) and stats['trades_closed'] == 2
+        assert stats['open_trades_indexed'] == 0 and agent.paper_trades_closed == 2
+
+        sol_row = read_trade(db, sol)
+        assert sol_row['status'] == 'CLOSED' and sol_row['exit_reason'] == 'SL_HIT'
+        assert sol_row['exit_price'] == 95.0  # the level, not the wick
+        # First tick through the level - the later markPrice tick below it doesn't re-close
+        assert sol_row['exit_tick_price'] == 94.8 and sol_row['exit_tick_source'] == 'aggTrade'
+        assert sol_row['exit_tick_time'] == '2023-11-14T22:13:22Z'
+
+        eth_row = read_trade(db, eth)
+        assert eth_row['exit_reason'] == 'TP_HIT' and eth_row['exit_price'] == 1900.0
+        assert eth_row['exit_tick_price'] == 1899.5 and eth_row['exit_tick_source'] == 'markPrice'
+        assert eth_row['exit_tick_time'] == '2023-11-14T22:13:24Z'
+        assert db.get_open_trades() == []
+    finally:
+        agent.stop_price_stream()
+        db.remove_trade_listener(agent.trigger_index)
+
+
+def test_competing_closers_close_each_trade_once():
+    """A second process (own index, no listener) replays the same ticks at the same time"""
+    db = TradingDatabase(os.path.join(tempfile.mkdtemp(), 'paper_trades.db'))
+    agent = make_agent(db)
+    try:
+        sol, eth = open_trades(db)
+
+        other_db = TradingDatabase(db.db_path)
+        other_index = TriggerIndex()
+        other_index.sync(other_db.get_open_trades())
+        other_closes = []
+
+        def other_close(trade_id, exit_price, exit_reason, exit_tick):
+            closed = other_db.close_trade(trade_id, exit_price, exit_reason, exit_tick=exit_tick)
+            other_closes.append((trade_id, closed))
+            return {'trade_id': trade_id} if closed else None
+
+        other_engine = ExitEngine(other_index, other_close, logging.getLogger('test_exit_engine'))
+        barrier = threading.Barrier(2)
+        streams = [ReplayPriceStream(messages=TAPE), ReplayPriceStream(messages=TAPE)]
+
+        def start(engine_start, stream):
+            barrier.wait()
+            engine_start(stream)
+
+        threads = [
+            threading.Thread(target=start, args=(lambda s: agent.start_price_stream(source=s), streams[0])),
+            threading.Thread(target=start, args=(other_engine.start, streams[1])),
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(5)
+        for stream in streams:
+            stream.join(5)
+
+        # status='OPEN' guard: each trade is closed by exactly one of the two engines
+        closes = agent.exit_engine.get_stats()['trades_closed'] + other_engine.get_stats()['trades_closed']
+        assert closes == 2
+        assert len([trade_id for trade_id, closed in other_closes if closed]) == other_engine.trades_closed
+        for trade_id in (sol, eth):
+            row = read_trade(db, trade_id)
+            assert row['status'] == 'CLOSED' and row['exit_tick_price'] in (94.8, 1899.5)
+    finally:
+        agent.stop_price_stream()
+        db.remove_trade_listener(agent.trigger_index)
+
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""NumPy indicator kernel matches the ta-based indicator functions"""
+import os
+import sys
+import threading
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import numpy as np
+import pandas as pd
+from utils.indicators import (
+    calculate_all_indicators, calculate_all_indicators_custom,
+    calculate_rsi, calculate_macd, calculate_ema, calculate_bollinger_bands,
+    calculate_volume_analysis, calculate_atr, find_support_resistance,
+    detect_trend_pattern, detect_choppy_market, FeatureCache, get_feature_cache
+)
+from utils.indicator_kernel import compute_indicator_values
+
+
+def make_candles(n: int, price: float, seed: int, volatility: float = 0.01) -> pd.DataFrame:
+    """Random-walk OHLCV candles"""
+    rng = np.random.default_rng(seed)
+    close = price * np.exp(np.cumsum(rng.normal(0, volatility, n)))
+    open_ = np.concatenate(([price], close[:-1]))
+    spread = np.abs(rng.normal(0, volatility, n)) * close
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01', periods=n, freq='15min'),
+        'open': open_,
+        'high': np.maximum(open_, close) + spread,
+        'low': np.minimum(open_, close) - spread,
+        'close': close,
+        'volume': rng.uniform(100, 1000, n)
+    })
+
+
+def reference_indicators(df: pd.DataFrame, ema_periods) -> dict:
+    """Indicators built from the per-indicator ta functions (previous implementation)"""
+    indicators = {
+        "rsi": calculate_rsi(df, period=14),
+        "rsi_7": calculate_rsi(df, period=7),
+        "macd": calculate_macd(df),
+        "ema": calculate_ema(df, ema_periods),
+        "bollinger_bands": calculate_bollinger_bands(df),
+        "support_resistance": find_support_resistance(df),
+        "volume": calculate_volume_analysis(df),
+        "atr": calculate_atr(df),
+        "trend_pattern": detect_trend_pattern(df)
+    }
+    indicators['market_condition'] = detect_choppy_market(indicators, df['close'].iloc[-1])
+    return indicators
+
+
+def assert_same(expected, actual, path=''):
+    """Labels must match exactly, numbers up to one unit in the last rounded digit"""
+    if isinstance(expected, dict):
+        assert set(expected) == set(actual), f"{path}: keys {set(expected)} != {set(actual)}"
+        for key in expected:
+            assert_same(expected[key], actual[key], f"{path}.{key}")
+    elif isinstance(expected, list):
+        assert len(expected) == len(actual), f"{path}: {expected} != {actual}"
+        for i, (e, a) in enumerate(zip(expected, actual)):
+            assert_same(e, a, f"{path}[{i}]")
+    elif isinstance(expected, (float, np.floating)) and not isinstance(expected, bool):
+        if np.isnan(expected):
+            assert np.isnan(actual), f"{path}: expected NaN, got {actual}"
+        else:
+            tolerance = max(1e-4, abs(expected) * 1e-9)
+            assert abs(expected - actual) <= tolerance, f"{path}: {expected} != {actual}"
+    else:
+        assert expected == actual, f"{path}: {expected!r} != {actual!r}"
+
+
+CASES = [
+    # (candles, price, ema periods)
+    (100, 150.0, [20, 50]),
+    (100, 3200.0, [7, 25]),
+    (100, 0.15, [20, 50]),
+    (100, 0.55, [7, 25]),
+    (60, 65000.0, [20, 50]),
+    (500, 150.0, [20, 50]),
+    (1500, 2.0, [7, 25]),
+]
+
+
+def test_kernel_matches_ta():
+    for n, price, ema_periods in CASES:
+        for seed in range(10):
+            df = make_candles(n, price, seed)
+            expected = reference_indicators(df, ema_periods)
+            actual = calculate_all_indicators_custom(df, ema_periods)
+            assert_same(expected, actual, f"n={n} price={price} seed={seed}")
+
+
+def test_default_ema_periods():
+    df = make_candles(100, 150.0, seed=42)
+    assert_same(reference_indicators(df, [20, 50]), calculate_all_indicators(df))
+
+
+def test_flat_market():
+    # No price movement - RSI 100 branch, zero-width bands, zero ATR
+    df = make_candles(100, 150.0, seed=1)
+    for col in ['open', 'high', 'low', 'close']:
+        df[col] = 150.0
+    assert_same(reference_indicators(df, [20, 50]), calculate_all_indicators(df))
+
+
+def test_speed():
+    df = make_candles(100, 150.0, seed=7)
+    runs = 200
+
+    def timed(func):
+        start = time.perf_counter()
+        for _ in range(runs):
+            func()
+        return (time.perf_counter() - start) / runs * 1000
+
+    # Indicators replaced by the kernel
+    ta_ms = timed(lambda: (
+        calculate_rsi(df, 14), calculate_rsi(df, 7), calculate_macd(df), calculate_ema(df, [20, 50]),
+        calculate_bollinger_bands(df), calculate_volume_analysis(df), calculate_atr(df)
+    ))
+    kernel_ms = timed(lambda: compute_indicator_values(
+        df['close'].values, df['high'].values, df['low'].values, df['volume'].values
+    ))
+    # Whole calculate_all_indicators call
+    reference_ms = timed(lambda: reference_indicators(df, [20, 50]))
+    all_ms = timed(lambda: calculate_all_indicators(df))
+
+    print(f"   ta indicators: {ta_ms:.3f} ms | kernel: {kernel_ms:.3f} ms ({ta_ms / kernel_ms:.1f}x)")
+    print(f"   calculate_all_indicators: {reference_ms:.3f} ms -> {all_ms:.3f} ms ({reference_ms / all_ms:.1f}x)")
+    assert kernel_ms < ta_ms
+
+
+def test_feature_cache_shared_between_strategies():
+    df = make_candles(100, 150.0, seed=11)
+    cache = get_feature_cache()
+    cache.clear()
+    cache.take_cycle_stats()
+
+    # sol (EMA 20/50) and sol_fast (EMA 7/25) on the same candles
+    sol = calculate_all_indicators(df, symbol='SOLUSDT', interval='15m')
+    sol_fast = calculate_all_indicators_custom(df, [7, 25], symbol='SOLUSDT', interval='15m')
+    assert_same(calculate_all_indicators(df), sol)
+    assert_same(calculate_all_indicators_custom(df, [7, 25]), sol_fast)
+
+    stats = cache.take_cycle_stats()
+    assert stats['misses'] == 5  # kernel, S/R, trend pattern + one EMA entry per strategy
+    assert stats['hits'] == 3
+
+    # Next closed candle -> new key
+    calculate_all_indicators(make_candles(101, 150.0, seed=11), symbol='SOLUSDT', interval='15m')
+    assert cache.take_cycle_stats()['hits'] == 0
+
+
+def test_feature_cache_threads_and_eviction():
+    cache = FeatureCache(max_entries=2)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.05)
+        return 'value'
+
+    threads = [threading.Thread(target=cache.get_or_compute, args=('key', compute)) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1  # concurrent misses wait for the first computation
+
+    cache.get_or_compute('a', lambda: 1)
+    cache.get_or_compute('b', lambda: 2)
+    stats = cache.get_stats()
+    assert stats['entries'] == 2 and stats['evictions'] == 1
+    assert cache.get_or_compute('key', lambda: 'recomputed') == 'recomputed'
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Typed-array kline parser vs the previous DataFrame conversion, with a micro-benchmark"""
+import os
+import sys
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import numpy as np
+import pandas as pd
+from utils.kline_parser import parse_klines, kline_arrays_from_dataframe
+from utils.binance_client import klines_to_dataframe
+
+
+def previous_klines_to_dataframe(klines):
+    """Previous implementation (object DataFrame + astype + slice)"""
+    df = pd.DataFrame(klines, columns=[
+        'timestamp', 'open', 'high', 'low', 'close', 'volume',
+        'close_time', 'quote_volume', 'trades', 'taker_buy_base',
+        'taker_buy_quote', 'ignore'
+    ])
+    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+    for col in ['open', 'high', 'low', 'close', 'volume']:
+        df[col] = df[col].astype(float)
+    df = df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
+    if len(df) > 1:
+        df = df.iloc[:-1].reset_index(drop=True)
+    return df
+
+
+def make_payload(n: int, seed: int = 0) -> list:
+    """Raw futures_klines rows (strings, as returned by the API)"""
+    rng = np.random.default_rng(seed)
+    start = 1700000000000
+    close = 150 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    return [[
+        start + i * 900000,
+        f"{close[i - 1] if i else 150:.4f}",
+        f"{close[i] * 1.004:.4f}",
+        f"{close[i] * 0.996:.4f}",
+        f"{close[i]:.4f}",
+        f"{rng.uniform(100, 10000):.3f}",
+        start + (i + 1) * 900000 - 1,
+        f"{rng.uniform(1e4, 1e6):.4f}",
+        int(rng.integers(100, 5000)),
+        f"{rng.uniform(50, 5000):.3f}",
+        f"{rng.uniform(1e4, 1e5):.4f}",
+        "0"
+    ] for i in range(n)]
+
+
+def test_matches_previous_dataframe():
+    for n in [1, 2, 100, 1000, 1500]:
+        klines = make_payload(n, seed=n)
+        expected = previous_klines_to_dataframe(klines)
+        pd.testing.assert_frame_equal(klines_to_dataframe(klines), expected)
+        pd.testing.assert_frame_equal(parse_klines(klines).to_dataframe(), expected)
+
+
+def test_typed_arrays():
+    klines = make_payload(100)
+    arrays = parse_klines(klines)
+    assert len(arrays) == 99  # forming candle dropped
+    assert arrays.open_time.dtype == np.int64 and arrays.ohlcv.dtype == np.float64
+    assert arrays.open_time[-1] == klines[-2][0]
+    assert arrays.close[-1] == float(klines[-2][4])
+    assert arrays.to_dataframe() is arrays.to_dataframe()  # built once
+    assert len(parse_klines(klines, drop_last=False)) == 100
+
+    round_trip = kline_arrays_from_dataframe(arrays.to_dataframe())
+    assert np.array_equal(round_trip.open_time, arrays.open_time)
+    assert np.array_equal(round_trip.ohlcv, arrays.ohlcv)
+
+
+def test_benchmark():
+    runs = 100
+
+    def timed(func, klines):
+        start = time.perf_counter()
+        for _ in range(runs):
+            func(klines)
+        return (time.perf_counter() - start) / runs * 1000
+
+    for n in [100, 1000, 1500]:
+        klines = make_payload(n)
+        previous_ms = timed(previous_klines_to_dataframe, klines)
+        arrays_ms = timed(parse_klines, klines)
+        dataframe_ms = timed(klines_to_dataframe, klines)
+        print(f"   {n:>5} candles: previous {previous_ms:.3f} ms | arrays {arrays_ms:.3f} ms "
+              f"({previous_ms / arrays_ms:.1f}x) | arrays + DataFrame {dataframe_ms:.3f} ms "
+              f"({previous_ms / dataframe_ms:.1f}x)")
+        assert arrays_ms < previous_ms
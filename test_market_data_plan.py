@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Market data plan: one multi-timeframe fetch per (symbol, timeframes) bundle per cycle"""
+import os
+import sys
+import threading
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import pandas as pd
+
+import agents.data_collector_generic as data_collector
+import config
+from agents.data_collector_generic import (
+    collect_market_data_bundles, collect_market_data_generic, get_market_data_key, plan_market_data
+)
+from strategy_config import get_active_strategies
+
+
+class FakeMarketDataClient:
+    """Counts get_multi_timeframe_data calls; symbols in `failing` fail on their first fetch"""
+
+    def __init__(self, failing=()):
+        self.calls = []
+        self.failing = set(failing)
+        self._lock = threading.Lock()
+
+    def get_multi_timeframe_data(self, symbol, timeframes, limit=100):
+        with self._lock:
+            self.calls.append((symbol, tuple(timeframes)))
+            if symbol in self.failing:
+                self.failing.discard(symbol)
+                raise Exception('HTTP 503')
+        candles = pd.DataFrame({'close': [1.0, 2.0, 3.0]})
+        return {
+            'symbol': symbol,
+            'current_price': 3.0,
+            'timeframes': {tf: candles for tf in timeframes},
+            'funding_rate': 0.0001,
+            'orderbook': {'bids': [[2.9, 1.0]], 'asks': [[3.1, 1.0]]}
+        }
+
+
+class patched_clients:
+    """Route both the sync and the async market data client to one fake"""
+
+    def __init__(self, client):
+        self.client = client
+
+    def __enter__(self):
+        self.originals = (data_collector.get_binance_client, data_collector.get_async_market_data_client)
+        data_collector.get_binance_client = lambda *args, **kwargs: self.client
+        data_collector.get_async_market_data_client = lambda: self.client
+        return self.client
+
+    def __exit__(self, *exc):
+        data_collector.get_binance_client, data_collector.get_async_market_data_client = self.originals
+
+
+def run_cycle(strategies, client):
+    """Bundles first, then every strategy's collector (as TradingBotDynamic.run_cycle does)"""
+    with patched_clients(client):
+        bundles = collect_market_data_bundles(strategies)
+        states = {}
+        for strategy in strategies:
+            state = collect_market_data_generic(
+                {'symbol': strategy.symbol},
+                strategy.name,
+                strategy.timeframe_higher,
+                strategy.timeframe_lower,
+                market_data=bundles.get(get_market_data_key(strategy))
+            )
+            states[strategy.name] = state[f"market_data_{strategy.name}"]
+    return bundles, states
+
+
+def test_fast_variants_share_a_bundle():
+    strategies = get_active_strategies()
+    assert len(strategies) == 8
+
+    plan = plan_market_data(strategies)
+    assert plan[('SOLUSDT', ('15m', '1h'))] == ['sol', 'sol_fast']
+    assert len(plan) == 4 and all(len(names) == 2 for names in plan.values())
+
+
+def test_one_fetch_per_bundle_per_cycle():
+    strategies = get_active_strategies()
+    client = FakeMarketDataClient()
+    _, states = run_cycle(strategies, client)
+
+    # Half the multi-timeframe fetches of one-per-strategy
+    assert len(client.calls) == len(strategies) // 2
+    assert sorted(client.calls) == sorted(set(client.calls))
+    assert all(states[s.name]['symbol'] == s.symbol for s in strategies)
+
+
+def test_failed_bundle_falls_back_to_per_strategy_fetch():
+    strategies = get_active_strategies()
+    client = FakeMarketDataClient(failing={'DOGEUSDT'})
+    bundles, states = run_cycle(strategies, client)
+
+    assert bundles[('DOGEUSDT', ('15m', '1h'))] is None
+    # 4 bundles (one failed) + doge and doge_fast fetching on their own
+    assert len(client.calls) == 6
+    assert [symbol for symbol, _ in client.calls].count('DOGEUSDT') == 3
+    assert states['doge'] is not None and states['doge_fast'] is not None
+
+
+def test_strategies_get_their_own_copy_of_a_shared_bundle():
+    strategies = [s for s in get_active_strategies() if s.symbol == 'SOLUSDT']
+    bundles, states = run_cycle(strategies, FakeMarketDataClient())
+
+    sol, sol_fast = states['sol'], states['sol_fast']
+    assert sol is not sol_fast
+    sol['analysis_note'] = 'sol only'
+    assert 'analysis_note' not in sol_fast
+    assert 'analysis_note' not in bundles[('SOLUSDT', ('15m', '1h'))]
+    # Candles are shared read-only, not copied per strategy
+    assert sol['timeframes']['1h'] is sol_fast['timeframes']['1h']
+
+
+def test_sync_client_path_shares_bundles_too():
+    enabled = config.BINANCE_ASYNC_MARKET_DATA
+    config.BINANCE_ASYNC_MARKET_DATA = False
+    try:
+        client = FakeMarketDataClient()
+        run_cycle(get_active_strategies(), client)
+    finally:
+        config.BINANCE_ASYNC_MARKET_DATA = enabled
+    assert len(client.calls) == 4
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Monitoring service runs on its own thread without overlap or blocking the caller"""
+import logging
+import os
+import sys
+import threading
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from agents.monitoring import MonitoringService
+
+
+class FakeAgent:
+    """Stands in for MonitoringAgent: sleeps like Binance round trips, tracks concurrency"""
+
+    def __init__(self, durations, fail_on=()):
+        self.logger = logging.getLogger('test_monitoring_service')
+        self.durations = list(durations)
+        self.fail_on = set(fail_on)
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def run(self):
+        with self.lock:
+            self.calls += 1
+            call = self.calls
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.durations[min(call, len(self.durations)) - 1])
+            if call in self.fail_on:
+                raise RuntimeError('binance timeout')
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+def test_start_does_not_block_caller():
+    agent = FakeAgent([0.5])
+    service = MonitoringService(agent, interval=10)
+    started = time.perf_counter()
+    service.start()
+    assert time.perf_counter() - started < 0.1
+    assert wait_for(lambda: service.get_stats()['running_for_seconds'] is not None)
+    assert service.get_stats()['healthy']
+    service.stop()
+    assert agent.calls == 1 and not service.get_stats()['alive']
+
+
+def test_slow_run_never_stacks_up():
+    agent = FakeAgent([0.35, 0.01])  # first run spans ~7 ticks
+    service = MonitoringService(agent, interval=0.05)
+    service.start()
+    assert wait_for(lambda: service.get_stats()['runs'] >= 3)
+    service.stop()
+
+    stats = service.get_stats()
+    assert agent.max_active == 1
+    assert stats['overruns'] >= 1
+    assert stats['skipped'] >= 5  # ticks during the slow run coalesced, not queued
+    assert stats['max_ms'] >= 350
+
+
+def test_failures_are_counted_and_service_keeps_running():
+    agent = FakeAgent([0.0, 0.0, 0.0, 0.3, 0.0], fail_on={1, 2, 3})  # run 4 holds the state while we look
+    service = MonitoringService(agent, interval=0.02)
+    service.start()
+    assert wait_for(lambda: service.get_stats()['failures'] == 3)
+    unhealthy = service.get_stats()
+    assert unhealthy['consecutive_failures'] == 3 and not unhealthy['healthy']
+    assert 'binance timeout' in unhealthy['last_error']
+
+    assert wait_for(lambda: service.get_stats()['runs'] >= 5)
+    service.stop()
+    recovered = service.get_stats()
+    assert recovered['consecutive_failures'] == 0 and recovered['last_success'] is not None
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""Local order book synced from a recorded diff-depth tape"""
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import numpy as np
+import utils.order_book as order_book
+from utils.order_book import (
+    OrderBookManager, ReplayDepthStream, apply_levels, get_local_orderbook, parse_depth_message
+)
+from utils.indicators import analyze_orderbook
+from utils.scheduler import get_server_clock
+
+
+def run_inline(job):
+    """Snapshot runner for deterministic replays (fetch happens on the replay thread)"""
+    job()
+
+
+def simulate_exchange(events: int, seed: int, symbol: str = 'SOLUSDT'):
+    """
+    Random exchange book + its diff-depth tape
+
+    Returns:
+        (messages, states) - raw depthUpdate messages and the exchange book
+        {'lastUpdateId', 'bids', 'asks'} after each message (index -1 = initial)
+    """
+    rng = np.random.default_rng(seed)
+    bids = {round(150 - i * 0.01, 2): float(rng.integers(1, 100)) for i in range(1, 200)}
+    asks = {round(150 + i * 0.01, 2): float(rng.integers(1, 100)) for i in range(1, 200)}
+    update_id = 1000
+
+    def state():
+        return {
+            'lastUpdateId': update_id,
+            'bids': [[str(p), str(q)] for p, q in sorted(bids.items(), reverse=True)],
+            'asks': [[str(p), str(q)] for p, q in sorted(asks.items())]
+        }
+
+    states = {-1: state()}
+    messages = []
+    for i in range(events):
+        changes = {'b': [], 'a': []}
+        for side, book, sign in [('b', bids, -1), ('a', asks, 1)]:
+            for _ in range(rng.integers(1, 6)):
+                price = round(150 + sign * int(rng.integers(1, 250)) * 0.01, 2)
+                qty = 0.0 if rng.random() < 0.3 else float(rng.integers(1, 100))
+                if qty:
+                    book[price] = qty
+                else:
+                    book.pop(price, None)
+                changes[side].append([str(price), str(qty)])
+
+        prev_id = update_id
+        update_id += int(rng.integers(1, 4))
+        messages.append({'stream': f'{symbol.lower()}@depth@100ms', 'data': {
+            'e': 'depthUpdate', 'E': 1700000000000 + i * 100, 'T': 1700000000000 + i * 100,
+            's': symbol, 'U': prev_id + 1, 'u': update_id, 'pu': prev_id,
+            'b': changes['b'], 'a': changes['a']
+        }})
+        states[i] = state()
+    return messages, states
+
+
+def as_array(levels):
+    return np.array(levels, dtype=np.float64).reshape(-1, 2)
+
+
+def assert_book_equals(view, state, max_levels):
+    assert view['last_update_id'] == state['lastUpdateId']
+    assert np.array_equal(view['bids'], as_array(state['bids'])[:max_levels])
+    assert np.array_equal(view['asks'], as_array(state['asks'])[:max_levels])
+
+
+def test_apply_levels():
+    side = apply_levels(np.empty((0, 2)), as_array([[10, 1], [12, 2], [11, 3]]), descending=True)
+    assert side.tolist() == [[12, 2], [11, 3], [10, 1]]
+    side = apply_levels(side, as_array([[11, 0], [13, 5], [10, 4]]), descending=True)
+    assert side.tolist() == [[13, 5], [12, 2], [10, 4]]
+    assert not side.flags.writeable
+
+
+def test_sync_and_follow_tape():
+    messages, states = simulate_exchange(300, seed=1)
+
+    # Snapshot taken while the stream is already running: it reflects the book
+    # two events before the one that triggered the request (step 3 drops older events)
+    snapshot_requests = []
+
+    def fetch_snapshot(symbol, limit):
+        snapshot_requests.append(symbol)
+        return states[len(snapshot_requests) + 1]
+
+    manager = OrderBookManager(['SOLUSDT'], fetch_snapshot=fetch_snapshot, run_snapshot=run_inline)
+    for book in manager.books.values():
+        book.min_snapshot_interval = 0
+
+    checkpoints = {}
+
+    def on_event(event):
+        manager.on_event(event)
+        checkpoints[event['final_update_id']] = manager.get_orderbook('SOLUSDT')
+
+    ReplayDepthStream(messages=messages).replay(on_event)
+
+    assert manager.get_stats()['SOLUSDT']['synced']
+    assert_book_equals(manager.get_orderbook('SOLUSDT'), states[len(messages) - 1], 1000)
+
+    # Views handed out earlier never change (copy-on-write)
+    for i in [50, 120, 299]:
+        view = checkpoints[states[i]['lastUpdateId']]
+        assert_book_equals(view, states[i], 1000)
+
+    # Drop-in for the REST orderbook
+    view = manager.get_orderbook('SOLUSDT', limit=100)
+    assert len(view['bids']) == 100
+    assert analyze_orderbook(view, 150.0)['imbalance']['pressure'] in [
+        'strong_buy', 'buy', 'balanced', 'sell', 'strong_sell'
+    ]
+
+
+def test_gap_triggers_resync():
+    messages, states = simulate_exchange(100, seed=2)
+    del messages[40]  # Lost message -> pu mismatch
+
+    fetches = []
+
+    def fetch_snapshot(symbol, limit):
+        fetches.append(len(fetches))
+        # Initial sync from the first state, resync from the exchange state at the gap
+        return states[-1] if len(fetches) == 1 else states[41]
+
+    manager = OrderBookManager(['SOLUSDT'], fetch_snapshot=fetch_snapshot, run_snapshot=run_inline)
+    for book in manager.books.values():
+        book.min_snapshot_interval = 0
+    ReplayDepthStream(messages=messages).replay(manager.on_event)
+
+    stats = manager.get_stats()['SOLUSDT']
+    assert stats['resyncs'] == 1 and stats['snapshots'] == 2
+    assert_book_equals(manager.get_orderbook('SOLUSDT'), states[99], 1000)
+
+
+def test_not_synced_until_snapshot():
+    messages, _ = simulate_exchange(5, seed=3)
+
+    def failing_snapshot(symbol, limit):
+        raise Exception("timeout")
+
+    manager = OrderBookManager(['SOLUSDT'], fetch_snapshot=failing_snapshot)
+    ReplayDepthStream(messages=messages).replay(manager.on_event)
+    assert manager.get_orderbook('SOLUSDT') is None
+    assert manager.get_orderbook('ETHUSDT') is None
+
+
+def test_replay_from_tape_file():
+    messages, states = simulate_exchange(50, seed=4)
+    path = os.path.join(tempfile.mkdtemp(), 'depth.jsonl')
+    with open(path, 'w') as f:
+        for message in messages:
+            f.write(json.dumps(message) + '\n')
+
+    manager = OrderBookManager(['SOLUSDT'], fetch_snapshot=lambda symbol, limit: states[-1],
+                               run_snapshot=run_inline)
+    stream = ReplayDepthStream(path)
+    manager.start(stream)
+    stream.join(5)
+    assert_book_equals(manager.get_orderbook('SOLUSDT'), states[49], 1000)
+    assert parse_depth_message({'e': 'markPriceUpdate'}) == []
+
+
+
+def test_snapshot_fetch_does_not_block_stream_thread():
+    messages, states = simulate_exchange(30, seed=5)
+    release = threading.Event()
+
+    def slow_snapshot(symbol, limit):
+        release.wait(5)
+        return states[-1]
+
+    manager = OrderBookManager(['SOLUSDT'], fetch_snapshot=slow_snapshot)
+    started = time.perf_counter()
+    ReplayDepthStream(messages=messages).replay(manager.on_event)
+    assert time.perf_counter() - started < 1  # events kept flowing while the request hangs
+    assert manager.get_orderbook('SOLUSDT') is None
+
+    release.set()
+    for _ in range(200):
+        if manager.get_stats()['SOLUSDT']['synced']:
+            break
+        time.sleep(0.01)
+    stats = manager.get_stats()['SOLUSDT']
+    assert stats['snapshots'] == 1 and stats['events_applied'] == 30
+    assert_book_equals(manager.get_orderbook('SOLUSDT'), states[29], 1000)
+
+
+def test_quiet_stream_falls_back_to_rest():
+    messages, states = simulate_exchange(10, seed=6)
+    manager = OrderBookManager(['SOLUSDT'], fetch_snapshot=lambda symbol, limit: states[-1],
+                               run_snapshot=run_inline)
+    ReplayDepthStream(messages=messages).replay(manager.on_event)
+    last_event_ms = manager.get_orderbook('SOLUSDT')['event_time']
+
+    clock = get_server_clock()
+    original = (clock.clock, clock.offset_ms)
+    order_book._order_book_manager = manager
+    try:
+        clock.offset_ms = 0.0
+        clock.clock = lambda: (last_event_ms + 500) / 1000
+        assert_book_equals(get_local_orderbook('SOLUSDT', max_age=3), states[9], 1000)
+
+        # No depth event for 5 s (disconnect) - caller must use REST
+        clock.clock = lambda: (last_event_ms + 5000) / 1000
+        assert get_local_orderbook('SOLUSDT', max_age=3) is None
+        assert manager.get_orderbook('SOLUSDT') is not None  # the book itself is kept
+    finally:
+        order_book._order_book_manager = None
+        clock.clock, clock.offset_ms = original
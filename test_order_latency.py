@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Candle-close-to-order latency records, SQLite table and SLO summary"""
+import os
+import sys
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from utils.database import TradingDatabase
+from utils.order_latency import OrderLatencyTimer, STAGES, summarize_latencies
+
+CLOSE = 1_700_000_100_000
+
+
+def make_record(strategy: str, close_ms: int, total_ms: float, slo_ms: float = 30000) -> dict:
+    cycle = {'interval_minutes': 15, 'candle_close_ms': close_ms, 'clock_offset_ms': 0.0,
+             'cycle_start_ms': close_ms + 1000, 'shared_data_done_ms': close_ms + 3000,
+             'market_bundles_done_ms': close_ms + 3500}
+    timing = {'started_ms': close_ms + 3510, 'market_data_done_ms': close_ms + 3600,
+              'analysis_done_ms': close_ms + 3700, 'decided_ms': close_ms + 9700}
+    timer = OrderLatencyTimer(cycle, timing)
+    timer.marks = {'picked_up': close_ms + 10000, 'entry_sent': close_ms + 10400,
+                   'entry_acked': close_ms + 10600, 'protective_acked': close_ms + total_ms}
+    return timer.record(strategy, 'SOLUSDT', slo_ms, order_id=123, protective_orders=4)
+
+
+def test_breakdown_adds_up_to_total():
+    record = make_record('sol', CLOSE, 11500)
+    assert record['total_latency_ms'] == 11500 and record['entry_latency_ms'] == 10600
+    assert sum(record[stage] for stage in STAGES) == record['total_latency_ms']
+    assert record['schedule_ms'] == 1000 and record['decision_ms'] == 6000
+    assert record['queue_ms'] == 10 + 300 and record['protective_orders_ms'] == 900
+    assert record['cycle_id'] == f'15m_{CLOSE}' and not record['slo_breached']
+    assert make_record('sol', CLOSE, 31000)['slo_breached']
+
+
+def test_timer_without_cycle_timing():
+    timer = OrderLatencyTimer(None, None)
+    timer.mark('entry_sent')
+    timer.mark('entry_acked')
+    record = timer.record('sol', 'SOLUSDT', 30000)
+    assert 0 <= record['total_latency_ms'] < 1000
+    assert abs(sum(record[stage] for stage in STAGES) - record['total_latency_ms']) < 1e-6
+
+
+def test_table_round_trip_and_summary():
+    db = TradingDatabase(os.path.join(tempfile.mkdtemp(), 'trades.db'))
+    for i, total in enumerate([8000, 9000, 12000, 35000]):
+        db.log_order_latency(make_record('sol', CLOSE + i * 900_000, total))
+    db.log_order_latency(make_record('eth', CLOSE + 3 * 900_000, 36000))
+
+    rows = db.get_order_latency()
+    assert len(rows) == 5 and rows[0]['candle_close_ms'] == CLOSE + 3 * 900_000
+    assert rows[0]['order_id'] == '123' and rows[0]['slo_breached'] is True
+    assert len(db.get_order_latency(strategy='sol', since_ms=CLOSE + 900_000)) == 3
+
+    summary = summarize_latencies(rows, 30000)
+    assert summary['count'] == 5 and summary['breaches'] == 2
+    assert summary['cycles'] == 4 and summary['cycles_breached'] == 1  # sol and eth share the last cycle
+    assert summary['p50'] == 12000
+    histogram = summary['histogram']
+    assert sum(histogram['counts']) == 5 and histogram['edges'][-1] == 36000
+    assert set(summary['stages']) == set(STAGES)
+    assert summarize_latencies([], 30000)['count'] == 0
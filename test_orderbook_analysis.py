@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Vectorized analyze_orderbook against the previous Python-loop implementation"""
+import os
+import sys
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import numpy as np
+from utils.indicators import analyze_orderbook
+from utils.binance_client import parse_orderbook
+
+
+def loop_analyze_orderbook(orderbook, current_price):
+    """Previous implementation (lists of [price, qty])"""
+    bids = orderbook['bids']
+    asks = orderbook['asks']
+
+    def calculate_depth_volume(orders, depth_levels=[0.5, 1.0, 2.0]):
+        volumes = {}
+        for depth_pct in depth_levels:
+            volume = 0
+            for price, qty in orders:
+                if abs((price - current_price) / current_price * 100) <= depth_pct:
+                    volume += qty
+            volumes[f"{depth_pct}%"] = volume
+        return volumes
+
+    bid_volumes = calculate_depth_volume(bids)
+    ask_volumes = calculate_depth_volume(asks)
+    total_bid_volume = sum(qty for _, qty in bids[:20])
+    total_ask_volume = sum(qty for _, qty in asks[:20])
+    total_volume = total_bid_volume + total_ask_volume
+    if total_volume > 0:
+        bid_percentage = (total_bid_volume / total_volume) * 100
+        ask_percentage = (total_ask_volume / total_volume) * 100
+        imbalance_ratio = total_bid_volume / total_ask_volume if total_ask_volume > 0 else 0
+    else:
+        bid_percentage = ask_percentage = 50
+        imbalance_ratio = 1.0
+
+    if imbalance_ratio > 1.3:
+        pressure = "strong_buy"
+    elif imbalance_ratio > 1.1:
+        pressure = "buy"
+    elif imbalance_ratio < 0.7:
+        pressure = "strong_sell"
+    elif imbalance_ratio < 0.9:
+        pressure = "sell"
+    else:
+        pressure = "balanced"
+
+    best_bid = bids[0][0] if bids else current_price
+    best_ask = asks[0][0] if asks else current_price
+    spread = best_ask - best_bid
+    spread_pct = (spread / current_price) * 100 if current_price > 0 else 0
+    avg_bid_size = np.mean([qty for _, qty in bids[:20]]) if bids else 0
+    avg_ask_size = np.mean([qty for _, qty in asks[:20]]) if asks else 0
+    bid_walls = [{"price": round(p, 2), "size": round(q, 2)} for p, q in bids[:20] if q > avg_bid_size * 3]
+    ask_walls = [{"price": round(p, 2), "size": round(q, 2)} for p, q in asks[:20] if q > avg_ask_size * 3]
+
+    return {
+        "imbalance": {"bid_percentage": round(bid_percentage, 2), "ask_percentage": round(ask_percentage, 2),
+                      "ratio": round(imbalance_ratio, 2), "pressure": pressure},
+        "depth": {"bid_volumes": {k: round(v, 2) for k, v in bid_volumes.items()},
+                  "ask_volumes": {k: round(v, 2) for k, v in ask_volumes.items()}},
+        "spread": {"absolute": round(spread, 2), "percentage": round(spread_pct, 4)},
+        "walls": {"bid_walls": bid_walls[:3], "ask_walls": ask_walls[:3],
+                  "has_significant_walls": len(bid_walls) > 0 or len(ask_walls) > 0}
+    }
+
+
+def make_depth(levels: int, price: float, seed: int) -> dict:
+    """Raw futures_order_book payload (string prices/quantities, best first)"""
+    rng = np.random.default_rng(seed)
+    tick = price * 0.0001
+    qty = np.round(rng.lognormal(2, 1, (2, levels)), 3)
+    bids = [[f"{price - (i + 1) * tick:.6f}", f"{q}"] for i, q in enumerate(qty[0])]
+    asks = [[f"{price + (i + 1) * tick:.6f}", f"{q}"] for i, q in enumerate(qty[1])]
+    return {'bids': bids, 'asks': asks, 'lastUpdateId': seed}
+
+
+def as_lists(orderbook: dict) -> dict:
+    return {side: orderbook[side].tolist() for side in ['bids', 'asks']}
+
+
+def assert_same_analysis(expected, actual):
+    """Depth volumes may differ by one rounding unit (levels are summed in distance order)"""
+    for side in ['bid_volumes', 'ask_volumes']:
+        for band, volume in expected['depth'][side].items():
+            assert abs(actual['depth'][side][band] - volume) <= 0.011, f"{side} {band}"
+    assert {k: v for k, v in actual.items() if k != 'depth'} == {k: v for k, v in expected.items() if k != 'depth'}
+
+
+def test_matches_loop_implementation():
+    for levels in [5, 20, 100, 500, 1000]:
+        for price in [0.15, 150.0, 65000.0]:
+            for seed in range(5):
+                orderbook = parse_orderbook(make_depth(levels, price, seed))
+                current_price = price * (1 + (seed - 2) * 0.001)
+                expected = loop_analyze_orderbook(as_lists(orderbook), current_price)
+                assert_same_analysis(expected, analyze_orderbook(orderbook, current_price))
+                # Lists are still accepted
+                assert_same_analysis(expected, analyze_orderbook(as_lists(orderbook), current_price))
+
+
+def test_empty_book():
+    orderbook = parse_orderbook({'bids': [], 'asks': [], 'lastUpdateId': 1})
+    assert orderbook['bids'].shape == (0, 2)
+    result = analyze_orderbook(orderbook, 100.0)
+    assert result['imbalance']['pressure'] == 'balanced'
+    assert result['spread']['absolute'] == 0
+    assert result['walls']['has_significant_walls'] is False
+
+
+def test_extra_depth_bands():
+    orderbook = parse_orderbook(make_depth(1000, 150.0, 1))
+    bands = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0)
+    volumes = analyze_orderbook(orderbook, 150.0, depth_levels=bands)['depth']['bid_volumes']
+    assert list(volumes) == [f"{b}%" for b in bands]
+    assert list(volumes.values()) == sorted(volumes.values())
+
+
+def test_speed():
+    orderbook = parse_orderbook(make_depth(1000, 150.0, 3))
+    lists = as_lists(orderbook)
+    runs = 50
+
+    start = time.perf_counter()
+    for _ in range(runs):
+        loop_analyze_orderbook(lists, 150.0)
+    loop_ms = (time.perf_counter() - start) / runs * 1000
+
+    start = time.perf_counter()
+    for _ in range(runs):
+        analyze_orderbook(orderbook, 150.0)
+    vector_ms = (time.perf_counter() - start) / runs * 1000
+
+    print(f"   1000 levels: loop {loop_ms:.2f} ms | vectorized {vector_ms:.3f} ms ({loop_ms / vector_ms:.0f}x)")
+    assert vector_ms < loop_ms
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Paper trade SL/TP checks: one all-symbols price snapshot per monitoring pass"""
+import logging
+import os
+import sys
+import tempfile
+import threading
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import agents.monitoring as monitoring
+from utils.binance_client import BinanceClient
+from utils.database import TradingDatabase
+
+# Long trades: SL 95 / TP 110 around an entry of 100
+SYMBOLS = ['SOLUSDT', 'ETHUSDT', 'DOGEUSDT', 'XRPUSDT']
+
+
+class FakePriceClient:
+    """get_all_prices snapshot; per-symbol lookups are a failure"""
+
+    def __init__(self, prices):
+        self.prices = prices
+        self.snapshots = 0
+
+    def get_all_prices(self, mark_price=False):
+        self.snapshots += 1
+        return dict(self.prices)
+
+    def get_current_price(self, symbol):
+        raise AssertionError('paper trades must be checked against the bulk snapshot')
+
+
+class FakeTickerApi:
+    def __init__(self):
+        self.calls = []
+
+    def futures_symbol_ticker(self, **params):
+        self.calls.append(('ticker', params))
+        return [{'symbol': symbol, 'price': '100.5', 'time': 0} for symbol in SYMBOLS]
+
+    def futures_mark_price(self, **params):
+        self.calls.append(('premiumIndex', params))
+        return [{'symbol': symbol, 'markPrice': '100.25'} for symbol in SYMBOLS]
+
+
+def make_agent(db, client):
+    original = monitoring.get_binance_client
+    monitoring.get_binance_client = lambda: client
+    try:
+        return monitoring.MonitoringAgent(logger_instance=logging.getLogger('test_paper_trade_prices'), db_instance=db)
+    finally:
+        monitoring.get_binance_client = original
+
+
+def open_trades(db, per_symbol):
+    for symbol in SYMBOLS:
+        for i in range(per_symbol):
+            db.create_trade({'symbol': symbol, 'strategy': f"s{i}", 'action': 'LONG', 'entry_price': 100.0,
+                             'stop_loss': 95.0, 'take_profit': 110.0})
+
+
+def run_pass(per_symbol, prices):
+    db = TradingDatabase(os.path.join(tempfile.mkdtemp(), 'paper_trades.db'))
+    client = FakePriceClient(prices)
+    agent = make_agent(db, client)
+    try:
+        open_trades(db, per_symbol)
+        return agent.check_and_close_paper_trades(), client, db
+    finally:
+        db.remove_trade_listener(agent.trigger_index)
+
+
+def test_bulk_snapshot_returns_every_symbol_in_one_request():
+    client = BinanceClient.__new__(BinanceClient)
+    client._local = threading.local()
+    client._local.client = api = FakeTickerApi()
+
+    assert client.get_all_prices() == {symbol: 100.5 for symbol in SYMBOLS}
+    assert client.get_all_prices(mark_price=True)['SOLUSDT'] == 100.25
+    # No symbol parameter: one request covers all symbols
+    assert api.calls == [('ticker', {}), ('premiumIndex', {})]
+
+
+def test_one_snapshot_per_pass_for_8_or_800_trades():
+    prices = {symbol: 100.0 for symbol in SYMBOLS}
+    for per_symbol in (2, 200):
+        result, client, db = run_pass(per_symbol, prices)
+        assert result['trades_checked'] == per_symbol * len(SYMBOLS)
+        assert result['trades_closed'] == 0
+        assert client.snapshots == 1
+
+
+def test_triggered_trades_close_and_symbol_missing_from_snapshot_is_skipped():
+    # SOL hit its TP, DOGE its SL, ETH in range, XRP missing from the snapshot
+    prices = {'SOLUSDT': 111.0, 'ETHUSDT': 101.0, 'DOGEUSDT': 94.0, 'BTCUSDT': 30000.0}
+    result, client, db = run_pass(3, prices)
+
+    assert client.snapshots == 1
+    assert result['status'] == 'success' and result['trades_closed'] == 6
+    closed = sorted((t['symbol'], t['exit_reason']) for t in result['closed_trades'])
+    assert closed == [('DOGEUSDT', 'SL_HIT')] * 3 + [('SOLUSDT', 'TP_HIT')] * 3
+
+    still_open = sorted(t['symbol'] for t in db.get_open_trades())
+    assert still_open == ['ETHUSDT'] * 3 + ['XRPUSDT'] * 3
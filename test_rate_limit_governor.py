@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Request-weight governor: endpoint weights, priority queueing, window roll, header sync and bans"""
+import os
+import sys
+import threading
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from utils.binance_client import (
+    RateLimitGovernor, RequestPriority, get_endpoint_weight, request_priority, resolve_request_priority
+)
+
+WINDOW_START = 1700000040.0  # start of a minute window
+
+
+class FakeClock:
+    """Wall clock in seconds, moved by hand"""
+
+    def __init__(self, now: float = WINDOW_START):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def start_waiter(governor, weight, priority, served):
+    """acquire() in a thread; wait until it is queued"""
+    queued = governor.get_stats()['queue_length']
+    thread = threading.Thread(target=lambda: (governor.acquire(weight, priority), served.append(priority)))
+    thread.start()
+    deadline = time.time() + 5
+    while governor.get_stats()['queue_length'] == queued and time.time() < deadline:
+        time.sleep(0.005)
+    assert governor.get_stats()['queue_length'] == queued + 1, 'waiter never queued'
+    return thread
+
+
+def advance(governor, clock, seconds):
+    """Move the clock and wake the waiters (any response does that)"""
+    clock.now += seconds
+    governor.update_from_headers(200, {})
+
+
+def test_endpoint_weight_brackets():
+    klines = {99: 1, 100: 2, 499: 2, 500: 5, 1000: 5, 1001: 10, 1500: 10}
+    for limit, weight in klines.items():
+        assert get_endpoint_weight('klines', {'limit': limit}) == weight, limit
+    assert get_endpoint_weight('klines') == 5  # Binance default limit is 500
+
+    depth = {5: 2, 50: 2, 100: 5, 500: 10, 1000: 20}
+    for limit, weight in depth.items():
+        assert get_endpoint_weight('depth', {'limit': limit}) == weight, limit
+
+    assert get_endpoint_weight('ticker/price', {'symbol': 'SOLUSDT'}) == 1
+    assert get_endpoint_weight('ticker/price') == 2
+    assert get_endpoint_weight('openOrders') == 40
+    assert get_endpoint_weight('openOrders', {'symbol': 'SOLUSDT'}) == 1
+    assert get_endpoint_weight('account') == 5 and get_endpoint_weight('income') == 30
+    assert get_endpoint_weight('premiumIndex') == 1
+
+
+def test_budget_shares_and_priority_order():
+    clock = FakeClock()
+    governor = RateLimitGovernor(weight_limit=100, clock=clock)
+    served = []
+
+    governor.acquire(80, RequestPriority.ANALYSIS)  # analysis share (80%) used up
+    dashboard = start_waiter(governor, 20, RequestPriority.DASHBOARD, served)
+    analysis = start_waiter(governor, 70, RequestPriority.ANALYSIS, served)
+
+    # Orders may use the whole budget and jump the queue
+    governor.acquire(10, RequestPriority.ORDER)
+    assert governor.get_stats()['used_weight'] == 90 and served == []
+
+    # New window: the queued analysis request goes first; afterwards 70 is past the
+    # dashboard's 60% share, so the dashboard request keeps waiting
+    advance(governor, clock, 60)
+    analysis.join(5)
+    assert served == [RequestPriority.ANALYSIS]
+    assert governor.get_stats()['queue_length'] == 1
+
+    advance(governor, clock, 60)
+    dashboard.join(5)
+    assert served == [RequestPriority.ANALYSIS, RequestPriority.DASHBOARD]
+
+    stats = governor.get_stats()
+    assert stats['by_priority'] == {'order': 1, 'monitoring': 0, 'analysis': 2, 'dashboard': 1}
+    assert stats['queued'] == 2 and stats['wait_seconds'] == 60 + 120
+
+
+def test_oversized_request_is_not_stuck_in_an_empty_window():
+    governor = RateLimitGovernor(weight_limit=100, clock=FakeClock())
+    governor.acquire(150, RequestPriority.DASHBOARD)
+    assert governor.get_stats()['used_weight'] == 150
+
+
+def test_window_roll_resets_used_weight():
+    clock = FakeClock(WINDOW_START + 30)
+    governor = RateLimitGovernor(weight_limit=100, clock=clock)
+    governor.acquire(40, RequestPriority.MONITORING)
+    clock.now = WINDOW_START + 59.9
+    assert governor.get_stats()['used_weight'] == 40
+    clock.now = WINDOW_START + 60
+    assert governor.get_stats()['used_weight'] == 0
+
+
+def test_header_sync_keeps_larger_count():
+    governor = RateLimitGovernor(weight_limit=100, clock=FakeClock())
+    governor.acquire(30, RequestPriority.ANALYSIS)
+
+    # Response for an earlier request: the local count already includes requests in flight
+    governor.update_from_headers(200, {'X-MBX-USED-WEIGHT-1M': '20'})
+    assert governor.get_stats()['used_weight'] == 30
+
+    # Other processes on the same IP used weight too
+    governor.update_from_headers(200, {'X-MBX-USED-WEIGHT-1M': '75'})
+    assert governor.get_stats()['used_weight'] == 75
+
+    governor.update_from_headers(200, None)
+    assert governor.get_stats()['used_weight'] == 75
+
+
+def test_429_and_418_pause_all_requests():
+    clock = FakeClock()
+    governor = RateLimitGovernor(weight_limit=100, clock=clock)
+    served = []
+
+    governor.update_from_headers(429, {'Retry-After': '5'})
+    stats = governor.get_stats()
+    assert stats['blocked_for'] == 5 and stats['rate_limited'] == 1
+
+    # Even orders wait out the pause
+    order = start_waiter(governor, 1, RequestPriority.ORDER, served)
+    advance(governor, clock, 4)
+    assert served == []
+    advance(governor, clock, 1)
+    order.join(5)
+    assert served == [RequestPriority.ORDER]
+
+    # IP ban without Retry-After: pause for a whole window
+    governor.update_from_headers(418, {})
+    stats = governor.get_stats()
+    assert stats['blocked_for'] == RateLimitGovernor.WINDOW_SECONDS and stats['banned'] == 1
+
+    monitoring = start_waiter(governor, 1, RequestPriority.MONITORING, served)
+    advance(governor, clock, RateLimitGovernor.WINDOW_SECONDS)
+    monitoring.join(5)
+    assert served == [RequestPriority.ORDER, RequestPriority.MONITORING]
+
+
+def test_order_endpoints_always_get_order_priority():
+    with request_priority(RequestPriority.DASHBOARD):
+        assert resolve_request_priority('POST', 'order') == RequestPriority.ORDER
+        assert resolve_request_priority('delete', 'batchOrders') == RequestPriority.ORDER
+        assert resolve_request_priority('DELETE', 'allOpenOrders') == RequestPriority.ORDER
+        assert resolve_request_priority('post', 'leverage') == RequestPriority.ORDER
+        # Reading orders is not placing them
+        assert resolve_request_priority('GET', 'order') == RequestPriority.DASHBOARD
+        assert resolve_request_priority('POST', 'listenKey') == RequestPriority.DASHBOARD
+    assert resolve_request_priority('GET', 'openOrders') == RequestPriority.ANALYSIS
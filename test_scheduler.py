@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Candle-close timer queue on a fake (offset) clock"""
+import os
+import sys
+import threading
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from utils.scheduler import CandleCloseScheduler, ServerClock
+
+MINUTE = 60_000
+
+
+class FakeClock:
+    """Local clock in seconds; the exchange runs `skew_ms` ahead of it"""
+
+    def __init__(self, start_ms: int, skew_ms: int = 0):
+        self.now = start_ms / 1000
+        self.skew_ms = skew_ms
+
+    def __call__(self) -> float:
+        return self.now
+
+    def server_time(self) -> int:
+        self.now += 0.02  # 40 ms round trip, server stamps halfway
+        server = int(self.now * 1000) + self.skew_ms
+        self.now += 0.02
+        return server
+
+
+def test_fires_at_server_candle_close_plus_settle():
+    local = FakeClock(start_ms=1_700_000_000_000 + 7 * MINUTE + 30_000, skew_ms=2500)
+    clock = ServerClock(local.server_time, clock=local)
+    assert abs(clock.sync() - 2500) < 1 and abs(clock.round_trip_ms - 40) < 1
+
+    scheduler = CandleCloseScheduler(clock, settle_delay=1.5)
+    fires = []
+    scheduler.add_candle_job('15min', 15, fires.append)
+
+    deadline = scheduler.next_fire_ms('15min')
+    assert (deadline - 1500) % (15 * MINUTE) == 0 and deadline > clock.now_ms()
+
+    # One ms before the deadline on the exchange clock nothing runs
+    local.now = (deadline - clock.offset_ms - 1) / 1000
+    assert scheduler.run_pending() == 0
+    local.now += 0.001
+    assert scheduler.run_pending() == 1
+    assert fires[0].mark_ms == deadline - 1500 and abs(fires[0].lateness_ms) < 1
+    assert scheduler.next_fire_ms('15min') == deadline + 15 * MINUTE
+
+
+def test_overrun_fires_late_instead_of_skipping():
+    local = FakeClock(start_ms=1_700_000_100_000)
+    scheduler = CandleCloseScheduler(ServerClock(clock=local), settle_delay=1.0)
+    fires = []
+
+    def slow_cycle(fire):
+        fires.append(fire)
+        if len(fires) == 1:
+            local.now += 12 * 60  # cycle runs past the next two closes
+
+    scheduler.add_candle_job('5min', 5, slow_cycle)
+    first = scheduler.next_fire_ms('5min')
+    local.now = first / 1000
+    assert scheduler.run_pending() == 2  # overdue mark fires right away
+    assert fires[1].mark_ms == fires[0].mark_ms + 10 * MINUTE
+    assert fires[1].missed == 1 and fires[1].lateness_ms > 0
+    assert scheduler.get_stats()['5min']['max_lateness_ms'] == fires[1].lateness_ms
+
+
+def test_heap_orders_jobs():
+    local = FakeClock(start_ms=1_700_000_400_000)  # 2023-11-14 22:20 UTC, a 5min/15min boundary
+    scheduler = CandleCloseScheduler(ServerClock(clock=local), settle_delay=0.5)
+    order = []
+    scheduler.add_candle_job('15min', 15, lambda fire: order.append('15min'))
+    scheduler.add_candle_job('5min', 5, lambda fire: order.append('5min'))
+    scheduler.add_periodic_job('monitoring', 60, lambda fire: order.append('monitoring'), run_now=True)
+
+    for _ in range(15 * 60):
+        local.now += 1
+        scheduler.run_pending()
+    assert order.count('5min') == 3 and order.count('15min') == 1 and order.count('monitoring') == 16
+    assert order[0] == 'monitoring'
+
+
+def test_run_sleeps_until_deadline():
+    scheduler = CandleCloseScheduler(settle_delay=0)
+    fires = []
+
+    def tick(fire):
+        fires.append(fire)
+        if len(fires) == 3:
+            scheduler.stop()
+
+    scheduler.add_periodic_job('tick', 0.05, tick)
+    thread = threading.Thread(target=scheduler.run)
+    started = time.time()
+    thread.start()
+    thread.join(2)
+    assert not thread.is_alive() and len(fires) == 3
+    assert time.time() - started >= 0.14  # three 50 ms periods (marks are whole ms)
+    assert max(fire.lateness_ms for fire in fires) < 30
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Shared collectors run concurrently, late sources fall back to stale values"""
+import os
+import sys
+import threading
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from agents.shared_data import SharedDataCollector
+from utils.source_cache import SourceCache
+
+
+def source(key, delay, value, calls=None):
+    def collector(state):
+        if calls is not None:
+            calls.append(key)
+        time.sleep(delay)
+        return {key: value}
+    return collector
+
+
+def test_sources_run_concurrently_within_deadline():
+    collector = SharedDataCollector([
+        ('news', 'news_data', source('news_data', 0.2, {'count': 3})),
+        ('btc', 'btc_data', source('btc_data', 0.2, {'current_price': 100.0, 'fresh': True})),
+        ('ixic', 'ixic_data', source('ixic_data', 0.2, {'current_price': 15000.0})),
+    ], deadline=1.0)
+
+    started = time.perf_counter()
+    result = collector.collect({'symbol': 'SOLUSDT'})
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.4  # one source's latency, not the sum
+    assert result == {'news_data': {'count': 3}, 'btc_data': {'current_price': 100.0, 'fresh': True},
+                      'ixic_data': {'current_price': 15000.0}}
+    stats = collector.get_stats()
+    assert all(s['runs'] == 1 and 150 < s['last_ms'] < 400 for s in stats.values())
+
+
+def test_slow_source_serves_last_good_value_marked_stale():
+    release = threading.Event()
+    calls = []
+    slow = {'delay': 0}
+
+    def ixic(state):
+        calls.append(1)
+        if slow['delay']:
+            release.wait(5)
+        return {'ixic_data': {'current_price': 15000.0 + len(calls), 'fresh': True, 'data_age_minutes': 5}}
+
+    collector = SharedDataCollector([
+        ('btc', 'btc_data', source('btc_data', 0, {'current_price': 100.0})),
+        ('ixic', 'ixic_data', ixic),
+    ], deadline=0.2)
+    assert collector.collect({})['ixic_data']['current_price'] == 15001.0
+
+    # IXIC hangs: the cycle still finishes on the deadline with the old value
+    slow['delay'] = 1
+    started = time.perf_counter()
+    result = collector.collect({})
+    assert time.perf_counter() - started < 0.5
+    assert result['btc_data'] == {'current_price': 100.0}
+    stale = result['ixic_data']
+    assert stale['current_price'] == 15001.0 and stale['stale'] and not stale['fresh']
+    assert stale['stale_age_seconds'] >= 0 and stale['data_age_minutes'] == 5
+
+    # Next cycle while it still hangs: not started a second time
+    collector.collect({})
+    assert len(calls) == 2
+    stats = collector.get_stats()['ixic']
+    assert stats['timeouts'] == 2 and stats['stale_served'] == 2
+
+    # Once it finishes, its result is the last good value
+    release.set()
+    time.sleep(0.1)
+    slow['delay'] = 0
+    assert collector.get_stats()['ixic']['runs'] == 2
+    assert collector.collect({})['ixic_data']['current_price'] == 15003.0
+
+
+def test_failure_without_history_is_none():
+    def broken(state):
+        raise RuntimeError("API down")
+
+    collector = SharedDataCollector([('news', 'news_data', broken)], deadline=0.5)
+    assert collector.collect({}) == {'news_data': None}
+    assert collector.get_stats()['news']['errors'] == 1
+
+
+def test_stale_ages_add_up_across_source_cache_and_last_good_value():
+    clock = {'now': 1000.0}
+    now = lambda: clock['now']
+    cache = SourceCache(clock=now)
+    fetches = []
+
+    def fetch_ixic():
+        fetches.append(1)
+        if len(fetches) > 1:
+            raise RuntimeError("Yahoo down")
+        return {'current_price': 15000.0, 'fresh': True, 'data_age_minutes': 5}
+
+    def ixic(state):
+        if len(fetches) > 1:
+            raise RuntimeError("Yahoo down")
+        return {'ixic_data': cache.get('ixic', fetch_ixic, 60)}
+
+    collector = SharedDataCollector([('ixic', 'ixic_data', ixic)], deadline=1.0, clock=now)
+    assert collector.collect({})['ixic_data']['fresh']
+
+    # The cache serves its value 2 minutes old; the collector keeps that as its last good value
+    clock['now'] += 120
+    inner = collector.collect({})['ixic_data']
+    assert inner['stale'] and inner['stale_age_seconds'] == 120 and inner['data_age_minutes'] == 7
+
+    # A minute later the collector fails: its own age is added to the cache's
+    time.sleep(0.1)  # background refresh fails
+    clock['now'] += 60
+    outer = collector.collect({})['ixic_data']
+    assert outer['stale'] and not outer['fresh']
+    assert outer['stale_age_seconds'] == 180 and outer['data_age_minutes'] == 8
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Frozen shared snapshot + per-strategy namespaces instead of deepcopy"""
+import os
+import sys
+import time
+import tracemalloc
+from copy import deepcopy
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import numpy as np
+import pandas as pd
+from models.state import freeze_state, strategy_state
+
+
+def make_shared_state() -> dict:
+    rng = np.random.default_rng(0)
+    candles = pd.DataFrame(rng.random((1000, 5)), columns=['open', 'high', 'low', 'close', 'volume'])
+    return {
+        'symbol': 'SOLUSDT',
+        'error': None,
+        'news_data': {'items': [{'title': f'headline {i}', 'text': 'x' * 200} for i in range(10)], 'count': 10},
+        'btc_data': {'current_price': 65000.0, 'trend_15m': 'bullish'},
+        'ixic_data': {'current_price': 15000.0, 'fresh': False},
+        'market_data_previous': {'timeframes': {'1h': candles, '15m': candles.copy()}},
+    }
+
+
+def run_fake_strategy(state, name: str):
+    """Mimics the agents: reads shared keys, writes its own"""
+    state[f'market_data_{name}'] = {'current_price': 150.0}
+    state[f'analysis_{name}'] = {'btc_trend': state['btc_data']['trend_15m']}
+    state[f'recommendation_{name}'] = {'action': 'LONG', 'symbol': state['symbol']}
+    return state
+
+
+def test_strategy_writes_stay_in_namespace():
+    shared = freeze_state(make_shared_state())
+    sol = strategy_state(shared, symbol='SOLUSDT')
+    eth = strategy_state(shared, symbol='ETHUSDT')
+    run_fake_strategy(sol, 'sol')
+    run_fake_strategy(eth, 'eth')
+
+    assert eth['recommendation_eth']['symbol'] == 'ETHUSDT'
+    assert 'analysis_sol' not in eth and 'analysis_sol' not in shared
+    assert set(sol.maps[0]) == {'symbol', 'market_data_sol', 'analysis_sol', 'recommendation_sol'}
+    assert sol['news_data'] is shared['news_data']  # by reference, not copied
+
+    try:
+        shared['btc_data'] = None
+        raise AssertionError("shared snapshot must be read-only")
+    except TypeError:
+        pass
+
+    merged = dict(shared)
+    for state in (sol, eth):
+        merged |= {k: v for k, v in state.maps[0].items() if k != 'symbol'}
+    assert merged['symbol'] == 'SOLUSDT' and merged['recommendation_eth']['action'] == 'LONG'
+
+
+def test_setup_cost_does_not_grow_with_strategies():
+    base = make_shared_state()
+    strategies = 32
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    copies = [deepcopy(base) for _ in range(strategies)]
+    deepcopy_s = time.perf_counter() - start
+    deepcopy_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del copies
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    shared = freeze_state(base)
+    states = [strategy_state(shared, symbol='SOLUSDT') for _ in range(strategies)]
+    snapshot_s = time.perf_counter() - start
+    snapshot_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(f"   {strategies} strategies: deepcopy {deepcopy_s * 1000:.1f} ms / {deepcopy_peak / 2**20:.1f} MB | "
+          f"snapshot {snapshot_s * 1000:.3f} ms / {snapshot_peak / 1024:.0f} KB")
+    assert len(states) == strategies
+    assert snapshot_peak < deepcopy_peak / 100
+    assert snapshot_s < deepcopy_s / 10
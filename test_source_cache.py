@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Stale-while-revalidate source cache, circuit breaker and IXIC market-hours TTL / freshness"""
+import os
+import sys
+import threading
+from datetime import datetime, timezone
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from utils.source_cache import SourceCache, ixic_ttl, nasdaq_is_open
+from agents.ixic_collector import with_current_age
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def wait_for_refresh(cache):
+    for _ in range(200):
+        if not any(entry.refreshing for entry in cache._entries.values()):
+            return
+        threading.Event().wait(0.01)
+
+
+def test_fresh_then_stale_while_revalidate():
+    clock = FakeClock()
+    cache = SourceCache(clock=clock)
+    calls = []
+
+    def fetch():
+        calls.append(clock.now)
+        return {'count': len(calls)}
+
+    assert cache.get('news', fetch, ttl=600) == {'count': 1}
+    clock.now += 599
+    assert cache.get('news', fetch, ttl=600) == {'count': 1} and len(calls) == 1
+
+    # Expired: old value served at once (marked stale), refreshed in the background
+    clock.now += 2
+    stale = cache.get('news', fetch, ttl=600)
+    assert stale == {'count': 1, 'stale': True, 'stale_age_seconds': 601}
+    wait_for_refresh(cache)
+    assert cache.get('news', fetch, ttl=600) == {'count': 2}
+    stats = cache.get_stats()['news']
+    assert stats['fetches'] == 2 and stats['hits'] == 2 and stats['stale_hits'] == 1
+
+
+def test_circuit_breaker_opens_and_recovers():
+    clock = FakeClock()
+    cache = SourceCache(failure_threshold=3, cooldown=300, clock=clock)
+    calls = []
+    healthy = {'ok': False}
+
+    def fetch():
+        calls.append(1)
+        if not healthy['ok']:
+            raise ConnectionError("yahoo down")
+        return {'current_price': 15000.0}
+
+    for _ in range(3):
+        assert cache.get('ixic', fetch, ttl=60) is None
+    assert cache.get_stats()['ixic']['circuit'] == 'open'
+
+    # Open circuit: the source is not called at all during the cooldown
+    for _ in range(5):
+        clock.now += 30
+        assert cache.get('ixic', fetch, ttl=60) is None
+    assert len(calls) == 3
+
+    # Cooldown over: one trial call; a failure re-opens immediately
+    clock.now += 200
+    assert cache.get('ixic', fetch, ttl=60) is None
+    assert len(calls) == 4 and cache.get_stats()['ixic']['circuit'] == 'open'
+
+    clock.now += 301
+    healthy['ok'] = True
+    assert cache.get('ixic', fetch, ttl=60) == {'current_price': 15000.0}
+    stats = cache.get_stats()['ixic']
+    assert stats['circuit'] == 'closed' and stats['failures'] == 0 and stats['trips'] == 1
+
+
+def test_failing_refresh_keeps_serving_stale():
+    clock = FakeClock()
+    cache = SourceCache(failure_threshold=2, cooldown=300, clock=clock)
+    state = {'fail': False}
+
+    def fetch():
+        if state['fail']:
+            raise TimeoutError("timeout")
+        return {'current_price': 100.0}
+
+    cache.get('btc', fetch, ttl=60)
+    state['fail'] = True
+    for _ in range(4):
+        clock.now += 61
+        value = cache.get('btc', fetch, ttl=60)
+        wait_for_refresh(cache)
+        assert value['current_price'] == 100.0 and value['stale']
+    assert cache.get_stats()['btc']['circuit'] == 'open'
+
+
+def test_refresh_inline_never_serves_expired_value_while_source_works():
+    clock = FakeClock()
+    cache = SourceCache(failure_threshold=3, cooldown=300, clock=clock)
+    state = {'price': 100.0, 'fail': False}
+
+    def fetch():
+        if state['fail']:
+            raise TimeoutError("timeout")
+        return {'current_price': state['price'], 'fresh': True, 'data_age_minutes': 0}
+
+    assert cache.get('btc', fetch, ttl=60, refresh_inline=True)['current_price'] == 100.0
+
+    # Next candle close: expired value is refetched before returning
+    clock.now += 900
+    state['price'] = 101.0
+    assert cache.get('btc', fetch, ttl=60, refresh_inline=True) == {
+        'current_price': 101.0, 'fresh': True, 'data_age_minutes': 0
+    }
+
+    # Failed refresh: last good value, no longer labelled fresh
+    clock.now += 900
+    state['fail'] = True
+    value = cache.get('btc', fetch, ttl=60, refresh_inline=True)
+    assert value['current_price'] == 101.0 and value['stale']
+    assert value['fresh'] is False and value['data_age_minutes'] == 15
+    stats = cache.get_stats()['btc']
+    assert stats['fetches'] == 2 and stats['stale_hits'] == 1 and stats['failures'] == 1
+
+
+def test_cached_ixic_freshness_is_recomputed_on_read():
+    fetched = {'current_price': 16000.0, 'fresh': True, 'data_age_minutes': 15,
+               'latest_time': '2024-03-12T15:45:00'}
+    # Same cached summary an hour later (market open) and overnight (closed)
+    assert with_current_age(fetched, datetime(2024, 3, 12, 17, 0)) == {
+        **fetched, 'fresh': True, 'data_age_minutes': 75
+    }
+    overnight = with_current_age(fetched, datetime(2024, 3, 13, 2, 0))
+    assert overnight['fresh'] is False and overnight['data_age_minutes'] == 615
+    assert fetched['data_age_minutes'] == 15  # cached value untouched
+    assert with_current_age(None) is None
+
+
+def test_ixic_ttl_follows_market_hours():
+    utc = timezone.utc
+    # Tuesday 2024-03-12 15:00 UTC = 11:00 New York (EDT) - open
+    assert nasdaq_is_open(datetime(2024, 3, 12, 15, 0, tzinfo=utc))
+    assert ixic_ttl(datetime(2024, 3, 12, 15, 0, tzinfo=utc), open_ttl=300) == 300
+    # Tuesday 21:00 UTC = 17:00 EDT - closed until Wednesday 09:30 EDT (13:30 UTC)
+    assert ixic_ttl(datetime(2024, 3, 12, 21, 0, tzinfo=utc), open_ttl=300) == 16.5 * 3600
+    # Friday 2024-03-08 22:00 UTC (17:00 EST) - closed until Monday 09:30 EDT (13:30 UTC, after DST)
+    friday = datetime(2024, 3, 8, 22, 0, tzinfo=utc)
+    assert not nasdaq_is_open(friday)
+    assert ixic_ttl(friday, open_ttl=300) == (datetime(2024, 3, 11, 13, 30, tzinfo=utc) - friday).total_seconds()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Streaming (O(1) per candle) indicators agree with the batch indicator functions"""
+import json
+import os
+import sys
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import numpy as np
+import pandas as pd
+from ta.momentum import RSIIndicator
+from ta.trend import MACD, EMAIndicator
+from ta.volatility import BollingerBands
+from utils.indicators import calculate_atr
+from utils.streaming_indicators import (
+    StreamingIndicators, save_indicator_states, load_indicator_states
+)
+from test_indicator_kernel import make_candles
+
+
+def assert_close(expected, actual, label):
+    if expected is None or (isinstance(expected, float) and np.isnan(expected)):
+        assert actual is None, f"{label}: expected warm-up (None), got {actual}"
+        return
+    assert actual is not None, f"{label}: expected {expected}, got None"
+    tolerance = max(1e-9, abs(expected) * 1e-9)
+    assert abs(expected - actual) <= tolerance, f"{label}: {expected} != {actual}"
+
+
+def batch_series(df: pd.DataFrame) -> dict:
+    """Full indicator series from the batch implementations"""
+    close = df['close']
+    macd = MACD(close=close)
+    bb = BollingerBands(close=close, window=20, window_dev=2)
+    high, low = df['high'], df['low']
+    true_range = pd.concat([high - low, (high - close.shift()).abs(), (low - close.shift()).abs()], axis=1).max(axis=1)
+    return {
+        'ema_20': EMAIndicator(close=close, window=20).ema_indicator().values,
+        'ema_50': EMAIndicator(close=close, window=50).ema_indicator().values,
+        'rsi_14': RSIIndicator(close=close, window=14).rsi().values,
+        'rsi_7': RSIIndicator(close=close, window=7).rsi().values,
+        'macd': macd.macd().values,
+        'macd_signal': macd.macd_signal().values,
+        'macd_diff': macd.macd_diff().values,
+        'bb_upper': bb.bollinger_hband().values,
+        'bb_middle': bb.bollinger_mavg().values,
+        'bb_lower': bb.bollinger_lband().values,
+        'atr': true_range.rolling(window=14).mean().values
+    }
+
+
+def check_step(state: StreamingIndicators, series: dict, i: int, label: str):
+    values = state.values()
+    assert_close(series['ema_20'][i], values['ema'][20], f"{label} ema_20[{i}]")
+    assert_close(series['ema_50'][i], values['ema'][50], f"{label} ema_50[{i}]")
+    assert_close(series['rsi_14'][i], values['rsi'][14], f"{label} rsi_14[{i}]")
+    assert_close(series['rsi_7'][i], values['rsi'][7], f"{label} rsi_7[{i}]")
+    assert_close(series['atr'][i], values['atr'], f"{label} atr[{i}]")
+
+    macd = values['macd']
+    assert_close(series['macd'][i], macd['macd'] if macd else None, f"{label} macd[{i}]")
+    assert_close(series['macd_signal'][i], macd['signal_line'] if macd else None, f"{label} signal[{i}]")
+    assert_close(series['macd_diff'][i], macd['histogram'] if macd else None, f"{label} histogram[{i}]")
+
+    bb = values['bollinger']
+    for key in ['upper', 'middle', 'lower']:
+        assert_close(series[f'bb_{key}'][i], bb[key] if bb else None, f"{label} bb_{key}[{i}]")
+
+
+def test_streaming_matches_batch_every_candle():
+    for price in [0.15, 150.0, 65000.0]:
+        for seed in range(3):
+            df = make_candles(600, price, seed)
+            series = batch_series(df)
+            state = StreamingIndicators()
+            for i in range(len(df)):
+                row = df.iloc[i]
+                state.update(i, row['high'], row['low'], row['close'])
+                check_step(state, series, i, f"price={price} seed={seed}")
+
+
+def test_atr_matches_calculate_atr():
+    df = make_candles(100, 150.0, seed=3)
+    state = StreamingIndicators()
+    state.update_from_df(df)
+    assert round(state.values()['atr'], 2) == calculate_atr(df)['value']
+
+
+def test_state_survives_restart():
+    df = make_candles(300, 150.0, seed=5)
+    series = batch_series(df)
+
+    state = StreamingIndicators()
+    state.update_from_df(df.iloc[:200])
+
+    path = os.path.join(tempfile.mkdtemp(), 'indicator_state.json')
+    save_indicator_states(path, {'SOLUSDT:15m': state})
+    restored = load_indicator_states(path)['SOLUSDT:15m']
+
+    # Overlapping window after restart - already applied candles are skipped
+    applied = restored.update_from_df(df.iloc[150:])
+    assert applied == 100
+    check_step(restored, series, len(df) - 1, "restored")
+
+    # JSON round trip is lossless
+    assert json.loads(json.dumps(restored.to_dict())) == restored.to_dict()
+
+
+def test_missing_state_file():
+    assert load_indicator_states(os.path.join(tempfile.mkdtemp(), 'missing.json')) == {}
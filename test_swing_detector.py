@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Vectorized swing detector finds the same swings as the previous Python loops"""
+import os
+import sys
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import numpy as np
+from utils.indicators import find_support_resistance, detect_trend_pattern
+from utils.swing_detector import (
+    sliding_max, sliding_min, find_swing_highs, find_swing_lows, cluster_levels, detect_swings
+)
+from test_indicator_kernel import make_candles
+
+
+def loop_swings(highs, lows, window):
+    """Previous find_support_resistance loops (non-strict, ties count)"""
+    resistance = [highs[i] for i in range(window, len(highs) - window)
+                  if highs[i] == max(highs[i-window:i+window+1])]
+    support = [lows[i] for i in range(window, len(lows) - window)
+               if lows[i] == min(lows[i-window:i+window+1])]
+    return resistance, support
+
+
+def loop_strict_swings(highs, lows):
+    """Previous detect_trend_pattern loops (strictly above/below 2 neighbours each side)"""
+    swing_highs = [highs[i] for i in range(2, len(highs) - 2)
+                   if highs[i] > highs[i-1] and highs[i] > highs[i-2] and highs[i] > highs[i+1] and highs[i] > highs[i+2]]
+    swing_lows = [lows[i] for i in range(2, len(lows) - 2)
+                  if lows[i] < lows[i-1] and lows[i] < lows[i-2] and lows[i] < lows[i+1] and lows[i] < lows[i+2]]
+    return swing_highs, swing_lows
+
+
+def loop_find_support_resistance(df, window=10):
+    resistance_levels, support_levels = loop_swings(df['high'].values, df['low'].values, window)
+    current_price = df['close'].iloc[-1]
+    resistance_above = [r for r in resistance_levels if r > current_price]
+    support_below = [s for s in support_levels if s < current_price]
+    nearest_resistance = min(resistance_above) if resistance_above else current_price * 1.05
+    nearest_support = max(support_below) if support_below else current_price * 0.95
+    resistance_distance = nearest_resistance - current_price
+    support_distance = current_price - nearest_support
+    if support_distance < resistance_distance * 0.5:
+        position = "near_support"
+    elif resistance_distance < support_distance * 0.5:
+        position = "near_resistance"
+    else:
+        position = "middle"
+    return {
+        "nearest_resistance": round(nearest_resistance, 2),
+        "nearest_support": round(nearest_support, 2),
+        "current_price": round(current_price, 2),
+        "position": position
+    }
+
+
+def test_sliding_extrema():
+    rng = np.random.default_rng(0)
+    for n in [1, 5, 17, 100, 333]:
+        x = np.round(rng.normal(100, 1, n), 1)  # rounding creates ties
+        for size in [1, 2, 3, 5, 21]:
+            expected_max = [max(x[j:j+size]) for j in range(n - size + 1)]
+            expected_min = [min(x[j:j+size]) for j in range(n - size + 1)]
+            assert list(sliding_max(x, size)) == expected_max
+            assert list(sliding_min(x, size)) == expected_min
+
+
+def test_swings_match_loops():
+    for price in [0.15, 150.0, 65000.0]:
+        for seed in range(20):
+            df = make_candles(200, price, seed)
+            # Rounded copy so equal highs/lows (ties) are exercised too
+            for decimals in [None, 1 if price > 1 else 3]:
+                highs = df['high'].values if decimals is None else np.round(df['high'].values, decimals)
+                lows = df['low'].values if decimals is None else np.round(df['low'].values, decimals)
+                for window in [2, 5, 10]:
+                    resistance, support = loop_swings(highs, lows, window)
+                    assert list(highs[find_swing_highs(highs, window)]) == resistance
+                    assert list(lows[find_swing_lows(lows, window)]) == support
+
+                swing_highs, swing_lows = loop_strict_swings(highs[-20:], lows[-20:])
+                swings = detect_swings(highs, lows, window=2, lookback=20, strict=True)
+                assert list(swings['swing_highs']) == swing_highs
+                assert list(swings['swing_lows']) == swing_lows
+
+
+def test_indicator_outputs_unchanged():
+    for n in [15, 30, 100, 500]:
+        for seed in range(10):
+            df = make_candles(n, 150.0, seed)
+            assert find_support_resistance(df) == loop_find_support_resistance(df)
+            highs, lows = loop_strict_swings(df['high'].values[-20:], df['low'].values[-20:])
+            result = detect_trend_pattern(df)
+            assert result['swing_highs_count'] == len(highs)
+            assert result['swing_lows_count'] == len(lows)
+            assert result['last_swing_high'] == (round(highs[-1], 2) if highs else None)
+            assert result['last_swing_low'] == (round(lows[-1], 2) if lows else None)
+
+
+def test_cluster_levels():
+    levels = cluster_levels([100.0, 100.3, 105.0, 99.9, 105.2], tolerance_pct=0.5)
+    assert [level['touches'] for level in levels] == [3, 2]
+    assert levels[0]['low'] == 99.9 and levels[0]['high'] == 100.3
+    assert cluster_levels([]) == []
+
+
+def test_speed():
+    df = make_candles(10000, 150.0, seed=1)
+    highs, lows = df['high'].values, df['low'].values
+
+    start = time.perf_counter()
+    loop_swings(highs, lows, 10)
+    loop_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    detect_swings(highs, lows, window=10)
+    vector_ms = (time.perf_counter() - start) * 1000
+
+    print(f"   10k candles: loop {loop_ms:.1f} ms | vectorized {vector_ms:.2f} ms ({loop_ms / vector_ms:.0f}x)")
+    assert vector_ms < loop_ms
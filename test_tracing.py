@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Per-stage latency spans, rolling quantiles and Prometheus export"""
+import contextvars
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from utils.tracing import Tracer
+
+
+def test_spans_nest_and_inherit_strategy_label():
+    trace_file = os.path.join(tempfile.mkdtemp(), 'trace.jsonl')
+    tracer = Tracer(trace_file=trace_file)
+
+    def run_strategy(name):
+        with tracer.span('strategy', strategy=name):
+            with tracer.span('analysis'):
+                with tracer.span('binance_rest', endpoint='klines'):
+                    time.sleep(0.001)
+
+    with tracer.span('cycle', interval='15m'):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for name in ['sol', 'eth']:
+                executor.submit(contextvars.copy_context().run, run_strategy, name)
+
+    spans = [json.loads(line) for line in open(trace_file)]
+    assert len(spans) == 7
+    by_id = {s['span_id']: s for s in spans}
+    cycle = next(s for s in spans if s['name'] == 'cycle')
+    assert cycle['parent_id'] is None
+    assert all(s['trace_id'] == cycle['trace_id'] for s in spans)
+
+    rest = [s for s in spans if s['name'] == 'binance_rest']
+    assert sorted(s['labels']['strategy'] for s in rest) == ['eth', 'sol']
+    for s in rest:
+        analysis = by_id[s['parent_id']]
+        assert analysis['name'] == 'analysis' and analysis['labels'] == {'strategy': s['labels']['strategy']}
+        assert by_id[analysis['parent_id']]['parent_id'] == cycle['span_id']
+        assert s['duration_ms'] >= 1
+
+    stats = tracer.get_stats()
+    assert stats[('binance_rest', (('endpoint', 'klines'), ('strategy', 'sol')))]['count'] == 1
+
+
+def test_errors_are_recorded_and_reraised():
+    tracer = Tracer()
+    try:
+        with tracer.span('llm', strategy='sol'):
+            raise TimeoutError('deepseek')
+    except TimeoutError:
+        pass
+    else:
+        raise AssertionError('exception swallowed')
+    assert tracer.get_stats()[('llm', (('strategy', 'sol'),))]['errors'] == 1
+
+
+def test_quantiles_and_prometheus_text():
+    tracer = Tracer(window=100)
+    with tracer.span('decision', strategy='sol'):
+        pass
+    series = tracer._series[('decision', (('strategy', 'sol'),))]
+    for ms in range(2, 201):  # only the last 100 samples (101..200 ms) count for quantiles
+        series.observe(ms / 1000)
+
+    stats = tracer.get_stats()[('decision', (('strategy', 'sol'),))]
+    assert stats['count'] == 200
+    assert abs(stats['p50'] - 0.1505) < 1e-9 and stats['p99'] > 0.199
+
+    text = tracer.render_prometheus()
+    assert '# TYPE llmtrader_stage_duration_seconds summary' in text
+    assert 'llmtrader_stage_duration_seconds{stage="decision",strategy="sol",quantile="0.95"} 0.19' in text
+    assert 'llmtrader_stage_duration_seconds_count{stage="decision",strategy="sol"} 200' in text
+    assert 'llmtrader_stage_errors_total{stage="decision",strategy="sol"} 0' in text
+
+    path = os.path.join(tempfile.mkdtemp(), 'metrics.prom')
+    tracer.export_prometheus(path)
+    assert open(path).read() == text
+
+
+def test_disabled_tracer_is_a_noop():
+    tracer = Tracer(enabled=False)
+    with tracer.span('cycle') as current:
+        assert current is None
+    assert tracer.get_stats() == {}
+
+
+def test_overhead():
+    tracer = Tracer()
+    runs = 20000
+    start = time.perf_counter()
+    for _ in range(runs):
+        with tracer.span('binance_rest', endpoint='ticker/price'):
+            pass
+    per_span_us = (time.perf_counter() - start) / runs * 1e6
+    print(f"   span overhead: {per_span_us:.1f} us")
+    assert per_span_us < 200
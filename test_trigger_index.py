@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""SL/TP trigger index: level boundaries and reconciliation with the DB"""
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from utils.trigger_index import TriggerIndex
+
+
+def trade(trade_id, action, stop_loss, take_profit, symbol='SOLUSDT'):
+    return {'trade_id': trade_id, 'symbol': symbol, 'action': action,
+            'stop_loss': stop_loss, 'take_profit': take_profit}
+
+
+def hits(index, price, symbol='SOLUSDT'):
+    return sorted((t['trade_id'], reason, exit_price) for t, reason, exit_price in index.check(symbol, price))
+
+
+def test_long_levels_trigger_at_the_boundary():
+    index = TriggerIndex()
+    index.add_trade(trade('long', 'LONG', stop_loss=95.0, take_profit=110.0))
+
+    assert hits(index, 95.01) == [] and hits(index, 109.99) == []
+    assert hits(index, 95.0) == [('long', 'SL_HIT', 95.0)]
+    assert hits(index, 90.0) == [('long', 'SL_HIT', 95.0)]  # gap through the stop: exit at the level
+    assert hits(index, 110.0) == [('long', 'TP_HIT', 110.0)]
+    assert hits(index, 120.0, symbol='ETHUSDT') == []
+
+
+def test_short_levels_trigger_at_the_boundary():
+    index = TriggerIndex()
+    index.add_trade(trade('short', 'SHORT', stop_loss=105.0, take_profit=90.0))
+
+    assert hits(index, 104.99) == [] and hits(index, 90.01) == []
+    assert hits(index, 105.0) == [('short', 'SL_HIT', 105.0)]
+    assert hits(index, 90.0) == [('short', 'TP_HIT', 90.0)]
+    assert hits(index, 80.0) == [('short', 'TP_HIT', 90.0)]
+
+
+def test_mixed_book_and_stop_loss_wins():
+    index = TriggerIndex()
+    index.add_trade(trade('l1', 'LONG', 95.0, 110.0))
+    index.add_trade(trade('l2', 'LONG', 98.0, 104.0))
+    index.add_trade(trade('s1', 'SHORT', 103.0, 96.0))
+    assert not index.add_trade(trade('no_levels', 'LONG', None, 110.0))
+
+    assert hits(index, 100.0) == []
+    assert hits(index, 96.0) == [('l2', 'SL_HIT', 98.0), ('s1', 'TP_HIT', 96.0)]
+    assert hits(index, 104.0) == [('l2', 'TP_HIT', 104.0), ('s1', 'SL_HIT', 103.0)]
+
+    # Bad data with TP below SL: both hit at once - the stop loss is reported
+    index.add_trade(trade('bad', 'LONG', stop_loss=100.0, take_profit=99.0))
+    assert ('bad', 'SL_HIT', 100.0) in hits(index, 99.5)
+    index.remove_trade('bad')
+
+    assert index.remove_trade('l2') and not index.remove_trade('l2')
+    assert hits(index, 96.0) == [('s1', 'TP_HIT', 96.0)]
+    assert len(index) == 2 and index.symbols() == ['SOLUSDT']
+
+
+def test_sync_adds_and_removes_trades_from_other_processes():
+    index = TriggerIndex()
+    index.add_trade(trade('closed_by_dashboard', 'LONG', 95.0, 110.0))
+    index.add_trade(trade('still_open', 'SHORT', 105.0, 90.0))
+
+    db_open = [trade('still_open', 'SHORT', 105.0, 90.0), trade('opened_by_dashboard', 'LONG', 90.0, 120.0)]
+    assert index.sync(db_open, index.sync_token()) == (1, 1)
+    assert 'closed_by_dashboard' not in index and 'opened_by_dashboard' in index
+    assert index.sync(db_open) == (0, 0)
+
+
+def test_sync_keeps_listener_updates_made_during_the_read():
+    index = TriggerIndex()
+    index.add_trade(trade('closing', 'LONG', 95.0, 110.0))
+
+    token = index.sync_token()
+    db_open = [trade('closing', 'LONG', 95.0, 110.0)]  # read before the listener calls below
+
+    index.on_trade_opened(trade('new', 'SHORT', 105.0, 90.0))  # strategy opened a trade
+    index.on_trade_closed('closing')  # exit engine closed one
+
+    assert index.sync(db_open, token) == (0, 0)
+    assert 'new' in index  # not in the older read, but indexed after it
+    assert 'closing' not in index  # in the older read, but closed after it
+    assert hits(index, 105.0) == [('new', 'SL_HIT', 105.0)]
+
+    # The next read reflects both changes
+    assert index.sync([trade('new', 'SHORT', 105.0, 90.0)], index.sync_token()) == (0, 0)
+    assert index._removed_at == {}
+